@@ -6,42 +6,23 @@ Uses the Pipeline Framework for execution.
 from __future__ import annotations
 
 import argparse
-import asyncio
+from collections.abc import Callable
 import logging
 import os
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from twinklr.core.config.loader import load_app_config, load_job_config
-from twinklr.core.pipeline import PipelineContext, PipelineExecutor
-from twinklr.core.pipeline.definitions import build_moving_heads_pipeline
-from twinklr.core.sequencer.display.xlights_mapping import (
-    XLightsGroupMapping,
-    XLightsMapping,
-)
-from twinklr.core.sequencer.moving_heads.templates import load_builtin_templates
-from twinklr.core.sequencer.moving_heads.templates.library import list_templates
-from twinklr.core.sequencer.templates.group.models.choreography import (
-    ChoreographyGraph,
-    ChoreoGroup,
-)
-from twinklr.core.sequencer.templates.group.models.display import GroupPosition
-from twinklr.core.sequencer.vocabulary.display import (
-    DisplayElementKind,
-    DisplayProminence,
-    GroupArrangement,
-)
-from twinklr.core.sequencer.vocabulary.spatial import (
-    DepthZone,
-    DisplayZone,
-    HorizontalZone,
-    VerticalZone,
-)
-from twinklr.core.session import TwinklrSession
-from twinklr.core.utils.formatting import clean_audio_filename
-from twinklr.core.utils.logging import configure_logging
+if TYPE_CHECKING:
+    from twinklr.core.agents.shared.judge.prejudge import PreJudgeEvaluation
+    from twinklr.core.sequencer.display.xlights_mapping import XLightsMapping
+    from twinklr.core.sequencer.templates.group.models.choreography import ChoreographyGraph
+
+# Heavy dependencies (librosa, numpy/scipy, LLM SDKs, builtin templates) are
+# imported inside the command handlers so `twinklr --help` and argument errors
+# stay fast. tests/unit/cli/test_startup.py guards this budget.
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -77,6 +58,24 @@ def build_display_graph() -> tuple[ChoreographyGraph, XLightsMapping]:
     Returns:
         Tuple of (ChoreographyGraph, XLightsMapping).
     """
+    from twinklr.core.sequencer.display.xlights_mapping import XLightsGroupMapping, XLightsMapping
+    from twinklr.core.sequencer.templates.group.models.choreography import (
+        ChoreographyGraph,
+        ChoreoGroup,
+    )
+    from twinklr.core.sequencer.templates.group.models.display import GroupPosition
+    from twinklr.core.sequencer.vocabulary.display import (
+        DisplayElementKind,
+        DisplayProminence,
+        GroupArrangement,
+    )
+    from twinklr.core.sequencer.vocabulary.spatial import (
+        DepthZone,
+        DisplayZone,
+        HorizontalZone,
+        VerticalZone,
+    )
+
     groups = [
         ChoreoGroup(
             id="MOVING_HEADS",
@@ -154,6 +153,14 @@ async def run_pipeline_async(
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    from twinklr.core.config.loader import load_app_config, load_job_config
+    from twinklr.core.pipeline import PipelineContext, PipelineExecutor
+    from twinklr.core.pipeline.definitions import build_moving_heads_pipeline
+    from twinklr.core.sequencer.moving_heads.templates import load_builtin_templates
+    from twinklr.core.sequencer.moving_heads.templates.library import list_templates
+    from twinklr.core.session import TwinklrSession
+    from twinklr.core.utils.formatting import clean_audio_filename
+
     # Check API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -294,6 +301,10 @@ async def run_pipeline_async(
 
 def run_pipeline(args: argparse.Namespace) -> None:
     """Run the full Twinklr pipeline."""
+    import asyncio
+
+    from twinklr.core.utils.logging import configure_logging
+
     configure_logging(level="INFO")
 
     audio_path = Path(args.audio).resolve()
@@ -328,6 +339,151 @@ def run_pipeline(args: argparse.Namespace) -> None:
     sys.exit(exit_code)
 
 
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte size such as ``"512MB"``, ``"2GB"`` or ``"1048576"``."""
+    text = value.strip().upper()
+    number = text.rstrip("KMGTB")
+    unit = text[len(number) :]
+    try:
+        size = float(number) * _SIZE_UNITS[unit]
+    except (KeyError, ValueError) as e:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}") from e
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {value!r}")
+    return int(size)
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count with the largest unit that keeps it >= 1."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{num_bytes} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def run_cache(args: argparse.Namespace) -> None:
+    """Inspect or garbage-collect a cache root."""
+    import asyncio
+
+    from twinklr.core.caching import FSCache, SQLiteCache
+    from twinklr.core.caching.backends.sqlite import SQLITE_CACHE_FILENAME
+    from twinklr.core.io import RealFileSystem, absolute_path
+
+    root = Path(args.root).resolve()
+    cache: FSCache | SQLiteCache
+    if root.is_file():
+        cache = SQLiteCache(root)
+    elif (root / SQLITE_CACHE_FILENAME).is_file():
+        cache = SQLiteCache(root / SQLITE_CACHE_FILENAME)
+    elif root.is_dir():
+        cache = FSCache(RealFileSystem(), absolute_path(str(root)))
+    else:
+        console.print(f"[red]ERROR: Cache root not found: {root}[/red]")
+        sys.exit(1)
+
+    if args.cache_cmd == "stats":
+        stats = asyncio.run(cache.stats())
+        console.print(f"[bold]Cache:[/bold] {root}")
+        console.print(f"   Entries: {stats.entries}")
+        console.print(f"   Size: {_format_size(stats.total_bytes)}")
+        for domain, domain_bytes in stats.bytes_by_domain.items():
+            console.print(f"   • {domain}: {_format_size(domain_bytes)}")
+        return
+
+    result = asyncio.run(cache.gc(args.max_size, purge_incomplete=args.purge_incomplete))
+    console.print(
+        f"[green]Removed {result.removed_entries} entries "
+        f"({_format_size(result.freed_bytes)})[/green]; "
+        f"{result.remaining_entries} entries ({_format_size(result.remaining_bytes)}) remain"
+    )
+
+
+def run_prejudge(args: argparse.Namespace) -> None:
+    """Fit or evaluate a judge's local pre-judge against recorded verdicts."""
+    from twinklr.core.agents.analytics import IssueRepository
+    from twinklr.core.agents.shared.judge.prejudge import (
+        PreJudge,
+        PreJudgeModel,
+        evaluate_prejudge,
+        prejudge_model_path,
+    )
+
+    repository = IssueRepository(args.storage_dir)
+    records = repository.read_verdicts(args.agent)
+    if not records:
+        console.print(
+            f"[red]ERROR: No recorded verdicts for {args.agent} in {args.storage_dir}[/red]"
+        )
+        sys.exit(1)
+
+    model_path = prejudge_model_path(args.storage_dir, args.agent)
+    thresholds = {
+        "approve_threshold": args.approve_threshold,
+        "fail_threshold": args.fail_threshold,
+        "min_samples": 0,
+    }
+
+    if args.prejudge_cmd == "fit":
+        # Hold out the most recent verdicts to report agreement before saving
+        n_train = int(len(records) * (1 - args.holdout))
+        if 0 < n_train < len(records):
+            holdout_model = PreJudgeModel.fit(args.agent, records[:n_train])
+            report = evaluate_prejudge(PreJudge(holdout_model, **thresholds), records[n_train:])
+            _print_prejudge_report(f"Holdout ({len(records) - n_train} verdicts)", report)
+        model = PreJudgeModel.fit(args.agent, records)
+        model.save(model_path)
+        console.print(
+            f"[green]Saved pre-judge for {args.agent}[/green] "
+            f"({model.n_samples} verdicts, approval rate {model.approval_rate:.0%}): {model_path}"
+        )
+        return
+
+    loaded = PreJudgeModel.load(model_path)
+    if loaded is None:
+        console.print(f"[red]ERROR: No pre-judge model at {model_path}[/red]")
+        sys.exit(1)
+    report = evaluate_prejudge(PreJudge(loaded, **thresholds), records)
+    _print_prejudge_report(f"All recorded verdicts ({len(records)})", report)
+
+
+def run_llm_logs(args: argparse.Namespace) -> None:
+    """Export or prune segmented LLM call logs."""
+    from twinklr.core.agents.logging import export_call_files, prune_segments
+
+    source = Path(args.source)
+    if not source.exists():
+        console.print(f"[red]ERROR: Segment path not found: {source}[/red]")
+        sys.exit(1)
+
+    if args.llm_logs_cmd == "export":
+        count = export_call_files(source, args.out, format=args.format, agent_name=args.agent)
+        console.print(f"[green]Exported {count} call logs to {args.out}[/green]")
+        return
+
+    removed = prune_segments(source, max_age_days=args.max_age_days, max_total_bytes=args.max_size)
+    console.print(f"[green]Removed {removed} segments[/green]")
+
+
+def _print_prejudge_report(title: str, report: PreJudgeEvaluation) -> None:
+    """Print a PreJudgeEvaluation."""
+    console.print(f"[bold]{title}[/bold]")
+    console.print(f"   Judge approvals: {report.approved}/{report.n_samples}")
+    console.print(
+        f"   Skipped: {report.skipped_approve} approve, {report.skipped_revise} revise "
+        f"(coverage {report.coverage:.0%})"
+    )
+    console.print(
+        f"   Agreement: {report.agreement:.0%} "
+        f"(approve {report.approve_agreement:.0%}, revise {report.revise_agreement:.0%})"
+    )
+    console.print(f"   Accuracy @0.5: {report.accuracy:.0%}  Brier: {report.brier:.3f}")
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     """Build argument parser for CLI."""
     p = argparse.ArgumentParser(
@@ -351,13 +507,94 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Path to job config JSON",
     )
 
+    cache = sub.add_parser("cache", help="Inspect or clean a cache directory")
+    cache_sub = cache.add_subparsers(dest="cache_cmd", required=True)
+    for name, help_text in (
+        ("stats", "Show entry count and size per domain"),
+        ("gc", "Remove expired entries and evict least-recently-used ones"),
+    ):
+        cmd = cache_sub.add_parser(name, help=help_text)
+        cmd.add_argument(
+            "--root",
+            default="data/cache",
+            help="Cache root directory or SQLite cache file (default: data/cache)",
+        )
+    gc = cache_sub.choices["gc"]
+    gc.add_argument(
+        "--max-size",
+        type=_parse_size,
+        default=None,
+        help="Evict LRU entries until the cache fits this size (e.g. 500MB, 2GB)",
+    )
+    gc.add_argument(
+        "--purge-incomplete",
+        action="store_true",
+        help="Also delete entries without a commit marker (only when nothing is writing)",
+    )
+
+    prejudge = sub.add_parser("prejudge", help="Fit or evaluate a judge's local pre-judge")
+    prejudge_sub = prejudge.add_subparsers(dest="prejudge_cmd", required=True)
+    for name, help_text in (
+        ("fit", "Fit the pre-judge on recorded verdicts and save it"),
+        ("eval", "Report the saved pre-judge's agreement with recorded verdicts"),
+    ):
+        cmd = prejudge_sub.add_parser(name, help=help_text)
+        cmd.add_argument("--agent", required=True, help="Judge agent name")
+        cmd.add_argument(
+            "--storage-dir",
+            default="data/agent_analytics",
+            help="Agent analytics directory (default: data/agent_analytics)",
+        )
+        cmd.add_argument("--approve-threshold", type=float, default=0.95)
+        cmd.add_argument("--fail-threshold", type=float, default=0.95)
+    prejudge_sub.choices["fit"].add_argument(
+        "--holdout",
+        type=float,
+        default=0.2,
+        help="Fraction of most recent verdicts held out for evaluation (default: 0.2)",
+    )
+
+    llm_logs = sub.add_parser("llm-logs", help="Export or prune segmented LLM call logs")
+    llm_logs_sub = llm_logs.add_subparsers(dest="llm_logs_cmd", required=True)
+    for name, help_text in (
+        ("export", "Write one file per logged call (the per-call file layout)"),
+        ("prune", "Delete segments by age and total size"),
+    ):
+        cmd = llm_logs_sub.add_parser(name, help=help_text)
+        cmd.add_argument(
+            "--source",
+            default="data/logging/segments",
+            help="Segments root, session directory or segment file "
+            "(default: data/logging/segments)",
+        )
+    export = llm_logs_sub.choices["export"]
+    export.add_argument("--out", required=True, help="Output directory")
+    export.add_argument("--format", choices=("yaml", "json"), default="yaml")
+    export.add_argument("--agent", default=None, help="Only export this agent's calls")
+    prune = llm_logs_sub.choices["prune"]
+    prune.add_argument("--max-age-days", type=float, default=None)
+    prune.add_argument(
+        "--max-size",
+        type=_parse_size,
+        default=None,
+        help="Delete oldest segments until the total fits this size (e.g. 2GB)",
+    )
+
     return p
 
 
+# Subcommand dispatch; handlers import their own dependencies on invocation
+COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "run": run_pipeline,
+    "cache": run_cache,
+    "prejudge": run_prejudge,
+    "llm-logs": run_llm_logs,
+}
+
+
 def main() -> None:
     """Main entry point for CLI."""
     p = build_arg_parser()
     args = p.parse_args()
 
-    if args.cmd == "run":
-        run_pipeline(args)
+    COMMANDS[args.cmd](args)
@@ -1,8 +1,10 @@
 """Agent orchestration system."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 # Phase 1: Foundation (Complete)
-# Phase 2: Agent Runner (Complete)
-from twinklr.core.agents.async_runner import AsyncAgentRunner, RunError
 from twinklr.core.agents.context import (
     BaseContextShaper,
     ContextShaper,
@@ -36,7 +38,6 @@ from twinklr.core.agents.providers import (
     LLMProvider,
     LLMProviderError,
     LLMResponse,
-    OpenAIProvider,
     ProviderType,
     ResponseMetadata,
     TokenUsage,
@@ -53,6 +54,18 @@ from twinklr.core.agents.state_machine import (
     StateTransition,
 )
 
+if TYPE_CHECKING:
+    # Phase 2: Agent Runner (Complete)
+    from twinklr.core.agents.async_runner import AsyncAgentRunner, RunError
+    from twinklr.core.agents.providers.openai import OpenAIProvider
+
+# Names resolved on first access: they pull in provider SDKs (openai/anthropic)
+_LAZY_EXPORTS: dict[str, str] = {
+    "AsyncAgentRunner": "twinklr.core.agents.async_runner",
+    "RunError": "twinklr.core.agents.async_runner",
+    "OpenAIProvider": "twinklr.core.agents.providers.openai",
+}
+
 __all__ = [
     # Providers
     "LLMProvider",
@@ -106,3 +119,13 @@ __all__ = [
     "LLMCallLog",
     "CallSummary",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    return getattr(importlib.import_module(module_path), name)
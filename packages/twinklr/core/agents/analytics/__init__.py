@@ -4,9 +4,14 @@ This module provides persistent tracking and analysis of agent performance,
 including issue tracking, resolution rates, and learning context generation.
 """
 
-from twinklr.core.agents.analytics.repository import IssueRecord, IssueRepository
+from twinklr.core.agents.analytics.repository import (
+    IssueRecord,
+    IssueRepository,
+    VerdictRecord,
+)
 
 __all__ = [
     "IssueRecord",
     "IssueRepository",
+    "VerdictRecord",
 ]
@@ -2,15 +2,27 @@
 
 This module provides a JSON-based repository for tracking issues across
 multiple job runs, enabling agents to learn from common mistakes.
+
+The JSON-lines log stays the source of truth. Each log file has one shared
+in-process index (running totals plus the most recent ``INDEX_WINDOW``
+records) that is updated on append, so learning-context and stats lookups
+never rescan history. Totals are snapshotted to ``{agent}_issues.index.json``
+with the log offset they cover; on load only the tail past that offset is
+scanned. Appends are buffered and flushed off the event loop when one is
+running.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import logging
-from collections import Counter
+import os
+import threading
+from collections import Counter, deque
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,6 +30,13 @@ from twinklr.core.agents.issues import Issue, IssueCategory
 
 logger = logging.getLogger(__name__)
 
+# Most recent issue records kept parsed in memory per agent; queries over at
+# most this many records are answered without reading the log
+INDEX_WINDOW = 1000
+
+_SNAPSHOT_VERSION = 1
+_TAIL_BLOCK_SIZE = 64 * 1024
+
 
 class IssueRecord(BaseModel):
     """Persistent record of an issue with agent context.
@@ -45,6 +64,353 @@ class IssueRecord(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+class VerdictRecord(BaseModel):
+    """Judge verdict paired with the deterministic features of the judged plan.
+
+    Training/evaluation sample for the local pre-judge.
+
+    Attributes:
+        agent_name: Judge name
+        job_id: Job identifier
+        iteration: Iteration number
+        score: Judge score
+        status: Judge verdict status (APPROVE, SOFT_FAIL, HARD_FAIL)
+        features: Plan features at judging time (name → value)
+        timestamp: Unix timestamp
+    """
+
+    agent_name: str = Field(description="Agent/judge name")
+    job_id: str = Field(description="Job identifier")
+    iteration: int = Field(ge=0, description="Iteration number")
+    score: float = Field(ge=0.0, le=10.0, description="Judge score")
+    status: str = Field(description="Judge verdict status")
+    features: dict[str, float] = Field(default_factory=dict, description="Plan features")
+    timestamp: float = Field(description="Unix timestamp")
+
+    model_config = ConfigDict(frozen=True)
+
+
+def _tail_lines(file_path: Path, n: int) -> list[str]:
+    """Read the last ``n`` non-empty lines of a file without reading all of it.
+
+    Args:
+        file_path: Path to JSON-lines file
+        n: Number of lines to return
+
+    Returns:
+        Up to ``n`` lines, oldest first
+    """
+    if n <= 0:
+        return []
+    with file_path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # n + 1 newlines guarantee n complete lines past the first one
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = [line for line in data.decode("utf-8", errors="replace").splitlines() if line.strip()]
+    if pos > 0:
+        lines = lines[1:]  # First line may be cut mid-record
+    return lines[-n:]
+
+
+class _BufferedLog:
+    """Buffered JSON-lines appender shared per log file per process.
+
+    ``append`` only buffers; the file write happens in ``flush``, on a worker
+    thread when an event loop is running (see ``schedule_flush``). ``lock``
+    guards the in-memory state and is never held during file I/O, so appends
+    do not wait on a flush in progress; ``_write_lock`` keeps flushes ordered.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._pending: list[str] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def schedule_flush(self) -> None:
+        """Flush on a worker thread if an event loop is running, else inline."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        with self.lock:
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = loop.create_task(asyncio.to_thread(self.flush))
+
+    def flush(self) -> None:
+        """Append buffered lines to the log."""
+        with self._write_lock:
+            pending = self._take_pending()
+            if pending:
+                self._write(pending)
+
+    def _take_pending(self) -> list[str]:
+        with self.lock:
+            pending, self._pending = self._pending, []
+            return pending
+
+    def _write(self, pending: list[str]) -> tuple[int, int] | None:
+        """Append lines; returns (size before, bytes written), or None on failure."""
+        data = "".join(pending).encode("utf-8")
+        try:
+            with self.path.open("ab") as f:
+                end = f.seek(0, os.SEEK_END)
+                f.write(data)
+                f.flush()
+        except OSError as e:
+            logger.error(f"Failed to write records to {self.path}: {e}")
+            with self.lock:
+                self._pending[:0] = pending  # Retry on the next flush
+            return None
+        return end, len(data)
+
+
+class _VerdictLog(_BufferedLog):
+    """Buffered writer for one judge's verdict log (see ``_verdict_log``)."""
+
+    def append(self, record: VerdictRecord) -> None:
+        """Buffer a verdict for the next flush.
+
+        Args:
+            record: Verdict sample
+        """
+        with self.lock:
+            self._pending.append(record.model_dump_json() + "\n")
+
+
+class _IssueLog(_BufferedLog):
+    """Buffered writer and aggregate index for one agent's issue log.
+
+    There is one instance per log file per process (see ``_issue_log``), so
+    every IssueRepository over the same directory shares the buffer and the
+    index. Index state is guarded by ``lock``; flushes may run on a worker
+    thread.
+
+    Attributes:
+        path: JSON-lines log file
+        snapshot_path: Sidecar file with the persisted totals
+        recent: Most recent records, oldest first (at most INDEX_WINDOW)
+        recent_by_category: Category counts over ``recent``
+        total: Total records in the log (including unflushed ones)
+        by_category: Category counts over the whole log
+        by_severity: Severity counts over the whole log
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.snapshot_path = path.with_suffix(".index.json")
+        self.recent: deque[IssueRecord] = deque(maxlen=INDEX_WINDOW)
+        self.recent_by_category: Counter[IssueCategory] = Counter()
+        self.total = 0
+        self.by_category: Counter[str] = Counter()
+        self.by_severity: Counter[str] = Counter()
+        self._loaded = False
+        # Bytes of the log file covered by the totals
+        self._offset = 0
+
+    def append(self, records: list[IssueRecord]) -> None:
+        """Index records and buffer them for the next flush.
+
+        Args:
+            records: New records, oldest first
+        """
+        with self.lock:
+            self.ensure_loaded()
+            for record in records:
+                self._count(record.issue.category.value, record.issue.severity.value)
+                self._push_recent(record)
+                self._pending.append(record.model_dump_json() + "\n")
+
+    def flush(self) -> None:
+        """Append buffered records to the log and refresh the snapshot."""
+        with self._write_lock:
+            pending = self._take_pending()
+            if not pending:
+                return
+            written = self._write(pending)
+            if written is None:
+                return
+            end, size = written
+            with self.lock:
+                start = self._offset
+            # Another writer appended since we last looked: index its records
+            counts, _ = _read_counts(self.path, start, end)
+            with self.lock:
+                for category, severity in counts:
+                    self._count(category, severity)
+                self._offset = end + size
+                snapshot = self._snapshot()
+            self._write_snapshot(snapshot)
+
+    def recent_records(self, max_records: int | None) -> list[IssueRecord] | None:
+        """Most recent records from memory, if the window covers the request.
+
+        Args:
+            max_records: Records wanted (most recent), None for all
+
+        Returns:
+            Records oldest first, or None if the log must be read
+        """
+        with self.lock:
+            self.ensure_loaded()
+            if max_records is not None and max_records <= 0:
+                return []
+            wanted = self.total if max_records is None else min(max_records, self.total)
+            if wanted > len(self.recent):
+                return None
+            records = list(self.recent)
+            return records[len(records) - wanted :]
+
+    def ensure_loaded(self) -> None:
+        """Build the index from the snapshot plus the log tail (once)."""
+        with self.lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.path.exists():
+                return
+
+            size = self.path.stat().st_size
+            snapshot = self._read_snapshot()
+            if snapshot is not None and snapshot["offset"] <= size:
+                self.total = snapshot["total"]
+                self.by_category = Counter(snapshot["by_category"])
+                self.by_severity = Counter(snapshot["by_severity"])
+                self._offset = snapshot["offset"]
+            stale = self._offset != size
+            self._scan_totals(self._offset, size)
+
+            for line in _tail_lines(self.path, INDEX_WINDOW):
+                try:
+                    self._push_recent(IssueRecord.model_validate_json(line))
+                except Exception as e:
+                    logger.warning(f"Failed to parse issue record: {e}")
+
+            if stale:
+                self._write_snapshot(self._snapshot())
+
+    def _count(self, category: str, severity: str) -> None:
+        self.total += 1
+        self.by_category[category] += 1
+        self.by_severity[severity] += 1
+
+    def _push_recent(self, record: IssueRecord) -> None:
+        if len(self.recent) == self.recent.maxlen:
+            evicted = self.recent[0].issue.category
+            self.recent_by_category[evicted] -= 1
+            if not self.recent_by_category[evicted]:
+                del self.recent_by_category[evicted]
+        self.recent.append(record)
+        self.recent_by_category[record.issue.category] += 1
+
+    def _scan_totals(self, start: int, end: int) -> None:
+        """Add complete log lines in ``[start, end)`` to the totals."""
+        counts, consumed = _read_counts(self.path, start, end)
+        for category, severity in counts:
+            self._count(category, severity)
+        self._offset += consumed
+
+    def _read_snapshot(self) -> dict[str, Any] | None:
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != _SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "offset": self._offset,
+            "total": self.total,
+            "by_category": dict(self.by_category),
+            "by_severity": dict(self.by_severity),
+        }
+
+    def _write_snapshot(self, snapshot: dict[str, Any]) -> None:
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(snapshot))
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Failed to write issue index {self.snapshot_path}: {e}")
+
+
+def _read_counts(path: Path, start: int, end: int) -> tuple[list[tuple[str, str]], int]:
+    """(category, severity) of the complete issue lines in ``[start, end)``.
+
+    Returns:
+        Counts per record, and the bytes of complete lines consumed
+    """
+    counts: list[tuple[str, str]] = []
+    consumed = 0
+    if start >= end:
+        return counts, consumed
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = end - start
+        for raw in f:
+            remaining -= len(raw)
+            if remaining < 0 or not raw.endswith(b"\n"):
+                break  # Partial record still being written
+            consumed += len(raw)
+            if not raw.strip():
+                continue
+            try:
+                issue = json.loads(raw)["issue"]
+                counts.append((issue["category"], issue["severity"]))
+            except Exception as e:
+                logger.warning(f"Failed to index issue record: {e}")
+    return counts, consumed
+
+
+_L = TypeVar("_L", bound=_BufferedLog)
+
+_LOGS: dict[Path, _BufferedLog] = {}
+_LOGS_LOCK = threading.Lock()
+
+
+def _shared_log(path: Path, log_cls: type[_L]) -> _L:
+    key = path.resolve()
+    with _LOGS_LOCK:
+        log = _LOGS.get(key)
+        if log is None:
+            log = _LOGS[key] = log_cls(key)
+        assert isinstance(log, log_cls)
+        return log
+
+
+def _issue_log(path: Path) -> _IssueLog:
+    """Process-wide shared log/index for an issue file."""
+    return _shared_log(path, _IssueLog)
+
+
+def _verdict_log(path: Path) -> _VerdictLog:
+    """Process-wide shared buffer for a verdict file."""
+    return _shared_log(path, _VerdictLog)
+
+
+def _flush_all_logs() -> None:
+    """Flush every buffered issue and verdict log (interpreter exit safety net)."""
+    for log in list(_LOGS.values()):
+        try:
+            log.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush log {log.path}: {e}")
+
+
+atexit.register(_flush_all_logs)
+
+
 class IssueRepository:
     """Persistent JSON-based issue repository.
 
@@ -53,6 +419,7 @@ class IssueRepository:
 
     The repository is organized by agent name:
     - {storage_dir}/{agent_name}_issues.jsonl
+    - {storage_dir}/{agent_name}_verdicts.jsonl (pre-judge samples)
 
     Attributes:
         storage_dir: Directory for JSON-lines files
@@ -68,6 +435,8 @@ class IssueRepository:
         """
         self.storage_dir = Path(storage_dir)
         self.enabled = enabled
+        self._logs: dict[str, _IssueLog] = {}
+        self._verdict_logs: dict[str, _VerdictLog] = {}
 
         if self.enabled:
             self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -104,9 +473,6 @@ class IssueRepository:
 
         resolved_ids = resolved_issue_ids or set()
 
-        # Append to agent-specific file
-        file_path = self._get_agent_file(agent_name)
-
         records = []
         for issue in issues:
             record = IssueRecord(
@@ -120,17 +486,65 @@ class IssueRepository:
             )
             records.append(record)
 
-        # Append as JSON-lines
-        with file_path.open("a") as f:
-            for record in records:
-                f.write(record.model_dump_json() + "\n")
-            f.flush()  # Explicit flush to prevent race conditions in async/parallel contexts
+        # Index now; the JSON-lines append happens off the event loop when one is running
+        log = self._issue_log(agent_name)
+        log.append(records)
+        log.schedule_flush()
 
         logger.debug(
             f"Recorded {len(records)} issues for {agent_name} "
             f"(job: {job_id}, iteration: {iteration})"
         )
 
+    def flush(self) -> None:
+        """Write all buffered issue and verdict records to disk."""
+        for log in [*self._logs.values(), *self._verdict_logs.values()]:
+            log.flush()
+
+    async def aflush(self) -> None:
+        """Write all buffered records to disk without blocking the loop."""
+        await asyncio.to_thread(self.flush)
+
+    def record_verdict(self, record: VerdictRecord) -> None:
+        """Record a judge verdict with the judged plan's features.
+
+        Args:
+            record: Verdict sample to append
+        """
+        if not self.enabled:
+            return
+
+        # Buffered like issues: the append happens off the event loop when one is running
+        log = self._verdict_log(record.agent_name)
+        log.append(record)
+        log.schedule_flush()
+
+    def read_verdicts(self, agent_name: str, max_records: int | None = None) -> list[VerdictRecord]:
+        """Read recorded verdict samples for an agent (oldest first).
+
+        Args:
+            agent_name: Agent/judge name
+            max_records: Maximum records to read (most recent), None for all
+
+        Returns:
+            List of verdict records
+        """
+        if not self.enabled:
+            return []
+
+        self._verdict_log(agent_name).flush()
+        file_path = self._get_agent_file(agent_name, kind="verdicts")
+        if not file_path.exists():
+            return []
+
+        records: list[VerdictRecord] = []
+        for line in self._read_lines(file_path, max_records=max_records):
+            try:
+                records.append(VerdictRecord.model_validate_json(line))
+            except Exception as e:
+                logger.warning(f"Failed to parse verdict record: {e}")
+        return records
+
     def get_top_issues(
         self,
         agent_name: str,
@@ -152,12 +566,7 @@ class IssueRepository:
         if not self.enabled:
             return []
 
-        file_path = self._get_agent_file(agent_name)
-        if not file_path.exists():
-            return []
-
-        # Read records (most recent first)
-        records = self._read_records(file_path, max_records=max_records)
+        records = self._recent_records(agent_name, max_records)
 
         # Count by category and collect generic examples
         category_counts: Counter[IssueCategory] = Counter()
@@ -205,11 +614,7 @@ class IssueRepository:
         if not self.enabled:
             return []
 
-        file_path = self._get_agent_file(agent_name)
-        if not file_path.exists():
-            return []
-
-        records = self._read_records(file_path, max_records=max_records)
+        records = self._recent_records(agent_name, max_records)
 
         # Count by issue_id and keep one example
         issue_counts: Counter[str] = Counter()
@@ -250,11 +655,7 @@ class IssueRepository:
         if not self.enabled:
             return 0.0
 
-        file_path = self._get_agent_file(agent_name)
-        if not file_path.exists():
-            return 0.0
-
-        records = self._read_records(file_path, max_records=max_records)
+        records = self._recent_records(agent_name, max_records)
 
         # Filter by category if specified
         if category:
@@ -303,7 +704,15 @@ class IssueRepository:
         if not self.enabled:
             return ""
 
-        top_issues = self.get_top_issues(agent_name, top_n=top_n, min_occurrences=3)
+        # Category counts over the index window: constant time regardless of history
+        log = self._issue_log(agent_name)
+        with log.lock:
+            log.ensure_loaded()
+            top_issues = [
+                (category, count)
+                for category, count in log.recent_by_category.most_common(top_n)
+                if count >= 3
+            ]
 
         if not top_issues:
             return ""
@@ -322,7 +731,7 @@ class IssueRepository:
         }
 
         lines: list[str] = []
-        for category, count, _examples in top_issues:
+        for category, count in top_issues:
             guidance = category_guidance.get(
                 category.value, f"Watch for recurring {category.value} issues."
             )
@@ -342,70 +751,109 @@ class IssueRepository:
         if not self.enabled:
             return {}
 
-        file_path = self._get_agent_file(agent_name)
-        if not file_path.exists():
-            return {"total_issues": 0}
-
-        records = self._read_records(file_path, max_records=None)
-
-        categories = {r.issue.category for r in records}
-        severities = {r.issue.severity for r in records}
-
-        # Get most common category (with min_occurrences=1 to ensure we get results)
-        top_issues = self.get_top_issues(agent_name, top_n=1, min_occurrences=1)
-        most_common = top_issues[0][0].value if top_issues else None
+        log = self._issue_log(agent_name)
+        with log.lock:
+            log.ensure_loaded()
+            if not log.total:
+                return {"total_issues": 0}
+            total = log.total
+            unique_categories = len(log.by_category)
+            unique_severities = len(log.by_severity)
+            top_category = log.by_category.most_common(1)
+        most_common = top_category[0][0] if top_category else None
 
         return {
-            "total_issues": len(records),
-            "unique_categories": len(categories),
-            "unique_severities": len(severities),
+            "total_issues": total,
+            "unique_categories": unique_categories,
+            "unique_severities": unique_severities,
             "resolution_rate": self.get_resolution_rate(agent_name),
             "most_common_category": most_common,
         }
 
-    def _get_agent_file(self, agent_name: str) -> Path:
-        """Get file path for agent's issue records.
+    def _get_agent_file(self, agent_name: str, kind: str = "issues") -> Path:
+        """Get file path for agent's issue (or verdict) records.
 
         Args:
             agent_name: Agent/judge name
+            kind: Record kind ("issues" or "verdicts")
 
         Returns:
             Path to JSON-lines file
         """
         # Sanitize agent name for filename
         safe_name = agent_name.replace("/", "_").replace("\\", "_")
-        return self.storage_dir / f"{safe_name}_issues.jsonl"
+        return self.storage_dir / f"{safe_name}_{kind}.jsonl"
+
+    def _issue_log(self, agent_name: str) -> _IssueLog:
+        """Get the shared log/index for an agent's issue file."""
+        log = self._logs.get(agent_name)
+        if log is None:
+            log = self._logs[agent_name] = _issue_log(self._get_agent_file(agent_name))
+        return log
+
+    def _verdict_log(self, agent_name: str) -> _VerdictLog:
+        """Get the shared write buffer for an agent's verdict file."""
+        log = self._verdict_logs.get(agent_name)
+        if log is None:
+            log = self._verdict_logs[agent_name] = _verdict_log(
+                self._get_agent_file(agent_name, kind="verdicts")
+            )
+        return log
 
-    def _read_records(self, file_path: Path, max_records: int | None = None) -> list[IssueRecord]:
-        """Read records from JSON-lines file.
+    def _recent_records(self, agent_name: str, max_records: int | None) -> list[IssueRecord]:
+        """Most recent issue records, from the index when it covers the request.
 
         Args:
-            file_path: Path to JSON-lines file
-            max_records: Maximum records to read (most recent), None for all
+            agent_name: Agent/judge name
+            max_records: Maximum records (most recent), None for all
 
         Returns:
-            List of issue records (most recent first if max_records set)
+            Issue records, oldest first
         """
-        records = []
+        log = self._issue_log(agent_name)
+        records = log.recent_records(max_records)
+        if records is None:
+            log.flush()
+            records = self._read_records(log.path, max_records=max_records)
+        return records
+
+    def _read_lines(self, file_path: Path, max_records: int | None = None) -> list[str]:
+        """Read raw JSON lines from a records file.
+
+        Args:
+            file_path: Path to JSON-lines file
+            max_records: Maximum lines to return (most recent), None for all
 
+        Returns:
+            Non-empty lines, oldest first
+        """
         try:
+            if max_records is not None:
+                return _tail_lines(file_path, max_records)
             with file_path.open("r") as f:
-                lines = f.readlines()
+                return [line for line in f if line.strip()]
+        except Exception as e:
+            logger.error(f"Failed to read records from {file_path}: {e}")
+            return []
 
-            # If max_records specified, take most recent
-            if max_records is not None:
-                lines = lines[-max_records:]
+    def _read_records(self, file_path: Path, max_records: int | None = None) -> list[IssueRecord]:
+        """Read records from JSON-lines file.
 
-            for line in lines:
-                try:
-                    data = json.loads(line)
-                    record = IssueRecord.model_validate(data)
-                    records.append(record)
-                except Exception as e:
-                    logger.warning(f"Failed to parse issue record: {e}")
-                    continue
+        Args:
+            file_path: Path to JSON-lines file
+            max_records: Maximum records to read (most recent), None for all
 
-        except Exception as e:
-            logger.error(f"Failed to read issue records from {file_path}: {e}")
+        Returns:
+            List of issue records (most recent first if max_records set)
+        """
+        records = []
+        for line in self._read_lines(file_path, max_records=max_records):
+            try:
+                data = json.loads(line)
+                record = IssueRecord.model_validate(data)
+                records.append(record)
+            except Exception as e:
+                logger.warning(f"Failed to parse issue record: {e}")
+                continue
 
         return records
@@ -1,6 +1,12 @@
 """Asset catalog persistence and reuse checking.
 
 Handles loading, saving, and querying the persistent asset catalog.
+
+Two persistence formats are supported:
+- ``load_catalog`` / ``save_catalog``: single JSON document (legacy).
+- ``AssetCatalogStore``: append-only JSON Lines log. Each save appends only
+  new or changed entries; the log is compacted when superseded lines
+  dominate. A legacy JSON catalog next to the log is imported on first load.
 """
 
 from __future__ import annotations
@@ -11,6 +17,11 @@ import logging
 from pathlib import Path
 
 from twinklr.core.agents.assets.models import AssetCatalog, AssetSpec, CatalogEntry
+from twinklr.core.agents.assets.perceptual_hash import (
+    DEFAULT_MAX_DISTANCE,
+    hamming_distance,
+    perceptual_hash_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -147,3 +158,199 @@ def check_reuse_by_spec_id(catalog: AssetCatalog, spec: AssetSpec) -> CatalogEnt
 
     logger.debug("Spec-id cache hit for %s → %s", spec.spec_id, entry.asset_id)
     return entry
+
+
+def check_reuse_similar(
+    catalog: AssetCatalog,
+    spec: AssetSpec,
+    *,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> CatalogEntry | None:
+    """Check reuse by visual subject when no exact match exists.
+
+    Candidates share the spec's similarity key, i.e. an equivalent subject
+    description (see ``similarity_key``), e.g. the same narrative subject
+    planned for a different song. A candidate is only reused if its file on
+    disk is still perceptually equivalent to the image recorded in the
+    catalog (within ``max_distance`` bits), so overwritten or corrupted files
+    are never served.
+
+    Decodes candidate images, so async callers should run it in a worker
+    thread.
+
+    Args:
+        catalog: The existing catalog.
+        spec: The spec to check (prompt may not be set yet).
+        max_distance: Maximum Hamming distance between recorded and current
+            perceptual hashes.
+
+    Returns:
+        Existing CatalogEntry if a visually equivalent image exists, None otherwise.
+    """
+    for entry in catalog.find_similar(spec):
+        if not entry.perceptual_hash:
+            continue
+        current = perceptual_hash_file(Path(entry.file_path))
+        if current is None:
+            continue
+        if hamming_distance(current, entry.perceptual_hash) > max_distance:
+            logger.debug(
+                "Similar candidate %s for %s changed on disk, skipping",
+                entry.asset_id,
+                spec.spec_id,
+            )
+            continue
+        logger.debug("Similar-asset hit for %s → %s", spec.spec_id, entry.asset_id)
+        return entry
+    return None
+
+
+class AssetCatalogStore:
+    """Append-only JSON Lines persistence for the asset catalog.
+
+    Each line is one serialized CatalogEntry; later lines supersede earlier
+    ones with the same asset_id. ``save`` appends only entries that differ
+    from what is already on disk, so a run that reuses most assets writes a
+    handful of lines instead of the whole catalog. ``append`` writes a single
+    entry without diffing the catalog, for checkpointing as assets finish.
+
+    Args:
+        log_path: Path to the ``.jsonl`` log.
+        legacy_path: Optional JSON catalog imported when the log does not exist.
+        compact_ratio: Rewrite the log when it holds more than this many
+            lines per live entry.
+
+    Example:
+        >>> store = AssetCatalogStore(assets_dir / "asset_catalog.jsonl")
+        >>> catalog = store.load()
+        >>> catalog.merge(new_entries)
+        >>> store.save(catalog)
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        *,
+        legacy_path: Path | None = None,
+        compact_ratio: float = 2.0,
+    ) -> None:
+        self.log_path = log_path
+        self.legacy_path = legacy_path
+        self.compact_ratio = compact_ratio
+        self._persisted: dict[str, str] = {}
+        self._line_count = 0
+
+    def load(self) -> AssetCatalog:
+        """Replay the log into a catalog (or import the legacy JSON catalog).
+
+        Corrupt lines (e.g. a torn final write) are skipped.
+
+        Returns:
+            AssetCatalog (existing or new empty).
+        """
+        self._persisted = {}
+        self._line_count = 0
+
+        if not self.log_path.exists():
+            catalog = (
+                load_catalog(self.legacy_path)
+                if self.legacy_path is not None
+                else AssetCatalog(catalog_id="default")
+            )
+            if catalog.entries:
+                logger.info(
+                    "Importing %d entries from legacy catalog %s",
+                    len(catalog.entries),
+                    self.legacy_path,
+                )
+                self._rewrite(catalog)
+            return catalog
+
+        latest: dict[str, CatalogEntry] = {}
+        with self.log_path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                self._line_count += 1
+                try:
+                    entry = CatalogEntry.model_validate_json(line)
+                except Exception:
+                    logger.warning("Skipping corrupt catalog line %d in %s", line_no, self.log_path)
+                    continue
+                latest.pop(entry.asset_id, None)
+                latest[entry.asset_id] = entry
+                self._persisted[entry.asset_id] = line
+
+        catalog = AssetCatalog(catalog_id="default", entries=list(latest.values()))
+        logger.debug(
+            "Loaded catalog with %d entries (%d log lines) from %s",
+            len(catalog.entries),
+            self._line_count,
+            self.log_path,
+        )
+        return catalog
+
+    def save(self, catalog: AssetCatalog) -> int:
+        """Append new or changed entries, compacting the log when needed.
+
+        Args:
+            catalog: The catalog to persist.
+
+        Returns:
+            Number of entries written.
+        """
+        changed: list[tuple[str, str]] = []
+        for entry in catalog.entries:
+            line = entry.model_dump_json()
+            if self._persisted.get(entry.asset_id) != line:
+                changed.append((entry.asset_id, line))
+
+        live = len(catalog.entries)
+        if self._line_count + len(changed) > max(live, 1) * self.compact_ratio:
+            self._rewrite(catalog)
+            return live
+
+        if changed:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.write("".join(f"{line}\n" for _, line in changed))
+            for asset_id, line in changed:
+                self._persisted[asset_id] = line
+            self._line_count += len(changed)
+
+        logger.debug("Appended %d catalog entries to %s", len(changed), self.log_path)
+        return len(changed)
+
+    def append(self, entry: CatalogEntry) -> bool:
+        """Append one entry if it differs from what is already on disk.
+
+        Cheap per-entry checkpoint for long runs: never compacts, so call
+        ``save`` once at the end to diff the whole catalog and compact.
+
+        Args:
+            entry: The entry to persist.
+
+        Returns:
+            True if a line was written.
+        """
+        line = entry.model_dump_json()
+        if self._persisted.get(entry.asset_id) == line:
+            return False
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("a", encoding="utf-8") as f:
+            f.write(f"{line}\n")
+        self._persisted[entry.asset_id] = line
+        self._line_count += 1
+        return True
+
+    def _rewrite(self, catalog: AssetCatalog) -> None:
+        """Atomically replace the log with one line per live entry."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = {e.asset_id: e.model_dump_json() for e in catalog.entries}
+        tmp_path = self.log_path.with_suffix(self.log_path.suffix + ".tmp")
+        tmp_path.write_text("".join(f"{line}\n" for line in lines.values()), encoding="utf-8")
+        tmp_path.replace(self.log_path)
+        self._persisted = lines
+        self._line_count = len(lines)
+        logger.debug("Compacted catalog log %s to %d entries", self.log_path, len(lines))
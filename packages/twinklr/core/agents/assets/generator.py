@@ -12,8 +12,6 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
-from PIL import Image
-
 from twinklr.core.agents.assets.catalog import compute_prompt_hash
 from twinklr.core.agents.assets.image_client import OpenAIImageClient
 from twinklr.core.agents.assets.models import (
@@ -21,6 +19,7 @@ from twinklr.core.agents.assets.models import (
     AssetSpec,
     AssetStatus,
     CatalogEntry,
+    ImageResult,
 )
 from twinklr.core.agents.assets.text_renderer import TextRenderer
 
@@ -62,29 +61,25 @@ def _build_output_path(spec: AssetSpec, assets_dir: Path) -> Path:
         return assets_dir / category_dir / f"{filename}.png"
 
 
-def _validate_image(file_path: Path, spec: AssetSpec) -> tuple[bool, str | None]:
-    """Validate a generated image with PIL.
+def _validate_image(result: ImageResult, spec: AssetSpec) -> tuple[bool, str | None]:
+    """Validate a generated image against its spec.
 
-    Checks dimensions and alpha channel presence.
+    Uses the properties of the decoded in-memory image reported by the
+    image client, so the written file is never decoded a second time.
 
     Args:
-        file_path: Path to the generated image.
+        result: Generation result describing the written image.
         spec: The spec for expected properties.
 
     Returns:
         (is_valid, error_message_or_none)
     """
-    try:
-        img = Image.open(file_path)
-        w, h = img.size
-
-        if w != spec.width or h != spec.height:
-            return False, (f"Dimension mismatch: expected {spec.width}x{spec.height}, got {w}x{h}")
-
-        return True, None
-
-    except Exception as e:
-        return False, f"Image validation failed: {e}"
+    if result.width != spec.width or result.height != spec.height:
+        return False, (
+            f"Dimension mismatch: expected {spec.width}x{spec.height}, "
+            f"got {result.width}x{result.height}"
+        )
+    return True, None
 
 
 def _make_failed_entry(
@@ -226,16 +221,7 @@ async def _generate_image(
         background=spec.background,
     )
 
-    # Validate (CPU-bound PIL work — run in thread)
-    _is_valid, error = await asyncio.to_thread(_validate_image, output_path, spec)
-
-    # Detect alpha
-    try:
-        img = Image.open(output_path)
-        has_alpha = img.mode == "RGBA"
-    except Exception:
-        has_alpha = False
-
+    _is_valid, error = _validate_image(result, spec)
     if not _is_valid:
         return _make_failed_entry(
             spec,
@@ -255,12 +241,13 @@ async def _generate_image(
         status=AssetStatus.CREATED,
         width=spec.width,
         height=spec.height,
-        has_alpha=has_alpha,
+        has_alpha=result.has_alpha,
         file_size_bytes=result.file_size_bytes,
         created_at=now,
         source_plan_id=source_plan_id,
         generation_model=image_client._model,
         prompt_hash=prompt_hash,
+        perceptual_hash=result.perceptual_hash,
     )
 
 
@@ -313,4 +300,5 @@ async def _generate_text(
         source_plan_id=source_plan_id,
         generation_model="pil",
         prompt_hash=prompt_hash,
+        perceptual_hash=result.perceptual_hash,
     )
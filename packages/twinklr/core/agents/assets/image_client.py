@@ -28,6 +28,7 @@ from openai import (
 from PIL import Image
 
 from twinklr.core.agents.assets.models import ImageResult
+from twinklr.core.agents.assets.perceptual_hash import compute_perceptual_hash
 from twinklr.core.sequencer.vocabulary import BackgroundMode
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,9 @@ def _process_image_bytes(
 ) -> ImageResult:
     """Decode, resize, hash, and write image bytes to disk.
 
+    The returned ImageResult describes the decoded image (size, alpha,
+    perceptual hash) so validation needs no second decode from disk.
+
     Pure CPU work — no I/O to external services. Safe to run in a thread
     or inline after an async API call.
 
@@ -105,12 +109,16 @@ def _process_image_bytes(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_bytes(image_bytes)
 
+    # Describe the in-memory image so callers never re-decode the file
+    actual_width, actual_height = img.size
     return ImageResult(
         file_path=str(output_path),
         content_hash=content_hash,
         file_size_bytes=len(image_bytes),
-        width=width,
-        height=height,
+        width=actual_width,
+        height=actual_height,
+        has_alpha=img.mode == "RGBA",
+        perceptual_hash=compute_perceptual_hash(img),
     )
 
 
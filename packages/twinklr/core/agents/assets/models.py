@@ -7,7 +7,7 @@ Defines the core data models for the asset creation pipeline:
 - EnrichedPrompt: LLM response model for prompt enrichment
 - ImageResult: Result from image/text generation
 - CatalogEntry: Provenance + reuse metadata for one generated asset
-- AssetCatalog: Persistent catalog of all generated assets
+- AssetCatalog: Persistent catalog of all generated assets (indexed lookups)
 """
 
 from __future__ import annotations
@@ -15,7 +15,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from twinklr.core.sequencer.vocabulary import BackgroundMode
 
@@ -191,6 +191,8 @@ class ImageResult(BaseModel):
         file_size_bytes: File size in bytes.
         width: Image width in pixels.
         height: Image height in pixels.
+        has_alpha: Whether the written image has an alpha channel.
+        perceptual_hash: Difference hash of the written image (see CatalogEntry).
     """
 
     model_config = ConfigDict(extra="forbid", frozen=True)
@@ -200,6 +202,8 @@ class ImageResult(BaseModel):
     file_size_bytes: int = Field(gt=0)
     width: int = Field(gt=0)
     height: int = Field(gt=0)
+    has_alpha: bool = False
+    perceptual_hash: str | None = None
 
 
 class CatalogEntry(BaseModel):
@@ -221,6 +225,8 @@ class CatalogEntry(BaseModel):
         source_plan_id: Which GroupPlanSet produced this.
         generation_model: Which image/text model was used.
         prompt_hash: SHA-256 of generation prompt (for exact-match cache).
+        perceptual_hash: 64-bit difference hash of the image (16 hex chars),
+            used to check the file is unchanged before similar-asset reuse.
         embedding: Future: prompt embedding for similarity search.
         error: Error message (only for FAILED status).
     """
@@ -249,17 +255,60 @@ class CatalogEntry(BaseModel):
 
     # Reuse
     prompt_hash: str
+    perceptual_hash: str | None = None
     embedding: list[float] | None = None
 
     # Error (FAILED only)
     error: str | None = None
 
 
+def _normalize_text(text: str | None) -> str:
+    return " ".join((text or "").lower().replace("_", " ").split())
+
+
+def similarity_key(spec: AssetSpec) -> str | None:
+    """Key grouping specs that describe the same visual subject.
+
+    Specs sharing a key may be satisfied by the same image: they match on
+    category, background, dimensions and palette, and on every field the
+    prompt enricher draws the subject from (motif or narrative subject,
+    narrative description, mood, color guidance, theme and tags). Per-song
+    context such as scene notes and song title is left out, so the same
+    subject planned for another song still matches.
+
+    Args:
+        spec: Asset spec.
+
+    Returns:
+        Similarity key, or None if the spec has no identifiable subject.
+    """
+    subject = spec.motif_id or spec.narrative_subject
+    if not subject:
+        return None
+    return "|".join(
+        [
+            spec.category.value,
+            spec.background.value,
+            f"{spec.width}x{spec.height}",
+            spec.palette_id or "",
+            spec.theme_id,
+            _normalize_text(subject),
+            _normalize_text(spec.narrative_description),
+            _normalize_text(spec.mood),
+            _normalize_text(spec.color_guidance),
+            ",".join(sorted(_normalize_text(t) for t in spec.content_tags)),
+            ",".join(sorted(_normalize_text(t) for t in spec.style_tags)),
+        ]
+    )
+
+
 class AssetCatalog(BaseModel):
     """Persistent catalog of all generated assets.
 
-    Accumulates across runs. Supports lookup by asset_id, motif_id,
-    and prompt_hash for exact-match reuse.
+    Accumulates across runs. Lookups by asset_id, motif_id, category,
+    prompt_hash, spec_id and similarity key go through
+    in-memory indexes that are built lazily and maintained by ``merge``.
+    The indexes are rebuilt if ``entries`` is replaced or resized directly.
 
     Attributes:
         schema_version: Catalog schema version.
@@ -273,6 +322,14 @@ class AssetCatalog(BaseModel):
     catalog_id: str = Field(min_length=1)
     entries: list[CatalogEntry] = Field(default_factory=list)
 
+    _index_state: tuple[int, int] | None = PrivateAttr(default=None)
+    _by_asset_id: dict[str, int] = PrivateAttr(default_factory=dict)
+    _by_motif: dict[str, list[int]] = PrivateAttr(default_factory=dict)
+    _by_category: dict[AssetCategory, list[int]] = PrivateAttr(default_factory=dict)
+    _by_prompt_hash: dict[str, list[int]] = PrivateAttr(default_factory=dict)
+    _by_spec_id: dict[str, list[int]] = PrivateAttr(default_factory=dict)
+    _by_similarity: dict[str, list[int]] = PrivateAttr(default_factory=dict)
+
     @property
     def total_created(self) -> int:
         """Count of entries with CREATED status."""
@@ -297,10 +354,9 @@ class AssetCatalog(BaseModel):
         Returns:
             CatalogEntry if found, None otherwise.
         """
-        for entry in self.entries:
-            if entry.asset_id == asset_id:
-                return entry
-        return None
+        self._ensure_index()
+        pos = self._by_asset_id.get(asset_id)
+        return None if pos is None else self.entries[pos]
 
     def find_by_motif(self, motif_id: str) -> list[CatalogEntry]:
         """Find all entries for a given motif.
@@ -311,7 +367,20 @@ class AssetCatalog(BaseModel):
         Returns:
             List of matching CatalogEntry objects.
         """
-        return [e for e in self.entries if e.spec.motif_id == motif_id]
+        self._ensure_index()
+        return [self.entries[i] for i in self._by_motif.get(motif_id, [])]
+
+    def find_by_category(self, category: AssetCategory) -> list[CatalogEntry]:
+        """Find all entries of a given category.
+
+        Args:
+            category: Asset category to search for.
+
+        Returns:
+            List of matching CatalogEntry objects.
+        """
+        self._ensure_index()
+        return [self.entries[i] for i in self._by_category.get(category, [])]
 
     def find_by_prompt_hash(self, prompt_hash: str) -> CatalogEntry | None:
         """Find entry by exact prompt hash (for cache reuse).
@@ -322,8 +391,10 @@ class AssetCatalog(BaseModel):
         Returns:
             First matching CatalogEntry, or None.
         """
-        for entry in self.entries:
-            if entry.prompt_hash == prompt_hash and entry.status != AssetStatus.FAILED:
+        self._ensure_index()
+        for i in self._by_prompt_hash.get(prompt_hash, []):
+            entry = self.entries[i]
+            if entry.status != AssetStatus.FAILED:
                 return entry
         return None
 
@@ -342,16 +413,36 @@ class AssetCatalog(BaseModel):
         Returns:
             First matching non-failed CatalogEntry, or None.
         """
-        for entry in self.entries:
+        self._ensure_index()
+        for i in self._by_spec_id.get(spec_id, []):
+            entry = self.entries[i]
             if (
-                entry.spec.spec_id == spec_id
-                and entry.spec.width == width
+                entry.spec.width == width
                 and entry.spec.height == height
                 and entry.status != AssetStatus.FAILED
             ):
                 return entry
         return None
 
+    def find_similar(self, spec: AssetSpec) -> list[CatalogEntry]:
+        """Find non-failed entries sharing the spec's similarity key.
+
+        Args:
+            spec: Spec to match.
+
+        Returns:
+            Candidate entries, most recently added first.
+        """
+        key = similarity_key(spec)
+        if key is None:
+            return []
+        self._ensure_index()
+        return [
+            self.entries[i]
+            for i in reversed(self._by_similarity.get(key, []))
+            if self.entries[i].status != AssetStatus.FAILED
+        ]
+
     def successful_entries(self) -> list[CatalogEntry]:
         """Return all non-failed entries (CREATED or CACHED).
 
@@ -366,13 +457,20 @@ class AssetCatalog(BaseModel):
         Args:
             new_entries: Entries to add or update.
         """
-        existing = {e.asset_id: i for i, e in enumerate(self.entries)}
+        self._ensure_index()
+        replaced = False
         for entry in new_entries:
-            if entry.asset_id in existing:
-                self.entries[existing[entry.asset_id]] = entry
+            pos = self._by_asset_id.get(entry.asset_id)
+            if pos is not None:
+                self.entries[pos] = entry
+                replaced = True
             else:
                 self.entries.append(entry)
-                existing[entry.asset_id] = len(self.entries) - 1
+                self._index_entry(len(self.entries) - 1, entry)
+        if replaced:
+            self._rebuild_index()
+        else:
+            self._index_state = (id(self.entries), len(self.entries))
 
     def build_index(self) -> dict[str, CatalogEntry]:
         """Build a fast-lookup index of successful entries by asset_id.
@@ -384,3 +482,30 @@ class AssetCatalog(BaseModel):
             Dict mapping asset_id → CatalogEntry for all successful entries.
         """
         return {e.asset_id: e for e in self.entries if e.status != AssetStatus.FAILED}
+
+    def _ensure_index(self) -> None:
+        if self._index_state != (id(self.entries), len(self.entries)):
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._by_asset_id = {}
+        self._by_motif = {}
+        self._by_category = {}
+        self._by_prompt_hash = {}
+        self._by_spec_id = {}
+        self._by_similarity = {}
+        for pos, entry in enumerate(self.entries):
+            self._index_entry(pos, entry)
+        self._index_state = (id(self.entries), len(self.entries))
+
+    def _index_entry(self, pos: int, entry: CatalogEntry) -> None:
+        # Last write wins for asset_id, matching merge's replace semantics
+        self._by_asset_id[entry.asset_id] = pos
+        if entry.spec.motif_id:
+            self._by_motif.setdefault(entry.spec.motif_id, []).append(pos)
+        self._by_category.setdefault(entry.spec.category, []).append(pos)
+        self._by_prompt_hash.setdefault(entry.prompt_hash, []).append(pos)
+        self._by_spec_id.setdefault(entry.spec.spec_id, []).append(pos)
+        key = similarity_key(entry.spec)
+        if key is not None:
+            self._by_similarity.setdefault(key, []).append(pos)
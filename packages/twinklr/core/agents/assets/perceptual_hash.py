@@ -0,0 +1,85 @@
+"""Perceptual hashing for checking cataloged asset files before reuse.
+
+Similar-asset reuse matches on the spec's normalized similarity key; the
+hash recorded at generation time only confirms that the file on disk is
+still the image the catalog describes (not overwritten or corrupted).
+
+Uses a 64-bit difference hash (dHash): the image is reduced to a 9x8
+grayscale thumbnail and each bit records whether a pixel is brighter than
+its right-hand neighbour. Visually equivalent images (re-encodes, resizes,
+small palette shifts) land within a few bits of each other, so the Hamming
+distance between hashes measures visual similarity.
+
+Transparent pixels are composited onto black before hashing so cutouts with
+the same silhouette hash alike regardless of hidden RGB values.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+HASH_BITS = 64
+
+# Default Hamming distance (out of 64 bits) treated as "visually equivalent".
+DEFAULT_MAX_DISTANCE = 6
+
+
+def compute_perceptual_hash(image: Image.Image) -> str:
+    """Compute the 64-bit difference hash of an image.
+
+    Args:
+        image: PIL image (any mode).
+
+    Returns:
+        16-character lowercase hex string.
+    """
+    if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+        rgba = image.convert("RGBA")
+        flattened = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
+        flattened.alpha_composite(rgba)
+        image = flattened
+
+    thumb = image.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+    pixels = list(thumb.getdata())
+
+    value = 0
+    for row in range(8):
+        offset = row * 9
+        for col in range(8):
+            value = (value << 1) | int(pixels[offset + col] > pixels[offset + col + 1])
+    return f"{value:016x}"
+
+
+def perceptual_hash_file(file_path: Path) -> str | None:
+    """Compute the perceptual hash of an image file.
+
+    Args:
+        file_path: Path to the image.
+
+    Returns:
+        Hex hash, or None if the file cannot be read as an image.
+    """
+    try:
+        with Image.open(file_path) as img:
+            return compute_perceptual_hash(img)
+    except Exception as e:
+        logger.debug("Perceptual hash failed for %s: %s", file_path, e)
+        return None
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """Number of differing bits between two hex hashes.
+
+    Args:
+        hash_a: First hex hash.
+        hash_b: Second hex hash.
+
+    Returns:
+        Hamming distance.
+    """
+    return (int(hash_a, 16) ^ int(hash_b, 16)).bit_count()
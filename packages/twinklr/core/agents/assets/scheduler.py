@@ -0,0 +1,123 @@
+"""Priority-ordered, per-backend bounded asset job scheduler.
+
+Runs asset generation jobs with a separate concurrency cap per backend
+(OpenAI image API vs local PIL text rendering), so slow image calls never
+starve cheap text renders and the image API is never flooded. Within a
+backend, jobs run in priority order (lower first) — the stage uses section
+render order, so assets for the opening sections are ready first.
+
+Each finished job is reported through ``on_complete`` as soon as it lands,
+which lets the stage persist progress to the catalog incrementally: an
+interrupted run resumes from the assets already recorded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+from twinklr.core.agents.assets.models import AssetSpec, CatalogEntry
+
+logger = logging.getLogger(__name__)
+
+IMAGE_BACKEND = "image"
+TEXT_BACKEND = "text"
+
+DEFAULT_CONCURRENCY: dict[str, int] = {IMAGE_BACKEND: 5, TEXT_BACKEND: 4}
+
+
+def backend_for(spec: AssetSpec) -> str:
+    """Generation backend a spec is routed to.
+
+    Args:
+        spec: Asset spec.
+
+    Returns:
+        IMAGE_BACKEND for image categories, TEXT_BACKEND otherwise.
+    """
+    return IMAGE_BACKEND if spec.category.is_image() else TEXT_BACKEND
+
+
+class AssetJobScheduler:
+    """Run asset generation jobs with per-backend caps and priority ordering.
+
+    Args:
+        concurrency: Maximum concurrent jobs per backend. Missing backends
+            fall back to DEFAULT_CONCURRENCY (and 1 for unknown backends).
+        on_complete: Optional callback invoked with each finished entry,
+            in completion order.
+
+    Example:
+        >>> scheduler = AssetJobScheduler(concurrency={"image": 3})
+        >>> entries = await scheduler.run(specs, generate, priority=section_rank)
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: Mapping[str, int] | None = None,
+        on_complete: Callable[[CatalogEntry], None] | None = None,
+    ) -> None:
+        self._concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self._on_complete = on_complete
+
+    async def run(
+        self,
+        specs: Sequence[AssetSpec],
+        generate: Callable[[AssetSpec], Awaitable[CatalogEntry]],
+        *,
+        priority: Callable[[AssetSpec], int] | None = None,
+    ) -> list[CatalogEntry]:
+        """Generate all specs and return their entries in input order.
+
+        Args:
+            specs: Specs to generate.
+            generate: Coroutine producing the CatalogEntry for one spec.
+                Expected to report failures as FAILED entries; exceptions
+                propagate and cancel the remaining jobs.
+            priority: Rank for a spec (lower runs first). Ties keep input order.
+
+        Returns:
+            One CatalogEntry per spec, in the order of ``specs``.
+        """
+        if not specs:
+            return []
+
+        queues: dict[str, asyncio.PriorityQueue[tuple[int, int, AssetSpec]]] = {}
+        for index, spec in enumerate(specs):
+            rank = priority(spec) if priority is not None else 0
+            queue = queues.setdefault(backend_for(spec), asyncio.PriorityQueue())
+            queue.put_nowait((rank, index, spec))
+
+        results: list[CatalogEntry | None] = [None] * len(specs)
+
+        async def _worker(queue: asyncio.PriorityQueue[tuple[int, int, AssetSpec]]) -> None:
+            while True:
+                try:
+                    _rank, index, spec = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                entry = await generate(spec)
+                results[index] = entry
+                if self._on_complete is not None:
+                    self._on_complete(entry)
+
+        workers: list[asyncio.Task[None]] = []
+        for backend, queue in queues.items():
+            cap = max(1, self._concurrency.get(backend, 1))
+            n_workers = min(cap, queue.qsize())
+            logger.debug("Scheduling %d %s jobs on %d workers", queue.qsize(), backend, n_workers)
+            workers.extend(asyncio.create_task(_worker(queue)) for _ in range(n_workers))
+
+        try:
+            done, _pending = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            # First failure (or our own cancellation): stop sibling workers so
+            # no further jobs are generated or reported after run() exits.
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return [entry for entry in results if entry is not None]
@@ -14,10 +14,10 @@ from typing import Any
 
 from twinklr.core.agents._paths import AGENTS_BASE_PATH
 from twinklr.core.agents.assets.catalog import (
+    AssetCatalogStore,
     check_reuse,
     check_reuse_by_spec_id,
-    load_catalog,
-    save_catalog,
+    check_reuse_similar,
 )
 from twinklr.core.agents.assets.generator import generate_asset
 from twinklr.core.agents.assets.image_client import OpenAIImageClient
@@ -31,6 +31,7 @@ from twinklr.core.agents.assets.prompt_enricher import (
     enrich_spec,
 )
 from twinklr.core.agents.assets.request_extractor import extract_asset_specs
+from twinklr.core.agents.assets.scheduler import AssetJobScheduler
 from twinklr.core.agents.assets.text_renderer import TextRenderer
 from twinklr.core.agents.async_runner import AsyncAgentRunner
 from twinklr.core.agents.audio.lyrics.models import LyricContextModel
@@ -65,13 +66,17 @@ class AssetCreationStage:
         self,
         *,
         text_renderer: TextRenderer | None = None,
+        concurrency: dict[str, int] | None = None,
     ) -> None:
         """Initialize asset creation stage.
 
         Args:
             text_renderer: Optional custom text renderer. Defaults to TextRenderer().
+            concurrency: Per-backend job caps ("image", "text"). Defaults to
+                the scheduler's DEFAULT_CONCURRENCY.
         """
         self._text_renderer = text_renderer or TextRenderer()
+        self._concurrency = concurrency
 
     @property
     def name(self) -> str:
@@ -106,10 +111,13 @@ class AssetCreationStage:
 
             # Determine output paths
             assets_dir = self._resolve_assets_dir(context)
-            catalog_path = assets_dir / "asset_catalog.json"
+            catalog_store = AssetCatalogStore(
+                assets_dir / "asset_catalog.jsonl",
+                legacy_path=assets_dir / "asset_catalog.json",
+            )
 
             # Load existing catalog for reuse checking
-            catalog = load_catalog(catalog_path)
+            catalog = catalog_store.load()
             source_plan_id = plan_set.plan_set_id
 
             # Step 1: Extract specs
@@ -120,6 +128,7 @@ class AssetCreationStage:
             # Step 2: Check reuse, separate cached vs new
             new_specs = []
             cached_entries: list[CatalogEntry] = []
+            similar_hits = 0
 
             for spec in specs:
                 # Text specs: check reuse by prompt_hash (prompt is deterministic)
@@ -138,15 +147,71 @@ class AssetCreationStage:
                         cached_entry = existing.model_copy(update={"status": AssetStatus.CACHED})
                         cached_entries.append(cached_entry)
                         continue
+                    # No exact match: a visually equivalent image of the same
+                    # subject (e.g. from another song) satisfies the spec.
+                    similar = await asyncio.to_thread(check_reuse_similar, catalog, spec)
+                    if similar:
+                        cached_entry = similar.model_copy(
+                            update={
+                                "asset_id": spec.spec_id,
+                                "spec": spec,
+                                "status": AssetStatus.CACHED,
+                            }
+                        )
+                        cached_entries.append(cached_entry)
+                        similar_hits += 1
+                        continue
                 new_specs.append(spec)
 
             logger.info(
-                "%d specs to generate, %d cached",
+                "%d specs to generate, %d cached (%d by visual similarity)",
                 len(new_specs),
                 len(cached_entries),
+                similar_hits,
+            )
+            context.add_metric("assets_reused_similar", similar_hits)
+
+            # Generation is scheduled per backend in section render order.
+            # Each finished asset is merged and appended to the catalog log
+            # immediately, so an interrupted run resumes where it stopped.
+            section_rank = {sp.section_id: i for i, sp in enumerate(plan_set.section_plans)}
+            image_client = self._build_image_client(context)
+            new_entries: list[CatalogEntry] = []
+
+            def _record(entry: CatalogEntry) -> None:
+                new_entries.append(entry)
+                catalog.merge([entry])
+                catalog_store.append(entry)
+
+            scheduler = AssetJobScheduler(
+                concurrency=self._concurrency,
+                on_complete=_record,
+            )
+
+            def _priority(spec: AssetSpec) -> int:
+                return min(
+                    (section_rank.get(sid, len(section_rank)) for sid in spec.section_ids),
+                    default=len(section_rank),
+                )
+
+            async def _generate_one(spec: AssetSpec) -> CatalogEntry:
+                return await generate_asset(
+                    spec,
+                    assets_dir,
+                    image_client=image_client,
+                    text_renderer=self._text_renderer,
+                    source_plan_id=source_plan_id,
+                )
+
+            image_specs_to_enrich = [s for s in new_specs if s.category.is_image()]
+            non_image_specs = [s for s in new_specs if not s.category.is_image()]
+
+            # Step 3: Local (text) renders run while image prompts are enriched
+            text_jobs = asyncio.create_task(
+                scheduler.run(non_image_specs, _generate_one, priority=_priority)
             )
 
-            # Step 3: Enrich image specs via LLM (concurrent)
+            # Step 4: Enrich image specs via LLM (concurrent)
             enricher_agent_spec = build_enricher_spec()
             runner = AsyncAgentRunner(
                 provider=context.provider,
@@ -155,8 +220,6 @@ class AssetCreationStage:
             )
 
             enrichment_sem = asyncio.Semaphore(5)
-            image_specs_to_enrich = [s for s in new_specs if s.category.is_image()]
-            non_image_specs = [s for s in new_specs if not s.category.is_image()]
 
             async def _enrich_one(spec: AssetSpec) -> AssetSpec:
                 async with enrichment_sem:
@@ -177,9 +240,13 @@ class AssetCreationStage:
                         motif_usage_notes=motif_notes,
                     )
 
-            enriched_images = list(
-                await asyncio.gather(*[_enrich_one(s) for s in image_specs_to_enrich])
-            )
+            try:
+                enriched_images = list(
+                    await asyncio.gather(*[_enrich_one(s) for s in image_specs_to_enrich])
+                )
+            except BaseException:
+                text_jobs.cancel()
+                raise
 
             # Check reuse with enriched prompts
             enriched_specs: list[AssetSpec] = []
@@ -190,30 +257,20 @@ class AssetCreationStage:
                     cached_entries.append(cached_entry)
                 else:
                     enriched_specs.append(enriched)
-            enriched_specs.extend(non_image_specs)
 
-            # Step 4: Generate assets (concurrent)
-            image_client = self._build_image_client(context)
-            generation_sem = asyncio.Semaphore(5)
+            # Step 5: Generate images (bounded, priority ordered)
+            try:
+                await scheduler.run(enriched_specs, _generate_one, priority=_priority)
+                await text_jobs
+            except BaseException:
+                text_jobs.cancel()
+                raise
 
-            async def _generate_one(spec: AssetSpec) -> CatalogEntry:
-                async with generation_sem:
-                    return await generate_asset(
-                        spec,
-                        assets_dir,
-                        image_client=image_client,
-                        text_renderer=self._text_renderer,
-                        source_plan_id=source_plan_id,
-                    )
-
-            new_entries = list(await asyncio.gather(*[_generate_one(s) for s in enriched_specs]))
-
-            # Step 5: Merge into catalog
+            # Step 6: Merge reused entries and save catalog
+            # (appends only new/changed entries, compacting if needed)
             all_entries = cached_entries + new_entries
-            catalog.merge(all_entries)
-
-            # Step 6: Save catalog
-            save_catalog(catalog, catalog_path)
+            catalog.merge(cached_entries)
+            catalog_store.save(catalog)
 
             # Metrics
             created = sum(1 for e in all_entries if e.status == AssetStatus.CREATED)
@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from io import BytesIO
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
 from twinklr.core.agents.assets.models import AssetSpec, ImageResult
+from twinklr.core.agents.assets.perceptual_hash import compute_perceptual_hash
 
 logger = logging.getLogger(__name__)
 
@@ -91,20 +93,23 @@ class TextRenderer:
         # Draw text
         draw.text((x, y), text, fill=color, font=font)
 
-        # Save
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        image.save(str(output_path), "PNG")
-
-        # Hash
-        file_bytes = output_path.read_bytes()
+        # Encode once in memory, then hash and write the same bytes
+        buf = BytesIO()
+        image.save(buf, "PNG")
+        file_bytes = buf.getvalue()
         content_hash = hashlib.sha256(file_bytes).hexdigest()
 
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(file_bytes)
+
         return ImageResult(
             file_path=str(output_path),
             content_hash=content_hash,
             file_size_bytes=len(file_bytes),
             width=width,
             height=height,
+            has_alpha=True,
+            perceptual_hash=compute_perceptual_hash(image),
         )
 
     def _auto_size_font(
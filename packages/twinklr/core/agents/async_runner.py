@@ -11,7 +11,7 @@ from pydantic import ValidationError
 
 from twinklr.core.agents.logging import LLMCallLogger, NullLLMCallLogger
 from twinklr.core.agents.prompts import PromptPackLoader
-from twinklr.core.agents.providers.base import LLMProvider
+from twinklr.core.agents.providers.base import CACHE_BREAKPOINT_KEY, LLMProvider
 from twinklr.core.agents.providers.conversation import generate_conversation_id
 from twinklr.core.agents.providers.errors import LLMProviderError
 from twinklr.core.agents.result import AgentResult
@@ -138,7 +138,12 @@ class AsyncAgentRunner:
             )
 
             # Build result
-            metadata: dict[str, Any] = {"schema_repair_attempts": repair_attempts}
+            metadata: dict[str, Any] = {
+                "schema_repair_attempts": repair_attempts,
+                "cached_prompt_tokens": (
+                    end_usage.cached_prompt_tokens - start_usage.cached_prompt_tokens
+                ),
+            }
             if state and state.conversation_id:
                 metadata["conversation_id"] = state.conversation_id
 
@@ -203,24 +208,53 @@ class AsyncAgentRunner:
     def _build_messages(self, prompts: dict[str, Any], spec: AgentSpec) -> list[dict[str, str]]:
         """Build message list for LLM provider.
 
+        Messages are laid out as a static prefix followed by a volatile
+        suffix so providers can cache the prefix across judge iterations and
+        sections:
+
+        - developer: schema, taxonomy (static for the agent)
+        - system: rules (static per section)
+        - examples, context: few-shot messages and per-section reference
+          material such as catalogs and graph summaries
+        - user: per-iteration content (plan, feedback)
+
+        The developer, system and last static message carry
+        ``CACHE_BREAKPOINT_KEY``; providers translate or strip it.
+        Conversational agents only send the latest user message per turn, so
+        their context is appended to the system prompt instead.
+
         Args:
-            prompts: Rendered prompts (system, developer, user, examples)
+            prompts: Rendered prompts (system, developer, context, user, examples)
             spec: Agent specification
 
         Returns:
             List of message dicts
         """
-        messages = []
+        messages: list[dict[str, str]] = []
 
         if "developer" in prompts:
-            messages.append({"role": "developer", "content": prompts["developer"]})
+            messages.append(
+                {"role": "developer", "content": prompts["developer"], CACHE_BREAKPOINT_KEY: "1"}
+            )
+
+        context = prompts.get("context")
+        conversational = spec.mode == AgentMode.CONVERSATIONAL
 
         if "system" in prompts:
-            messages.append({"role": "system", "content": prompts["system"]})
+            system = prompts["system"]
+            if context and conversational:
+                system = f"{system}\n\n{context}"
+            messages.append({"role": "system", "content": system, CACHE_BREAKPOINT_KEY: "1"})
 
         if "examples" in prompts:
             messages.extend(prompts["examples"])
 
+        if context and not conversational:
+            messages.append({"role": "user", "content": context})
+
+        if messages and CACHE_BREAKPOINT_KEY not in messages[-1]:
+            messages[-1] = {**messages[-1], CACHE_BREAKPOINT_KEY: "1"}
+
         if "user" in prompts:
             messages.append({"role": "user", "content": prompts["user"]})
 
@@ -261,6 +295,7 @@ class AsyncAgentRunner:
         summary["prompt_sizes"] = {
             "system_chars": len(prompts.get("system") or ""),
             "developer_chars": len(prompts.get("developer") or ""),
+            "context_chars": len(prompts.get("context") or ""),
             "user_chars": len(prompts.get("user") or ""),
             "examples_count": len(prompts.get("examples") or []),
         }
@@ -542,6 +577,7 @@ class AsyncAgentRunner:
             tokens_used = end_usage.total_tokens - start_usage.total_tokens
             prompt_tokens = end_usage.prompt_tokens - start_usage.prompt_tokens
             completion_tokens = end_usage.completion_tokens - start_usage.completion_tokens
+            cached_prompt_tokens = end_usage.cached_prompt_tokens - start_usage.cached_prompt_tokens
 
             await self.llm_logger.complete_call_async(
                 call_id=call_id,
@@ -554,6 +590,7 @@ class AsyncAgentRunner:
                 duration_seconds=duration,
                 success=success,
                 repair_attempts=repair_attempts,
+                cached_prompt_tokens=cached_prompt_tokens,
             )
         except Exception as e:
             logger.warning(f"Failed to log call completion: {e}")
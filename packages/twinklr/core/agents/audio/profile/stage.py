@@ -84,6 +84,7 @@ class AudioProfileStage:
                 result_type=AudioProfileModel,
                 cache_key_fn=lambda: orchestrator.get_cache_key(input),
                 cache_version="1",
+                session_scoped=False,  # Same audio bundle → same profile
                 state_handler=self._handle_state,
             )
 
@@ -16,6 +16,14 @@ Example:
     # For testing: use null logger
     logger = NullLLMCallLogger()
 
+    # Batched gzip segments instead of one file per call
+    logger = create_llm_logger(
+        output_dir=Path("artifacts"),
+        session_id="abc123",
+        storage="segments",
+        retention_max_bytes=2 * 1024**3,
+    )
+
     # Using factory (recommended):
     from twinklr.core.agents.logging import create_llm_logger
     logger = create_llm_logger(
@@ -34,6 +42,12 @@ from twinklr.core.agents.logging.async_file_logger import AsyncFileLogger
 from twinklr.core.agents.logging.models import AgentCallSummary, CallSummary, LLMCallLog
 from twinklr.core.agents.logging.null_logger import NullLLMCallLogger
 from twinklr.core.agents.logging.protocol import LLMCallLogger
+from twinklr.core.agents.logging.segment_logger import (
+    SegmentedLLMLogger,
+    export_call_files,
+    prune_segments,
+    read_call_logs,
+)
 
 
 def create_llm_logger(
@@ -44,18 +58,26 @@ def create_llm_logger(
     log_level: str = "standard",
     format: str = "json",
     sanitize: bool = True,
+    storage: str = "files",
+    segment_max_bytes: int = 16 * 1024 * 1024,
+    retention_max_age_days: float | None = None,
+    retention_max_bytes: int | None = None,
+    queue_size: int = 1000,
+    queue_full_policy: str = "drop",
 ) -> LLMCallLogger:
     """Factory function to create an LLM call logger.
 
     Creates the appropriate logger implementation based on configuration.
     Respects environment variable overrides.
 
-    Log directory structure: <output_dir>/<agent>/<session_id>/<step_iteration>.json
+    Log directory structure: <output_dir>/<agent>/<session_id>/<step_iteration>.json,
+    or <output_dir>/segments/<session_id>/calls-NNNNNN.jsonl.gz with storage="segments".
 
     Environment Variables:
         TWINKLR_DISABLE_LLM_LOGGING: Set to "1" or "true" to disable logging
         TWINKLR_LLM_LOG_LEVEL: Override log level ("minimal", "standard", "full")
         TWINKLR_LLM_LOG_FORMAT: Override format ("yaml", "json")
+        TWINKLR_LLM_LOG_STORAGE: Override storage ("files", "segments")
 
     Args:
         enabled: Enable LLM call logging (False returns NullLLMCallLogger)
@@ -65,9 +87,16 @@ def create_llm_logger(
         log_level: Detail level ("minimal", "standard", "full")
         format: Output format ("yaml", "json")
         sanitize: Sanitize sensitive data from logs
+        storage: "files" (one file per call) or "segments" (batched gzip JSON-lines)
+        segment_max_bytes: Segment rotation size (segments only)
+        retention_max_age_days: Delete older segments (segments only)
+        retention_max_bytes: Cap on total segment size (segments only)
+        queue_size: Maximum queued call logs (segments only)
+        queue_full_policy: "drop" or "block" when the queue is full (segments only)
 
     Returns:
-        LLMCallLogger implementation (AsyncFileLogger or NullLLMCallLogger)
+        LLMCallLogger implementation (AsyncFileLogger, SegmentedLLMLogger or
+        NullLLMCallLogger)
 
     Example:
         # Basic usage
@@ -100,6 +129,10 @@ def create_llm_logger(
     if env_format and env_format in ("yaml", "json"):
         format = env_format
 
+    env_storage = os.environ.get("TWINKLR_LLM_LOG_STORAGE")
+    if env_storage and env_storage in ("files", "segments"):
+        storage = env_storage
+
     # Return NullLogger if disabled
     if not enabled:
         return NullLLMCallLogger()
@@ -115,6 +148,20 @@ def create_llm_logger(
     if output_dir is None:
         output_dir = Path("artifacts")
 
+    if storage == "segments":
+        return SegmentedLLMLogger(
+            output_dir=Path(output_dir),
+            run_id=effective_session_id,
+            session_id=effective_session_id,
+            log_level=log_level,
+            sanitize=sanitize,
+            segment_max_bytes=segment_max_bytes,
+            max_age_days=retention_max_age_days,
+            max_total_bytes=retention_max_bytes,
+            queue_size=queue_size,
+            queue_full_policy="block" if queue_full_policy == "block" else "drop",
+        )
+
     # Create and return AsyncFileLogger
     return AsyncFileLogger(
         output_dir=Path(output_dir),
@@ -131,9 +178,14 @@ __all__ = [
     "LLMCallLogger",
     # Implementations
     "AsyncFileLogger",
+    "SegmentedLLMLogger",
     "NullLLMCallLogger",
     # Factory
     "create_llm_logger",
+    # Segment readers / retention
+    "read_call_logs",
+    "export_call_files",
+    "prune_segments",
     # Models
     "LLMCallLog",
     "CallSummary",
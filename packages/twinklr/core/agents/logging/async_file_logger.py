@@ -27,6 +27,142 @@ logging.addLevelName(TRACE, "TRACE")
 
 _logger = logging.getLogger(__name__)
 
+# Errors kept in the run summary
+_MAX_SUMMARY_ERRORS = 10
+
+
+def call_log_filename(iteration: int | None, call_num: int, run_id: str | None, ext: str) -> str:
+    """Filename of one call's log file within ``<agent>/<session_id>/``.
+
+    Args:
+        iteration: Iteration number
+        call_num: Per-agent call counter
+        run_id: Optional run identifier (sanitized into a suffix)
+        ext: File extension ("yaml", "json")
+
+    Returns:
+        Filename such as ``iter_01_call_003_run_abc.json``
+    """
+    run_id_suffix = ""
+    if run_id:
+        safe_run_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(run_id))[:48]
+        run_id_suffix = f"_run_{safe_run_id}"
+    return f"iter_{iteration or 0:02d}_call_{call_num:03d}{run_id_suffix}.{ext}"
+
+
+def render_log_document(data: dict[str, Any], format: str) -> str:
+    """Render a log or summary dict as a YAML or JSON document."""
+    if format == "yaml":
+        return "---\n" + yaml.dump(
+            data, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
+    return json.dumps(data, indent=2, default=str)
+
+
+class CallSummaryAccumulator:
+    """Running totals for a run's CallSummary.
+
+    Updated once per completed call so the summary can be rewritten at any
+    time without revisiting earlier calls.
+    """
+
+    def __init__(self) -> None:
+        self.total_calls = 0
+        self.successful_calls = 0
+        self.total_tokens = 0
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+        self.total_cached_prompt_tokens = 0
+        self.total_duration = 0.0
+        self.max_iteration = 0
+        self.agent_stats: dict[str, dict[str, Any]] = {}
+        self.errors: list[str] = []
+
+    def add(self, log: LLMCallLog) -> None:
+        """Fold one completed call into the totals."""
+        self.total_calls += 1
+        self.successful_calls += int(log.success)
+        self.total_tokens += log.tokens_used
+        self.total_prompt_tokens += log.prompt_tokens
+        self.total_completion_tokens += log.completion_tokens
+        self.total_cached_prompt_tokens += log.cached_prompt_tokens
+        self.total_duration += log.duration_seconds
+        self.max_iteration = max(self.max_iteration, log.iteration or 0)
+
+        stats = self.agent_stats.setdefault(
+            log.agent_name,
+            {
+                "total_calls": 0,
+                "successful_calls": 0,
+                "failed_calls": 0,
+                "total_tokens": 0,
+                "total_duration": 0.0,
+                "repair_attempts": 0,
+            },
+        )
+        stats["total_calls"] += 1
+        if log.success:
+            stats["successful_calls"] += 1
+        else:
+            stats["failed_calls"] += 1
+        stats["total_tokens"] += log.tokens_used
+        stats["total_duration"] += log.duration_seconds
+        stats["repair_attempts"] += log.repair_attempts
+
+        room = _MAX_SUMMARY_ERRORS - len(self.errors)
+        if room > 0 and log.validation_errors:
+            self.errors.extend(log.validation_errors[:room])
+
+    def build(self, run_id: str, log_level: str, format: str) -> CallSummary:
+        """Build the summary for the calls seen so far."""
+        failed_calls = self.total_calls - self.successful_calls
+        agent_summaries = [
+            AgentCallSummary(
+                agent_name=agent_name,
+                total_calls=stats["total_calls"],
+                successful_calls=stats["successful_calls"],
+                failed_calls=stats["failed_calls"],
+                total_tokens=stats["total_tokens"],
+                total_duration_seconds=round(stats["total_duration"], 2),
+                avg_tokens_per_call=(
+                    stats["total_tokens"] / stats["total_calls"] if stats["total_calls"] > 0 else 0
+                ),
+                avg_duration_seconds=(
+                    stats["total_duration"] / stats["total_calls"]
+                    if stats["total_calls"] > 0
+                    else 0
+                ),
+                repair_attempts=stats["repair_attempts"],
+            )
+            for agent_name, stats in self.agent_stats.items()
+        ]
+
+        # Determine status
+        if failed_calls == 0:
+            status = "succeeded"
+        elif self.successful_calls == 0:
+            status = "failed"
+        else:
+            status = "partial"
+
+        return CallSummary(
+            run_id=run_id,
+            status=status,
+            iterations=self.max_iteration,
+            total_calls=self.total_calls,
+            successful_calls=self.successful_calls,
+            failed_calls=failed_calls,
+            total_tokens=self.total_tokens,
+            total_prompt_tokens=self.total_prompt_tokens,
+            total_completion_tokens=self.total_completion_tokens,
+            total_cached_prompt_tokens=self.total_cached_prompt_tokens,
+            total_duration_seconds=round(self.total_duration, 2),
+            agents=agent_summaries,
+            errors=list(self.errors),
+            log_level=log_level,
+            format=format,
+        )
+
 
 class AsyncFileLogger:
     """Async file-based LLM call logger.
@@ -86,7 +222,7 @@ class AsyncFileLogger:
         # Counters and buffers
         self.call_counters: dict[str, int] = {}
         self.pending_logs: dict[str, dict[str, Any]] = {}
-        self.completed_logs: list[LLMCallLog] = []
+        self.summary = CallSummaryAccumulator()
 
         # Async lock for thread-safe operations
         self._lock = asyncio.Lock()
@@ -168,6 +304,7 @@ class AsyncFileLogger:
             temperature=temperature,
             system_prompt=prompts.get("system"),
             developer_prompt=prompts.get("developer"),
+            context_prompt=prompts.get("context"),
             user_prompt=prompts.get("user", ""),
             examples=prompts.get("examples", []),
             context_summary=self._format_context_summary(context),
@@ -202,6 +339,7 @@ class AsyncFileLogger:
         duration_seconds: float,
         success: bool,
         repair_attempts: int,
+        cached_prompt_tokens: int = 0,
     ) -> None:
         """Log the completion of an LLM call (async).
 
@@ -219,6 +357,7 @@ class AsyncFileLogger:
             duration_seconds: Call duration
             success: Whether successful
             repair_attempts: Schema repair attempts
+            cached_prompt_tokens: Prompt tokens served from the prefix cache
         """
         async with self._lock:
             pending = self.pending_logs.get(call_id)
@@ -240,6 +379,7 @@ class AsyncFileLogger:
         log_entry.tokens_used = tokens_used
         log_entry.prompt_tokens = prompt_tokens
         log_entry.completion_tokens = completion_tokens
+        log_entry.cached_prompt_tokens = cached_prompt_tokens
         log_entry.duration_seconds = round(duration_seconds, 3)
         log_entry.success = success
         log_entry.repair_attempts = repair_attempts
@@ -258,7 +398,7 @@ class AsyncFileLogger:
 
         # Move to completed
         async with self._lock:
-            self.completed_logs.append(log_entry)
+            self.summary.add(log_entry)
             del self.pending_logs[call_id]
 
     async def flush_async(self) -> None:
@@ -284,137 +424,28 @@ class AsyncFileLogger:
         agent_dir = self.log_dir / agent_name / self.session_id
         agent_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate filename
-        ext = self.format
-        run_id_suffix = ""
-        if log_entry.run_id:
-            safe_run_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(log_entry.run_id))[:48]
-            run_id_suffix = f"_run_{safe_run_id}"
-        filename = f"iter_{iteration or 0:02d}_call_{call_num:03d}{run_id_suffix}.{ext}"
+        filename = call_log_filename(iteration, call_num, log_entry.run_id, self.format)
         filepath = agent_dir / filename
 
         # Convert to dict
         log_dict = log_entry.model_dump(exclude_none=True, mode="json")
 
-        # Write based on format
-        if self.format == "yaml":
-            async with aiofiles.open(filepath, "w") as f:
-                await f.write("---\n")
-                await f.write(
-                    yaml.dump(
-                        log_dict, default_flow_style=False, sort_keys=False, allow_unicode=True
-                    )
-                )
-
-        elif self.format == "json":
-            async with aiofiles.open(filepath, "w") as f:
-                await f.write(json.dumps(log_dict, indent=2, default=str))
+        async with aiofiles.open(filepath, "w") as f:
+            await f.write(render_log_document(log_dict, self.format))
 
     async def _write_summary_async(self) -> None:
         """Write summary file (async)."""
-        if not self.completed_logs:
+        if not self.summary.total_calls:
             return
 
-        # Aggregate metrics
-        total_calls = len(self.completed_logs)
-        successful_calls = sum(1 for log in self.completed_logs if log.success)
-        failed_calls = total_calls - successful_calls
-        total_tokens = sum(log.tokens_used for log in self.completed_logs)
-        total_prompt_tokens = sum(log.prompt_tokens for log in self.completed_logs)
-        total_completion_tokens = sum(log.completion_tokens for log in self.completed_logs)
-        total_duration = sum(log.duration_seconds for log in self.completed_logs)
-        max_iteration = max((log.iteration or 0) for log in self.completed_logs)
-
-        # Build per-agent summaries
-        agent_stats: dict[str, dict[str, Any]] = {}
-        for log in self.completed_logs:
-            if log.agent_name not in agent_stats:
-                agent_stats[log.agent_name] = {
-                    "total_calls": 0,
-                    "successful_calls": 0,
-                    "failed_calls": 0,
-                    "total_tokens": 0,
-                    "total_duration": 0.0,
-                    "repair_attempts": 0,
-                }
-            stats = agent_stats[log.agent_name]
-            stats["total_calls"] += 1
-            if log.success:
-                stats["successful_calls"] += 1
-            else:
-                stats["failed_calls"] += 1
-            stats["total_tokens"] += log.tokens_used
-            stats["total_duration"] += log.duration_seconds
-            stats["repair_attempts"] += log.repair_attempts
-
-        agent_summaries = [
-            AgentCallSummary(
-                agent_name=agent_name,
-                total_calls=stats["total_calls"],
-                successful_calls=stats["successful_calls"],
-                failed_calls=stats["failed_calls"],
-                total_tokens=stats["total_tokens"],
-                total_duration_seconds=round(stats["total_duration"], 2),
-                avg_tokens_per_call=(
-                    stats["total_tokens"] / stats["total_calls"] if stats["total_calls"] > 0 else 0
-                ),
-                avg_duration_seconds=(
-                    stats["total_duration"] / stats["total_calls"]
-                    if stats["total_calls"] > 0
-                    else 0
-                ),
-                repair_attempts=stats["repair_attempts"],
-            )
-            for agent_name, stats in agent_stats.items()
-        ]
-
-        # Collect errors
-        errors = []
-        for log in self.completed_logs:
-            if log.validation_errors:
-                errors.extend(log.validation_errors)
-
-        # Determine status
-        if failed_calls == 0:
-            status = "succeeded"
-        elif successful_calls == 0:
-            status = "failed"
-        else:
-            status = "partial"
-
-        # Build summary
-        summary = CallSummary(
-            run_id=self.run_id,
-            status=status,
-            iterations=max_iteration,
-            total_calls=total_calls,
-            successful_calls=successful_calls,
-            failed_calls=failed_calls,
-            total_tokens=total_tokens,
-            total_prompt_tokens=total_prompt_tokens,
-            total_completion_tokens=total_completion_tokens,
-            total_duration_seconds=round(total_duration, 2),
-            agents=agent_summaries,
-            errors=errors[:10],  # Limit to first 10 errors
-            log_level=self.log_level,
-            format=self.format,
-        )
+        summary = self.summary.build(self.run_id, self.log_level, self.format)
 
         # Write summary per session: <output_dir>/summary_<session_id>.{format}
         summary_path = self.log_dir / f"summary_{self.session_id}.{self.format}"
         summary_dict = summary.model_dump(exclude_none=True, mode="json")
 
-        if self.format == "yaml":
-            async with aiofiles.open(summary_path, "w") as f:
-                await f.write("---\n")
-                await f.write(
-                    yaml.dump(
-                        summary_dict, default_flow_style=False, sort_keys=False, allow_unicode=True
-                    )
-                )
-        elif self.format == "json":
-            async with aiofiles.open(summary_path, "w") as f:
-                await f.write(json.dumps(summary_dict, indent=2, default=str))
+        async with aiofiles.open(summary_path, "w") as f:
+            await f.write(render_log_document(summary_dict, self.format))
 
     def _format_context_summary(self, context: dict[str, Any]) -> str:
         """Format context summary for logging."""
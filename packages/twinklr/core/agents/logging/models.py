@@ -29,6 +29,7 @@ class LLMCallLog(BaseModel):
     # Prompts
     system_prompt: str | None = None
     developer_prompt: str | None = None
+    context_prompt: str | None = None
     user_prompt: str = ""
     examples: list[dict[str, str]] = Field(default_factory=list)
 
@@ -49,6 +50,7 @@ class LLMCallLog(BaseModel):
     tokens_used: int = 0
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Subset of prompt_tokens served from prefix cache
     duration_seconds: float = 0.0
 
     # Status (set on completion)
@@ -96,6 +98,7 @@ class CallSummary(BaseModel):
     total_tokens: int = 0
     total_prompt_tokens: int = 0
     total_completion_tokens: int = 0
+    total_cached_prompt_tokens: int = 0
     total_duration_seconds: float = 0.0
 
     # Per-agent breakdown
@@ -65,6 +65,7 @@ class NullLLMCallLogger:
         duration_seconds: float,
         success: bool,
         repair_attempts: int,
+        cached_prompt_tokens: int = 0,
     ) -> None:
         """No-op completion (async).
 
@@ -79,6 +80,7 @@ class NullLLMCallLogger:
             duration_seconds: Ignored
             success: Ignored
             repair_attempts: Ignored
+            cached_prompt_tokens: Ignored
         """
 
     async def flush_async(self) -> None:
@@ -83,6 +83,7 @@ class LLMCallLogger(Protocol):
         duration_seconds: float,
         success: bool,
         repair_attempts: int,
+        cached_prompt_tokens: int = 0,
     ) -> None:
         """Log the completion of an LLM call (async).
 
@@ -100,6 +101,7 @@ class LLMCallLogger(Protocol):
             duration_seconds: Total call duration
             success: Whether the call was successful
             repair_attempts: Number of schema repair attempts
+            cached_prompt_tokens: Prompt tokens served from the provider's prefix cache
         """
         ...
 
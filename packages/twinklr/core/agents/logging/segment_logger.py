@@ -0,0 +1,414 @@
+"""Batched LLM call logger writing compressed JSON-lines segments.
+
+Instead of one file per call, completed calls are queued to a single
+background writer task that appends them in batches to gzip-compressed
+JSON-lines segments:
+
+    <output_dir>/segments/<session_id>/calls-000001.jsonl.gz
+
+Each batch is one gzip member, so a segment stays readable up to its last
+complete batch even if the process dies mid-write. Segments rotate at
+``segment_max_bytes`` and old ones are pruned by age and total size. The
+run summary is maintained incrementally and rewritten on flush.
+
+``read_call_logs`` and ``export_call_files`` reconstruct per-call views
+(the AsyncFileLogger file layout) from the segments.
+"""
+
+import asyncio
+import atexit
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from twinklr.core.agents.logging.async_file_logger import (
+    AsyncFileLogger,
+    call_log_filename,
+    render_log_document,
+)
+from twinklr.core.agents.logging.models import LLMCallLog
+
+_logger = logging.getLogger(__name__)
+
+SEGMENTS_DIRNAME = "segments"
+_SEGMENT_GLOB = "calls-*.jsonl.gz"
+_SEGMENT_RE = re.compile(r"calls-(\d+)\.jsonl\.gz$")
+
+QueueFullPolicy = Literal["drop", "block"]
+
+# Live loggers drained at interpreter exit (records still queued when the loop died)
+_LIVE_LOGGERS: "weakref.WeakSet[SegmentedLLMLogger]" = weakref.WeakSet()
+
+
+class SegmentedLLMLogger(AsyncFileLogger):
+    """LLM call logger with one background writer and rotating gzip segments.
+
+    Prompt capture, sanitization and summaries behave as in AsyncFileLogger;
+    only storage differs. Logging never blocks on disk: completed calls go to
+    a bounded queue, and with the ``"drop"`` policy a full queue drops the
+    record (counted in ``dropped_records``) instead of stalling the caller.
+
+    Example:
+        logger = SegmentedLLMLogger(
+            output_dir=Path("data/logging"),
+            run_id="session_1",
+            session_id="session_1",
+            max_total_bytes=2 * 1024**3,
+        )
+        call_id = await logger.start_call_async(...)
+        await logger.complete_call_async(call_id, ...)
+        await logger.close_async()
+    """
+
+    def __init__(
+        self,
+        *,
+        output_dir: Path | str,
+        run_id: str,
+        session_id: str | None = None,
+        log_level: str = "standard",
+        sanitize: bool = True,
+        log_full_prompts: bool = False,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        max_age_days: float | None = None,
+        max_total_bytes: int | None = None,
+        queue_size: int = 1000,
+        queue_full_policy: QueueFullPolicy = "drop",
+        batch_size: int = 200,
+    ):
+        """Initialize segmented logger.
+
+        Args:
+            output_dir: Base output directory
+            run_id: Unique run identifier
+            session_id: Session identifier (segment subdirectory)
+            log_level: Log level ("minimal", "standard", "full")
+            sanitize: Whether to sanitize sensitive data
+            log_full_prompts: Log full prompt content at DEBUG level
+            segment_max_bytes: Compressed size at which a segment is rotated
+            max_age_days: Delete segments older than this (None keeps all)
+            max_total_bytes: Delete oldest segments beyond this total (None: no cap)
+            queue_size: Maximum queued records awaiting the writer
+            queue_full_policy: "drop" records or "block" the caller when full
+            batch_size: Maximum records written per batch
+        """
+        super().__init__(
+            output_dir=output_dir,
+            run_id=run_id,
+            session_id=session_id,
+            log_level=log_level,
+            format="json",
+            sanitize=sanitize,
+            log_full_prompts=log_full_prompts,
+        )
+        self.segment_max_bytes = segment_max_bytes
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self.queue_size = queue_size
+        self.queue_full_policy = queue_full_policy
+        self.batch_size = batch_size
+        self.dropped_records = 0
+
+        self.segments_root = self.log_dir / SEGMENTS_DIRNAME
+        self.segment_dir = self.segments_root / self.session_id
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        # Never append to a previous process's segment: it may end mid-member
+        existing = [_segment_number(p) for p in self.segment_dir.glob(_SEGMENT_GLOB)]
+        self._segment_number = max(existing, default=0) + 1
+
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._writer_loop: asyncio.AbstractEventLoop | None = None
+        self._write_lock = threading.Lock()
+
+        _LIVE_LOGGERS.add(self)
+        self._apply_retention()
+
+    @property
+    def current_segment(self) -> Path:
+        """Segment the next batch is appended to."""
+        return self.segment_dir / f"calls-{self._segment_number:06d}.jsonl.gz"
+
+    async def flush_async(self) -> None:
+        """Wait for queued records to be written, then rewrite the summary."""
+        if self._queue is not None:
+            if self._writer_loop is asyncio.get_running_loop():
+                await self._queue.join()
+            else:
+                await asyncio.to_thread(self._write_batch, _drain(self._queue))
+        await super().flush_async()
+
+    async def close_async(self) -> None:
+        """Flush, stop the writer task and apply retention."""
+        await self.flush_async()
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        await asyncio.to_thread(self._apply_retention)
+
+    async def _write_log_file_async(
+        self,
+        agent_name: str,
+        iteration: int | None,
+        call_num: int,
+        log_entry: LLMCallLog,
+    ) -> None:
+        """Queue a completed call for the background writer."""
+        record = log_entry.model_dump(exclude_none=True, mode="json")
+        record["session_id"] = self.session_id
+        record["call_num"] = call_num
+
+        queue = self._ensure_writer()
+        if self.queue_full_policy == "block":
+            await queue.put(record)
+            return
+        try:
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped_records += 1
+            if self.dropped_records == 1 or self.dropped_records % 100 == 0:
+                _logger.warning(
+                    "LLM call log queue full; dropped %d record(s) so far", self.dropped_records
+                )
+
+    async def _write_summary_async(self) -> None:
+        """Rewrite the summary from the running totals (atomically, off-loop)."""
+        if not self.summary.total_calls:
+            return
+        summary = self.summary.build(self.run_id, self.log_level, self.format)
+        if self.dropped_records:
+            summary = summary.model_copy(
+                update={"errors": [*summary.errors, f"{self.dropped_records} call logs dropped"]}
+            )
+        summary_dict = summary.model_dump(exclude_none=True, mode="json")
+        summary_path = self.log_dir / f"summary_{self.session_id}.json"
+        await asyncio.to_thread(_atomic_write_text, summary_path, json.dumps(summary_dict))
+
+    def _ensure_writer(self) -> "asyncio.Queue[dict[str, Any]]":
+        """Queue feeding the writer task on the running loop (started on first use)."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._writer_loop is not loop or self._writer is None:
+            if self._queue is not None:
+                # Previous loop is gone: write whatever it left behind
+                self._write_batch(_drain(self._queue))
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._writer = loop.create_task(self._run_writer(self._queue))
+            self._writer_loop = loop
+        return self._queue
+
+    async def _run_writer(self, queue: "asyncio.Queue[dict[str, Any]]") -> None:
+        """Write queued records in batches until cancelled."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                _logger.error(f"Failed to write {len(batch)} LLM call logs: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Append records to the current segment as one gzip member."""
+        if not batch:
+            return
+        data = "".join(json.dumps(r, default=str, separators=(",", ":")) + "\n" for r in batch)
+        with self._write_lock:
+            segment = self.current_segment
+            with gzip.open(segment, "ab", compresslevel=6) as f:
+                f.write(data.encode("utf-8"))
+            if segment.stat().st_size >= self.segment_max_bytes:
+                self._segment_number += 1
+                self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        removed = prune_segments(
+            self.segments_root,
+            max_age_days=self.max_age_days,
+            max_total_bytes=self.max_total_bytes,
+            keep={self.current_segment},
+        )
+        if removed:
+            _logger.debug(f"Pruned {removed} LLM call log segments under {self.segments_root}")
+
+    def _drain_on_exit(self) -> None:
+        if self._queue is not None:
+            self._write_batch(_drain(self._queue))
+
+
+def _drain(queue: "asyncio.Queue[dict[str, Any]]") -> list[dict[str, Any]]:
+    """Take everything from a queue without awaiting (safe after its loop closed)."""
+    items: list[dict[str, Any]] = []
+    while True:
+        try:
+            items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return items
+        queue.task_done()
+
+
+def _drain_live_loggers() -> None:
+    for logger in list(_LIVE_LOGGERS):
+        try:
+            logger._drain_on_exit()
+        except Exception as e:
+            _logger.error(f"Failed to write queued LLM call logs at exit: {e}")
+
+
+atexit.register(_drain_live_loggers)
+
+
+def _segment_number(path: Path) -> int:
+    match = _SEGMENT_RE.search(path.name)
+    return int(match.group(1)) if match else 0
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def _segment_files(path: Path) -> list[Path]:
+    """Segments under a segment file, session directory or segments root, oldest first."""
+    if path.is_file():
+        return [path]
+    return sorted(path.rglob(_SEGMENT_GLOB), key=lambda p: (p.parent.name, _segment_number(p)))
+
+
+def prune_segments(
+    root: Path | str,
+    *,
+    max_age_days: float | None = None,
+    max_total_bytes: int | None = None,
+    keep: set[Path] | None = None,
+) -> int:
+    """Delete expired segments, then the oldest ones until under a size cap.
+
+    Args:
+        root: A segment file, a session's segment directory or the segments
+            root (``<output_dir>/segments``)
+        max_age_days: Delete segments last written longer ago than this
+        max_total_bytes: Delete oldest segments until the total fits
+        keep: Segments never deleted (e.g. ones still being written)
+
+    Returns:
+        Number of segments deleted
+    """
+    root = Path(root)
+    if not root.exists() or (max_age_days is None and max_total_bytes is None):
+        return 0
+    keep = keep or set()
+
+    segments: list[tuple[float, int, Path]] = []
+    for path in _segment_files(root):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        segments.append((stat.st_mtime, stat.st_size, path))
+    segments.sort()
+
+    removed = 0
+    total = sum(size for _, size, _ in segments)
+    cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+    for mtime, size, path in segments:
+        expired = cutoff is not None and mtime < cutoff
+        over_cap = max_total_bytes is not None and total > max_total_bytes
+        if not (expired or over_cap) or path in keep:
+            continue
+        try:
+            path.unlink()
+        except OSError as e:
+            _logger.warning(f"Failed to delete LLM call log segment {path}: {e}")
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def read_call_logs(
+    path: Path | str,
+    *,
+    agent_name: str | None = None,
+    call_id: str | None = None,
+) -> Iterator[LLMCallLog]:
+    """Iterate logged calls from segments, oldest first.
+
+    A segment whose final batch was cut short (e.g. by a crash) yields every
+    complete record before the damage.
+
+    Args:
+        path: A segment file, a session's segment directory or the segments root
+        agent_name: Only calls made by this agent
+        call_id: Only the call with this ID
+
+    Yields:
+        Call logs (``session_id`` and ``call_num`` are kept as extra fields)
+    """
+    for segment in _segment_files(Path(path)):
+        try:
+            with gzip.open(segment, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if agent_name is not None and record.get("agent_name") != agent_name:
+                        continue
+                    if call_id is not None and record.get("call_id") != call_id:
+                        continue
+                    yield LLMCallLog.model_validate(record)
+        except (EOFError, OSError, zlib.error, ValueError) as e:
+            _logger.warning(f"Stopped reading truncated segment {segment}: {e}")
+
+
+def export_call_files(
+    source: Path | str,
+    dest_dir: Path | str,
+    *,
+    format: str = "yaml",
+    agent_name: str | None = None,
+) -> int:
+    """Write one file per logged call, in the AsyncFileLogger layout.
+
+    Produces ``<dest_dir>/<agent>/<session_id>/iter_XX_call_YYY.<format>``.
+
+    Args:
+        source: A segment file, a session's segment directory or the segments root
+        dest_dir: Output directory
+        format: Output format ("yaml", "json")
+        agent_name: Only export calls made by this agent
+
+    Returns:
+        Number of files written
+    """
+    dest = Path(dest_dir)
+    count = 0
+    for log in read_call_logs(source, agent_name=agent_name):
+        data = log.model_dump(exclude_none=True, mode="json")
+        session_id = str(data.pop("session_id", "default"))
+        call_num = int(data.pop("call_num", count + 1))
+        agent_dir = dest / log.agent_name / session_id
+        agent_dir.mkdir(parents=True, exist_ok=True)
+        filename = call_log_filename(log.iteration, call_num, log.run_id, format)
+        (agent_dir / filename).write_text(render_log_document(data, format))
+        count += 1
+    return count
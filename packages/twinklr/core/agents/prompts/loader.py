@@ -1,9 +1,18 @@
-"""Prompt pack loader."""
+"""Prompt pack loader.
+
+Prompt files are cached process-wide, keyed by path and file mtime/size:
+the text is read once, examples are parsed once, and Jinja templates are
+compiled once, so repeated runs of the same pack (judge loops, per-section
+fan-out) only pay for variable substitution. Edited files are picked up on
+the next load because their mtime changes.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +27,55 @@ class LoadError(Exception):
     pass
 
 
+@dataclass
+class _CachedPromptFile:
+    """One prompt file as last read from disk."""
+
+    mtime_ns: int
+    size: int
+    text: str
+    compiled: Any = None
+    examples: list[dict[str, Any]] | None = None
+
+
+# Rendered in this order; everything but "user" forms the static prompt prefix
+_TEMPLATE_COMPONENTS = ("system", "developer", "context", "user")
+
+_FILE_CACHE: dict[Path, _CachedPromptFile] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def clear_prompt_cache() -> None:
+    """Drop all cached prompt files (mainly for tests)."""
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
+
+
+def _cached_file(path: Path) -> _CachedPromptFile | None:
+    """Return the cache entry for ``path``, re-reading it if it changed.
+
+    Args:
+        path: Prompt file path
+
+    Returns:
+        Cache entry, or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    with _FILE_CACHE_LOCK:
+        entry = _FILE_CACHE.get(path)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+    entry = _CachedPromptFile(mtime_ns=stat.st_mtime_ns, size=stat.st_size, text=path.read_text())
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[path] = entry
+    return entry
+
+
 class PromptPackLoader:
     """Loads prompt packs from filesystem.
 
@@ -25,6 +83,7 @@ class PromptPackLoader:
         pack_name/
         ├── system.j2            # Required: System prompt
         ├── developer.j2         # Optional: Developer/contract prompt
+        ├── context.j2           # Optional: Static reference context (cached prefix)
         ├── user.j2              # Optional: User message template
         └── examples.jsonl       # Optional: Few-shot examples
     """
@@ -50,51 +109,15 @@ class PromptPackLoader:
             Dict with prompt components:
             - "system": System prompt template
             - "developer": Developer prompt template (optional)
+            - "context": Static reference context template (optional)
             - "user": User prompt template (optional)
             - "examples": List of example messages (optional)
 
         Raises:
             LoadError: If pack doesn't exist or required files missing
         """
-        pack_dir = self.base_path / pack_name
-
-        if not pack_dir.exists() or not pack_dir.is_dir():
-            raise LoadError(f"Prompt pack '{pack_name}' does not exist at {pack_dir}")
-
-        prompts: dict[str, Any] = {}
-
-        # Load system prompt (required)
-        system_path = pack_dir / "system.j2"
-        if not system_path.exists():
-            raise LoadError(
-                f"Prompt pack '{pack_name}' missing required system.j2 at {system_path}"
-            )
-
-        prompts["system"] = system_path.read_text()
-
-        # Load developer prompt (optional)
-        developer_path = pack_dir / "developer.j2"
-        if developer_path.exists():
-            prompts["developer"] = developer_path.read_text()
-
-        # Load user prompt (optional)
-        user_path = pack_dir / "user.j2"
-        if user_path.exists():
-            prompts["user"] = user_path.read_text()
-
-        # Load examples (optional)
-        examples_path = pack_dir / "examples.jsonl"
-        if examples_path.exists():
-            try:
-                examples = []
-                for line in examples_path.read_text().strip().split("\n"):
-                    if line.strip():
-                        examples.append(json.loads(line))
-                prompts["examples"] = examples
-            except json.JSONDecodeError as e:
-                raise LoadError(
-                    f"Invalid JSON in examples.jsonl for pack '{pack_name}': {e}"
-                ) from e
+        files = self._resolve_files(pack_name, refinement=False)
+        prompts = self._read_components(pack_name, files)
 
         logger.debug(f"Loaded prompt pack '{pack_name}': {list(prompts.keys())}")
 
@@ -105,6 +128,7 @@ class PromptPackLoader:
 
         Supports refinement prompts: if `iteration > 0` in variables and
         `user_refinement.j2` exists, it will be used instead of `user.j2`.
+        Templates are compiled once per file version and reused.
 
         Args:
             pack_name: Name of the prompt pack directory
@@ -117,24 +141,17 @@ class PromptPackLoader:
             LoadError: If loading fails
             RenderError: If rendering fails
         """
-        # Load templates (with refinement support)
-        prompts = self.load_with_refinement(pack_name, variables)
+        files = self._resolve_files(pack_name, refinement=variables.get("iteration", 0) > 0)
 
-        # Render templates
         rendered: dict[str, Any] = {}
-
-        if "system" in prompts:
-            rendered["system"] = self.renderer.render(prompts["system"], variables)
-
-        if "developer" in prompts:
-            rendered["developer"] = self.renderer.render(prompts["developer"], variables)
-
-        if "user" in prompts:
-            rendered["user"] = self.renderer.render(prompts["user"], variables)
+        for component in _TEMPLATE_COMPONENTS:
+            if component in files:
+                compiled = self._compiled(files[component])
+                rendered[component] = self.renderer.render_compiled(compiled, variables)
 
         # Examples are not rendered (they're already concrete messages)
-        if "examples" in prompts:
-            rendered["examples"] = prompts["examples"]
+        if "examples" in files:
+            rendered["examples"] = self._examples(pack_name, files["examples"])
 
         return rendered
 
@@ -158,59 +175,97 @@ class PromptPackLoader:
         Raises:
             LoadError: If pack doesn't exist or required files missing
         """
+        iteration = variables.get("iteration", 0)
+        files = self._resolve_files(pack_name, refinement=iteration > 0)
+        if files.get("user") is not None and files["user"].name == "user_refinement.j2":
+            logger.debug(
+                f"Using user_refinement.j2 for pack '{pack_name}' (iteration {iteration + 1})"
+            )
+
+        prompts = self._read_components(pack_name, files)
+
+        logger.debug(f"Loaded prompt pack '{pack_name}': {list(prompts.keys())}")
+
+        return prompts
+
+    def _resolve_files(self, pack_name: str, *, refinement: bool) -> dict[str, Path]:
+        """Map prompt components to the files that exist for a pack.
+
+        Args:
+            pack_name: Name of the prompt pack directory
+            refinement: Prefer user_refinement.j2 over user.j2 when present
+
+        Returns:
+            Dict of component name → file path
+
+        Raises:
+            LoadError: If pack doesn't exist or system.j2 is missing
+        """
         pack_dir = self.base_path / pack_name
 
-        if not pack_dir.exists() or not pack_dir.is_dir():
+        if not pack_dir.is_dir():
             raise LoadError(f"Prompt pack '{pack_name}' does not exist at {pack_dir}")
 
-        prompts: dict[str, Any] = {}
-
-        # Load system prompt (required)
         system_path = pack_dir / "system.j2"
-        if not system_path.exists():
+        if not system_path.is_file():
             raise LoadError(
                 f"Prompt pack '{pack_name}' missing required system.j2 at {system_path}"
             )
 
-        prompts["system"] = system_path.read_text()
+        files: dict[str, Path] = {"system": system_path}
 
-        # Load developer prompt (optional)
         developer_path = pack_dir / "developer.j2"
-        if developer_path.exists():
-            prompts["developer"] = developer_path.read_text()
+        if developer_path.is_file():
+            files["developer"] = developer_path
 
-        # Load user prompt with refinement support
-        # Check if we're in a refinement iteration (iteration > 0)
-        iteration = variables.get("iteration", 0)
-        is_refinement = iteration > 0
+        context_path = pack_dir / "context.j2"
+        if context_path.is_file():
+            files["context"] = context_path
 
         user_refinement_path = pack_dir / "user_refinement.j2"
         user_path = pack_dir / "user.j2"
+        if refinement and user_refinement_path.is_file():
+            files["user"] = user_refinement_path
+        elif user_path.is_file():
+            files["user"] = user_path
 
-        if is_refinement and user_refinement_path.exists():
-            # Use refinement template for iteration 2+
-            prompts["user"] = user_refinement_path.read_text()
-            logger.debug(
-                f"Using user_refinement.j2 for pack '{pack_name}' (iteration {iteration + 1})"
-            )
-        elif user_path.exists():
-            # Use standard user template
-            prompts["user"] = user_path.read_text()
-
-        # Load examples (optional)
         examples_path = pack_dir / "examples.jsonl"
-        if examples_path.exists():
+        if examples_path.is_file():
+            files["examples"] = examples_path
+
+        return files
+
+    def _read_components(self, pack_name: str, files: dict[str, Path]) -> dict[str, Any]:
+        prompts: dict[str, Any] = {}
+        for component in _TEMPLATE_COMPONENTS:
+            if component in files:
+                prompts[component] = self._entry(files[component]).text
+        if "examples" in files:
+            prompts["examples"] = self._examples(pack_name, files["examples"])
+        return prompts
+
+    def _entry(self, path: Path) -> _CachedPromptFile:
+        entry = _cached_file(path)
+        if entry is None:
+            raise LoadError(f"Prompt file disappeared while loading: {path}")
+        return entry
+
+    def _compiled(self, path: Path) -> Any:
+        entry = self._entry(path)
+        if entry.compiled is None:
+            entry.compiled = self.renderer.compile(entry.text)
+        return entry.compiled
+
+    def _examples(self, pack_name: str, path: Path) -> list[dict[str, Any]]:
+        entry = self._entry(path)
+        if entry.examples is None:
             try:
-                examples = []
-                for line in examples_path.read_text().strip().split("\n"):
-                    if line.strip():
-                        examples.append(json.loads(line))
-                prompts["examples"] = examples
+                entry.examples = [
+                    json.loads(line) for line in entry.text.strip().split("\n") if line.strip()
+                ]
             except json.JSONDecodeError as e:
                 raise LoadError(
                     f"Invalid JSON in examples.jsonl for pack '{pack_name}': {e}"
                 ) from e
-
-        logger.debug(f"Loaded prompt pack '{pack_name}': {list(prompts.keys())}")
-
-        return prompts
+        # Callers extend message lists with these; never hand out the cached list
+        return list(entry.examples)
@@ -55,22 +55,60 @@ class PromptRenderer:
         Raises:
             RenderError: If rendering fails (missing variables, syntax errors, etc.)
         """
+        return self.render_compiled(self.compile(template), variables)
+
+    def compile(self, template: str) -> Any:
+        """Parse a template once for repeated rendering.
+
+        Args:
+            template: Template string (Jinja2 format)
+
+        Returns:
+            Compiled Jinja2 Template, or the template string itself when
+            using the simple fallback renderer.
+
+        Raises:
+            RenderError: If the template has invalid syntax
+        """
         if not self.use_jinja2:
+            return template
+
+        try:
+            from jinja2 import TemplateSyntaxError
+
+            return self.env.from_string(template)
+
+        except TemplateSyntaxError as e:
+            raise RenderError(f"Invalid template syntax: {e}") from e
+
+        except Exception as e:
+            raise RenderError(f"Template rendering failed: {e}") from e
+
+    def render_compiled(self, compiled: Any, variables: dict[str, Any]) -> str:
+        """Render a template returned by ``compile``.
+
+        Args:
+            compiled: Result of ``compile``
+            variables: Variables for template rendering
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            RenderError: If rendering fails (missing variables, etc.)
+        """
+        if isinstance(compiled, str):
             # Fallback to simple renderer
-            return self._simple_render(template, variables)
+            return self._simple_render(compiled, variables)
 
         try:
-            from jinja2 import TemplateSyntaxError, UndefinedError
+            from jinja2 import UndefinedError
 
-            jinja_template = self.env.from_string(template)
-            return jinja_template.render(**variables)
+            return str(compiled.render(**variables))
 
         except UndefinedError as e:
             raise RenderError(f"Missing variable in template: {e}") from e
 
-        except TemplateSyntaxError as e:
-            raise RenderError(f"Invalid template syntax: {e}") from e
-
         except Exception as e:
             raise RenderError(f"Template rendering failed: {e}") from e
 
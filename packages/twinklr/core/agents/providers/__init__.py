@@ -1,5 +1,9 @@
 """LLM provider abstraction for agents."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from twinklr.core.agents.providers.base import (
     LLMProvider,
     LLMResponse,
@@ -8,7 +12,9 @@ from twinklr.core.agents.providers.base import (
     TokenUsage,
 )
 from twinklr.core.agents.providers.errors import LLMProviderError
-from twinklr.core.agents.providers.openai import OpenAIProvider
+
+if TYPE_CHECKING:
+    from twinklr.core.agents.providers.openai import OpenAIProvider
 
 __all__ = [
     "LLMProvider",
@@ -19,3 +25,12 @@ __all__ = [
     "LLMProviderError",
     "OpenAIProvider",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # Provider SDKs are slow to import; load them on first use only
+    if name == "OpenAIProvider":
+        from twinklr.core.agents.providers.openai import OpenAIProvider
+
+        return OpenAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
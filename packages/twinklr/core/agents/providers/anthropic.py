@@ -8,6 +8,7 @@ import threading
 from typing import Any
 
 from twinklr.core.agents.providers.base import (
+    CACHE_BREAKPOINT_KEY,
     LLMResponse,
     ProviderType,
     ResponseMetadata,
@@ -40,9 +41,15 @@ class AnthropicProvider:
     - Conversation windowing mirrors the OpenAI provider (``_window_messages``).
     - The ``anthropic`` package is imported lazily so it remains an optional
       dependency; callers that never use this provider pay no import cost.
+    - Prompt caching: messages marked with ``CACHE_BREAKPOINT_KEY`` become
+      text blocks with ``cache_control`` breakpoints, so the static prompt
+      prefix is written to the cache once and read back on later judge
+      iterations and sections. A conversation's system prompt is always a
+      breakpoint.
     """
 
     _DEFAULT_WINDOW_SIZE: int = 2  # Keep last 2 exchange pairs
+    _MAX_CACHE_BREAKPOINTS: int = 4  # API limit per request
 
     def __init__(
         self,
@@ -96,10 +103,11 @@ class AnthropicProvider:
     # Internal helpers
     # =========================================================================
 
-    @staticmethod
+    @classmethod
     def _split_messages(
+        cls,
         messages: list[dict[str, str]],
-    ) -> tuple[str | None, list[dict[str, str]]]:
+    ) -> tuple[str | list[dict[str, Any]] | None, list[dict[str, Any]]]:
         """Extract system/developer content from a messages list.
 
         Anthropic requires system instructions as a top-level ``system``
@@ -107,26 +115,56 @@ class AnthropicProvider:
         ``"role": "developer"`` for the same purpose, so both roles are
         treated equivalently here.
 
+        Without cache breakpoints the system text is a plain string.  When any
+        message carries ``CACHE_BREAKPOINT_KEY``, system parts become separate
+        text blocks and marked messages get ``cache_control`` on their block
+        (only the last ``_MAX_CACHE_BREAKPOINTS`` markers are kept).
+
         Args:
             messages: Full list of message dicts with ``role`` and ``content``.
 
         Returns:
-            A two-tuple ``(system_text, filtered_messages)`` where
-            ``system_text`` is the concatenated text of all system/developer
-            messages (or ``None`` if absent) and ``filtered_messages`` is the
-            remaining list with only ``"user"`` and ``"assistant"`` roles.
+            A two-tuple ``(system, filtered_messages)`` where ``system`` is the
+            system text or block list (or ``None`` if absent) and
+            ``filtered_messages`` is the remaining list with only ``"user"``
+            and ``"assistant"`` roles.
         """
-        system_parts: list[str] = []
-        conversation: list[dict[str, str]] = []
+        marked = [i for i, m in enumerate(messages) if m.get(CACHE_BREAKPOINT_KEY)]
+        breakpoints = set(marked[-cls._MAX_CACHE_BREAKPOINTS :])
 
-        for msg in messages:
+        system_blocks: list[dict[str, Any]] = []
+        conversation: list[dict[str, Any]] = []
+
+        for i, msg in enumerate(messages):
+            block = cls._text_block(msg["content"], cached=i in breakpoints)
             if msg["role"] in ("system", "developer"):
-                system_parts.append(msg["content"])
+                system_blocks.append(block)
+            elif i in breakpoints:
+                conversation.append({"role": msg["role"], "content": [block]})
             else:
-                conversation.append(msg)
+                conversation.append({"role": msg["role"], "content": msg["content"]})
+
+        if not system_blocks:
+            return None, conversation
+        if not breakpoints:
+            return "\n\n".join(b["text"] for b in system_blocks), conversation
+        return system_blocks, conversation
+
+    @staticmethod
+    def _text_block(text: str, *, cached: bool) -> dict[str, Any]:
+        """Build a text content block, optionally ending a cached prefix.
+
+        Args:
+            text: Block text.
+            cached: Attach an ephemeral ``cache_control`` breakpoint.
 
-        system_text = "\n\n".join(system_parts) if system_parts else None
-        return system_text, conversation
+        Returns:
+            Anthropic text block dict.
+        """
+        block: dict[str, Any] = {"type": "text", "text": text}
+        if cached:
+            block["cache_control"] = {"type": "ephemeral"}
+        return block
 
     def _window_messages(
         self,
@@ -160,7 +198,11 @@ class AnthropicProvider:
         return system_msgs + conversation
 
     def _update_token_usage(
-        self, prompt_tokens: int, completion_tokens: int, total_tokens: int
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cached_prompt_tokens: int = 0,
     ) -> None:
         """Thread-safe accumulation of token usage.
 
@@ -168,12 +210,16 @@ class AnthropicProvider:
             prompt_tokens: Input tokens for this call.
             completion_tokens: Output tokens for this call.
             total_tokens: Total tokens for this call.
+            cached_prompt_tokens: Input tokens read from the prompt cache.
         """
         with self._token_lock:
             self._total_tokens = TokenUsage(
                 prompt_tokens=self._total_tokens.prompt_tokens + prompt_tokens,
                 completion_tokens=self._total_tokens.completion_tokens + completion_tokens,
                 total_tokens=self._total_tokens.total_tokens + total_tokens,
+                cached_prompt_tokens=(
+                    self._total_tokens.cached_prompt_tokens + cached_prompt_tokens
+                ),
             )
 
     @staticmethod
@@ -183,18 +229,28 @@ class AnthropicProvider:
         Args:
             response: Raw response object from ``anthropic.messages.create``.
 
+        Anthropic's ``input_tokens`` excludes tokens written to or read from
+        the prompt cache; both are folded back into ``prompt_tokens`` so usage
+        stays comparable with uncached calls and other providers.
+
         Returns:
             Populated ``TokenUsage`` dataclass.
         """
         if not hasattr(response, "usage") or response.usage is None:
             return TokenUsage()
 
-        input_tokens = getattr(response.usage, "input_tokens", 0) or 0
-        output_tokens = getattr(response.usage, "output_tokens", 0) or 0
+        def _count(name: str) -> int:
+            value = getattr(response.usage, name, 0)
+            return value if isinstance(value, int) else 0
+
+        cache_read = _count("cache_read_input_tokens")
+        input_tokens = _count("input_tokens") + _count("cache_creation_input_tokens") + cache_read
+        output_tokens = _count("output_tokens")
         return TokenUsage(
             prompt_tokens=input_tokens,
             completion_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
+            cached_prompt_tokens=cache_read,
         )
 
     @staticmethod
@@ -273,6 +329,7 @@ class AnthropicProvider:
                 prompt_tokens=token_usage.prompt_tokens,
                 completion_tokens=token_usage.completion_tokens,
                 total_tokens=token_usage.total_tokens,
+                cached_prompt_tokens=token_usage.cached_prompt_tokens,
             )
 
             return LLMResponse(
@@ -324,7 +381,10 @@ class AnthropicProvider:
             else:
                 messages: list[dict[str, str]] = []
                 if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
+                    # Fixed for the conversation's lifetime: cache it
+                    messages.append(
+                        {"role": "system", "content": system_prompt, CACHE_BREAKPOINT_KEY: "1"}
+                    )
                 messages.append({"role": "user", "content": user_message})
                 conversation = Conversation(id=conversation_id, messages=messages)
                 self._conversations[conversation_id] = conversation
@@ -403,6 +463,7 @@ class AnthropicProvider:
                 prompt_tokens=token_usage.prompt_tokens,
                 completion_tokens=token_usage.completion_tokens,
                 total_tokens=token_usage.total_tokens,
+                cached_prompt_tokens=token_usage.cached_prompt_tokens,
             )
 
             return LLMResponse(
@@ -453,7 +514,10 @@ class AnthropicProvider:
             else:
                 messages: list[dict[str, str]] = []
                 if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
+                    # Fixed for the conversation's lifetime: cache it
+                    messages.append(
+                        {"role": "system", "content": system_prompt, CACHE_BREAKPOINT_KEY: "1"}
+                    )
                 messages.append({"role": "user", "content": user_message})
                 conversation = Conversation(id=conversation_id, messages=messages)
                 self._conversations[conversation_id] = conversation
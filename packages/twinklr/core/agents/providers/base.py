@@ -14,13 +14,42 @@ class ProviderType(str, Enum):
     ANTHROPIC = "anthropic"
 
 
+# Message key marking the end of a cacheable prompt prefix. The runner sets it
+# on static messages (developer/system/context); providers translate it into
+# their caching mechanism and never forward it to the API as-is.
+CACHE_BREAKPOINT_KEY = "cache_breakpoint"
+
+
 @dataclass(frozen=True)
 class TokenUsage:
-    """Standardized token usage."""
+    """Standardized token usage.
+
+    ``cached_prompt_tokens`` is the part of ``prompt_tokens`` served from the
+    provider's prompt prefix cache (billed at a discount).
+    """
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cached_prompt_tokens: int = 0
+
+
+def strip_cache_markers(messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Return messages without cache breakpoint markers.
+
+    Args:
+        messages: Message dicts, possibly carrying ``CACHE_BREAKPOINT_KEY``.
+
+    Returns:
+        Messages safe to send to APIs that reject unknown keys. Unmarked
+        messages are passed through unchanged.
+    """
+    return [
+        {k: v for k, v in m.items() if k != CACHE_BREAKPOINT_KEY}
+        if CACHE_BREAKPOINT_KEY in m
+        else m
+        for m in messages
+    ]
 
 
 @dataclass(frozen=True)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from twinklr.core.agents.providers.base import LLMProvider
-from twinklr.core.agents.providers.openai import OpenAIProvider
 from twinklr.core.config.models import AppConfig
 
 
@@ -23,7 +22,10 @@ def create_llm_provider(app_config: AppConfig, session_id: str) -> LLMProvider:
     """
     provider_name = app_config.llm_provider.lower().strip()
 
+    # Provider modules are imported on dispatch so only the selected SDK loads
     if provider_name == "openai":
+        from twinklr.core.agents.providers.openai import OpenAIProvider
+
         return OpenAIProvider(
             api_key=app_config.llm_api_key.get_secret_value(),
             session_id=session_id,
@@ -22,6 +22,7 @@ from twinklr.core.agents.providers.base import (
     ProviderType,
     ResponseMetadata,
     TokenUsage,
+    strip_cache_markers,
 )
 from twinklr.core.agents.providers.conversation import Conversation
 from twinklr.core.agents.providers.errors import LLMProviderError
@@ -44,6 +45,12 @@ class OpenAIProvider:
     - Manage conversation state
     - Convert responses to standard format
     - Thread-safe token tracking
+
+    Prompt caching: OpenAI caches prompt prefixes automatically once they are
+    byte-identical across requests. Cache breakpoint markers set by the runner
+    are stripped (the API rejects unknown keys) without reordering or
+    re-serializing messages, and cached input tokens are reported in
+    ``TokenUsage.cached_prompt_tokens``.
     """
 
     _DEFAULT_WINDOW_SIZE: int = 2  # Keep last 2 exchanges
@@ -102,7 +109,10 @@ class OpenAIProvider:
         """
         try:
             response_data = self._sync_client.generate_json(
-                messages=messages, model=model, temperature=temperature, **kwargs
+                messages=strip_cache_markers(messages),
+                model=model,
+                temperature=temperature,
+                **kwargs,
             )
 
             usage = self._sync_client.get_total_token_usage()
@@ -212,7 +222,11 @@ class OpenAIProvider:
         self._sync_client.reset_conversation()
 
     def _update_token_usage(
-        self, prompt_tokens: int, completion_tokens: int, total_tokens: int
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cached_prompt_tokens: int = 0,
     ) -> None:
         """Thread-safe token usage update."""
         with self._token_lock:
@@ -220,8 +234,31 @@ class OpenAIProvider:
                 prompt_tokens=self._total_tokens.prompt_tokens + prompt_tokens,
                 completion_tokens=self._total_tokens.completion_tokens + completion_tokens,
                 total_tokens=self._total_tokens.total_tokens + total_tokens,
+                cached_prompt_tokens=(
+                    self._total_tokens.cached_prompt_tokens + cached_prompt_tokens
+                ),
             )
 
+    @staticmethod
+    def _cached_prompt_tokens(usage: Any) -> int:
+        """Read cached input tokens from a usage object.
+
+        The Responses API reports them under ``input_tokens_details``; Chat
+        Completions-style payloads use ``prompt_tokens_details``.
+
+        Args:
+            usage: Usage object from an API response.
+
+        Returns:
+            Cached prompt token count (0 when not reported).
+        """
+        for details_name in ("input_tokens_details", "prompt_tokens_details"):
+            details = getattr(usage, details_name, None)
+            cached = getattr(details, "cached_tokens", None) if details is not None else None
+            if isinstance(cached, int) and cached > 0:
+                return cached
+        return 0
+
     def _window_messages(
         self,
         messages: list[dict[str, str]],
@@ -292,9 +329,11 @@ class OpenAIProvider:
 
         try:
             # Build request parameters
+            # Markers are stripped without touching content or order so the
+            # static prefix stays byte-identical (automatic prefix caching)
             request_params: dict[str, Any] = {
                 "model": model,
-                "input": messages,
+                "input": strip_cache_markers(messages),
                 "text": {"format": {"type": "json_object"}},
             }
 
@@ -351,11 +390,13 @@ class OpenAIProvider:
                     prompt_tokens=prompt_tokens or 0,
                     completion_tokens=completion_tokens or 0,
                     total_tokens=total_tokens or 0,
+                    cached_prompt_tokens=self._cached_prompt_tokens(response.usage),
                 )
                 self._update_token_usage(
                     prompt_tokens=token_usage.prompt_tokens,
                     completion_tokens=token_usage.completion_tokens,
                     total_tokens=token_usage.total_tokens,
+                    cached_prompt_tokens=token_usage.cached_prompt_tokens,
                 )
 
             return LLMResponse(
@@ -7,6 +7,7 @@ avoiding synchronization bugs between hardcoded schemas and models.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -32,13 +33,32 @@ def get_json_schema_example(
 
     Returns:
         Formatted JSON schema string for use in prompts
+
+    Note:
+        Results are memoized per (model, indent, filters); models are
+        immutable class objects, so the schema cannot change in-process.
     """
+    return _schema_example_cached(
+        model,
+        indent,
+        tuple(exclude_fields or ()),
+        tuple(optional_fields or ()),
+    )
+
+
+@lru_cache(maxsize=256)
+def _schema_example_cached(
+    model: type[BaseModel],
+    indent: int,
+    exclude_fields: tuple[str, ...],
+    optional_fields: tuple[str, ...],
+) -> str:
     # Get the full JSON schema from Pydantic
     schema = model.model_json_schema()
 
     # Apply filters if specified
     if exclude_fields or optional_fields:
-        schema = _filter_schema(schema, exclude_fields or [], optional_fields or [])
+        schema = _filter_schema(schema, list(exclude_fields), list(optional_fields))
 
     return json.dumps(schema, indent=indent)
 
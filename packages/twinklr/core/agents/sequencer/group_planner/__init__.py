@@ -21,6 +21,11 @@ from twinklr.core.agents.sequencer.group_planner.holistic_stage import (
 from twinklr.core.agents.sequencer.group_planner.orchestrator import (
     GroupPlannerOrchestrator,
 )
+from twinklr.core.agents.sequencer.group_planner.repair import (
+    PlanRepairer,
+    RepairResult,
+    apply_fixes,
+)
 from twinklr.core.agents.sequencer.group_planner.specs import (
     GROUP_PLANNER_SPEC,
     SECTION_JUDGE_SPEC,
@@ -37,6 +42,8 @@ from twinklr.core.agents.sequencer.group_planner.timing import (
     TimingContext,
 )
 from twinklr.core.agents.sequencer.group_planner.validators import (
+    FixAction,
+    FixKind,
     SectionPlanValidator,
     ValidationIssue,
     ValidationResult,
@@ -122,10 +129,16 @@ __all__ = [
     "SectionBounds",
     "TimingContext",
     # Validators
+    "FixAction",
+    "FixKind",
     "SectionPlanValidator",
     "ValidationIssue",
     "ValidationResult",
     "ValidationSeverity",
+    # Repair
+    "PlanRepairer",
+    "RepairResult",
+    "apply_fixes",
     # Orchestrator
     "GroupPlannerOrchestrator",
     # Specs
@@ -10,12 +10,15 @@ import hashlib
 import json
 import logging
 from collections.abc import Callable
-from difflib import get_close_matches
 from typing import Any
 
 from twinklr.core.agents.logging import LLMCallLogger, NullLLMCallLogger
 from twinklr.core.agents.providers.base import LLMProvider
 from twinklr.core.agents.sequencer.group_planner.context import SectionPlanningContext
+from twinklr.core.agents.sequencer.group_planner.plan_features import (
+    build_section_plan_featurizer,
+)
+from twinklr.core.agents.sequencer.group_planner.repair import PlanRepairer
 from twinklr.core.agents.sequencer.group_planner.specs import (
     get_planner_spec,
     get_section_judge_spec,
@@ -34,7 +37,6 @@ from twinklr.core.agents.shared.judge.feedback import FeedbackManager
 from twinklr.core.agents.shared.judge.models import IterationState
 from twinklr.core.agents.spec import AgentSpec
 from twinklr.core.sequencer.planning import SectionCoordinationPlan
-from twinklr.core.sequencer.vocabulary import CoordinationMode, EffectDuration, LaneKind
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +105,7 @@ class GroupPlannerOrchestrator:
         - Section planning context (macro section plan, display graph, templates, layer intents)
         - Max iterations
         - Min pass score
+        - Local pre-judge settings (a pre-judge approval skips the judge)
         - Model configuration
 
         Note: timing_context is excluded from cache key because it contains
@@ -134,6 +137,10 @@ class GroupPlannerOrchestrator:
             "section_context": section_context_dict,
             "max_iterations": self.config.max_iterations,
             "min_pass_score": self.config.approval_score_threshold,
+            "enable_prejudge": self.config.enable_prejudge,
+            "prejudge_approve_threshold": self.config.prejudge_approve_threshold,
+            "prejudge_fail_threshold": self.config.prejudge_fail_threshold,
+            "prejudge_min_samples": self.config.prejudge_min_samples,
             "planner_model": self.planner_spec.model,
             "judge_model": self.section_judge_spec.model,
         }
@@ -312,6 +319,7 @@ class GroupPlannerOrchestrator:
             validator=validator,
             provider=self.provider,
             llm_logger=self.llm_logger,
+            plan_featurizer=build_section_plan_featurizer(section_context),
         )
 
     async def _run_heuristic_only(
@@ -433,6 +441,9 @@ class GroupPlannerOrchestrator:
     ) -> Callable[[SectionCoordinationPlan], list[str]]:
         """Build validator function for section plans.
 
+        The returned function auto-repairs fixable issues in place before
+        reporting, so only unrepairable errors trigger a planner revision.
+
         Args:
             section_context: Section planning context
 
@@ -447,306 +458,22 @@ class GroupPlannerOrchestrator:
             recipe_catalog=section_context.recipe_catalog,
         )
 
+        repairer = PlanRepairer(validator)
+
         def validate(plan: SectionCoordinationPlan) -> list[str]:
-            """Validate plan and return list of error messages."""
-            # Deterministic ID normalization to recover common alias drift
-            # (e.g., MATRICES -> MATRIX) without spending an iteration.
-            self._normalize_group_target_ids(plan, section_context)
-
-            # Snap all timing to section bounds: drop out-of-range placements
-            # and clamp window ends.  Prevents PLACEMENT_OUTSIDE_SECTION and
-            # TIMING_START_OUT_OF_BOUNDS without burning an iteration.
-            self._snap_to_section_bounds(plan, section_context)
-
-            # Drop coordination plans that have no usable content (empty
-            # UNIFIED plans, plans left empty after other sanitizers, etc.).
-            self._drop_empty_coordination_plans(plan, section_context)
-
-            # Drop placements that duplicate targets already covered by a
-            # SEQUENCED window in the same lane (prevents TARGET_SELF_OVERLAP).
-            self._drop_sequenced_window_conflicts(plan, section_context)
-
-            # Deterministic safety pass to reduce avoidable first-iteration failures.
-            # This removes same-target placements that are too tightly packed for
-            # categorical duration expansion, which commonly causes overlap errors.
-            self._sanitize_same_target_spacing(plan, section_context)
-            result = validator.validate(plan)
+            """Repair mechanical issues in place and return remaining errors."""
+            # Fixable issues (aliased group IDs, out-of-section placements,
+            # same-target overlaps, duplicate group_order entries, empty
+            # coordination plans) are repaired deterministically; only the
+            # rest go back to the planner as a revision request.
+            outcome = repairer.repair(plan)
 
             # Return only ERROR severity issues as strings
             errors = [
                 f"{issue.code}: {issue.message}"
-                for issue in result.errors
+                for issue in outcome.result.errors
                 if issue.severity == ValidationSeverity.ERROR
             ]
             return errors
 
         return validate
-
-    def _normalize_group_target_ids(
-        self,
-        plan: SectionCoordinationPlan,
-        section_context: SectionPlanningContext,
-    ) -> None:
-        """Normalize near-miss group IDs to valid concrete display IDs.
-
-        This is intentionally conservative and only applies when there is a
-        single high-confidence match in the current choreography graph.
-        """
-        from twinklr.core.sequencer.templates.group.models.coordination import PlanTarget
-        from twinklr.core.sequencer.vocabulary import TargetType
-
-        valid_ids = {g.id for g in section_context.choreo_graph.groups}
-        if not valid_ids:
-            return
-
-        def canonicalize(raw_id: str) -> str:
-            token = raw_id.strip().upper()
-            if token == "MATRICES" and "MATRIX" in valid_ids:
-                return "MATRIX"
-            if token == "WREATH" and "WREATHS" in valid_ids:
-                return "WREATHS"
-            if token == "ICICLE" and "ICICLES" in valid_ids:
-                return "ICICLES"
-            if token == "SNOWFLAKE" and "SNOWFLAKES" in valid_ids:
-                return "SNOWFLAKES"
-            if token in valid_ids:
-                return token
-            close = get_close_matches(token, sorted(valid_ids), n=1, cutoff=0.84)
-            return close[0] if close else token
-
-        for lane_plan in plan.lane_plans:
-            for coord_plan in lane_plan.coordination_plans:
-                # Normalize coordination targets
-                normalized_targets: list[PlanTarget] = []
-                for target in coord_plan.targets:
-                    if target.type != TargetType.GROUP:
-                        normalized_targets.append(target)
-                        continue
-                    normalized_id = canonicalize(target.id)
-                    if normalized_id != target.id:
-                        logger.warning(
-                            "Normalized group target id in %s/%s: %s -> %s",
-                            section_context.section_id,
-                            lane_plan.lane.value,
-                            target.id,
-                            normalized_id,
-                        )
-                    normalized_targets.append(target.model_copy(update={"id": normalized_id}))
-                coord_plan.targets = normalized_targets
-
-                # Normalize placement targets
-                normalized_placements = []
-                for placement in coord_plan.placements:
-                    ptarget = placement.target
-                    if ptarget.type != TargetType.GROUP:
-                        normalized_placements.append(placement)
-                        continue
-                    normalized_id = canonicalize(ptarget.id)
-                    new_target = (
-                        ptarget
-                        if normalized_id == ptarget.id
-                        else ptarget.model_copy(update={"id": normalized_id})
-                    )
-                    normalized_placements.append(
-                        placement.model_copy(update={"target": new_target})
-                    )
-                coord_plan.placements = normalized_placements
-
-    def _sanitize_same_target_spacing(
-        self,
-        plan: SectionCoordinationPlan,
-        section_context: SectionPlanningContext,
-    ) -> None:
-        """Drop same-target placements that are too close to safely coexist.
-
-        This is intentionally conservative and deterministic:
-        - BASE/RHYTHM same-target starts must be >= 1 beat apart.
-        - ACCENT same-target starts must be >= 2 beats apart.
-        - If either placement is BURST, same-target starts must be >= 1 bar apart.
-        """
-        beats_per_bar = max(1, section_context.timing_context.beats_per_bar)
-
-        for lane_plan in plan.lane_plans:
-            # Track last kept start+duration per target across entire lane.
-            last_kept: dict[str, tuple[int, EffectDuration]] = {}
-
-            for coordination_plan in lane_plan.coordination_plans:
-                if not coordination_plan.placements:
-                    continue
-
-                placements_sorted = sorted(
-                    coordination_plan.placements,
-                    key=lambda p: (p.start.bar, p.start.beat, p.placement_id),
-                )
-                kept = []
-                for placement in placements_sorted:
-                    target_key = f"{placement.target.type.value}:{placement.target.id}"
-                    start_beat = (placement.start.bar - 1) * beats_per_bar + placement.start.beat
-
-                    prev = last_kept.get(target_key)
-                    keep = True
-                    if prev is not None:
-                        prev_start, prev_duration = prev
-                        min_gap = beats_per_bar if lane_plan.lane == LaneKind.ACCENT else 1
-                        if (
-                            prev_duration == EffectDuration.BURST
-                            or placement.duration == EffectDuration.BURST
-                        ):
-                            min_gap = beats_per_bar
-                        if start_beat - prev_start < min_gap:
-                            keep = False
-
-                    if keep:
-                        kept.append(placement)
-                        last_kept[target_key] = (start_beat, placement.duration)
-
-                coordination_plan.placements = kept
-
-    def _drop_empty_coordination_plans(
-        self,
-        plan: SectionCoordinationPlan,
-        section_context: SectionPlanningContext,
-    ) -> None:
-        """Drop coordination plans that have no usable content.
-
-        A UNIFIED/COMPLEMENTARY plan with no placements does nothing.
-        A SEQUENCED/CALL_RESPONSE/RIPPLE plan with no window does nothing.
-        Leaving them in causes the judge to flag UNIFIED_EMPTY_PLACEMENTS
-        errors that the LLM fails to self-correct.
-        """
-        for lane_plan in plan.lane_plans:
-            original_count = len(lane_plan.coordination_plans)
-            kept = []
-            for coord_plan in lane_plan.coordination_plans:
-                has_placements = bool(coord_plan.placements)
-                has_window = coord_plan.window is not None
-                if has_placements or has_window:
-                    kept.append(coord_plan)
-            lane_plan.coordination_plans = kept
-            dropped = original_count - len(kept)
-            if dropped:
-                logger.debug(
-                    "Dropped %d empty coordination plan(s) in %s/%s",
-                    dropped,
-                    section_context.section_id,
-                    lane_plan.lane.value,
-                )
-
-    def _drop_sequenced_window_conflicts(
-        self,
-        plan: SectionCoordinationPlan,
-        section_context: SectionPlanningContext,
-    ) -> None:
-        """Drop placements on targets already covered by a SEQUENCED window.
-
-        A SEQUENCED window occupies ALL its targets for the full window
-        duration.  A separate placement on the same target in the same
-        lane causes TARGET_SELF_OVERLAP.  Rather than burning an
-        iteration, remove the redundant placement deterministically.
-        """
-        for lane_plan in plan.lane_plans:
-            # Collect target IDs covered by any SEQUENCED/CALL_RESPONSE/RIPPLE window
-            window_target_ids: set[str] = set()
-            for coord_plan in lane_plan.coordination_plans:
-                if coord_plan.window is not None and coord_plan.coordination_mode in (
-                    CoordinationMode.SEQUENCED,
-                    CoordinationMode.CALL_RESPONSE,
-                    CoordinationMode.RIPPLE,
-                ):
-                    for target in coord_plan.targets:
-                        window_target_ids.add(f"{target.type.value}:{target.id}")
-
-            if not window_target_ids:
-                continue
-
-            # Remove conflicting placements from ALL coord plans in this lane
-            for coord_plan in lane_plan.coordination_plans:
-                if not coord_plan.placements:
-                    continue
-                original_count = len(coord_plan.placements)
-                coord_plan.placements = [
-                    p
-                    for p in coord_plan.placements
-                    if f"{p.target.type.value}:{p.target.id}" not in window_target_ids
-                ]
-                dropped = original_count - len(coord_plan.placements)
-                if dropped:
-                    logger.debug(
-                        "Dropped %d SEQUENCED-window conflict(s) in %s/%s "
-                        "(targets already in window: %s)",
-                        dropped,
-                        section_context.section_id,
-                        lane_plan.lane.value,
-                        window_target_ids,
-                    )
-
-    def _compute_max_valid_bar(
-        self,
-        section_context: SectionPlanningContext,
-    ) -> int:
-        """Compute the last bar whose start falls within section bounds."""
-        timing_ctx = section_context.timing_context
-        section_end_ms = section_context.end_ms
-        return max(
-            (bar for bar, info in timing_ctx.bar_map.items() if info.start_ms < section_end_ms),
-            default=max(timing_ctx.bar_map.keys()),
-        )
-
-    def _snap_to_section_bounds(
-        self,
-        plan: SectionCoordinationPlan,
-        section_context: SectionPlanningContext,
-    ) -> None:
-        """Snap all timing references to valid section bounds.
-
-        Handles two recurring LLM planning errors deterministically:
-        1. Placements whose resolved start_ms >= section_end_ms → dropped
-        2. SEQUENCED window ends past section end → clamped
-
-        Uses millisecond resolution (not just bar numbers) to catch
-        beat-level overflows where bar N is valid but beat 2+ of bar N
-        resolves past section_end_ms.
-        """
-        from twinklr.core.sequencer.vocabulary.planning import PlanningTimeRef
-
-        timing_ctx = section_context.timing_context
-        section_end_ms = section_context.end_ms
-        max_valid_bar = self._compute_max_valid_bar(section_context)
-
-        for lane_plan in plan.lane_plans:
-            for coord_plan in lane_plan.coordination_plans:
-                # 1. Drop placements whose resolved start_ms is out of bounds
-                if coord_plan.placements:
-                    original_count = len(coord_plan.placements)
-                    kept: list[Any] = []
-                    for p in coord_plan.placements:
-                        try:
-                            start_ms = timing_ctx.resolve_planning_time_ref(p.start)
-                        except (ValueError, KeyError):
-                            kept.append(p)
-                            continue
-                        if start_ms < section_end_ms:
-                            kept.append(p)
-                    coord_plan.placements = kept
-                    dropped = original_count - len(kept)
-                    if dropped:
-                        logger.debug(
-                            "Dropped %d out-of-bounds placement(s) in %s/%s (section_end=%dms)",
-                            dropped,
-                            section_context.section_id,
-                            lane_plan.lane.value,
-                            section_end_ms,
-                        )
-
-                # 2. Clamp window end to max_valid_bar
-                if coord_plan.window and coord_plan.window.end.bar > max_valid_bar:
-                    old_end = coord_plan.window.end.bar
-                    clamped_end = PlanningTimeRef(bar=max_valid_bar, beat=1)
-                    coord_plan.window = coord_plan.window.model_copy(update={"end": clamped_end})
-                    logger.debug(
-                        "Clamped window end bar %d→%d in %s/%s",
-                        old_end,
-                        max_valid_bar,
-                        section_context.section_id,
-                        lane_plan.lane.value,
-                    )
@@ -0,0 +1,203 @@
+"""Deterministic section-plan features for the local pre-judge.
+
+Summarises a SectionCoordinationPlan as a flat dict of floats: coverage of
+the display and of the section's focus targets, template diversity per lane
+(``compute_lane_stats``), timing-driver consistency and accent distribution,
+plus the section judge's recurring soft-fail patterns as flagged by the
+validator's warnings. Feature names are stable: they key the fitted
+pre-judge model.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from twinklr.core.agents.sequencer.group_planner.context import SectionPlanningContext
+from twinklr.core.agents.sequencer.group_planner.validators import (
+    SectionPlanValidator,
+    compute_lane_stats,
+)
+from twinklr.core.agents.shared.judge.prejudge import PlanFeaturizer
+from twinklr.core.sequencer.planning import SectionCoordinationPlan
+from twinklr.core.sequencer.templates.group.models import GroupPlacement
+from twinklr.core.sequencer.vocabulary import (
+    CoordinationMode,
+    EnergyTarget,
+    IntensityLevel,
+    LaneKind,
+    TargetType,
+)
+
+logger = logging.getLogger(__name__)
+
+_INTENSITY_LEVEL = {
+    IntensityLevel.WHISPER: 0.0,
+    IntensityLevel.SOFT: 0.25,
+    IntensityLevel.MED: 0.5,
+    IntensityLevel.STRONG: 0.75,
+    IntensityLevel.PEAK: 1.0,
+}
+
+_ENERGY_LEVEL = {
+    EnergyTarget.LOW.value: 0.25,
+    EnergyTarget.MED.value: 0.5,
+    EnergyTarget.HIGH.value: 0.75,
+    EnergyTarget.BUILD.value: 0.6,
+    EnergyTarget.RELEASE.value: 0.4,
+    EnergyTarget.PEAK.value: 1.0,
+}
+
+_WINDOW_MODES = {
+    CoordinationMode.SEQUENCED,
+    CoordinationMode.CALL_RESPONSE,
+    CoordinationMode.RIPPLE,
+}
+
+# Guidance sent to the planner when a feature drives a local REVISE
+FEATURE_HINTS: dict[str, str] = {
+    "group_coverage": "Cover more of the display: give placements to groups that have none.",
+    "primary_coverage": "Every primary focus target needs at least one placement.",
+    "secondary_coverage": "Give secondary targets supporting placements (BASE or RHYTHM).",
+    "placements_per_bar": "Adjust placement density to the section's motion density.",
+    "template_unique_ratio": "Vary templates within each lane instead of repeating one.",
+    "template_top2_share": "Spread placements across more templates; two dominate the section.",
+    "template_max_consecutive": "Avoid using the same template back-to-back in a lane.",
+    "accent_per_bar": "Rebalance accent density: accents should punctuate, not blanket.",
+    "accent_target_spread": "Distribute accents across targets rather than one group.",
+    "accent_strong_share": "Reserve STRONG/PEAK accents for focal moments.",
+    "intensity_energy_gap": "Match lane intensities to the section's energy target.",
+    "timing_driver_mismatch": "Align each lane's timing_driver with how placements are anchored.",
+    "identical_accent_on_primaries": "Give one primary target the focal accent; vary the others.",
+    "window_plan_share": "Balance sequenced windows with direct placements.",
+    "lane_count": "Use the BASE, RHYTHM and ACCENT lanes the section calls for.",
+}
+
+
+def _section_bar_count(section_context: SectionPlanningContext) -> int:
+    bars = [
+        bar
+        for bar, info in section_context.timing_context.bar_map.items()
+        if section_context.start_ms <= info.start_ms < section_context.end_ms
+    ]
+    return max(1, len(bars))
+
+
+def extract_section_plan_features(
+    plan: SectionCoordinationPlan,
+    section_context: SectionPlanningContext,
+    validator: SectionPlanValidator,
+) -> dict[str, float]:
+    """Compute pre-judge features for a section plan.
+
+    Args:
+        plan: Plan that passed heuristic validation
+        section_context: Section planning context
+        validator: Validator for the section (warnings become features)
+
+    Returns:
+        Feature name → value
+    """
+    n_bars = _section_bar_count(section_context)
+    lanes = {lane_plan.lane for lane_plan in plan.lane_plans}
+
+    placements_by_lane: dict[LaneKind, list[GroupPlacement]] = {}
+    targeted_groups: set[str] = set()
+    coordination_count = window_count = 0
+    for lane_plan in plan.lane_plans:
+        lane_placements = placements_by_lane.setdefault(lane_plan.lane, [])
+        for coord_plan in lane_plan.coordination_plans:
+            coordination_count += 1
+            window_count += int(
+                coord_plan.coordination_mode in _WINDOW_MODES and coord_plan.window is not None
+            )
+            targeted_groups.update(t.id for t in coord_plan.targets if t.type == TargetType.GROUP)
+            lane_placements.extend(coord_plan.placements)
+            targeted_groups.update(
+                p.target.id for p in coord_plan.placements if p.target.type == TargetType.GROUP
+            )
+
+    all_placements = [p for ps in placements_by_lane.values() for p in ps]
+    all_groups = {g.id for g in section_context.choreo_graph.groups}
+    primary = set(section_context.primary_focus_targets)
+    secondary = set(section_context.secondary_targets)
+
+    lane_stats = [
+        compute_lane_stats(placements, lane)
+        for lane, placements in placements_by_lane.items()
+        if placements
+    ]
+
+    accents = placements_by_lane.get(LaneKind.ACCENT, [])
+    mean_intensity = (
+        sum(_INTENSITY_LEVEL.get(p.intensity, 0.5) for p in all_placements) / len(all_placements)
+        if all_placements
+        else 0.0
+    )
+    energy_level = _ENERGY_LEVEL.get(section_context.energy_target.upper(), 0.5)
+
+    warning_codes = [w.code for w in validator.validate(plan).warnings]
+
+    return {
+        "lane_count": float(len(lanes)),
+        "has_base_lane": float(LaneKind.BASE in lanes),
+        "has_rhythm_lane": float(LaneKind.RHYTHM in lanes),
+        "has_accent_lane": float(LaneKind.ACCENT in lanes),
+        "placement_count": float(len(all_placements)),
+        "placements_per_bar": len(all_placements) / n_bars,
+        "window_plan_share": window_count / coordination_count if coordination_count else 0.0,
+        "group_coverage": (
+            len(targeted_groups & all_groups) / len(all_groups) if all_groups else 1.0
+        ),
+        "primary_coverage": len(targeted_groups & primary) / len(primary) if primary else 1.0,
+        "secondary_coverage": (
+            len(targeted_groups & secondary) / len(secondary) if secondary else 1.0
+        ),
+        "template_unique_ratio": (
+            sum(s.unique_template_ids / s.total_placements for s in lane_stats) / len(lane_stats)
+            if lane_stats
+            else 0.0
+        ),
+        "template_top2_share": max((s.top2_share for s in lane_stats), default=0.0),
+        "template_max_consecutive": float(
+            max((s.max_consecutive_same_template for s in lane_stats), default=0)
+        ),
+        "accent_per_bar": len(accents) / n_bars,
+        "accent_target_spread": (
+            len({p.target.id for p in accents}) / len(accents) if accents else 0.0
+        ),
+        "accent_strong_share": (
+            sum(p.intensity in (IntensityLevel.STRONG, IntensityLevel.PEAK) for p in accents)
+            / len(accents)
+            if accents
+            else 0.0
+        ),
+        "intensity_energy_gap": abs(mean_intensity - energy_level) if all_placements else 0.0,
+        "timing_driver_mismatch": float(warning_codes.count("TIMING_DRIVER_MISMATCH")),
+        "identical_accent_on_primaries": float(
+            warning_codes.count("IDENTICAL_ACCENT_ON_PRIMARIES")
+        ),
+        "validator_warning_count": float(len(warning_codes)),
+    }
+
+
+def build_section_plan_featurizer(
+    section_context: SectionPlanningContext,
+) -> PlanFeaturizer[SectionCoordinationPlan]:
+    """Featurizer for one section's plans.
+
+    Args:
+        section_context: Section planning context
+
+    Returns:
+        PlanFeaturizer bound to the section
+    """
+    validator = SectionPlanValidator(
+        choreo_graph=section_context.choreo_graph,
+        template_catalog=section_context.template_catalog,
+        timing_context=section_context.timing_context,
+        recipe_catalog=section_context.recipe_catalog,
+    )
+    return PlanFeaturizer(
+        extract=lambda plan: extract_section_plan_features(plan, section_context, validator),
+        hints=FEATURE_HINTS,
+    )
@@ -0,0 +1,239 @@
+"""Deterministic auto-repair of GroupPlanner output.
+
+Applies the typed ``FixAction``s emitted by ``SectionPlanValidator`` and
+re-validates in-process, so mechanical issues (aliased group IDs, placements
+outside the section, duplicate ``group_order`` entries, same-target overlaps,
+empty coordination plans) never cost a planner iteration. Only issues without
+a fix are left for the LLM.
+
+Repairs mutate the plan in place, like the orchestrator's other sanitizers.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from twinklr.core.agents.sequencer.group_planner.validators import (
+    FixAction,
+    FixKind,
+    SectionPlanValidator,
+    ValidationResult,
+)
+from twinklr.core.sequencer.planning import SectionCoordinationPlan
+from twinklr.core.sequencer.templates.group.models.coordination import CoordinationPlan
+from twinklr.core.sequencer.vocabulary import PlanningTimeRef, TargetType
+
+logger = logging.getLogger(__name__)
+
+# Apply order within a pass: renames first (they can resolve other issues),
+# coordination plan drops last (they shift coordination indices).
+_FIX_ORDER = {
+    FixKind.REPLACE_GROUP_ID: 0,
+    FixKind.DEDUPE_GROUP_ORDER: 1,
+    FixKind.DROP_GROUP_ORDER_ENTRIES: 2,
+    FixKind.CLAMP_WINDOW_END: 3,
+    FixKind.DROP_PLACEMENT: 4,
+    FixKind.DROP_COORDINATION_PLAN: 5,
+}
+
+
+@dataclass
+class RepairResult:
+    """Outcome of repairing a plan.
+
+    Attributes:
+        result: Validation result of the repaired plan.
+        applied: Fixes that changed the plan, in application order.
+        passes: Validation passes run (including the final one).
+    """
+
+    result: ValidationResult
+    applied: list[FixAction] = field(default_factory=list)
+    passes: int = 0
+
+
+def _coordination_plan(plan: SectionCoordinationPlan, fix: FixAction) -> CoordinationPlan | None:
+    if fix.lane_index >= len(plan.lane_plans) or fix.coordination_index is None:
+        return None
+    coord_plans = plan.lane_plans[fix.lane_index].coordination_plans
+    if fix.coordination_index >= len(coord_plans):
+        return None
+    return coord_plans[fix.coordination_index]
+
+
+def _replace_group_id(coord_plan: CoordinationPlan, old_id: str, new_id: str) -> bool:
+    changed = False
+
+    targets = []
+    for target in coord_plan.targets:
+        if target.type == TargetType.GROUP and target.id == old_id:
+            target = target.model_copy(update={"id": new_id})
+            changed = True
+        targets.append(target)
+    coord_plan.targets = targets
+
+    placements = []
+    for placement in coord_plan.placements:
+        ptarget = placement.target
+        if ptarget.type == TargetType.GROUP and ptarget.id == old_id:
+            new_target = ptarget.model_copy(update={"id": new_id})
+            placement = placement.model_copy(update={"target": new_target})
+            changed = True
+        placements.append(placement)
+    coord_plan.placements = placements
+
+    config = coord_plan.config
+    if config is not None and old_id in config.group_order:
+        group_order = [new_id if gid == old_id else gid for gid in config.group_order]
+        coord_plan.config = config.model_copy(update={"group_order": group_order})
+        changed = True
+
+    return changed
+
+
+def _edit_group_order(coord_plan: CoordinationPlan, fix: FixAction) -> bool:
+    config = coord_plan.config
+    if config is None:
+        return False
+    if fix.kind == FixKind.DEDUPE_GROUP_ORDER:
+        group_order = list(dict.fromkeys(config.group_order))
+    else:
+        dropped = set(fix.values)
+        group_order = [gid for gid in config.group_order if gid not in dropped]
+    if group_order == config.group_order:
+        return False
+    coord_plan.config = config.model_copy(update={"group_order": group_order})
+    return True
+
+
+def _drop_placement(plan: SectionCoordinationPlan, fix: FixAction) -> bool:
+    if fix.lane_index >= len(plan.lane_plans):
+        return False
+    if fix.coordination_index is None:
+        # Lane-wide (cross-plan overlap): drop the first placement with the id
+        candidates = plan.lane_plans[fix.lane_index].coordination_plans
+    else:
+        coord_plan = _coordination_plan(plan, fix)
+        candidates = [coord_plan] if coord_plan is not None else []
+
+    for coord_plan in candidates:
+        for i, placement in enumerate(coord_plan.placements):
+            if placement.placement_id == fix.placement_id:
+                coord_plan.placements = coord_plan.placements[:i] + coord_plan.placements[i + 1 :]
+                return True
+    return False
+
+
+def apply_fixes(plan: SectionCoordinationPlan, fixes: Iterable[FixAction]) -> list[FixAction]:
+    """Apply fix actions to a plan in place.
+
+    Fixes must all come from one validation of ``plan``: their indices refer
+    to the plan as it was validated. Duplicate fixes are applied once.
+
+    Args:
+        plan: Plan to repair (mutated).
+        fixes: Fix actions from ``SectionPlanValidator.validate``.
+
+    Returns:
+        Fixes that changed the plan, in application order.
+    """
+    ordered = sorted(
+        dict.fromkeys(fixes),
+        key=lambda f: (
+            _FIX_ORDER[f.kind],
+            # Drop later coordination plans first so earlier indices stay valid
+            -(f.coordination_index or 0) if f.kind == FixKind.DROP_COORDINATION_PLAN else 0,
+        ),
+    )
+
+    applied: list[FixAction] = []
+    # The same overlap is reported per coordination plan and lane-wide
+    dropped: set[tuple[int, str | None]] = set()
+    for fix in ordered:
+        changed = False
+        if fix.kind == FixKind.DROP_PLACEMENT:
+            key = (fix.lane_index, fix.placement_id)
+            if key not in dropped:
+                changed = _drop_placement(plan, fix)
+                dropped.add(key)
+        elif fix.kind == FixKind.DROP_COORDINATION_PLAN:
+            coord_plan = _coordination_plan(plan, fix)
+            if coord_plan is not None and fix.coordination_index is not None:
+                del plan.lane_plans[fix.lane_index].coordination_plans[fix.coordination_index]
+                changed = True
+        else:
+            coord_plan = _coordination_plan(plan, fix)
+            if coord_plan is None:
+                pass
+            elif fix.kind == FixKind.REPLACE_GROUP_ID:
+                if fix.old_value is not None and fix.new_value is not None:
+                    changed = _replace_group_id(coord_plan, fix.old_value, fix.new_value)
+            elif fix.kind == FixKind.CLAMP_WINDOW_END:
+                window = coord_plan.window
+                if window is not None and fix.bar is not None and window.end.bar > fix.bar:
+                    end = PlanningTimeRef(bar=fix.bar, beat=1)
+                    coord_plan.window = window.model_copy(update={"end": end})
+                    changed = True
+            else:
+                changed = _edit_group_order(coord_plan, fix)
+
+        if changed:
+            applied.append(fix)
+
+    return applied
+
+
+class PlanRepairer:
+    """Validate → apply fixes → re-validate until no fixable issue remains.
+
+    Args:
+        validator: Validator whose issues carry the fixes.
+        max_passes: Maximum repair passes before giving up on fixable
+            issues (later passes catch issues exposed by earlier fixes,
+            e.g. a plan emptied by dropped placements).
+
+    Example:
+        >>> repairer = PlanRepairer(validator)
+        >>> outcome = repairer.repair(plan)
+        >>> remaining = outcome.result.errors
+    """
+
+    def __init__(self, validator: SectionPlanValidator, *, max_passes: int = 3) -> None:
+        self.validator = validator
+        self.max_passes = max(1, max_passes)
+
+    def repair(self, plan: SectionCoordinationPlan) -> RepairResult:
+        """Repair ``plan`` in place and return the final validation result.
+
+        Args:
+            plan: Plan to repair (mutated).
+
+        Returns:
+            RepairResult; ``result.errors`` are the issues left for the LLM.
+        """
+        outcome = RepairResult(result=self.validator.validate(plan), passes=1)
+
+        while outcome.passes <= self.max_passes:
+            issues = [*outcome.result.errors, *outcome.result.warnings]
+            fixes = [issue.fix for issue in issues if issue.fix is not None]
+            if not fixes:
+                break
+
+            applied = apply_fixes(plan, fixes)
+            if not applied:
+                break
+            outcome.applied.extend(applied)
+            outcome.result = self.validator.validate(plan)
+            outcome.passes += 1
+
+        if outcome.applied:
+            logger.debug(
+                "Auto-repaired %d issue(s) in %s over %d pass(es); %d error(s) remain",
+                len(outcome.applied),
+                plan.section_id,
+                outcome.passes,
+                len(outcome.result.errors),
+            )
+        return outcome
@@ -179,8 +179,9 @@ class GroupPlannerStage:
                 result_extractor=extract_plan,
                 result_type=IterationResult,
                 cache_key_fn=lambda: orchestrator.get_cache_key(section_context),
-                cache_version="1",
+                cache_version="2",
                 cache_domain=self.name,  # Group all sections under "group_planner"
+                session_scoped=False,  # Same section context → same plan
             )
 
         except ValueError as e:
@@ -1,7 +1,11 @@
 """Deterministic validators for GroupPlanner outputs.
 
 These validators run before LLM judge evaluation to catch
-structural and timing issues quickly.
+structural and timing issues quickly. Mechanical issues (aliased group IDs,
+placements outside the section, duplicate ``group_order`` entries, same-target
+overlaps, empty coordination plans) carry a typed ``FixAction`` that
+``group_planner.repair`` applies in-process instead of spending a planner
+iteration on them.
 
 Updated for categorical planning (IntensityLevel, EffectDuration, PlanningTimeRef).
 """
@@ -32,6 +36,14 @@ from twinklr.core.sequencer.vocabulary import (
 )
 from twinklr.core.sequencer.vocabulary.choreography import ChoreoTag
 
+# Group id aliases the planner commonly drifts to (singular/plural swaps)
+_GROUP_ID_ALIASES: dict[str, str] = {
+    "MATRICES": "MATRIX",
+    "WREATH": "WREATHS",
+    "ICICLE": "ICICLES",
+    "SNOWFLAKE": "SNOWFLAKES",
+}
+
 
 class ValidationSeverity(str, Enum):
     """Severity of validation issue."""
@@ -40,6 +52,46 @@ class ValidationSeverity(str, Enum):
     WARNING = "WARNING"  # Advisory, does not block
 
 
+class FixKind(str, Enum):
+    """Kind of machine-applicable repair attached to a validation issue."""
+
+    REPLACE_GROUP_ID = "REPLACE_GROUP_ID"  # Rewrite an aliased/near-miss group id
+    DROP_PLACEMENT = "DROP_PLACEMENT"  # Remove one placement
+    CLAMP_WINDOW_END = "CLAMP_WINDOW_END"  # Pull a window end back into the section
+    DEDUPE_GROUP_ORDER = "DEDUPE_GROUP_ORDER"  # Keep first occurrence of each id
+    DROP_GROUP_ORDER_ENTRIES = "DROP_GROUP_ORDER_ENTRIES"  # Remove ids not in targets
+    DROP_COORDINATION_PLAN = "DROP_COORDINATION_PLAN"  # Remove an empty coordination plan
+
+
+class FixAction(BaseModel):
+    """Deterministic repair for a validation issue.
+
+    Locations are indices into ``plan.lane_plans`` and the lane's
+    ``coordination_plans`` as they were when the plan was validated.
+
+    Attributes:
+        kind: Repair to apply.
+        lane_index: Index of the lane plan.
+        coordination_index: Index of the coordination plan (None = whole lane).
+        placement_id: Placement to drop (DROP_PLACEMENT).
+        old_value: Group id to replace (REPLACE_GROUP_ID).
+        new_value: Replacement group id (REPLACE_GROUP_ID).
+        values: Group ids to remove (DROP_GROUP_ORDER_ENTRIES).
+        bar: Bar to clamp to (CLAMP_WINDOW_END).
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    kind: FixKind
+    lane_index: int
+    coordination_index: int | None = None
+    placement_id: str | None = None
+    old_value: str | None = None
+    new_value: str | None = None
+    values: tuple[str, ...] = ()
+    bar: int | None = None
+
+
 class ValidationIssue(BaseModel):
     """Single validation issue."""
 
@@ -50,6 +102,7 @@ class ValidationIssue(BaseModel):
     message: str
     field_path: str | None = None
     fix_hint: str | None = None
+    fix: FixAction | None = None
 
 
 class ValidationResult(BaseModel):
@@ -138,6 +191,21 @@ class SectionPlanValidator:
             return max(self.timing_context.bar_map.keys())
         return 1
 
+    def _get_last_bar_in_section(self, section_end_ms: int) -> int:
+        """Get the last bar that starts before the section end.
+
+        Args:
+            section_end_ms: End time in milliseconds
+
+        Returns:
+            Bar number (1-indexed)
+        """
+        bar_map = self.timing_context.bar_map
+        return max(
+            (bar for bar, info in bar_map.items() if info.start_ms < section_end_ms),
+            default=max(bar_map.keys(), default=1),
+        )
+
     def _get_section_end_beat(self, section_end_ms: int) -> int:
         """Get the beat number for a given millisecond position.
 
@@ -180,10 +248,34 @@ class SectionPlanValidator:
             section_end_ms = self.timing_context.resolve_to_ms(section_bounds.end)
 
         # Validate each lane plan
-        for lane_plan in plan.lane_plans:
+        for lane_index, lane_plan in enumerate(plan.lane_plans):
             target_timings: dict[str, list[tuple[int, int, str]]] = defaultdict(list)
 
-            for coord_plan in lane_plan.coordination_plans:
+            for coord_index, coord_plan in enumerate(lane_plan.coordination_plans):
+                # A plan with neither placements nor a window does nothing
+                if not coord_plan.placements and coord_plan.window is None:
+                    errors.append(
+                        ValidationIssue(
+                            severity=ValidationSeverity.ERROR,
+                            code="EMPTY_COORDINATION_PLAN",
+                            message=(
+                                f"{coord_plan.coordination_mode.value} coordination plan "
+                                f"in {lane_plan.lane.value} lane has no placements or window"
+                            ),
+                            field_path=(
+                                f"lane_plans[{lane_plan.lane.value}]"
+                                f".coordination_plans[{coord_index}]"
+                            ),
+                            fix_hint="Add placements (or a window) or remove the plan",
+                            fix=FixAction(
+                                kind=FixKind.DROP_COORDINATION_PLAN,
+                                lane_index=lane_index,
+                                coordination_index=coord_index,
+                            ),
+                        )
+                    )
+                    continue
+
                 # Validate coordination-mode-specific required fields
                 errors.extend(
                     self._validate_coordination_requirements(
@@ -194,7 +286,12 @@ class SectionPlanValidator:
 
                 # Validate targets
                 for target in coord_plan.targets:
-                    target_errors = self._validate_target(target, lane_plan.lane.value)
+                    target_errors = self._validate_target(
+                        target,
+                        lane_plan.lane.value,
+                        lane_index=lane_index,
+                        coordination_index=coord_index,
+                    )
                     errors.extend(target_errors)
 
                 # Validate config for sequenced modes
@@ -205,6 +302,8 @@ class SectionPlanValidator:
                             coord_plan.config.group_order,
                             target_ids,
                             lane_plan.lane.value,
+                            lane_index=lane_index,
+                            coordination_index=coord_index,
                         )
                     )
 
@@ -225,6 +324,8 @@ class SectionPlanValidator:
                     lane_plan.lane,
                     section_start_ms,
                     section_end_ms,
+                    lane_index=lane_index,
+                    coordination_index=coord_index,
                 )
                 errors.extend(placement_errors)
 
@@ -234,22 +335,25 @@ class SectionPlanValidator:
 
                 # Validate window (for sequenced modes)
                 if coord_plan.window:
-                    window_errors, window_timings = self._validate_window(
+                    window_errors, window_warnings, window_timings = self._validate_window(
                         coord_plan.window,
                         coord_plan.coordination_mode,
                         coord_plan.targets,
                         lane_plan.lane,
                         section_start_ms,
                         section_end_ms,
+                        lane_index=lane_index,
+                        coordination_index=coord_index,
                     )
                     errors.extend(window_errors)
+                    warnings.extend(window_warnings)
 
                     for target_key, timings in window_timings.items():
                         target_timings[target_key].extend(timings)
 
             # Self-overlap check (real-world validated: 0% in 14 profiles)
             overlap_errors, overlap_warnings = self._check_target_self_overlaps(
-                target_timings, lane_plan.lane
+                target_timings, lane_plan.lane, lane_index=lane_index
             )
             errors.extend(overlap_errors)
             warnings.extend(overlap_warnings)
@@ -314,7 +418,36 @@ class SectionPlanValidator:
 
         return errors
 
-    def _validate_target(self, target: PlanTarget, lane_name: str) -> list[ValidationIssue]:
+    def _resolve_group_alias(self, raw_id: str) -> str | None:
+        """Map a near-miss group id to a single high-confidence valid id.
+
+        Intentionally conservative: only case/whitespace drift, known
+        singular/plural aliases, and a single close match (cutoff 0.84)
+        are resolved.
+
+        Args:
+            raw_id: Group id as emitted by the planner.
+
+        Returns:
+            Valid group id, or None if there is no confident match.
+        """
+        token = raw_id.strip().upper()
+        alias = _GROUP_ID_ALIASES.get(token)
+        if alias is not None and alias in self._valid_group_ids:
+            return alias
+        if token in self._valid_group_ids:
+            return token
+        close = get_close_matches(token, sorted(self._valid_group_ids), n=1, cutoff=0.84)
+        return close[0] if close else None
+
+    def _validate_target(
+        self,
+        target: PlanTarget,
+        lane_name: str,
+        *,
+        lane_index: int,
+        coordination_index: int,
+    ) -> list[ValidationIssue]:
         """Validate a typed PlanTarget.
 
         Checks that the target id is valid for its type.
@@ -322,6 +455,8 @@ class SectionPlanValidator:
         Args:
             target: Target to validate.
             lane_name: Name of the lane (for error messages).
+            lane_index: Index of the lane plan (for fix actions).
+            coordination_index: Index of the coordination plan (for fix actions).
 
         Returns:
             List of validation issues.
@@ -332,6 +467,7 @@ class SectionPlanValidator:
                 sorted_ids = sorted(self._valid_group_ids)
                 close = get_close_matches(target.id, sorted_ids, n=2, cutoff=0.4)
                 suggestion = f" Did you mean: {', '.join(close)}?" if close else ""
+                resolved = self._resolve_group_alias(target.id)
                 errors.append(
                     ValidationIssue(
                         severity=ValidationSeverity.ERROR,
@@ -345,6 +481,17 @@ class SectionPlanValidator:
                             f"Replace '{target.id}' with an exact group id from "
                             f"the list above." + (f" Closest match: {close[0]}" if close else "")
                         ),
+                        fix=(
+                            FixAction(
+                                kind=FixKind.REPLACE_GROUP_ID,
+                                lane_index=lane_index,
+                                coordination_index=coordination_index,
+                                old_value=target.id,
+                                new_value=resolved,
+                            )
+                            if resolved is not None
+                            else None
+                        ),
                     )
                 )
         elif target.type == TargetType.ZONE:
@@ -503,7 +650,13 @@ class SectionPlanValidator:
         return warnings
 
     def _validate_group_order(
-        self, group_order: list[str], target_ids: list[str], lane_name: str
+        self,
+        group_order: list[str],
+        target_ids: list[str],
+        lane_name: str,
+        *,
+        lane_index: int,
+        coordination_index: int,
     ) -> list[ValidationIssue]:
         """Validate group_order for duplicates and membership in targets.
 
@@ -511,6 +664,8 @@ class SectionPlanValidator:
             group_order: List of group IDs in sequence
             target_ids: List of target IDs from the coordination plan
             lane_name: Name of lane
+            lane_index: Index of the lane plan (for fix actions)
+            coordination_index: Index of the coordination plan (for fix actions)
 
         Returns:
             List of validation issues
@@ -533,6 +688,11 @@ class SectionPlanValidator:
                     message=f"Duplicate groups in group_order: {duplicates}",
                     field_path=f"lane_plans[{lane_name}].config.group_order",
                     fix_hint="Remove duplicate entries from group_order array",
+                    fix=FixAction(
+                        kind=FixKind.DEDUPE_GROUP_ORDER,
+                        lane_index=lane_index,
+                        coordination_index=coordination_index,
+                    ),
                 )
             )
 
@@ -541,6 +701,8 @@ class SectionPlanValidator:
         invalid_entries = [gid for gid in group_order if gid not in target_ids_set]
 
         if invalid_entries:
+            # Dropping is only safe if something is left to sequence
+            can_drop = len(invalid_entries) < len(group_order)
             errors.append(
                 ValidationIssue(
                     severity=ValidationSeverity.ERROR,
@@ -554,6 +716,16 @@ class SectionPlanValidator:
                         f"All entries in group_order must match target IDs. "
                         f"Remove {invalid_entries} or add them to targets."
                     ),
+                    fix=(
+                        FixAction(
+                            kind=FixKind.DROP_GROUP_ORDER_ENTRIES,
+                            lane_index=lane_index,
+                            coordination_index=coordination_index,
+                            values=tuple(dict.fromkeys(invalid_entries)),
+                        )
+                        if can_drop
+                        else None
+                    ),
                 )
             )
 
@@ -563,6 +735,8 @@ class SectionPlanValidator:
         self,
         target_timings: dict[str, list[tuple[int, int, str]]],
         lane: LaneKind,
+        *,
+        lane_index: int,
     ) -> tuple[list[ValidationIssue], list[ValidationIssue]]:
         """Check for self-overlap of the same target within a lane.
 
@@ -578,6 +752,8 @@ class SectionPlanValidator:
             target_timings: Dict mapping target key (type:id) to list of
                 (start_ms, end_ms, source) tuples.
             lane: Lane kind.
+            lane_index: Index of the lane plan (for fix actions). The fix
+                drops the later placement; window-vs-window overlaps have none.
 
         Returns:
             Tuple of (errors, warnings).
@@ -616,6 +792,7 @@ class SectionPlanValidator:
                                     f"used once at a time in {lane.value} "
                                     f"lane. Adjust timing or merge placements."
                                 ),
+                                fix=_drop_overlapping_placement(lane_index, source_i, source_j),
                             )
                         )
                     elif start_j < end_i:
@@ -641,6 +818,9 @@ class SectionPlanValidator:
         lane: LaneKind,
         section_start_ms: int | None,
         section_end_ms: int | None,
+        *,
+        lane_index: int,
+        coordination_index: int,
     ) -> tuple[list[ValidationIssue], dict[str, list[tuple[int, int, str]]]]:
         """Validate a list of placements.
 
@@ -651,6 +831,9 @@ class SectionPlanValidator:
         - Intensity in valid range
         - No within-coordination overlaps on same target
 
+        Out-of-section placements and the later placement of each overlap
+        carry a DROP_PLACEMENT fix.
+
         Returns:
             Tuple of (errors, target_timings keyed by ``type:id``).
         """
@@ -734,6 +917,8 @@ class SectionPlanValidator:
             target_errors = self._validate_target(
                 placement.target,
                 f"placement[{placement.placement_id}]",
+                lane_index=lane_index,
+                coordination_index=coordination_index,
             )
             errors.extend(target_errors)
 
@@ -786,6 +971,12 @@ class SectionPlanValidator:
                             ),
                             field_path=f"placement[{placement.placement_id}].start",
                             fix_hint="Adjust placement start to be within section bounds",
+                            fix=FixAction(
+                                kind=FixKind.DROP_PLACEMENT,
+                                lane_index=lane_index,
+                                coordination_index=coordination_index,
+                                placement_id=placement.placement_id,
+                            ),
                         )
                     )
 
@@ -796,33 +987,42 @@ class SectionPlanValidator:
                 (start_ms, end_ms, f"placement:{placement.placement_id}")
             )
 
-        # Check for within-coordination overlaps on same target
+        # Check for within-coordination overlaps on same target. Each
+        # placement is compared against the last one that would survive
+        # dropping the earlier overlaps, so the fixes compose in one pass.
         for t_key, t_placements in placements_by_target.items():
             sorted_placements = sorted(t_placements, key=lambda x: x[0])
+            _, kept_end_ms, pid1 = sorted_placements[0]
 
-            for i in range(len(sorted_placements) - 1):
-                _, end_ms, pid1 = sorted_placements[i]
-                next_start_ms, _, pid2 = sorted_placements[i + 1]
+            for next_start_ms, next_end_ms, pid2 in sorted_placements[1:]:
+                if kept_end_ms <= next_start_ms:
+                    kept_end_ms, pid1 = next_end_ms, pid2
+                    continue
 
-                if end_ms > next_start_ms:
-                    errors.append(
-                        ValidationIssue(
-                            severity=ValidationSeverity.ERROR,
-                            code="WITHIN_COORDINATION_OVERLAP",
-                            message=(
-                                f"Overlap in {lane.value} lane on target '{t_key}': "
-                                f"placements '{pid1}' and '{pid2}'"
-                            ),
-                            field_path=f"lane_plans[{lane.value}].placements",
-                            fix_hint=(
-                                f"Each target can only have ONE active placement at a "
-                                f"time per lane. Remove '{pid2}' or change its start to "
-                                f"after '{pid1}' ends. For continuous coverage, use a "
-                                f"single SECTION-duration placement instead of multiple "
-                                f"overlapping ones."
-                            ),
-                        )
+                errors.append(
+                    ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        code="WITHIN_COORDINATION_OVERLAP",
+                        message=(
+                            f"Overlap in {lane.value} lane on target '{t_key}': "
+                            f"placements '{pid1}' and '{pid2}'"
+                        ),
+                        field_path=f"lane_plans[{lane.value}].placements",
+                        fix_hint=(
+                            f"Each target can only have ONE active placement at a "
+                            f"time per lane. Remove '{pid2}' or change its start to "
+                            f"after '{pid1}' ends. For continuous coverage, use a "
+                            f"single SECTION-duration placement instead of multiple "
+                            f"overlapping ones."
+                        ),
+                        fix=FixAction(
+                            kind=FixKind.DROP_PLACEMENT,
+                            lane_index=lane_index,
+                            coordination_index=coordination_index,
+                            placement_id=pid2,
+                        ),
                     )
+                )
 
         return errors, target_timings
 
@@ -834,13 +1034,20 @@ class SectionPlanValidator:
         lane: LaneKind,
         section_start_ms: int | None,
         section_end_ms: int | None,
-    ) -> tuple[list[ValidationIssue], dict[str, list[tuple[int, int, str]]]]:
+        *,
+        lane_index: int,
+        coordination_index: int,
+    ) -> tuple[list[ValidationIssue], list[ValidationIssue], dict[str, list[tuple[int, int, str]]]]:
         """Validate a placement window.
 
+        A window ending past the section is only a warning (the renderer
+        clamps it), but carries a CLAMP_WINDOW_END fix.
+
         Returns:
-            Tuple of (errors, target_timings keyed by ``type:id``).
+            Tuple of (errors, warnings, target_timings keyed by ``type:id``).
         """
         errors: list[ValidationIssue] = []
+        warnings: list[ValidationIssue] = []
         target_timings: dict[str, list[tuple[int, int, str]]] = defaultdict(list)
 
         if not self._is_known_template(window.template_id):
@@ -887,7 +1094,7 @@ class SectionPlanValidator:
                     field_path=f"lane_plans[{lane.value}].window.start/end",
                 )
             )
-            return errors, target_timings
+            return errors, warnings, target_timings
 
         # Validate intensity is a valid IntensityLevel enum
         if not isinstance(window.intensity, IntensityLevel):
@@ -924,6 +1131,27 @@ class SectionPlanValidator:
                         fix_hint="Adjust window start to be within section bounds",
                     )
                 )
+            else:
+                last_bar = self._get_last_bar_in_section(section_end_ms)
+                if window.end.bar > last_bar:
+                    warnings.append(
+                        ValidationIssue(
+                            severity=ValidationSeverity.WARNING,
+                            code="WINDOW_END_PAST_SECTION",
+                            message=(
+                                f"Window ends at bar {window.end.bar}, past the last "
+                                f"section bar {last_bar}"
+                            ),
+                            field_path=f"lane_plans[{lane.value}].window.end",
+                            fix_hint=f"End the window at or before bar {last_bar}",
+                            fix=FixAction(
+                                kind=FixKind.CLAMP_WINDOW_END,
+                                lane_index=lane_index,
+                                coordination_index=coordination_index,
+                                bar=last_bar,
+                            ),
+                        )
+                    )
 
         # Track window timing for all targets in this coordination_plan
         for target in targets:
@@ -932,7 +1160,22 @@ class SectionPlanValidator:
                 (start_ms, end_ms, f"window:{coordination_mode.value}")
             )
 
-        return errors, target_timings
+        return errors, warnings, target_timings
+
+
+def _drop_overlapping_placement(
+    lane_index: int, earlier_source: str, later_source: str
+) -> FixAction | None:
+    """Fix for a same-target overlap: drop the later placement if there is one.
+
+    Sources are ``placement:<id>`` or ``window:<mode>`` as recorded in
+    target timings. Windows are never dropped.
+    """
+    for source in (later_source, earlier_source):
+        kind, _, ref = source.partition(":")
+        if kind == "placement":
+            return FixAction(kind=FixKind.DROP_PLACEMENT, lane_index=lane_index, placement_id=ref)
+    return None
 
 
 # =============================================================================
@@ -224,7 +224,7 @@ class MovingHeadStage:
             descriptions: list[TemplateDescription] = []
             for tid in self.available_templates:
                 try:
-                    doc = REGISTRY.get(tid, deep_copy=False)
+                    doc = REGISTRY.get(tid)
                     tmpl = doc.template
                     meta = tmpl.metadata
 
@@ -18,6 +18,16 @@ from twinklr.core.agents.shared.judge.models import (
     RevisionRequest,
     VerdictStatus,
 )
+from twinklr.core.agents.shared.judge.prejudge import (
+    PlanFeaturizer,
+    PreJudge,
+    PreJudgeAction,
+    PreJudgeDecision,
+    PreJudgeEvaluation,
+    PreJudgeModel,
+    evaluate_prejudge,
+    prejudge_model_path,
+)
 
 __version__ = "1.0.0"
 
@@ -37,4 +47,13 @@ __all__ = [
     "FeedbackEntry",
     "FeedbackManager",
     "FeedbackType",
+    # Pre-judge
+    "PlanFeaturizer",
+    "PreJudge",
+    "PreJudgeAction",
+    "PreJudgeDecision",
+    "PreJudgeEvaluation",
+    "PreJudgeModel",
+    "evaluate_prejudge",
+    "prejudge_model_path",
 ]
@@ -7,6 +7,7 @@ refinement loops across all agents.
 from __future__ import annotations
 
 import logging
+import time
 import uuid
 from collections.abc import Callable
 from pathlib import Path
@@ -15,7 +16,7 @@ from typing import Any, Generic, TypeVar, cast
 from pydantic import BaseModel, ConfigDict, Field
 
 from twinklr.core.agents._paths import AGENTS_BASE_PATH
-from twinklr.core.agents.analytics.repository import IssueRepository
+from twinklr.core.agents.analytics.repository import IssueRepository, VerdictRecord
 from twinklr.core.agents.async_runner import AsyncAgentRunner
 from twinklr.core.agents.logging import LLMCallLogger
 from twinklr.core.agents.providers.base import LLMProvider
@@ -28,6 +29,14 @@ from twinklr.core.agents.shared.judge.models import (
     RevisionRequest,
     VerdictStatus,
 )
+from twinklr.core.agents.shared.judge.prejudge import (
+    PlanFeaturizer,
+    PreJudge,
+    PreJudgeAction,
+    PreJudgeDecision,
+    PreJudgeModel,
+    prejudge_model_path,
+)
 from twinklr.core.agents.spec import AgentSpec
 from twinklr.core.agents.state import AgentState
 
@@ -51,6 +60,10 @@ class IterationConfig(BaseModel):
         issue_tracking_storage_dir: Directory for issue storage (if enabled)
         include_historical_learning: Include historical learning context in developer prompts
         top_n_historical_issues: Number of top historical issues to include
+        enable_prejudge: Use a fitted local pre-judge (if one exists) to skip judge calls
+        prejudge_approve_threshold: Min predicted approval probability to skip the judge
+        prejudge_fail_threshold: Min predicted failure probability to revise locally
+        prejudge_min_samples: Min training verdicts before the pre-judge may act
     """
 
     max_iterations: int = Field(ge=1, le=10, default=3, description="Maximum iterations")
@@ -92,6 +105,21 @@ class IterationConfig(BaseModel):
         description="Number of top issue categories to include in learning context",
     )
 
+    # Local pre-judge (model fit offline with `twinklr prejudge fit`)
+    enable_prejudge: bool = Field(
+        default=True,
+        description="Use a fitted local pre-judge (if one exists) to skip judge calls",
+    )
+    prejudge_approve_threshold: float = Field(
+        gt=0.5, le=1.0, default=0.95, description="Min approval probability to skip the judge"
+    )
+    prejudge_fail_threshold: float = Field(
+        gt=0.5, le=1.0, default=0.95, description="Min failure probability to revise locally"
+    )
+    prejudge_min_samples: int = Field(
+        ge=1, default=50, description="Min training verdicts before the pre-judge may act"
+    )
+
     model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=True)
 
 
@@ -106,6 +134,7 @@ class IterationContext(BaseModel):
         state: Current iteration state
         verdicts: List of judge verdicts from all iterations
         revision_requests: List of revision requests from all iterations
+        prejudge_decisions: Local pre-judge decisions from all iterations
         total_tokens_used: Cumulative token usage
         termination_reason: Reason for termination (if terminated)
         final_verdict: Final judge verdict (if any)
@@ -118,6 +147,7 @@ class IterationContext(BaseModel):
     # History
     verdicts: list[JudgeVerdict] = Field(default_factory=list)
     revision_requests: list[RevisionRequest] = Field(default_factory=list)
+    prejudge_decisions: list[PreJudgeDecision] = Field(default_factory=list)
 
     # Tracking
     total_tokens_used: int = Field(ge=0, default=0)
@@ -268,6 +298,7 @@ class StandardIterationController(Generic[TPlan]):
         llm_logger: LLMCallLogger,
         prompt_base_path: Path | str = AGENTS_BASE_PATH,
         judge_context_builder: Callable[[TPlan, int], dict[str, Any]] | None = None,
+        plan_featurizer: PlanFeaturizer[TPlan] | None = None,
     ) -> IterationResult[TPlan]:
         """Run iteration loop until approval or termination.
 
@@ -282,6 +313,9 @@ class StandardIterationController(Generic[TPlan]):
             judge_context_builder: Optional callback to build judge-specific
                 variables from (plan, iteration). When provided, these variables
                 are used instead of planner variables for the judge.
+            plan_featurizer: Optional deterministic plan features. Enables the
+                local pre-judge (when a fitted model exists) and records each
+                judge verdict with the plan's features for offline fitting.
 
         Returns:
             IterationResult with final plan and metadata
@@ -323,6 +357,9 @@ class StandardIterationController(Generic[TPlan]):
         # Always set the variable (templates check for non-empty content)
         initial_variables["learning_context"] = learning_context
 
+        pre_judge = self._load_pre_judge(judge_spec.name) if plan_featurizer else None
+        last_revision_local = False
+
         plan: TPlan | None = None
         for iteration in range(self.config.max_iterations):
             context.increment_iteration()
@@ -392,6 +429,48 @@ class StandardIterationController(Generic[TPlan]):
                 context.add_revision_request(revision)
                 continue
 
+            # === PRE-JUDGE STAGE ===
+            features = plan_featurizer.extract(plan) if plan_featurizer is not None else None
+            if pre_judge is not None and plan_featurizer is not None and features is not None:
+                # A local revision is never the last word: the judge sees the
+                # next plan, and the final iteration is always judged.
+                decision = pre_judge.decide(
+                    features,
+                    allow_revise=(
+                        iteration < self.config.max_iterations - 1 and not last_revision_local
+                    ),
+                )
+                context.prejudge_decisions.append(decision)
+                self.logger.debug(
+                    f"Pre-judge (iteration {iteration + 1}): {decision.action.value} "
+                    f"(p_approve={decision.approval_probability:.2f})"
+                )
+
+                if decision.action == PreJudgeAction.APPROVE:
+                    context.update_state(IterationState.COMPLETE)
+                    self.logger.debug(
+                        f"✅ Plan approved by pre-judge "
+                        f"(p_approve={decision.approval_probability:.2f})"
+                    )
+                    return IterationResult(success=True, plan=plan, context=context)
+
+                if decision.action == PreJudgeAction.REVISE:
+                    context.update_state(IterationState.JUDGE_SOFT_FAIL)
+                    revision = PreJudge.revision_request(decision, plan_featurizer.hints)
+                    self.feedback.add_judge_soft_failure(
+                        message=revision.context_for_planner,
+                        iteration=iteration,
+                        metadata={
+                            "prejudge": True,
+                            "approval_probability": decision.approval_probability,
+                        },
+                    )
+                    context.add_revision_request(revision)
+                    last_revision_local = True
+                    continue
+
+            last_revision_local = False
+
             # === JUDGING STAGE ===
             context.update_state(IterationState.JUDGING)
             self.logger.debug("Judging plan")
@@ -426,6 +505,18 @@ class StandardIterationController(Generic[TPlan]):
 
             # Record verdict issues to repository (for learning, regardless of approval status)
             self.feedback.add_judge_verdict(verdict, iteration)
+            if features is not None and self.issue_repository is not None:
+                self.issue_repository.record_verdict(
+                    VerdictRecord(
+                        agent_name=judge_spec.name,
+                        job_id=self.job_id,
+                        iteration=iteration,
+                        score=verdict.score,
+                        status=verdict.status.value,
+                        features=features,
+                        timestamp=time.time(),
+                    )
+                )
 
             # === DECISION STAGE ===
             if verdict.status == VerdictStatus.APPROVE:
@@ -468,6 +559,30 @@ class StandardIterationController(Generic[TPlan]):
         assert plan is not None, "Plan should exist after at least one iteration"
         return self._handle_max_iterations(context, plan)
 
+    def _load_pre_judge(self, agent_name: str) -> PreJudge | None:
+        """Load the fitted pre-judge for a judge, if enabled and present.
+
+        Args:
+            agent_name: Judge name
+
+        Returns:
+            PreJudge, or None (every plan goes to the LLM judge)
+        """
+        if not self.config.enable_prejudge:
+            return None
+        model = PreJudgeModel.load(
+            prejudge_model_path(self.config.issue_tracking_storage_dir, agent_name)
+        )
+        if model is None:
+            return None
+        self.logger.debug(f"Pre-judge loaded for {agent_name} ({model.n_samples} samples)")
+        return PreJudge(
+            model,
+            approve_threshold=self.config.prejudge_approve_threshold,
+            fail_threshold=self.config.prejudge_fail_threshold,
+            min_samples=self.config.prejudge_min_samples,
+        )
+
     def _prepare_planner_variables(
         self, initial_vars: dict[str, Any], context: IterationContext, iteration: int
     ) -> dict[str, Any]:
@@ -0,0 +1,424 @@
+"""Calibrated local pre-judge for judge-based refinement loops.
+
+Predicts the LLM judge's verdict from deterministic plan features so the
+iteration controller can skip the judge call when approval is near-certain,
+or send a cheap revision request when failure is near-certain. Everything in
+between (and every plan when no model is trained yet) still goes to the judge.
+
+The model is an L2-regularised logistic regression over standardised
+features, fit offline on ``VerdictRecord`` samples that the controller
+records alongside each judge verdict. Maximum-likelihood fitting keeps the
+predicted probabilities calibrated; ``evaluate_prejudge`` reports agreement
+with recorded verdicts (``twinklr prejudge eval``).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from twinklr.core.agents.analytics.repository import VerdictRecord
+from twinklr.core.agents.shared.judge.models import RevisionPriority, RevisionRequest
+
+logger = logging.getLogger(__name__)
+
+TPlan = TypeVar("TPlan")
+
+# Same threshold JudgeVerdict uses for APPROVE
+APPROVAL_SCORE = 7.0
+
+
+class PreJudgeAction(str, Enum):
+    """What the controller should do with a plan."""
+
+    APPROVE = "APPROVE"  # Skip the LLM judge, accept the plan
+    REVISE = "REVISE"  # Skip the LLM judge, send a local revision request
+    DEFER = "DEFER"  # Run the LLM judge
+
+
+class PreJudgeDecision(BaseModel):
+    """Pre-judge outcome for one plan.
+
+    Attributes:
+        action: Controller action
+        approval_probability: Predicted probability the judge approves
+        reasons: Features pulling hardest towards failure (most negative first)
+    """
+
+    action: PreJudgeAction
+    approval_probability: float = Field(ge=0.0, le=1.0)
+    reasons: list[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+@dataclass(frozen=True)
+class PlanFeaturizer(Generic[TPlan]):
+    """Deterministic feature extractor for a plan type.
+
+    Attributes:
+        extract: Plan → feature values (stable names, finite floats)
+        hints: Feature name → revision guidance used when the pre-judge
+            sends a plan back without calling the judge
+    """
+
+    extract: Callable[[TPlan], dict[str, float]]
+    hints: Mapping[str, str] = field(default_factory=dict)
+
+
+def prejudge_model_path(storage_dir: Path | str, agent_name: str) -> Path:
+    """Location of a judge's fitted pre-judge model.
+
+    Args:
+        storage_dir: Issue tracking storage directory
+        agent_name: Judge name
+
+    Returns:
+        ``{storage_dir}/{agent_name}_prejudge.json``
+    """
+    safe_name = agent_name.replace("/", "_").replace("\\", "_")
+    return Path(storage_dir) / f"{safe_name}_prejudge.json"
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    ez = math.exp(z)
+    return ez / (1.0 + ez)
+
+
+class PreJudgeModel(BaseModel):
+    """Logistic approval model over standardised plan features.
+
+    Attributes:
+        agent_name: Judge the model was fit for
+        feature_names: Feature order for the weight vector
+        means: Per-feature training mean
+        scales: Per-feature training standard deviation (1.0 if constant)
+        weights: Per-feature logistic weight
+        bias: Logistic intercept
+        n_samples: Number of training samples
+        approval_rate: Fraction of training samples the judge approved
+    """
+
+    agent_name: str
+    feature_names: list[str]
+    means: list[float]
+    scales: list[float]
+    weights: list[float]
+    bias: float
+    n_samples: int = Field(ge=0)
+    approval_rate: float = Field(ge=0.0, le=1.0)
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def _standardize(self, features: Mapping[str, float]) -> list[float]:
+        # Missing features fall back to the training mean (0 after scaling)
+        return [
+            (float(features.get(name, mean)) - mean) / scale
+            for name, mean, scale in zip(self.feature_names, self.means, self.scales, strict=True)
+        ]
+
+    def contributions(self, features: Mapping[str, float]) -> dict[str, float]:
+        """Per-feature contribution to the approval logit.
+
+        Args:
+            features: Plan features
+
+        Returns:
+            Feature name → weight × standardised value
+        """
+        x = self._standardize(features)
+        return {
+            name: w * xi for name, w, xi in zip(self.feature_names, self.weights, x, strict=True)
+        }
+
+    def approval_probability(self, features: Mapping[str, float]) -> float:
+        """Predicted probability that the judge approves the plan.
+
+        Args:
+            features: Plan features
+
+        Returns:
+            Probability in [0, 1]
+        """
+        return _sigmoid(self.bias + sum(self.contributions(features).values()))
+
+    @classmethod
+    def fit(
+        cls,
+        agent_name: str,
+        records: Sequence[VerdictRecord],
+        *,
+        l2: float = 1.0,
+        epochs: int = 500,
+        learning_rate: float = 0.5,
+    ) -> PreJudgeModel:
+        """Fit the model on recorded verdicts.
+
+        Full-batch gradient descent on the L2-regularised log loss; the
+        sample sizes involved (hundreds to a few thousand verdicts, a few
+        dozen features) make this instant without numerical dependencies.
+
+        Args:
+            agent_name: Judge name
+            records: Verdict samples (label: score >= APPROVAL_SCORE)
+            l2: L2 penalty strength (not applied to the intercept)
+            epochs: Gradient steps
+            learning_rate: Step size
+
+        Returns:
+            Fitted model
+
+        Raises:
+            ValueError: If there are no records
+        """
+        if not records:
+            raise ValueError(f"No verdict records to fit pre-judge for '{agent_name}'")
+
+        names = sorted({name for record in records for name in record.features})
+        n = len(records)
+        labels = [1.0 if r.score >= APPROVAL_SCORE else 0.0 for r in records]
+
+        # Mean over the records that report each feature; records missing it
+        # are filled with that mean, the same rule _standardize applies
+        means = []
+        for name in names:
+            present = [float(r.features[name]) for r in records if name in r.features]
+            means.append(sum(present) / len(present))
+        rows = [
+            [float(r.features.get(name, mean)) for name, mean in zip(names, means, strict=True)]
+            for r in records
+        ]
+        scales = []
+        for j, mean in enumerate(means):
+            var = sum((row[j] - mean) ** 2 for row in rows) / n
+            scales.append(math.sqrt(var) if var > 1e-12 else 1.0)
+        x = [[(v - m) / s for v, m, s in zip(row, means, scales, strict=True)] for row in rows]
+
+        approval_rate = sum(labels) / n
+        # Start at the base rate so a featureless model predicts it exactly
+        clipped = min(max(approval_rate, 1e-3), 1 - 1e-3)
+        bias = math.log(clipped / (1 - clipped))
+        weights = [0.0] * len(names)
+
+        for _ in range(epochs):
+            grad_w = [0.0] * len(names)
+            grad_b = 0.0
+            for xi, yi in zip(x, labels, strict=True):
+                err = _sigmoid(bias + sum(w * v for w, v in zip(weights, xi, strict=True))) - yi
+                grad_b += err
+                for j, v in enumerate(xi):
+                    grad_w[j] += err * v
+            bias -= learning_rate * grad_b / n
+            weights = [
+                w - learning_rate * (g / n + l2 * w / n)
+                for w, g in zip(weights, grad_w, strict=True)
+            ]
+
+        return cls(
+            agent_name=agent_name,
+            feature_names=names,
+            means=means,
+            scales=scales,
+            weights=weights,
+            bias=bias,
+            n_samples=n,
+            approval_rate=approval_rate,
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the model as JSON.
+
+        Args:
+            path: Destination file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> PreJudgeModel | None:
+        """Load a model written by ``save``.
+
+        Args:
+            path: Model file
+
+        Returns:
+            Model, or None if the file is missing or unreadable
+        """
+        if not path.is_file():
+            return None
+        try:
+            return cls.model_validate_json(path.read_text())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable pre-judge model {path}: {e}")
+            return None
+
+
+class PreJudge:
+    """Threshold policy over a PreJudgeModel.
+
+    Args:
+        model: Fitted approval model
+        approve_threshold: Minimum approval probability to skip the judge
+        fail_threshold: Minimum failure probability to revise without the judge
+        min_samples: Models fit on fewer samples always defer
+
+    Example:
+        >>> pre_judge = PreJudge(model, approve_threshold=0.95)
+        >>> decision = pre_judge.decide(featurizer.extract(plan))
+    """
+
+    def __init__(
+        self,
+        model: PreJudgeModel,
+        *,
+        approve_threshold: float = 0.95,
+        fail_threshold: float = 0.95,
+        min_samples: int = 50,
+    ) -> None:
+        self.model = model
+        self.approve_threshold = approve_threshold
+        self.fail_threshold = fail_threshold
+        self.min_samples = min_samples
+
+    def decide(
+        self, features: Mapping[str, float], *, allow_revise: bool = True
+    ) -> PreJudgeDecision:
+        """Decide whether the LLM judge is needed for a plan.
+
+        Args:
+            features: Plan features
+            allow_revise: Whether a local REVISE is permitted (the controller
+                forbids it on the last iteration and right after another
+                local revision, so the judge always gets a say)
+
+        Returns:
+            PreJudgeDecision
+        """
+        p = self.model.approval_probability(features)
+        contributions = self.model.contributions(features)
+        ranked = sorted(contributions.items(), key=lambda item: item[1])
+        reasons = [name for name, c in ranked if c < 0][:5]
+
+        action = PreJudgeAction.DEFER
+        if self.model.n_samples >= self.min_samples:
+            if p >= self.approve_threshold:
+                action = PreJudgeAction.APPROVE
+            elif allow_revise and 1.0 - p >= self.fail_threshold:
+                action = PreJudgeAction.REVISE
+
+        return PreJudgeDecision(action=action, approval_probability=p, reasons=reasons)
+
+    @staticmethod
+    def revision_request(decision: PreJudgeDecision, hints: Mapping[str, str]) -> RevisionRequest:
+        """Build a local revision request from a REVISE decision.
+
+        Args:
+            decision: Pre-judge decision
+            hints: Feature name → revision guidance
+
+        Returns:
+            RevisionRequest targeting the features pulling towards failure
+        """
+        fixes = [hints[name] for name in decision.reasons if name in hints]
+        if not fixes:
+            fixes = ["Revise the plan: it matches patterns the judge consistently rejects."]
+        return RevisionRequest(
+            priority=RevisionPriority.HIGH,
+            focus_areas=decision.reasons[:5] or ["Quality improvement"],
+            specific_fixes=fixes,
+            avoid=[],
+            context_for_planner=(
+                "A local quality check predicts this plan will fail review "
+                f"(approval probability {decision.approval_probability:.0%}). "
+                "Address the fixes below before it is judged."
+            ),
+        )
+
+
+@dataclass
+class PreJudgeEvaluation:
+    """Agreement of a pre-judge with recorded verdicts.
+
+    Attributes:
+        n_samples: Verdicts evaluated
+        approved: Recorded verdicts that were approvals
+        skipped_approve: Plans the pre-judge would have approved locally
+        skipped_revise: Plans the pre-judge would have revised locally
+        approve_agreement: Fraction of local approvals the judge approved
+        revise_agreement: Fraction of local revisions the judge rejected
+        coverage: Fraction of judge calls the pre-judge would skip
+        accuracy: Agreement with the judge at p=0.5 over all samples
+        brier: Mean squared error of the approval probability
+    """
+
+    n_samples: int = 0
+    approved: int = 0
+    skipped_approve: int = 0
+    skipped_revise: int = 0
+    approve_agreement: float = 0.0
+    revise_agreement: float = 0.0
+    coverage: float = 0.0
+    accuracy: float = 0.0
+    brier: float = 0.0
+
+    @property
+    def agreement(self) -> float:
+        """Fraction of skipped judge calls whose local decision matched the judge."""
+        skipped = self.skipped_approve + self.skipped_revise
+        if not skipped:
+            return 0.0
+        return (
+            self.approve_agreement * self.skipped_approve
+            + self.revise_agreement * self.skipped_revise
+        ) / skipped
+
+
+def evaluate_prejudge(pre_judge: PreJudge, records: Sequence[VerdictRecord]) -> PreJudgeEvaluation:
+    """Replay recorded verdicts through a pre-judge.
+
+    Args:
+        pre_judge: Pre-judge to evaluate
+        records: Recorded verdict samples (ideally not used for fitting)
+
+    Returns:
+        PreJudgeEvaluation
+    """
+    result = PreJudgeEvaluation(n_samples=len(records))
+    if not records:
+        return result
+
+    approve_hits = revise_hits = correct = 0
+    brier = 0.0
+    for record in records:
+        judge_approved = record.score >= APPROVAL_SCORE
+        decision = pre_judge.decide(record.features)
+        p = decision.approval_probability
+
+        result.approved += int(judge_approved)
+        correct += int((p >= 0.5) == judge_approved)
+        brier += (p - float(judge_approved)) ** 2
+        if decision.action == PreJudgeAction.APPROVE:
+            result.skipped_approve += 1
+            approve_hits += int(judge_approved)
+        elif decision.action == PreJudgeAction.REVISE:
+            result.skipped_revise += 1
+            revise_hits += int(not judge_approved)
+
+    n = len(records)
+    if result.skipped_approve:
+        result.approve_agreement = approve_hits / result.skipped_approve
+    if result.skipped_revise:
+        result.revise_agreement = revise_hits / result.skipped_revise
+    result.coverage = (result.skipped_approve + result.skipped_revise) / n
+    result.accuracy = correct / n
+    result.brier = brier / n
+    return result
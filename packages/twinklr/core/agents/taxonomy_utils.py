@@ -12,13 +12,23 @@ def get_taxonomy_dict() -> dict[str, list[str]]:
     """Get dictionary of taxonomy enum names to value lists.
 
     Extracts all enum values from the vocabulary and issues modules for dynamic
-    injection into prompts, preventing hardcoded enum drift.
+    injection into prompts, preventing hardcoded enum drift. The enums are
+    scanned once per process; callers receive their own copy to modify.
 
     Returns:
         Dict mapping enum class names to lists of their string values.
         Example: {"LayerRole": ["BASE", "RHYTHM", ...],
                   "IssueCategory": ["SCHEMA", "TIMING", ...], ...}
     """
+    return {name: list(values) for name, values in _get_taxonomy_cached().items()}
+
+
+@lru_cache(maxsize=1)
+def _get_taxonomy_cached() -> dict[str, list[str]]:
+    """Build the taxonomy dict once (enums are static for a process).
+
+    The returned dict is shared: treat it as read-only.
+    """
     from enum import Enum
 
     from twinklr.core.agents.issues import (
@@ -263,7 +273,8 @@ def inject_taxonomy(variables: dict[str, Any]) -> dict[str, Any]:
         Variables dict with 'taxonomy' key added containing enum values
     """
     if "taxonomy" not in variables:
-        variables = {**variables, "taxonomy": get_taxonomy_dict()}
+        # Templates only read the taxonomy, so the shared copy is injected as-is
+        variables = {**variables, "taxonomy": _get_taxonomy_cached()}
     return variables
 
 
@@ -5,9 +5,11 @@ Exposes a small, ergonomic surface:
 - HttpClientConfig: configuration
 - Exceptions: ApiError and subclasses
 - Auth helpers: ApiKeyAuth, BearerTokenAuth, TokenProvider
+- CachingAsyncTransport / HttpCachePolicy: persistent response cache + rate limits
 """
 
 from twinklr.core.api.http.auth import ApiKeyAuth, BearerTokenAuth, TokenProvider
+from twinklr.core.api.http.cache import CachingAsyncTransport, HttpCachePolicy
 from twinklr.core.api.http.client import ApiClient, AsyncApiClient
 from twinklr.core.api.http.config import HttpClientConfig
 from twinklr.core.api.http.errors import (
@@ -26,6 +28,8 @@ __all__ = [
     "ApiClient",
     "AsyncApiClient",
     "HttpClientConfig",
+    "CachingAsyncTransport",
+    "HttpCachePolicy",
     "ApiKeyAuth",
     "BearerTokenAuth",
     "TokenProvider",
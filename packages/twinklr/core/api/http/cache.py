@@ -0,0 +1,266 @@
+"""Persistent HTTP response caching transport.
+
+Wraps an HTTPX async transport so repeat lookups (metadata, lyrics) are served
+from a twinklr cache backend instead of the network:
+- Per-host TTLs for fresh entries
+- ETag / Last-Modified revalidation of stale entries (304 refreshes the entry)
+- Negative caching of "not found" responses with their own TTL
+- Per-host minimum request spacing (e.g. MusicBrainz's 1 req/s policy)
+
+Only network round trips are rate limited; cache hits return immediately.
+Because it is a transport, AsyncApiClient retries, errors and logging apply
+unchanged to cached responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import time
+from collections.abc import Mapping
+
+import httpx
+from pydantic import BaseModel, Field
+
+from twinklr.core.caching.fingerprint import compute_fingerprint
+from twinklr.core.caching.models import CacheKey
+from twinklr.core.caching.protocols import Cache
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DOMAIN = "http"
+
+# Headers that describe the wire encoding of the original body; cached bodies
+# are stored decoded, so these must not be replayed.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class HttpCachePolicy(BaseModel):
+    """Caching and rate-limit policy for CachingAsyncTransport.
+
+    Host keys match the request host exactly or as a parent domain
+    ("musicbrainz.org" also matches "beta.musicbrainz.org").
+
+    Args:
+        default_ttl_s: Freshness lifetime for cacheable responses
+        ttl_by_host: Per-host freshness lifetime overrides
+        negative_ttl_s: Freshness lifetime for negative responses
+        negative_statuses: Status codes cached as negative results
+        min_interval_by_host: Minimum seconds between network requests per host
+        cacheable_methods: HTTP methods whose responses are cached
+        version: Cache entry version (bump to invalidate all entries)
+    """
+
+    model_config = {"frozen": True}
+
+    default_ttl_s: float = Field(default=7 * 24 * 3600.0, ge=0.0)
+    ttl_by_host: dict[str, float] = Field(default_factory=dict)
+    negative_ttl_s: float = Field(default=24 * 3600.0, ge=0.0)
+    negative_statuses: tuple[int, ...] = (404, 410)
+    min_interval_by_host: dict[str, float] = Field(default_factory=dict)
+    cacheable_methods: tuple[str, ...] = ("GET", "HEAD")
+    version: str = "1"
+
+    def ttl_for(self, host: str, status_code: int) -> float:
+        """Freshness lifetime for a response from ``host``."""
+        if status_code in self.negative_statuses:
+            return self.negative_ttl_s
+        ttl = _match_host(self.ttl_by_host, host)
+        return self.default_ttl_s if ttl is None else ttl
+
+
+class CachedHttpResponse(BaseModel):
+    """Cached HTTP response (decoded body, base64-encoded for JSON storage)."""
+
+    status_code: int
+    headers: list[tuple[str, str]] = Field(default_factory=list)
+    content_b64: str = ""
+    fetched_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def content(self) -> bytes:
+        """Decoded response body."""
+        return base64.b64decode(self.content_b64)
+
+    def is_fresh(self, now: float) -> bool:
+        """True if the entry can be served without contacting the server."""
+        return now < self.expires_at
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild an HTTPX response for ``request``."""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class _HostRateLimiter:
+    """Enforce a minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval_by_host: Mapping[str, float]) -> None:
+        self._min_interval_by_host = dict(min_interval_by_host)
+        self._next_at: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def wait(self, host: str) -> None:
+        interval = _match_host(self._min_interval_by_host, host)
+        if not interval:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._next_at.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                logger.debug("Rate limiting %s: waiting %.2fs", host, delay)
+                await asyncio.sleep(delay)
+            self._next_at[host] = time.monotonic() + interval
+
+
+class CachingAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport adding a persistent response cache and per-host rate limits.
+
+    Args:
+        cache: Cache backend for entries (FSCache, SQLiteCache, ...). Entries are
+            session-independent; freshness is tracked per entry, so the backend
+            should not expire them itself (stale entries are still revalidated).
+        policy: TTL, negative caching and rate-limit policy
+        transport: Inner transport performing real requests
+            (defaults to httpx.AsyncHTTPTransport)
+
+    Example:
+        >>> transport = CachingAsyncTransport(cache, HttpCachePolicy())
+        >>> client = AsyncApiClient(config, transport=transport)
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        policy: HttpCachePolicy | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.cache = cache
+        self.policy = policy or HttpCachePolicy()
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._rate_limiter = _HostRateLimiter(self.policy.min_interval_by_host)
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve ``request`` from cache when fresh, otherwise fetch (and store)."""
+        host = request.url.host
+        if request.method.upper() not in self.policy.cacheable_methods:
+            return await self._send(request)
+
+        key = self._cache_key(request)
+        cached = await self._load(key)
+        now = time.time()
+
+        if cached is not None and cached.is_fresh(now):
+            self.hits += 1
+            return cached.to_response(request)
+
+        if cached is not None:
+            # Stale: revalidate with the stored validators
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._send(request)
+
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            self.revalidated += 1
+            refreshed = cached.model_copy(
+                update={
+                    "fetched_at": now,
+                    "expires_at": now + self.policy.ttl_for(host, cached.status_code),
+                }
+            )
+            await self._store(key, refreshed)
+            return refreshed.to_response(request)
+
+        self.misses += 1
+        if not self._is_storable(response):
+            return response
+
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        entry = CachedHttpResponse(
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _WIRE_HEADERS
+            ],
+            content_b64=base64.b64encode(content).decode("ascii"),
+            fetched_at=now,
+            expires_at=now + self.policy.ttl_for(host, response.status_code),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        await self._store(key, entry)
+        return entry.to_response(request)
+
+    async def aclose(self) -> None:
+        """Close the inner transport."""
+        await self._transport.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        await self._rate_limiter.wait(request.url.host)
+        return await self._transport.handle_async_request(request)
+
+    def _is_storable(self, response: httpx.Response) -> bool:
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return False
+        return response.status_code == 200 or response.status_code in self.policy.negative_statuses
+
+    def _cache_key(self, request: httpx.Request) -> CacheKey:
+        host = request.url.host
+        step_id = f"http.{host}"
+        inputs = {
+            "method": request.method.upper(),
+            "url": str(request.url),
+            "accept": request.headers.get("Accept", ""),
+        }
+        return CacheKey(
+            domain=HTTP_CACHE_DOMAIN,
+            step_id=step_id,
+            step_version=self.policy.version,
+            input_fingerprint=compute_fingerprint(step_id, self.policy.version, inputs),
+            session_scoped=False,
+        )
+
+    async def _load(self, key: CacheKey) -> CachedHttpResponse | None:
+        try:
+            return await self.cache.load(key, CachedHttpResponse)
+        except Exception as e:
+            logger.warning("HTTP cache load failed for %s: %s", key, e)
+            return None
+
+    async def _store(self, key: CacheKey, entry: CachedHttpResponse) -> None:
+        try:
+            await self.cache.store(key, entry)
+        except Exception as e:
+            # Caching is best effort; the response is still returned
+            logger.warning("HTTP cache store failed for %s: %s", key, e)
+
+
+def _match_host(mapping: Mapping[str, float], host: str) -> float | None:
+    """Look up ``host`` or its closest parent domain in ``mapping``."""
+    parts = host.lower().split(".")
+    for i in range(len(parts)):
+        value = mapping.get(".".join(parts[i:]))
+        if value is not None:
+            return value
+    return None
@@ -24,7 +24,9 @@ import numpy as np
 from twinklr.core.audio.advanced.tension import compute_tension_curve
 from twinklr.core.audio.cache_adapter import (
     load_audio_features_async,
+    load_chromaprint_async,
     save_audio_features_async,
+    save_chromaprint_async,
 )
 from twinklr.core.audio.energy.builds_drops import detect_builds_and_drops
 from twinklr.core.audio.energy.multiscale import extract_smoothed_energy
@@ -33,6 +35,11 @@ from twinklr.core.audio.harmonic.chords import detect_chords
 from twinklr.core.audio.harmonic.hpss import compute_hpss, compute_onset_env
 from twinklr.core.audio.harmonic.key import detect_musical_key, extract_chroma
 from twinklr.core.audio.harmonic.pitch import extract_pitch_tracking
+from twinklr.core.audio.metadata.fingerprint import (
+    ChromaprintError,
+    ChromaprintResult,
+    compute_chromaprint_from_pcm,
+)
 from twinklr.core.audio.models import (
     LyricsBundle,
     MetadataBundle,
@@ -43,6 +50,7 @@ from twinklr.core.audio.models import (
 from twinklr.core.audio.models.enums import StageStatus
 from twinklr.core.audio.models.metadata import EmbeddedMetadata
 from twinklr.core.audio.phonemes.bundle import build_phoneme_bundle
+from twinklr.core.audio.phonemes.g2p_service import get_g2p_engine
 from twinklr.core.audio.rhythm.beats import (
     compute_beats,
     detect_downbeats_phase_aligned,
@@ -55,9 +63,15 @@ from twinklr.core.audio.spectral.vocals import detect_vocals
 from twinklr.core.audio.structure.sections import detect_song_sections
 from twinklr.core.audio.timeline.builder import build_timeline_export
 from twinklr.core.audio.validation.validator import validate_features
-from twinklr.core.caching import FSCache
+from twinklr.core.caching import (
+    FSCache,
+    LayeredCache,
+    SQLiteCache,
+    create_cache,
+    shared_memory_cache,
+)
 from twinklr.core.config.models import AppConfig, JobConfig
-from twinklr.core.io import RealFileSystem, absolute_path
+from twinklr.core.io import absolute_path, run_in_private_loop, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -94,9 +108,18 @@ class AudioAnalyzer:
         self.job_config = job_config
 
         # Initialize async cache
-        fs = RealFileSystem()
         cache_root = absolute_path(str(Path(app_config.cache_dir or "data/cache")))
-        self.cache = FSCache(fs, cache_root)
+        backend = create_cache(
+            app_config.cache_backend, cache_root, max_bytes=app_config.cache_max_bytes
+        )
+        self.cache: FSCache | SQLiteCache | LayeredCache = backend
+        if app_config.cache_memory_entries > 0:
+            # Shared per root so every stage's analyzer reuses loaded bundles
+            memory = shared_memory_cache(str(cache_root), app_config.cache_memory_entries)
+            self.cache = LayeredCache(backend, memory)
+
+        # Model-predicted pronunciations persist next to the cache entries
+        self.g2p_lexicon_path = Path(str(cache_root)) / "g2p_lexicon.json"
 
         # Initialize cache if not in an async context
         try:
@@ -104,8 +127,8 @@ class AudioAnalyzer:
             # Already in async context - cache will be initialized on first use
             self._cache_initialized = False
         except RuntimeError:
-            # No running loop - safe to use asyncio.run()
-            asyncio.run(self.cache.initialize())
+            # No running loop - block on the shared sync bridge
+            run_sync(self.cache.initialize())
             self._cache_initialized = True
 
         # Initialize enhancement services via factory (DI pattern)
@@ -179,12 +202,47 @@ class AudioAnalyzer:
         embedded_metadata = await self._extract_embedded_metadata_fast(audio_path)
         genre = embedded_metadata.genre[0] if embedded_metadata.genre else None
 
+        # Chromaprint for AcoustID: reuse the cached one, else fingerprint the
+        # PCM decoded for analysis instead of re-decoding in fpcalc
+        chromaprint: ChromaprintResult | None = None
+        chromaprint_sink: list[ChromaprintResult] | None = None
+        if self._wants_chromaprint():
+            chromaprint = await load_chromaprint_async(audio_path, self.cache)
+            if chromaprint is None:
+                chromaprint_sink = []
+
         # Process audio (CPU-bound, run in thread pool) with genre hint
         logger.debug(f"Analyzing audio: {audio_path} (genre={genre})")
-        features = await asyncio.to_thread(self._process_audio, audio_path, genre=genre)
+        features = await asyncio.to_thread(
+            self._process_audio, audio_path, genre=genre, chromaprint_sink=chromaprint_sink
+        )
+        if chromaprint_sink:
+            chromaprint = chromaprint_sink[0]
 
         # Build bundle (includes async metadata/lyrics extraction)
-        bundle = await self._build_song_bundle(audio_path, features, embedded_metadata)
+        bundle = await self._build_song_bundle(
+            audio_path,
+            features,
+            embedded_metadata,
+            (chromaprint.fingerprint, chromaprint.duration_s) if chromaprint else None,
+        )
+
+        # Cache a freshly computed chromaprint (in-process or fpcalc fallback)
+        fingerprint_info = bundle.metadata.fingerprint if bundle.metadata else None
+        if (
+            chromaprint_sink is not None
+            and fingerprint_info is not None
+            and fingerprint_info.chromaprint_fingerprint
+            and fingerprint_info.chromaprint_duration_s
+        ):
+            await save_chromaprint_async(
+                audio_path,
+                self.cache,
+                ChromaprintResult(
+                    fingerprint=fingerprint_info.chromaprint_fingerprint,
+                    duration_s=fingerprint_info.chromaprint_duration_s,
+                ),
+            )
 
         # Calculate total compute time
         compute_ms = time.perf_counter() * 1000 - start_time_ms
@@ -205,7 +263,9 @@ class AudioAnalyzer:
         """Analyze audio synchronously and return SongBundle.
 
         This is a sync wrapper around async analyze(). Prefer using async analyze() directly
-        when in async context.
+        when in async context. Each call runs on its own private event loop rather
+        than the shared sync bridge, so concurrent callers (e.g. worker threads)
+        analyze in parallel and the call is safe from inside any running loop.
 
         Args:
             audio_path: Path to audio file (mp3, wav, etc.)
@@ -220,7 +280,7 @@ class AudioAnalyzer:
             tempo = bundle.features["tempo_bpm"]
             artist = bundle.metadata.embedded.artist if bundle.metadata else None
         """
-        return asyncio.run(self.analyze(audio_path, force_reprocess=force_reprocess))
+        return run_in_private_loop(self.analyze(audio_path, force_reprocess=force_reprocess))
 
     async def _extract_embedded_metadata_fast(self, audio_path: str) -> EmbeddedMetadata:
         """Extract embedded metadata quickly (genre, artist, title).
@@ -242,7 +302,11 @@ class AudioAnalyzer:
             return EmbeddedMetadata()
 
     async def _build_song_bundle(
-        self, audio_path: str, features: dict[str, Any], embedded_metadata: EmbeddedMetadata
+        self,
+        audio_path: str,
+        features: dict[str, Any],
+        embedded_metadata: EmbeddedMetadata,
+        chromaprint: tuple[str, float] | None = None,
     ) -> SongBundle:
         """Build SongBundle from v2.3 features dict (async).
 
@@ -250,6 +314,7 @@ class AudioAnalyzer:
             audio_path: Path to audio file
             features: v2.3 features dict
             embedded_metadata: Pre-extracted embedded metadata (for efficiency)
+            chromaprint: Precomputed (fingerprint, duration_s) for AcoustID
 
         Returns:
             SongBundle with v3.0 schema
@@ -274,7 +339,7 @@ class AudioAnalyzer:
         # Extract metadata and lyrics in parallel (async)
         # Pass embedded_metadata to avoid re-extracting
         metadata_bundle, lyrics_bundle = await asyncio.gather(
-            self._extract_metadata_if_enabled(audio_path, embedded_metadata),
+            self._extract_metadata_if_enabled(audio_path, embedded_metadata, chromaprint),
             self._extract_lyrics_if_enabled(audio_path, duration_ms, None, vocal_segments),
         )
 
@@ -308,7 +373,10 @@ class AudioAnalyzer:
         )
 
     async def _extract_metadata_if_enabled(
-        self, audio_path: str, embedded_metadata: EmbeddedMetadata | None = None
+        self,
+        audio_path: str,
+        embedded_metadata: EmbeddedMetadata | None = None,
+        chromaprint: tuple[str, float] | None = None,
     ) -> MetadataBundle:
         """Extract metadata if feature is enabled (async).
 
@@ -317,6 +385,8 @@ class AudioAnalyzer:
         Args:
             audio_path: Path to audio file
             embedded_metadata: Pre-extracted embedded metadata (optional, for efficiency)
+            chromaprint: Precomputed (fingerprint, duration_s); None lets the
+                pipeline fall back to fpcalc
 
         Returns:
             MetadataBundle (with SKIPPED status if disabled)
@@ -333,7 +403,7 @@ class AudioAnalyzer:
         try:
             logger.debug(f"Extracting metadata (Phase 3 pipeline) from {audio_path}")
             bundle = await self.metadata_pipeline.extract(
-                audio_path, embedded_metadata=embedded_metadata
+                audio_path, embedded_metadata=embedded_metadata, chromaprint=chromaprint
             )
             return bundle
 
@@ -460,6 +530,7 @@ class AudioAnalyzer:
                 min_hold_ms=enhancements.viseme_min_hold_ms,
                 min_burst_ms=enhancements.viseme_min_burst_ms,
                 boundary_soften_ms=enhancements.viseme_boundary_soften_ms,
+                g2p_engine=get_g2p_engine(self.g2p_lexicon_path),
             )
             logger.debug(
                 f"Phoneme bundle built: {len(bundle.phonemes)} phonemes, "
@@ -471,12 +542,25 @@ class AudioAnalyzer:
             logger.warning(f"Phoneme pipeline failed: {e}")
             return None
 
-    def _process_audio(self, audio_path: str, genre: str | None = None) -> dict[str, Any]:
+    def _wants_chromaprint(self) -> bool:
+        """True if the metadata pipeline will look up AcoustID (needs a chromaprint)."""
+        pipeline = self.metadata_pipeline
+        return pipeline is not None and pipeline.config.enable_acoustid is True
+
+    def _process_audio(
+        self,
+        audio_path: str,
+        genre: str | None = None,
+        *,
+        chromaprint_sink: list[ChromaprintResult] | None = None,
+    ) -> dict[str, Any]:
         """Process audio file (internal implementation).
 
         Args:
             audio_path: Path to audio file
             genre: Optional genre hint for section detection
+            chromaprint_sink: If given, receives a chromaprint computed from the
+                decoded waveform (left empty if in-process fingerprinting fails)
 
         Returns:
             Feature dictionary
@@ -489,6 +573,15 @@ class AudioAnalyzer:
         sr = int(sr_raw)  # Ensure sr is int
         duration = float(len(y)) / float(sr)
 
+        if chromaprint_sink is not None:
+            try:
+                fingerprint, fp_duration = compute_chromaprint_from_pcm(y, sr)
+                chromaprint_sink.append(
+                    ChromaprintResult(fingerprint=fingerprint, duration_s=fp_duration)
+                )
+            except ChromaprintError as e:
+                logger.debug(f"In-process chromaprint unavailable, using fpcalc: {e}")
+
         # Handle very short audio
         if duration < 10.0:
             logger.warning(f"Audio too short ({duration:.1f}s) for meaningful analysis")
@@ -6,6 +6,8 @@ Functions:
     compute_audio_file_hash: Hash audio file for cache key
     load_audio_features_async: Load cached audio features
     save_audio_features_async: Save audio features to cache
+    load_chromaprint_async: Load a cached chromaprint fingerprint
+    save_chromaprint_async: Save a chromaprint fingerprint to cache
 
 Example:
     >>> from twinklr.core.caching import FSCache
@@ -25,7 +27,8 @@ from typing import TypeVar
 
 from pydantic import BaseModel
 
-from twinklr.core.caching import CacheKey, FSCache
+from twinklr.core.audio.metadata.fingerprint import ChromaprintResult
+from twinklr.core.caching import Cache, CacheKey
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +65,7 @@ async def compute_audio_file_hash(audio_path: str) -> str:
 
 async def load_audio_features_async(
     audio_path: str,
-    cache: FSCache,
+    cache: Cache,
     model_cls: type[T],
     *,
     step_version: str = "3",
@@ -71,7 +74,7 @@ async def load_audio_features_async(
 
     Args:
         audio_path: Path to audio file
-        cache: FSCache instance
+        cache: Cache backend (e.g. FSCache or LayeredCache)
         model_cls: Pydantic model class (e.g., SongBundle)
         step_version: Schema version (default: "3" for v3.0)
 
@@ -93,6 +96,7 @@ async def load_audio_features_async(
             step_id="audio.features",
             step_version=step_version,
             input_fingerprint=audio_hash,
+            session_scoped=False,
         )
 
         # Load with Pydantic validation
@@ -107,7 +111,7 @@ async def load_audio_features_async(
 
 async def save_audio_features_async(
     audio_path: str,
-    cache: FSCache,
+    cache: Cache,
     features: BaseModel,
     *,
     step_version: str = "3",
@@ -117,7 +121,7 @@ async def save_audio_features_async(
 
     Args:
         audio_path: Path to audio file
-        cache: FSCache instance
+        cache: Cache backend (e.g. FSCache or LayeredCache)
         features: Pydantic model to cache
         step_version: Schema version
         compute_ms: Optional computation duration in milliseconds
@@ -135,6 +139,7 @@ async def save_audio_features_async(
             step_id="audio.features",
             step_version=step_version,
             input_fingerprint=audio_hash,
+            session_scoped=False,
         )
 
         # Store with atomic commit
@@ -143,3 +148,58 @@ async def save_audio_features_async(
     except Exception as e:
         logger.warning(f"Failed to save cache: {e}")
         # Non-fatal - continue without caching
+
+
+def _chromaprint_key(audio_hash: str) -> CacheKey:
+    return CacheKey(
+        domain="audio",
+        step_id="audio.chromaprint",
+        step_version="1",
+        input_fingerprint=audio_hash,
+        session_scoped=False,
+    )
+
+
+async def load_chromaprint_async(audio_path: str, cache: Cache) -> ChromaprintResult | None:
+    """Load a cached chromaprint fingerprint for an audio file.
+
+    Stored next to the audio features entry (same file hash), but independent
+    of analysis parameters and SongBundle schema version.
+
+    Args:
+        audio_path: Path to audio file
+        cache: Cache backend (e.g. FSCache or LayeredCache)
+
+    Returns:
+        Cached ChromaprintResult or None if not found
+    """
+    try:
+        audio_hash = await compute_audio_file_hash(audio_path)
+        result = await cache.load(_chromaprint_key(audio_hash), ChromaprintResult)
+        if result:
+            logger.debug(f"Chromaprint cache hit: {audio_path}")
+        return result
+    except Exception as e:
+        logger.warning(f"Failed to load chromaprint cache: {e}")
+        return None
+
+
+async def save_chromaprint_async(
+    audio_path: str,
+    cache: Cache,
+    result: ChromaprintResult,
+) -> None:
+    """Save a chromaprint fingerprint to cache.
+
+    Args:
+        audio_path: Path to audio file
+        cache: Cache backend (e.g. FSCache or LayeredCache)
+        result: Fingerprint to cache
+    """
+    try:
+        audio_hash = await compute_audio_file_hash(audio_path)
+        await cache.store(_chromaprint_key(audio_hash), result)
+        logger.debug(f"Cached chromaprint: {audio_path}")
+    except Exception as e:
+        logger.warning(f"Failed to save chromaprint cache: {e}")
+        # Non-fatal - continue without caching
@@ -6,16 +6,23 @@ Centralizes HTTP client and provider initialization for dependency injection.
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any
 
 from twinklr.core.api.audio.acoustid import AcoustIDClient
 from twinklr.core.api.audio.musicbrainz import MusicBrainzClient
-from twinklr.core.api.http import AsyncApiClient, HttpClientConfig
+from twinklr.core.api.http import (
+    AsyncApiClient,
+    CachingAsyncTransport,
+    HttpCachePolicy,
+    HttpClientConfig,
+)
 from twinklr.core.audio.lyrics.pipeline import LyricsPipeline, LyricsPipelineConfig
 from twinklr.core.audio.lyrics.providers.genius import GeniusClient
 from twinklr.core.audio.lyrics.providers.lrclib import LRCLibClient
 from twinklr.core.audio.lyrics.whisperx_models import WhisperXConfig
 from twinklr.core.audio.metadata.pipeline import MetadataPipeline, PipelineConfig
+from twinklr.core.caching import create_cache
 from twinklr.core.config.models import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -25,7 +32,7 @@ class EnhancementServiceFactory:
     """Factory for creating audio enhancement services with proper DI.
 
     Centralizes:
-    - HTTP client creation
+    - HTTP client creation (with persistent response cache + per-host rate limits)
     - Provider initialization (AcoustID, MusicBrainz, Genius, LRCLib)
     - Pipeline assembly (MetadataPipeline, LyricsPipeline)
     - WhisperX service initialization
@@ -36,6 +43,38 @@ class EnhancementServiceFactory:
         lyrics_pipeline = factory.create_lyrics_pipeline(app_config)
     """
 
+    @staticmethod
+    def create_http_client(config: AppConfig, http_config: HttpClientConfig) -> AsyncApiClient:
+        """Create the async HTTP client shared by enhancement providers.
+
+        When HTTP caching is enabled, responses are cached under
+        ``<cache_dir>/http`` (same backend as the audio cache) and requests to
+        MusicBrainz are spaced to its configured rate limit.
+
+        Args:
+            config: Application configuration
+            http_config: HTTP client configuration
+
+        Returns:
+            AsyncApiClient, with a caching transport if enabled
+        """
+        enhancements = config.audio_processing.enhancements
+        if not enhancements.http_cache_enabled:
+            return AsyncApiClient(config=http_config)
+
+        policy = HttpCachePolicy(
+            default_ttl_s=enhancements.http_cache_ttl_s,
+            ttl_by_host=enhancements.http_cache_ttl_by_host,
+            negative_ttl_s=enhancements.http_cache_negative_ttl_s,
+            min_interval_by_host={"musicbrainz.org": 1.0 / enhancements.musicbrainz_rate_limit_rps},
+        )
+        cache = create_cache(
+            config.cache_backend,
+            Path(config.cache_dir or "data/cache") / "http",
+            max_bytes=config.cache_max_bytes,
+        )
+        return AsyncApiClient(config=http_config, transport=CachingAsyncTransport(cache, policy))
+
     @staticmethod
     def create_metadata_pipeline(config: AppConfig) -> MetadataPipeline | None:
         """Create configured metadata pipeline if enabled.
@@ -59,7 +98,7 @@ class EnhancementServiceFactory:
         ):
             # Create async HTTP client for API calls
             http_config = HttpClientConfig(base_url="http://localhost")
-            http_client = AsyncApiClient(config=http_config)
+            http_client = EnhancementServiceFactory.create_http_client(config, http_config)
 
             # Initialize AcoustID client if enabled
             if config.audio_processing.enhancements.enable_acoustid:
@@ -113,7 +152,7 @@ class EnhancementServiceFactory:
             # Create async HTTP client for API calls
             # Providers use absolute URLs, so base_url is just a placeholder
             http_config = HttpClientConfig(base_url="https://api.placeholder.local")
-            http_client = AsyncApiClient(config=http_config)
+            http_client = EnhancementServiceFactory.create_http_client(config, http_config)
 
             # LRCLib (always available, no API key needed)
             providers["lrclib"] = LRCLibClient(http_client=http_client)
@@ -1,14 +1,23 @@
 """Chromaprint fingerprinting (Phase 3).
 
-Compute audio fingerprints using the fpcalc binary from chromaprint.
+Compute audio fingerprints in-process from already-decoded PCM (pyacoustid +
+libchromaprint), or with the fpcalc binary from chromaprint as a fallback.
 """
 
 import logging
 import re
 import subprocess
 
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
 logger = logging.getLogger(__name__)
 
+# Chromaprint resamples everything to 11025 Hz internally; feeding it that rate
+# directly skips its own resampler. fpcalc fingerprints the first 120 s by default.
+CHROMAPRINT_SAMPLE_RATE = 11025
+CHROMAPRINT_MAX_LENGTH_S = 120.0
+
 
 class ChromaprintError(RuntimeError):
     """Chromaprint computation failed."""
@@ -16,6 +25,73 @@ class ChromaprintError(RuntimeError):
     pass
 
 
+class ChromaprintResult(BaseModel):
+    """Chromaprint fingerprint of one audio file (cacheable)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    fingerprint: str = Field(description="Compressed, base64-encoded chromaprint")
+    duration_s: float = Field(gt=0, description="Full audio duration (seconds)")
+
+
+def compute_chromaprint_from_pcm(
+    y: np.ndarray,
+    sr: int,
+    *,
+    max_length_s: float = CHROMAPRINT_MAX_LENGTH_S,
+) -> tuple[str, float]:
+    """Compute chromaprint fingerprint in-process from a decoded waveform.
+
+    Avoids decoding the file a second time in an fpcalc subprocess when the
+    caller (e.g. the audio analyzer) already holds the samples.
+
+    Args:
+        y: Mono waveform (float, roughly [-1, 1])
+        sr: Sample rate of ``y``
+        max_length_s: Seconds of audio to fingerprint (fpcalc default: 120)
+
+    Returns:
+        Tuple of (fingerprint_string, duration_seconds)
+
+    Raises:
+        ChromaprintError: If pyacoustid/libchromaprint is unavailable or
+            fingerprinting fails
+    """
+    try:
+        import acoustid
+    except ImportError as e:
+        raise ChromaprintError(f"pyacoustid not installed: {e}") from e
+
+    if not getattr(acoustid, "have_chromaprint", False):
+        raise ChromaprintError("libchromaprint not available for in-process fingerprinting")
+
+    if sr <= 0 or y.size == 0:
+        raise ChromaprintError("Cannot fingerprint empty audio")
+
+    duration = float(y.shape[-1]) / float(sr)
+
+    try:
+        import librosa
+
+        head = y[: int(max_length_s * sr)]
+        if sr != CHROMAPRINT_SAMPLE_RATE:
+            head = librosa.resample(head, orig_sr=sr, target_sr=CHROMAPRINT_SAMPLE_RATE)
+        pcm = (np.clip(head, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+        fingerprint = acoustid.fingerprint(
+            CHROMAPRINT_SAMPLE_RATE, 1, iter([pcm]), maxlength=int(max_length_s)
+        )
+    except Exception as e:
+        raise ChromaprintError(f"In-process chromaprint failed: {e}") from e
+
+    if isinstance(fingerprint, bytes):
+        fingerprint = fingerprint.decode("ascii")
+
+    logger.debug(f"Computed in-process chromaprint: duration={duration:.2f}s")
+
+    return fingerprint, duration
+
+
 def compute_chromaprint_fingerprint(audio_path: str, *, timeout_s: float) -> tuple[str, float]:
     """Compute chromaprint fingerprint using fpcalc binary.
 
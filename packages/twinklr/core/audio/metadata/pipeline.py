@@ -96,7 +96,10 @@ class MetadataPipeline:
         self.musicbrainz_client = musicbrainz_client
 
     async def extract(
-        self, audio_path: str, embedded_metadata: EmbeddedMetadata | None = None
+        self,
+        audio_path: str,
+        embedded_metadata: EmbeddedMetadata | None = None,
+        chromaprint: tuple[str, float] | None = None,
     ) -> MetadataBundle:
         """Extract metadata from audio file (async).
 
@@ -109,6 +112,8 @@ class MetadataPipeline:
         Args:
             audio_path: Path to audio file
             embedded_metadata: Pre-extracted embedded metadata (optional, for efficiency)
+            chromaprint: Precomputed (fingerprint, duration_s), e.g. from the
+                analyzer's decoded PCM or cache; skips the fpcalc subprocess
 
         Returns:
             MetadataBundle with merged metadata
@@ -136,7 +141,7 @@ class MetadataPipeline:
                 warnings.append(f"Embedded metadata extraction failed: {str(e)}")
 
         # Stage 2: Compute fingerprint
-        fingerprint = self._compute_fingerprint(audio_path, warnings)
+        fingerprint = self._compute_fingerprint(audio_path, warnings, chromaprint)
 
         # Stage 3: Query providers (async - Phase 8)
         candidates: list[MetadataCandidate] = []
@@ -189,16 +194,22 @@ class MetadataPipeline:
             provenance=provenance,
         )
 
-    def _compute_fingerprint(self, audio_path: str, warnings: list[str]) -> FingerprintInfo | None:
+    def _compute_fingerprint(
+        self,
+        audio_path: str,
+        warnings: list[str],
+        chromaprint: tuple[str, float] | None = None,
+    ) -> FingerprintInfo | None:
         """Compute audio fingerprint.
 
         Computes both:
         - Basic audio fingerprint (file hash)
-        - Chromaprint fingerprint (for AcoustID)
+        - Chromaprint fingerprint (for AcoustID; fpcalc unless precomputed)
 
         Args:
             audio_path: Path to audio file
             warnings: List to append warnings to
+            chromaprint: Precomputed (fingerprint, duration_s), if available
 
         Returns:
             FingerprintInfo or None if basic hash computation fails
@@ -216,7 +227,10 @@ class MetadataPipeline:
         chromaprint_duration_s = None
         chromaprint_duration_bucket = None
 
-        if self.config.enable_acoustid:
+        if self.config.enable_acoustid and chromaprint is not None:
+            chromaprint_fingerprint, chromaprint_duration_s = chromaprint
+            chromaprint_duration_bucket = round(chromaprint_duration_s, 1)  # Bucket to 0.1s
+        elif self.config.enable_acoustid:
             try:
                 fingerprint, duration = compute_chromaprint_fingerprint(
                     audio_path, timeout_s=self.config.chromaprint_timeout_s
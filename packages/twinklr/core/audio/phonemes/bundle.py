@@ -21,10 +21,9 @@ from twinklr.core.audio.models.phonemes import (
     Phoneme,
     PhonemeBundle,
     PhonemeSource,
-    VisemeEvent,
 )
-from twinklr.core.audio.phonemes.g2p_service import G2PConfig, word_to_phonemes
-from twinklr.core.audio.phonemes.smooth import smooth_visemes
+from twinklr.core.audio.phonemes.g2p_service import G2PConfig, G2PEngine, get_g2p_engine
+from twinklr.core.audio.phonemes.smooth import VisemeTimeline, smooth_timeline
 from twinklr.core.audio.phonemes.timing import (
     classify_phoneme,
     distribute_word_window_to_phonemes,
@@ -46,11 +45,12 @@ def build_phoneme_bundle(
     min_hold_ms: int = 50,
     min_burst_ms: int = 40,
     boundary_soften_ms: int = 15,
+    g2p_engine: G2PEngine | None = None,
 ) -> PhonemeBundle:
     """Build complete PhonemeBundle from timed lyric words.
 
     Pipeline stages:
-    1. G2P: Convert each word to ARPAbet phonemes via g2p_en.
+    1. G2P: Convert all words to ARPAbet phonemes in one cached batch.
     2. Distribute: Assign weighted timing windows to phonemes within each word.
     3. Viseme map: Map each timed phoneme to a viseme code.
     4. Smooth: Apply coalesce, min-hold, burst merge, boundary soften.
@@ -68,6 +68,7 @@ def build_phoneme_bundle(
         min_hold_ms: Minimum viseme hold duration in ms.
         min_burst_ms: Minimum burst duration before merging in ms.
         boundary_soften_ms: Boundary softening window in ms.
+        g2p_engine: G2P engine (default: the shared memory-only engine).
 
     Returns:
         PhonemeBundle with phonemes, visemes, confidence, and stats.
@@ -85,26 +86,21 @@ def build_phoneme_bundle(
         )
 
     g2p_config = G2PConfig(strip_stress=False, filter_punctuation=True)
+    engine = g2p_engine or get_g2p_engine()
+
+    # Skip words with no text
+    timed_words = [word for word in words if word.text.strip()]
+
+    # Stage 1: G2P conversion (failed words come back empty and count as OOV)
+    phoneme_lists = engine.convert_batch([word.text for word in timed_words], config=g2p_config)
 
     all_phonemes: list[Phoneme] = []
-    raw_viseme_events: list[VisemeEvent] = []
+    # Visemes stay columnar until the bundle is built
+    raw_visemes = VisemeTimeline()
     oov_count = 0
     total_words = len(words)
 
-    for word in words:
-        # Skip words with no text
-        text = word.text.strip()
-        if not text:
-            continue
-
-        # Stage 1: G2P conversion
-        try:
-            phoneme_list = word_to_phonemes(text, config=g2p_config)
-        except Exception:
-            logger.debug(f"G2P failed for word '{text}', skipping")
-            oov_count += 1
-            continue
-
+    for word, phoneme_list in zip(timed_words, phoneme_lists, strict=True):
         if not phoneme_list:
             oov_count += 1
             continue
@@ -132,18 +128,11 @@ def build_phoneme_bundle(
             )
 
             # Stage 3: Viseme mapping
-            viseme_code = phoneme_to_viseme(phoneme_text)
-            raw_viseme_events.append(
-                VisemeEvent(
-                    viseme=viseme_code,
-                    start_ms=start_ms,
-                    end_ms=end_ms,
-                )
-            )
+            raw_visemes.append(phoneme_to_viseme(phoneme_text), start_ms, end_ms)
 
     # Stage 4: Smoothing
-    smoothed_visemes, burst_merge_count = smooth_visemes(
-        raw_viseme_events,
+    smoothed_visemes, burst_merge_count = smooth_timeline(
+        raw_visemes,
         min_hold_ms=min_hold_ms,
         min_burst_ms=min_burst_ms,
         boundary_soften_ms=boundary_soften_ms,
@@ -161,7 +150,7 @@ def build_phoneme_bundle(
 
     return PhonemeBundle(
         phonemes=all_phonemes,
-        visemes=smoothed_visemes,
+        visemes=smoothed_visemes.to_events(),
         source=PhonemeSource.G2P,
         confidence=confidence,
         oov_rate=oov_rate,
@@ -176,21 +165,20 @@ def build_phoneme_bundle(
     )
 
 
-def _compute_coverage(visemes: list[VisemeEvent], duration_ms: int) -> float:
+def _compute_coverage(visemes: VisemeTimeline, duration_ms: int) -> float:
     """Compute viseme coverage as fraction of song duration.
 
     Args:
-        visemes: Smoothed viseme events.
+        visemes: Smoothed viseme timeline.
         duration_ms: Total song duration in milliseconds.
 
     Returns:
         Coverage fraction (0-1).
     """
-    if not visemes or duration_ms <= 0:
+    if not len(visemes) or duration_ms <= 0:
         return 0.0
 
-    total_viseme_span = sum(v.end_ms - v.start_ms for v in visemes)
-    return min(1.0, total_viseme_span / duration_ms)
+    return min(1.0, visemes.covered_ms() / duration_ms)
 
 
 def _compute_confidence(
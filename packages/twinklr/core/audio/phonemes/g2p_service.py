@@ -2,12 +2,21 @@
 
 Converts text to phonemes using g2p_en library.
 
+The g2p_en model (CMUdict plus a neural fallback for out-of-vocabulary
+words) is loaded lazily, once per process. ``G2PEngine`` puts an LRU cache
+and an optional persistent on-disk lexicon in front of it, answers plain
+in-vocabulary words straight from CMUdict without running the model, and
+converts whole lyric word lists in one batch call.
+
 Functions:
     word_to_phonemes: Convert word to phoneme list
+    words_to_phonemes: Convert a list of words to phoneme lists
     normalize_phoneme: Strip stress markers from phoneme
+    get_g2p_engine: Shared G2PEngine per lexicon path
 
 Classes:
     G2PConfig: Configuration for G2P conversion
+    G2PEngine: Cached G2P conversion over the shared g2p_en model
     G2PService: Protocol for G2P service
     G2PImpl: Implementation using g2p_en
 
@@ -18,14 +27,28 @@ Example:
     ['HH', 'EH', 'L', 'OW']
 """
 
+from __future__ import annotations
+
+import json
 import logging
-from typing import Protocol
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Protocol
 
-from g2p_en import G2p as _G2p
 from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
+# Words g2p_en tokenizes as a single token and looks up in CMUdict verbatim
+_PLAIN_WORD_RE = re.compile(r"[a-z]+")
+
+_LEXICON_FORMAT = 1
+
 
 class G2PConfig(BaseModel):
     """Configuration for G2P conversion.
@@ -70,10 +93,263 @@ def normalize_phoneme(phoneme: str) -> str:
     return "".join(ch for ch in phoneme if not ch.isdigit())
 
 
+_MODEL: Any = None
+_DICTIONARY: tuple[dict[str, list[list[str]]], frozenset[str]] | None = None
+_LOAD_LOCK = threading.Lock()
+
+
+def _get_model() -> Any:
+    """Return the process-wide g2p_en model, loading it on first use.
+
+    Raises:
+        ImportError: If g2p_en library not installed
+    """
+    global _MODEL
+    if _MODEL is None:
+        with _LOAD_LOCK:
+            if _MODEL is None:
+                from g2p_en import G2p
+
+                logger.debug("Loading g2p_en model")
+                _MODEL = G2p()
+    return _MODEL
+
+
+def _get_dictionary() -> tuple[dict[str, list[list[str]]], frozenset[str]]:
+    """Return CMUdict and the homographs g2p_en disambiguates by part of speech.
+
+    Raises:
+        ImportError: If g2p_en library not installed
+    """
+    global _DICTIONARY
+    if _DICTIONARY is None:
+        with _LOAD_LOCK:
+            if _DICTIONARY is None:
+                from g2p_en.g2p import construct_homograph_dictionary
+                from nltk.corpus import cmudict
+
+                _DICTIONARY = (cmudict.dict(), frozenset(construct_homograph_dictionary()))
+    return _DICTIONARY
+
+
+def _g2p_version() -> str:
+    try:
+        return metadata.version("g2p_en")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _apply_config(raw_phonemes: Iterable[str], config: G2PConfig) -> tuple[str, ...]:
+    phonemes = list(raw_phonemes)
+
+    # Filter out non-phoneme tokens (spaces, punctuation)
+    if config.filter_punctuation:
+        phonemes = [p for p in phonemes if any(ch.isalpha() for ch in p)]
+
+    # Strip stress markers if configured
+    if config.strip_stress:
+        phonemes = [normalize_phoneme(p) for p in phonemes]
+
+    return tuple(phonemes)
+
+
+class G2PEngine:
+    """Cached grapheme-to-phoneme conversion over the shared g2p_en model.
+
+    Lookup order per word: LRU cache → persistent lexicon → CMUdict (plain
+    alphabetic, non-homograph words, which g2p_en would look up verbatim) →
+    g2p_en model. Words are trimmed and lowercased before lookup. The LRU is
+    keyed by word and config; the lexicon stores raw g2p_en output (stress
+    markers and punctuation tokens kept), so one file serves every config.
+
+    Args:
+        lexicon_path: Optional JSON file persisting model-predicted
+            pronunciations across runs. CMUdict hits are not stored.
+        max_cache_entries: LRU capacity
+
+    Example:
+        >>> engine = G2PEngine(lexicon_path="data/audio_cache/g2p_lexicon.json")
+        >>> engine.convert_batch(["hello", "world"], config=G2PConfig())
+        [['HH', 'AH', 'L', 'OW'], ['W', 'ER', 'L', 'D']]
+    """
+
+    def __init__(
+        self, *, lexicon_path: Path | str | None = None, max_cache_entries: int = 4096
+    ) -> None:
+        self.lexicon_path = Path(lexicon_path) if lexicon_path is not None else None
+        self.max_cache_entries = max(1, max_cache_entries)
+        self._cache: OrderedDict[tuple[str, bool, bool], tuple[str, ...]] = OrderedDict()
+        self._lexicon: dict[str, list[str]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def convert(self, word: str, *, config: G2PConfig | None = None) -> list[str]:
+        """Convert one word to phonemes.
+
+        Args:
+            word: Word to convert
+            config: Optional configuration
+
+        Returns:
+            List of phonemes (ARPAbet format)
+
+        Raises:
+            ImportError: If g2p_en library not installed
+        """
+        if config is None:
+            config = G2PConfig()
+
+        key = word.strip().lower()
+        if not key:
+            return []
+
+        cache_key = (key, config.strip_stress, config.filter_punctuation)
+        with self._lock:
+            phonemes = self._cache.get(cache_key)
+            if phonemes is not None:
+                self._cache.move_to_end(cache_key)
+                return list(phonemes)
+
+        phonemes = _apply_config(self._pronounce(key), config)
+        with self._lock:
+            self._cache[cache_key] = phonemes
+            if len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+        return list(phonemes)
+
+    def convert_batch(
+        self, words: Iterable[str], *, config: G2PConfig | None = None
+    ) -> list[list[str]]:
+        """Convert a word list (e.g. a song's lyric words) to phonemes.
+
+        Each distinct word is converted once. A word that fails conversion
+        yields an empty list, like an out-of-vocabulary word. New lexicon
+        entries are flushed to disk at the end.
+
+        Args:
+            words: Words to convert
+            config: Optional configuration
+
+        Returns:
+            Phoneme list per input word, in input order
+
+        Raises:
+            ImportError: If g2p_en library not installed
+        """
+        if config is None:
+            config = G2PConfig()
+
+        converted: dict[str, list[str]] = {}
+        results: list[list[str]] = []
+        for word in words:
+            key = word.strip().lower()
+            if key not in converted:
+                try:
+                    converted[key] = self.convert(key, config=config)
+                except ImportError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"G2P failed for word '{word}': {e}")
+                    converted[key] = []
+            results.append(list(converted[key]))
+
+        self.flush()
+        return results
+
+    def flush(self) -> None:
+        """Write new lexicon entries to disk (no-op without a lexicon path).
+
+        Entries written meanwhile by other processes are merged, not lost.
+        """
+        if self.lexicon_path is None:
+            return
+        with self._lock:
+            if not self._dirty or self._lexicon is None:
+                return
+            entries = {**self._read_lexicon_file(), **self._lexicon}
+            self._dirty = False
+
+        path = self.lexicon_path
+        payload = {"format": _LEXICON_FORMAT, "g2p_en": _g2p_version(), "entries": entries}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, sort_keys=True))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write G2P lexicon {path}: {e}")
+
+    def _pronounce(self, key: str) -> tuple[str, ...]:
+        """Raw g2p_en pronunciation of a normalised word."""
+        with self._lock:
+            lexicon = self._load_lexicon()
+            stored = lexicon.get(key)
+        if stored is not None:
+            return tuple(stored)
+
+        if _PLAIN_WORD_RE.fullmatch(key):
+            cmu, homographs = _get_dictionary()
+            pronunciations = cmu.get(key)
+            if pronunciations and key not in homographs:
+                return tuple(pronunciations[0])
+
+        raw: tuple[str, ...] = tuple(_get_model()(key))
+        if self.lexicon_path is not None:
+            with self._lock:
+                lexicon[key] = list(raw)
+                self._dirty = True
+        return raw
+
+    def _load_lexicon(self) -> dict[str, list[str]]:
+        # Caller holds self._lock
+        if self._lexicon is None:
+            self._lexicon = self._read_lexicon_file()
+            if self._lexicon:
+                logger.debug(f"Loaded {len(self._lexicon)} G2P lexicon entries")
+        return self._lexicon
+
+    def _read_lexicon_file(self) -> dict[str, list[str]]:
+        path = self.lexicon_path
+        if path is None or not path.is_file():
+            return {}
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable G2P lexicon {path}: {e}")
+            return {}
+        # Predictions from another model version are stale
+        if payload.get("format") != _LEXICON_FORMAT or payload.get("g2p_en") != _g2p_version():
+            return {}
+        entries = payload.get("entries")
+        return dict(entries) if isinstance(entries, dict) else {}
+
+
+_ENGINES: dict[Path | None, G2PEngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_g2p_engine(lexicon_path: Path | str | None = None) -> G2PEngine:
+    """Return the shared G2PEngine for a lexicon path.
+
+    Args:
+        lexicon_path: Persistent lexicon file, or None for memory-only caching
+
+    Returns:
+        Process-wide engine (all engines share one g2p_en model)
+    """
+    key = Path(lexicon_path).resolve() if lexicon_path is not None else None
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = _ENGINES[key] = G2PEngine(lexicon_path=key)
+    return engine
+
+
 def word_to_phonemes(word: str, *, config: G2PConfig | None = None) -> list[str]:
     """Convert word to list of phonemes.
 
-    Uses g2p_en library to convert text to ARPAbet phonemes.
+    Uses g2p_en library to convert text to ARPAbet phonemes, through the
+    shared memory-only G2PEngine.
 
     Args:
         word: Word to convert
@@ -91,28 +367,20 @@ def word_to_phonemes(word: str, *, config: G2PConfig | None = None) -> list[str]
         >>> word_to_phonemes("HELLO")
         ['HH', 'EH', 'L', 'OW']
     """
-    if config is None:
-        config = G2PConfig()
+    return get_g2p_engine().convert(word, config=config)
 
-    # Handle empty/whitespace
-    word = word.strip()
-    if not word:
-        return []
 
-    # Convert to phonemes
-    g2p = _G2p()
-    raw_phonemes: list[str] = g2p(word)  # Type cast from Any
-    phonemes = raw_phonemes
+def words_to_phonemes(words: Iterable[str], *, config: G2PConfig | None = None) -> list[list[str]]:
+    """Convert a list of words to phonemes in one batch.
 
-    # Filter out non-phoneme tokens (spaces, punctuation)
-    if config.filter_punctuation:
-        phonemes = [p for p in phonemes if any(ch.isalpha() for ch in p)]
-
-    # Strip stress markers if configured
-    if config.strip_stress:
-        phonemes = [normalize_phoneme(p) for p in phonemes]
+    Args:
+        words: Words to convert
+        config: Optional configuration
 
-    return phonemes
+    Returns:
+        Phoneme list per input word (empty for words that failed conversion)
+    """
+    return get_g2p_engine().convert_batch(words, config=config)
 
 
 class G2PService(Protocol):
@@ -140,6 +408,9 @@ class G2PService(Protocol):
 class G2PImpl:
     """G2P service implementation using g2p_en.
 
+    Args:
+        engine: Engine to convert with (default: the shared memory-only engine)
+
     Example:
         >>> service = G2PImpl()
         >>> config = G2PConfig()
@@ -148,6 +419,9 @@ class G2PImpl:
         4
     """
 
+    def __init__(self, engine: G2PEngine | None = None) -> None:
+        self.engine = engine or get_g2p_engine()
+
     def convert(self, text: str, *, config: G2PConfig) -> list[str]:
         """Convert text to list of phonemes.
 
@@ -161,4 +435,4 @@ class G2PImpl:
         Raises:
             ImportError: If g2p_en not installed
         """
-        return word_to_phonemes(text, config=config)
+        return self.engine.convert(text, config=config)
@@ -8,9 +8,19 @@ Implements the spec smoothing pipeline:
 4. Boundary softening: expand boundaries by boundary_soften_ms,
    clamp to neighbors and [0, duration_ms].
 
+The pipeline runs as one streaming pass over a columnar ``VisemeTimeline``
+(start/end/code/confidence arrays): each stage consumes plain tuples from the
+previous one with at most one event of lookahead, so no intermediate lists or
+``VisemeEvent`` models are built. The list-of-models stage functions below
+are the reference the kernel is tested against.
+
+Classes:
+    VisemeTimeline: Columnar viseme events.
+
 Functions:
     coalesce_adjacent: Merge consecutive identical visemes.
-    smooth_visemes: Full smoothing pipeline.
+    smooth_timeline: Full smoothing pipeline over a VisemeTimeline.
+    smooth_visemes: Full smoothing pipeline over VisemeEvent lists.
 
 Example:
     >>> from twinklr.core.audio.models.phonemes import VisemeEvent
@@ -23,8 +33,78 @@ Example:
     1
 """
 
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
 from twinklr.core.audio.models.phonemes import VisemeEvent
 
+# (start_ms, end_ms, viseme, confidence)
+_Row = tuple[int, int, str, float]
+
+
+@dataclass
+class VisemeTimeline:
+    """Columnar viseme events (one array per field, sorted by start).
+
+    Attributes:
+        start_ms: Event start times
+        end_ms: Event end times
+        visemes: Viseme codes
+        confidence: Event confidences
+
+    Example:
+        >>> timeline = VisemeTimeline()
+        >>> timeline.append("A", 0, 100)
+        >>> timeline.to_events()[0].end_ms
+        100
+    """
+
+    start_ms: array[int] = field(default_factory=lambda: array("q"))
+    end_ms: array[int] = field(default_factory=lambda: array("q"))
+    visemes: list[str] = field(default_factory=list)
+    confidence: array[float] = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.visemes)
+
+    def append(self, viseme: str, start_ms: int, end_ms: int, confidence: float = 1.0) -> None:
+        """Append one event."""
+        self.start_ms.append(start_ms)
+        self.end_ms.append(end_ms)
+        self.visemes.append(viseme)
+        self.confidence.append(confidence)
+
+    def rows(self) -> Iterator[_Row]:
+        """Iterate events as (start_ms, end_ms, viseme, confidence) tuples."""
+        return zip(self.start_ms, self.end_ms, self.visemes, self.confidence, strict=True)
+
+    def covered_ms(self) -> int:
+        """Total duration covered by events."""
+        return sum(self.end_ms) - sum(self.start_ms)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[_Row]) -> VisemeTimeline:
+        """Build a timeline from (start_ms, end_ms, viseme, confidence) tuples."""
+        timeline = cls()
+        for start_ms, end_ms, viseme, confidence in rows:
+            timeline.append(viseme, start_ms, end_ms, confidence)
+        return timeline
+
+    @classmethod
+    def from_events(cls, events: Iterable[VisemeEvent]) -> VisemeTimeline:
+        """Build a timeline from VisemeEvent models."""
+        return cls.from_rows((e.start_ms, e.end_ms, e.viseme, e.confidence) for e in events)
+
+    def to_events(self) -> list[VisemeEvent]:
+        """Convert to VisemeEvent models."""
+        return [
+            VisemeEvent(viseme=viseme, start_ms=start_ms, end_ms=end_ms, confidence=confidence)
+            for start_ms, end_ms, viseme, confidence in self.rows()
+        ]
+
 
 def coalesce_adjacent(events: list[VisemeEvent]) -> list[VisemeEvent]:
     """Merge consecutive identical visemes into single events.
@@ -230,6 +310,124 @@ def _apply_boundary_soften(
     return result
 
 
+def _coalesce_rows(rows: Iterable[_Row]) -> Iterator[_Row]:
+    """Streaming ``coalesce_adjacent``."""
+    prev: _Row | None = None
+    for row in rows:
+        if prev is None:
+            prev = row
+        elif row[2] == prev[2]:
+            prev = (prev[0], row[1], prev[2], min(prev[3], row[3]))
+        else:
+            yield prev
+            prev = row
+    if prev is not None:
+        yield prev
+
+
+def _min_hold_rows(rows: Iterable[_Row], min_hold_ms: int) -> Iterator[_Row]:
+    """Streaming ``_apply_min_hold``.
+
+    The last kept event stays pending while short events may still extend
+    it. A short first event is merged forward once the second kept event
+    arrives (it can no longer change after that).
+    """
+    last: _Row | None = None
+    kept = 0
+    for row in rows:
+        if last is not None and row[1] - row[0] < min_hold_ms:
+            last = (last[0], row[1], last[2], min(last[3], row[3]))
+            continue
+        if last is not None:
+            if kept == 1 and last[1] - last[0] < min_hold_ms:
+                row = (last[0], row[1], row[2], min(last[3], row[3]))
+            else:
+                yield last
+        last = row
+        kept += 1
+    if last is not None:
+        yield last
+
+
+def _burst_merge_rows(rows: Iterable[_Row], min_burst_ms: int, merges: list[int]) -> Iterator[_Row]:
+    """Streaming ``_apply_burst_merge``; counts merges into ``merges[0]``."""
+    it = iter(rows)
+    last: _Row | None = None
+    current = next(it, None)
+    while current is not None:
+        upcoming = next(it, None)
+        if current[1] - current[0] >= min_burst_ms:
+            if last is not None:
+                yield last
+            last = current
+        else:
+            merges[0] += 1
+            prev_dur = last[1] - last[0] if last is not None else 0
+            next_dur = upcoming[1] - upcoming[0] if upcoming is not None else 0
+            if last is not None and (prev_dur >= next_dur or upcoming is None):
+                last = (last[0], current[1], last[2], min(last[3], current[3]))
+            elif upcoming is not None:
+                upcoming = (current[0], upcoming[1], upcoming[2], min(current[3], upcoming[3]))
+            else:
+                last = current
+        current = upcoming
+    if last is not None:
+        yield last
+
+
+def _soften_rows(rows: Iterable[_Row], boundary_soften_ms: int, duration_ms: int) -> Iterator[_Row]:
+    """Streaming ``_apply_boundary_soften``."""
+    it = iter(rows)
+    prev_end: int | None = None
+    current = next(it, None)
+    while current is not None:
+        upcoming = next(it, None)
+        start_ms = max(0, current[0] - boundary_soften_ms)
+        end_ms = min(duration_ms, current[1] + boundary_soften_ms)
+        if prev_end is not None:
+            start_ms = max(start_ms, prev_end)
+        if upcoming is not None:
+            end_ms = min(end_ms, upcoming[0])
+        yield (start_ms, end_ms, current[2], current[3])
+        prev_end = end_ms
+        current = upcoming
+
+
+def smooth_timeline(
+    timeline: VisemeTimeline,
+    *,
+    min_hold_ms: int,
+    min_burst_ms: int,
+    boundary_soften_ms: int,
+    duration_ms: int,
+) -> tuple[VisemeTimeline, int]:
+    """Apply the full smoothing pipeline to a timeline in one pass.
+
+    Same stages and results as ``smooth_visemes``.
+
+    Args:
+        timeline: Raw viseme timeline.
+        min_hold_ms: Minimum hold duration in milliseconds.
+        min_burst_ms: Minimum burst duration before merging in milliseconds.
+        boundary_soften_ms: Boundary softening window in milliseconds.
+        duration_ms: Total duration in milliseconds.
+
+    Returns:
+        Tuple of (smoothed timeline, burst_merge_count).
+    """
+    rows: Iterable[_Row] = _coalesce_rows(timeline.rows())
+    if min_hold_ms > 0:
+        rows = _coalesce_rows(_min_hold_rows(rows, min_hold_ms))
+    merges = [0]
+    if min_burst_ms > 0:
+        rows = _coalesce_rows(_burst_merge_rows(rows, min_burst_ms, merges))
+    if boundary_soften_ms > 0:
+        rows = _soften_rows(rows, boundary_soften_ms, duration_ms)
+
+    smoothed = VisemeTimeline.from_rows(rows)
+    return smoothed, merges[0]
+
+
 def smooth_visemes(
     events: list[VisemeEvent],
     *,
@@ -268,22 +466,11 @@ def smooth_visemes(
     if not events:
         return [], 0
 
-    # Stage 1: Coalesce adjacent identical
-    smoothed = coalesce_adjacent(events)
-
-    # Stage 2: Min-hold
-    smoothed = _apply_min_hold(smoothed, min_hold_ms)
-
-    # Re-coalesce after min-hold (merges may create new adjacents)
-    smoothed = coalesce_adjacent(smoothed)
-
-    # Stage 3: Burst merge
-    smoothed, burst_merge_count = _apply_burst_merge(smoothed, min_burst_ms)
-
-    # Re-coalesce after burst merge
-    smoothed = coalesce_adjacent(smoothed)
-
-    # Stage 4: Boundary soften
-    smoothed = _apply_boundary_soften(smoothed, boundary_soften_ms, duration_ms)
-
-    return smoothed, burst_merge_count
+    smoothed, burst_merge_count = smooth_timeline(
+        VisemeTimeline.from_events(events),
+        min_hold_ms=min_hold_ms,
+        min_burst_ms=min_burst_ms,
+        boundary_soften_ms=boundary_soften_ms,
+        duration_ms=duration_ms,
+    )
+    return smoothed.to_events(), burst_merge_count
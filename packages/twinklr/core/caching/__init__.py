@@ -11,26 +11,52 @@ Key features:
 - Pydantic model validation
 - Atomic commit pattern (artifact + meta)
 - Graceful error handling
+- Optional in-process LRU tier and size-budgeted FS eviction
+- Cross-session object store for session-independent (deterministic) steps
+- SQLite backend (single WAL-mode database file) for many small entries
 """
 
 from twinklr.core.caching.backends.fs import FSCache, FSCacheSync
+from twinklr.core.caching.backends.layered import LayeredCache, LayeredCacheSync
+from twinklr.core.caching.backends.memory import MemoryCache, shared_memory_cache
 from twinklr.core.caching.backends.null import NullCache, NullCacheSync
+from twinklr.core.caching.backends.sqlite import SQLiteCache, SQLiteCacheSync
+from twinklr.core.caching.factory import create_cache
 from twinklr.core.caching.fingerprint import compute_fingerprint
-from twinklr.core.caching.models import CacheKey, CacheMeta, CacheOptions
+from twinklr.core.caching.models import (
+    CacheBackend,
+    CacheGCResult,
+    CacheKey,
+    CacheMeta,
+    CacheOptions,
+    CacheRef,
+    CacheStats,
+)
 from twinklr.core.caching.protocols import Cache, CacheSync
 
 __all__ = [
     # Core
     "Cache",
+    "CacheBackend",
     "CacheSync",
     "CacheKey",
     "CacheMeta",
     "CacheOptions",
+    "CacheRef",
+    "CacheStats",
+    "CacheGCResult",
     # Backends
     "FSCache",
     "FSCacheSync",
+    "LayeredCache",
+    "LayeredCacheSync",
+    "MemoryCache",
     "NullCache",
     "NullCacheSync",
+    "SQLiteCache",
+    "SQLiteCacheSync",
     # Utils
     "compute_fingerprint",
+    "create_cache",
+    "shared_memory_cache",
 ]
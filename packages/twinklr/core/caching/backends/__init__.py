@@ -1,14 +1,23 @@
 """Cache backend implementations.
 
-Provides filesystem and null cache backends.
+Provides filesystem, SQLite, in-memory, layered and null cache backends.
 """
 
 from .fs import FSCache, FSCacheSync
+from .layered import LayeredCache, LayeredCacheSync
+from .memory import MemoryCache, shared_memory_cache
 from .null import NullCache, NullCacheSync
+from .sqlite import SQLiteCache, SQLiteCacheSync
 
 __all__ = [
     "FSCache",
     "FSCacheSync",
+    "LayeredCache",
+    "LayeredCacheSync",
+    "MemoryCache",
     "NullCache",
     "NullCacheSync",
+    "SQLiteCache",
+    "SQLiteCacheSync",
+    "shared_memory_cache",
 ]
@@ -1,31 +1,72 @@
 """Filesystem-backed cache using core.io for all operations.
 
-Provides atomic commit pattern (artifact → meta) for cache correctness.
+Provides atomic commit pattern (artifact → meta) for cache correctness,
+plus optional size-budgeted LRU eviction and garbage collection.
+
+Session-independent keys (``CacheKey.session_scoped=False``) are stored once in
+a cross-session object store under ``<root>/_objects/``; each session that
+stores or loads one gets a small ``ref.json`` index file in its own entry
+directory pointing at the shared object.
 """
 
 import asyncio
 import time
+from dataclasses import dataclass
 from typing import TypeVar
 
 from pydantic import BaseModel, ValidationError
 
-from twinklr.core.caching.models import CacheKey, CacheMeta
+from twinklr.core.caching.models import (
+    CacheGCResult,
+    CacheKey,
+    CacheMeta,
+    CacheRef,
+    CacheStats,
+)
 from twinklr.core.io import AbsolutePath, FileSystem
 from twinklr.core.io.sync_adapter import SyncAdapter
 from twinklr.core.io.utils import sanitize_path_component
 
 T = TypeVar("T", bound=BaseModel)
 
+# Depth of <domain>/<session_id>/<step_id>/<input_fingerprint> below the root
+# (and of _objects/<step_id>/<step_version>/<input_fingerprint>)
+_ENTRY_DEPTH = 4
+
+OBJECTS_DIR = "_objects"
+_REF_FILE = "ref.json"
+
+
+@dataclass
+class _IndexEntry:
+    """Size and recency of one committed entry (budget bookkeeping)."""
+
+    domain: str
+    artifact_bytes: int
+    last_used: float
+    expires_at: float | None
+    shared: bool = False
+
 
 class FSCache:
     """
     Async filesystem-backed cache using core.io for all operations.
 
     The cache lazily initializes on first use (thread-safe).
+
+    With ``max_bytes`` set, the cache keeps an index of committed entries
+    (built from each entry's ``CacheMeta`` on first store) and evicts the
+    least-recently-used entries after a store pushes the total artifact size
+    over budget. Recency is the last load/store in this process, falling back
+    to ``created_at`` for entries not touched yet.
     """
 
     def __init__(
-        self, fs: FileSystem, root: AbsolutePath, ttl_seconds: float | None = None
+        self,
+        fs: FileSystem,
+        root: AbsolutePath,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
     ) -> None:
         """
         Initialize filesystem cache.
@@ -33,12 +74,16 @@ class FSCache:
         Args:
             fs: Async filesystem implementation
             root: Absolute path to cache root directory
+            ttl_seconds: Optional TTL in seconds for cache expiration
+            max_bytes: Optional artifact size budget (None = unbounded)
         """
         self.fs = fs
         self.root = root
         self._initialized = False
         self._init_lock = asyncio.Lock()
         self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._index: dict[AbsolutePath, _IndexEntry] | None = None
 
     async def initialize(self) -> None:
         """
@@ -57,7 +102,27 @@ class FSCache:
 
         Structure: <cache_root>/<domain>/<session_id>/<step_id>/<input_fingerprint>/
         This structure supports multi-user parallelism by isolating sessions.
+        Session-independent keys live in the object store instead.
+        """
+        if not key.session_scoped:
+            return self._object_dir(key)
+        return self._session_dir(key)
+
+    def _object_dir(self, key: CacheKey) -> AbsolutePath:
+        """Cross-session object directory (sync).
+
+        Structure: <cache_root>/_objects/<step_id>/<step_version>/<input_fingerprint>/
         """
+        return self.fs.join(
+            self.root,
+            OBJECTS_DIR,
+            sanitize_path_component(key.step_id),
+            sanitize_path_component(key.step_version),
+            key.input_fingerprint,
+        )
+
+    def _session_dir(self, key: CacheKey) -> AbsolutePath:
+        """Per-session entry directory, ignoring ``session_scoped`` (sync)."""
         domain_safe = sanitize_path_component(key.domain)
         session_id_safe = sanitize_path_component(key.session_id or "default")
         step_id_safe = sanitize_path_component(key.step_id)
@@ -78,6 +143,15 @@ class FSCache:
         """Compute meta.json path - commit marker (sync)."""
         return self.fs.join(self._entry_dir(key), "meta.json")
 
+    def _ref_path(self, key: CacheKey) -> AbsolutePath | None:
+        """Compute the session's ref.json path for a shared key (sync).
+
+        Returns None for session-scoped keys and keys without a session.
+        """
+        if key.session_scoped or key.session_id is None:
+            return None
+        return self.fs.join(self._session_dir(key), _REF_FILE)
+
     async def exists(self, key: CacheKey) -> bool:
         """
         Check if valid cache entry exists and is not expired (async).
@@ -165,6 +239,12 @@ class FSCache:
             # Validate artifact
             artifact = model_cls.model_validate_json(artifact_json)
 
+            if self._index is not None:
+                indexed = self._index.get(self._entry_dir(key))
+                if indexed is not None:
+                    indexed.last_used = time.time()
+
+            await self._link(key)
             return artifact
 
         except (FileNotFoundError, ValidationError, ValueError):
@@ -207,7 +287,7 @@ class FSCache:
 
         meta = CacheMeta(
             domain=key.domain,
-            session_id=key.session_id,
+            session_id=key.session_id if key.session_scoped else None,
             step_id=key.step_id,
             step_version=key.step_version,
             input_fingerprint=key.input_fingerprint,
@@ -225,19 +305,260 @@ class FSCache:
             meta.model_dump_json(indent=2),
         )
 
+        if self._max_bytes is not None:
+            index = await self._get_index()
+            index[entry_dir] = _IndexEntry(
+                domain=key.domain,
+                artifact_bytes=artifact_bytes,
+                last_used=meta.created_at,
+                expires_at=_expires_at(meta),
+                shared=not key.session_scoped,
+            )
+            await self._evict_to(self._max_bytes, protect=entry_dir)
+
+        await self._link(key)
+
     async def invalidate(self, key: CacheKey) -> None:
-        """Invalidate cache entry by removing directory (async)."""
+        """Invalidate cache entry by removing directory (async).
+
+        For a session-independent key this removes the shared object (for
+        every session) along with the calling session's ref.
+        """
         await self.initialize()  # Lazy initialization
         entry_dir = self._entry_dir(key)
+        if self._index is not None:
+            self._index.pop(entry_dir, None)
         if await self.fs.exists(entry_dir):
             await self.fs.rmdir(entry_dir, recursive=True)
+        ref_path = self._ref_path(key)
+        if ref_path is not None and await self.fs.exists(ref_path):
+            await self._unlink_ref(self._session_dir(key))
+
+    async def _link(self, key: CacheKey) -> None:
+        """Record a session's use of a shared object in its ref.json index file."""
+        ref_path = self._ref_path(key)
+        if ref_path is None or await self.fs.exists(ref_path):
+            return
+        ref = CacheRef(
+            domain=key.domain,
+            session_id=key.session_id or "default",
+            step_id=key.step_id,
+            step_version=key.step_version,
+            input_fingerprint=key.input_fingerprint,
+            linked_at=time.time(),
+        )
+        await self.fs.mkdirs(self._session_dir(key), exist_ok=True)
+        await self.fs.write_text(ref_path, ref.model_dump_json(indent=2))
+
+    async def stats(self) -> CacheStats:
+        """Summarize committed entries under the cache root (async).
+
+        Rescans the root, so entries written by other processes are included.
+
+        Returns:
+            Entry count and artifact bytes, in total and per domain
+        """
+        await self.initialize()
+        index, _, refs = await self._scan()
+        self._index = index
+        bytes_by_domain: dict[str, int] = {}
+        for entry in index.values():
+            bytes_by_domain[entry.domain] = (
+                bytes_by_domain.get(entry.domain, 0) + entry.artifact_bytes
+            )
+        return CacheStats(
+            entries=len(index),
+            total_bytes=sum(bytes_by_domain.values()),
+            max_bytes=self._max_bytes,
+            bytes_by_domain=dict(sorted(bytes_by_domain.items())),
+            shared_entries=sum(1 for entry in index.values() if entry.shared),
+            session_refs=len(refs),
+        )
+
+    async def gc(
+        self,
+        max_bytes: int | None = None,
+        *,
+        purge_incomplete: bool = False,
+    ) -> CacheGCResult:
+        """Remove expired entries and evict LRU entries down to a budget (async).
+
+        Args:
+            max_bytes: Size budget (default: the budget configured at init;
+                None for both only removes expired entries)
+            purge_incomplete: Also remove entry directories without a valid
+                meta.json. Only safe when no other process is writing, since
+                an in-flight store looks incomplete until it commits.
+
+        Session refs whose shared object no longer exists are always removed
+        (they are not counted as entries).
+
+        Returns:
+            Counts of removed and remaining entries and bytes
+        """
+        await self.initialize()
+        index, incomplete, refs = await self._scan()
+        self._index = index
+        removed = 0
+        freed = 0
+
+        now = time.time()
+        for entry_dir, entry in list(index.items()):
+            if entry.expires_at is not None and entry.expires_at < now:
+                removed += 1
+                freed += entry.artifact_bytes
+                await self._remove_entry(entry_dir)
+
+        if purge_incomplete:
+            for entry_dir in incomplete:
+                removed += 1
+                await self._remove_entry(entry_dir)
+
+        budget = max_bytes if max_bytes is not None else self._max_bytes
+        if budget is not None:
+            evicted, evicted_bytes = await self._evict_to(budget)
+            removed += evicted
+            freed += evicted_bytes
+
+        for ref_dir, object_dir in refs.items():
+            if object_dir not in index:
+                await self._unlink_ref(ref_dir)
+
+        return CacheGCResult(
+            removed_entries=removed,
+            freed_bytes=freed,
+            remaining_entries=len(index),
+            remaining_bytes=sum(entry.artifact_bytes for entry in index.values()),
+        )
+
+    async def _get_index(self) -> dict[AbsolutePath, _IndexEntry]:
+        """Return the entry index, scanning the root on first use."""
+        if self._index is None:
+            self._index, _, _ = await self._scan()
+        return self._index
+
+    async def _evict_to(self, budget: int, protect: AbsolutePath | None = None) -> tuple[int, int]:
+        """Evict least-recently-used entries until total bytes fit the budget.
+
+        Args:
+            budget: Target total artifact bytes
+            protect: Entry that must survive (the one just stored)
+
+        Returns:
+            (entries evicted, bytes freed)
+        """
+        index = await self._get_index()
+        total = sum(entry.artifact_bytes for entry in index.values())
+        evicted = 0
+        freed = 0
+        for entry_dir, entry in sorted(index.items(), key=lambda item: item[1].last_used):
+            if total <= budget:
+                break
+            if entry_dir == protect:
+                continue
+            await self._remove_entry(entry_dir)
+            total -= entry.artifact_bytes
+            evicted += 1
+            freed += entry.artifact_bytes
+        return evicted, freed
+
+    async def _remove_entry(self, entry_dir: AbsolutePath) -> None:
+        """Delete an entry directory and drop it from the index."""
+        if self._index is not None:
+            self._index.pop(entry_dir, None)
+        try:
+            await self.fs.rmdir(entry_dir, recursive=True)
+        except FileNotFoundError:
+            pass  # Already removed by another process
+
+    async def _unlink_ref(self, entry_dir: AbsolutePath) -> None:
+        """Remove a session ref, keeping any session-scoped entry beside it."""
+        if await self.fs.exists(self.fs.join(entry_dir, "meta.json")):
+            await self.fs.remove(self.fs.join(entry_dir, _REF_FILE))
+        else:
+            await self._remove_entry(entry_dir)
+
+    async def _scan(
+        self,
+    ) -> tuple[
+        dict[AbsolutePath, _IndexEntry], list[AbsolutePath], dict[AbsolutePath, AbsolutePath]
+    ]:
+        """Walk the cache root and read every entry's meta.json.
+
+        Returns:
+            (committed entries by directory, directories without valid meta,
+            session ref directories mapped to the object they point at)
+        """
+        index: dict[AbsolutePath, _IndexEntry] = {}
+        incomplete: list[AbsolutePath] = []
+        refs: dict[AbsolutePath, AbsolutePath] = {}
+        objects_root = self.fs.join(self.root, OBJECTS_DIR)
+        for entry_dir in await self._entry_dirs(self.root, _ENTRY_DEPTH):
+            meta_path = self.fs.join(entry_dir, "meta.json")
+            ref_path = self.fs.join(entry_dir, _REF_FILE)
+            if await self.fs.exists(ref_path):
+                try:
+                    ref = CacheRef.model_validate_json(await self.fs.read_text(ref_path))
+                except (FileNotFoundError, ValidationError, ValueError):
+                    incomplete.append(entry_dir)
+                    continue
+                refs[entry_dir] = self._object_dir(
+                    CacheKey(
+                        domain=ref.domain,
+                        step_id=ref.step_id,
+                        step_version=ref.step_version,
+                        input_fingerprint=ref.input_fingerprint,
+                        session_scoped=False,
+                    )
+                )
+                if not await self.fs.exists(meta_path):
+                    continue
+            try:
+                meta = CacheMeta.model_validate_json(await self.fs.read_text(meta_path))
+                artifact_bytes = meta.artifact_bytes
+                if artifact_bytes is None:
+                    artifact_path = self.fs.join(entry_dir, "artifact.json")
+                    artifact_bytes = len((await self.fs.read_text(artifact_path)).encode("utf-8"))
+            except (FileNotFoundError, ValidationError, ValueError):
+                incomplete.append(entry_dir)
+                continue
+            index[entry_dir] = _IndexEntry(
+                domain=meta.domain,
+                artifact_bytes=artifact_bytes,
+                last_used=meta.created_at,
+                expires_at=_expires_at(meta),
+                shared=entry_dir.is_relative_to(objects_root),
+            )
+        return index, incomplete, refs
+
+    async def _entry_dirs(self, path: AbsolutePath, depth: int) -> list[AbsolutePath]:
+        """List directories exactly ``depth`` levels below ``path``."""
+        if depth == 0:
+            return [path]
+        try:
+            names = await self.fs.listdir(path)
+        except FileNotFoundError:
+            return []
+        found: list[AbsolutePath] = []
+        for name in sorted(names):
+            child = self.fs.join(path, name)
+            if await self.fs.is_dir(child):
+                found.extend(await self._entry_dirs(child, depth - 1))
+        return found
+
+
+def _expires_at(meta: CacheMeta) -> float | None:
+    """Expiry timestamp recorded in an entry's meta, if it has a TTL."""
+    if meta.ttl_seconds is None:
+        return None
+    return meta.created_at + meta.ttl_seconds
 
 
 class FSCacheSync(SyncAdapter):
     """Synchronous wrapper around FSCache.
 
     Delegates all method calls to an FSCache instance via SyncAdapter.
-    Uses asyncio.run() to execute async operations in blocking mode.
+    Each call blocks on the process-wide sync bridge loop (``run_sync``).
     Cache initializes lazily on first use.
     TTL is configured at initialization time.
     Maintains full backward compatibility: class name and public API are unchanged.
@@ -248,6 +569,7 @@ class FSCacheSync(SyncAdapter):
         fs: FileSystem,
         root: AbsolutePath,
         ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
     ) -> None:
         """Initialize sync cache wrapper.
 
@@ -255,5 +577,6 @@ class FSCacheSync(SyncAdapter):
             fs: Async filesystem implementation
             root: Absolute path to cache root directory
             ttl_seconds: Optional TTL in seconds for cache expiration
+            max_bytes: Optional artifact size budget (None = unbounded)
         """
-        super().__init__(FSCache(fs, root, ttl_seconds))
+        super().__init__(FSCache(fs, root, ttl_seconds, max_bytes))
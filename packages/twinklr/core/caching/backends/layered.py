@@ -0,0 +1,97 @@
+"""Two-tier cache: in-process LRU in front of a persistent backend.
+
+Loads are served from memory when possible and fall through to the backend
+(typically FSCache) otherwise; backend hits are promoted into memory.
+Stores and invalidations go to both tiers.
+"""
+
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from twinklr.core.caching.backends.memory import MemoryCache
+from twinklr.core.caching.models import CacheKey
+from twinklr.core.caching.protocols import Cache
+from twinklr.core.io.sync_adapter import SyncAdapter
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LayeredCache:
+    """
+    Async two-tier cache (memory over a persistent backend).
+
+    Both tiers keep their own bounds: the memory tier by entry count, the
+    backend by its own policy (e.g. FSCache ``max_bytes``).
+    """
+
+    def __init__(self, backend: Cache, memory: MemoryCache | None = None) -> None:
+        """
+        Initialize layered cache.
+
+        Args:
+            backend: Persistent cache tier
+            memory: In-process tier (default: a private MemoryCache)
+        """
+        self.backend = backend
+        self.memory = memory or MemoryCache()
+
+    async def initialize(self) -> None:
+        """Initialize the backend tier (async)."""
+        initialize = getattr(self.backend, "initialize", None)
+        if initialize is not None:
+            await initialize()
+
+    async def exists(self, key: CacheKey) -> bool:
+        """Check memory, then the backend (async)."""
+        return await self.memory.exists(key) or await self.backend.exists(key)
+
+    async def load(self, key: CacheKey, model_cls: type[T]) -> T | None:
+        """
+        Load from memory, falling back to the backend (async).
+
+        Args:
+            key: Cache key
+            model_cls: Pydantic model class for validation
+
+        Returns:
+            Validated artifact model, or None on miss in both tiers
+        """
+        artifact = await self.memory.load(key, model_cls)
+        if artifact is not None:
+            return artifact
+        artifact = await self.backend.load(key, model_cls)
+        if artifact is not None:
+            await self.memory.store(key, artifact)
+        return artifact
+
+    async def store(
+        self,
+        key: CacheKey,
+        artifact: BaseModel,
+        compute_ms: float | None = None,
+    ) -> None:
+        """Write through to the backend, then hold in memory (async)."""
+        await self.backend.store(key, artifact, compute_ms)
+        await self.memory.store(key, artifact, compute_ms)
+
+    async def invalidate(self, key: CacheKey) -> None:
+        """Invalidate in both tiers (async)."""
+        await self.memory.invalidate(key)
+        await self.backend.invalidate(key)
+
+
+class LayeredCacheSync(SyncAdapter):
+    """Synchronous wrapper around LayeredCache.
+
+    Delegates all method calls to a LayeredCache instance via SyncAdapter.
+    """
+
+    def __init__(self, backend: Cache, memory: MemoryCache | None = None) -> None:
+        """Initialize sync layered cache wrapper.
+
+        Args:
+            backend: Persistent async cache tier
+            memory: In-process tier (default: a private MemoryCache)
+        """
+        super().__init__(LayeredCache(backend, memory))
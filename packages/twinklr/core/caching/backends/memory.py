@@ -0,0 +1,143 @@
+"""In-process LRU cache of validated artifact models.
+
+Used as the front tier of LayeredCache so repeated loads of the same entry
+within one process skip file reads and JSON validation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from twinklr.core.caching.models import CacheKey
+
+T = TypeVar("T", bound=BaseModel)
+
+DEFAULT_MAX_ENTRIES = 128
+
+_EntryId = tuple[str, str | None, str, str, str]
+
+_shared_caches: dict[str, "MemoryCache"] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def _entry_id(key: CacheKey) -> _EntryId:
+    if not key.session_scoped:
+        # Shared across sessions and domains, like the FS object store
+        return ("", None, key.step_id, key.step_version, key.input_fingerprint)
+    return (key.domain, key.session_id, key.step_id, key.step_version, key.input_fingerprint)
+
+
+class MemoryCache:
+    """
+    Async in-process cache holding up to ``max_entries`` validated models.
+
+    Least-recently-used entries are dropped once the bound is reached.
+    Frozen models are returned as stored; mutable models are deep-copied on
+    load so callers cannot alter the cached instance. The copy is a
+    deliberate safety trade-off: it is still far cheaper than the file read
+    and JSON validation it replaces, and artifacts that are hot enough for
+    the copy to matter should be declared ``frozen=True`` to be shared as-is.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float | None = None
+    ) -> None:
+        """
+        Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of models held (must be positive)
+            ttl_seconds: Optional TTL in seconds for cache expiration
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[_EntryId, tuple[BaseModel, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def initialize(self) -> None:
+        """No-op (async)."""
+
+    async def exists(self, key: CacheKey) -> bool:
+        """Check if a live entry is held for key (async)."""
+        return self._get(key) is not None
+
+    async def load(self, key: CacheKey, model_cls: type[T]) -> T | None:
+        """
+        Return the held model for key (async).
+
+        Args:
+            key: Cache key
+            model_cls: Expected model class
+
+        Returns:
+            Cached model (the held instance if the model is frozen, otherwise
+            a deep copy), or None on miss/expiration/class mismatch
+        """
+        artifact = self._get(key)
+        if not isinstance(artifact, model_cls):
+            return None
+        self._entries.move_to_end(_entry_id(key))
+        if artifact.model_config.get("frozen"):
+            return artifact
+        return artifact.model_copy(deep=True)
+
+    async def store(
+        self,
+        key: CacheKey,
+        artifact: BaseModel,
+        compute_ms: float | None = None,
+    ) -> None:
+        """Hold artifact under key, evicting the LRU entry if full (async)."""
+        entry_id = _entry_id(key)
+        if not artifact.model_config.get("frozen"):
+            artifact = artifact.model_copy(deep=True)
+        self._entries[entry_id] = (artifact, time.time())
+        self._entries.move_to_end(entry_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, key: CacheKey) -> None:
+        """Drop entry for key (async)."""
+        self._entries.pop(_entry_id(key), None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _get(self, key: CacheKey) -> BaseModel | None:
+        held = self._entries.get(_entry_id(key))
+        if held is None:
+            return None
+        artifact, stored_at = held
+        if self._ttl_seconds is not None and time.time() > stored_at + self._ttl_seconds:
+            del self._entries[_entry_id(key)]
+            return None
+        return artifact
+
+
+def shared_memory_cache(scope: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> MemoryCache:
+    """Return the process-wide MemoryCache for a scope (e.g. a cache root).
+
+    Components that build their own cache objects per call (such as each
+    pipeline stage's AudioAnalyzer) share loaded models through this.
+
+    Args:
+        scope: Sharing key, typically the FS cache root path
+        max_entries: Bound used when the scope's cache is first created;
+            later calls for the same scope get the existing cache unchanged
+
+    Returns:
+        The same MemoryCache for every call with the same scope
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(scope)
+        if cache is None:
+            cache = _shared_caches[scope] = MemoryCache(max_entries=max_entries)
+        return cache
@@ -3,12 +3,12 @@
 Always reports cache miss, discards all stores.
 """
 
-import asyncio
 from typing import TypeVar
 
 from pydantic import BaseModel
 
 from twinklr.core.caching.models import CacheKey
+from twinklr.core.io import run_sync
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -63,11 +63,11 @@ class NullCacheSync:
 
     def exists(self, key: CacheKey) -> bool:
         """Always returns False (blocking)."""
-        return asyncio.run(self._async_cache.exists(key))
+        return run_sync(self._async_cache.exists(key))
 
     def load(self, key: CacheKey, model_cls: type[T]) -> T | None:
         """Always returns None (blocking)."""
-        return asyncio.run(self._async_cache.load(key, model_cls))
+        return run_sync(self._async_cache.load(key, model_cls))
 
     def store(
         self,
@@ -76,12 +76,12 @@ class NullCacheSync:
         compute_ms: float | None = None,
     ) -> None:
         """Discard (blocking)."""
-        asyncio.run(self._async_cache.store(key, artifact, compute_ms))
+        run_sync(self._async_cache.store(key, artifact, compute_ms))
 
     def invalidate(self, key: CacheKey) -> None:
         """No-op (blocking)."""
-        asyncio.run(self._async_cache.invalidate(key))
+        run_sync(self._async_cache.invalidate(key))
 
     def initialize(self) -> None:
         """No-op (blocking)."""
-        asyncio.run(self._async_cache.initialize())
+        run_sync(self._async_cache.initialize())
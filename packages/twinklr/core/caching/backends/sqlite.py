@@ -0,0 +1,501 @@
+"""SQLite-backed cache: one database file instead of a directory per entry.
+
+Suited to many small entries (per-section plans, LLM results, asset metadata)
+and to network filesystems, where FSCache's two files and atomic renames per
+entry dominate. Artifacts are stored as zlib-compressed JSON blobs; TTL and
+LRU eviction work off indexed ``expires_at`` / ``last_used`` columns.
+
+The database runs in WAL mode so readers never block the single writer, and
+every write is an ``IMMEDIATE`` transaction with a busy timeout, so several
+worker processes can share one cache file. Each process (and each fork) opens
+its own connection lazily.
+
+Reads keep ``last_used`` only approximately current: an entry's recency is
+refreshed at most once per ``recency_resolution_s``, and only if the write
+lock is free at that moment, so hot reads never queue behind a writer.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from twinklr.core.caching.models import CacheGCResult, CacheKey, CacheStats
+from twinklr.core.io.sync_adapter import SyncAdapter
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+SQLITE_CACHE_FILENAME = "cache.sqlite3"
+DEFAULT_BUSY_TIMEOUT_S = 30.0
+DEFAULT_COMPRESSION_LEVEL = 6
+DEFAULT_RECENCY_RESOLUTION_S = 60.0
+
+_SEP = "\x1f"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    entry_id TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    session_id TEXT,
+    step_id TEXT NOT NULL,
+    step_version TEXT NOT NULL,
+    input_fingerprint TEXT NOT NULL,
+    shared INTEGER NOT NULL DEFAULT 0,
+    artifact_model TEXT NOT NULL,
+    artifact_schema_version INTEGER,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    expires_at REAL,
+    compute_ms REAL,
+    artifact_bytes INTEGER NOT NULL,
+    artifact BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_last_used ON cache_entries (last_used);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_domain ON cache_entries (domain);
+"""
+
+
+def _entry_id(key: CacheKey) -> str:
+    """Primary key for a cache key (session-independent keys share one row)."""
+    if not key.session_scoped:
+        parts = ("_objects", "", key.step_id, key.step_version, key.input_fingerprint)
+    else:
+        parts = (
+            key.domain,
+            key.session_id or "default",
+            key.step_id,
+            key.step_version,
+            key.input_fingerprint,
+        )
+    return _SEP.join(parts)
+
+
+class SQLiteCache:
+    """
+    Async cache backed by a single SQLite database file.
+
+    Implements the ``Cache`` protocol plus batched ``load_many`` /
+    ``store_many``, and ``stats`` / ``gc`` like FSCache. Blocking SQLite calls
+    run in a worker thread. ``max_bytes`` budgets the compressed blob size.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        busy_timeout_s: float = DEFAULT_BUSY_TIMEOUT_S,
+        recency_resolution_s: float = DEFAULT_RECENCY_RESOLUTION_S,
+    ) -> None:
+        """
+        Initialize SQLite cache.
+
+        Args:
+            db_path: Path to the database file (created on first use)
+            ttl_seconds: Optional TTL in seconds for cache expiration
+            max_bytes: Optional compressed artifact size budget (None = unbounded)
+            compression_level: zlib level for artifact blobs (0-9)
+            busy_timeout_s: How long a writer waits for another process's lock
+            recency_resolution_s: Minimum age of ``last_used`` before a read
+                refreshes it (LRU eviction order is only this precise)
+        """
+        self.db_path = db_path
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._compression_level = compression_level
+        self._busy_timeout_s = busy_timeout_s
+        self._recency_resolution_s = recency_resolution_s
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._lock = threading.Lock()
+
+    async def initialize(self) -> None:
+        """
+        Open the database and create the schema (async).
+
+        Called automatically on first use. Safe to call multiple times.
+        """
+        await self._run(lambda conn: None)
+
+    def close(self) -> None:
+        """Close this process's connection. Safe to call multiple times."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    async def exists(self, key: CacheKey) -> bool:
+        """
+        Check if a live entry exists for key (async).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry exists and is not expired
+        """
+
+        def query(conn: sqlite3.Connection) -> bool:
+            where, params = self._live_filter()
+            row = conn.execute(
+                f"SELECT 1 FROM cache_entries WHERE entry_id = ? AND {where}",
+                (_entry_id(key), *params),
+            ).fetchone()
+            return row is not None
+
+        return await self._run(query)
+
+    async def load(self, key: CacheKey, model_cls: type[T]) -> T | None:
+        """
+        Load and validate cached artifact (async).
+
+        Args:
+            key: Cache key
+            model_cls: Pydantic model class for validation
+
+        Returns:
+            Validated artifact model, or None on miss/corruption/validation failure/expiration
+        """
+        return (await self.load_many([key], model_cls))[0]
+
+    async def load_many(self, keys: Sequence[CacheKey], model_cls: type[T]) -> list[T | None]:
+        """
+        Load several artifacts in one query (async).
+
+        Args:
+            keys: Cache keys
+            model_cls: Pydantic model class for validation
+
+        Returns:
+            One entry per key, in order: validated model or None on miss
+        """
+        if not keys:
+            return []
+        ids = [_entry_id(key) for key in keys]
+        unique_ids = list(dict.fromkeys(ids))
+
+        def query(conn: sqlite3.Connection) -> dict[str, bytes]:
+            where, params = self._live_filter()
+            blobs: dict[str, bytes] = {}
+            stale: list[str] = []
+            now = time.time()
+            for chunk in _chunks(unique_ids):
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT entry_id, artifact, last_used FROM cache_entries "
+                    f"WHERE entry_id IN ({placeholders}) AND {where}",
+                    (*chunk, *params),
+                ).fetchall()
+                for entry_id, blob, last_used in rows:
+                    blobs[entry_id] = blob
+                    if last_used < now - self._recency_resolution_s:
+                        stale.append(entry_id)
+            if stale:
+                self._touch(conn, stale, now)
+            return blobs
+
+        try:
+            blobs = await self._run(query)
+        except sqlite3.Error:
+            return [None] * len(keys)
+
+        artifacts: dict[str, T | None] = {}
+        for entry_id, blob in blobs.items():
+            try:
+                artifacts[entry_id] = model_cls.model_validate_json(zlib.decompress(blob))
+            except (zlib.error, ValidationError, ValueError):
+                artifacts[entry_id] = None  # Corrupted entry → cache miss
+        return [artifacts.get(entry_id) for entry_id in ids]
+
+    async def store(
+        self,
+        key: CacheKey,
+        artifact: BaseModel,
+        compute_ms: float | None = None,
+    ) -> None:
+        """
+        Store artifact in a single transaction (async).
+
+        Args:
+            key: Cache key
+            artifact: Pydantic model to cache
+            compute_ms: Optional computation duration
+        """
+        await self.store_many([(key, artifact)], compute_ms=compute_ms)
+
+    async def store_many(
+        self,
+        items: Sequence[tuple[CacheKey, BaseModel]],
+        compute_ms: float | None = None,
+    ) -> None:
+        """
+        Store several artifacts in one transaction (async).
+
+        Entries over the size budget are evicted (least recently used first)
+        in the same transaction; the entries just stored are never evicted.
+
+        Args:
+            items: (key, artifact) pairs; later pairs win on duplicate keys
+            compute_ms: Optional computation duration recorded on every entry
+        """
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + self._ttl_seconds if self._ttl_seconds is not None else None
+        rows = []
+        for key, artifact in items:
+            blob = zlib.compress(
+                artifact.model_dump_json().encode("utf-8"), self._compression_level
+            )
+            rows.append(
+                (
+                    _entry_id(key),
+                    key.domain,
+                    key.session_id if key.session_scoped else None,
+                    key.step_id,
+                    key.step_version,
+                    key.input_fingerprint,
+                    int(not key.session_scoped),
+                    f"{artifact.__class__.__module__}.{artifact.__class__.__name__}",
+                    getattr(artifact, "schema_version", None),
+                    now,
+                    now,
+                    expires_at,
+                    compute_ms,
+                    len(blob),
+                    blob,
+                )
+            )
+        protected = {row[0] for row in rows}
+
+        def write(conn: sqlite3.Connection) -> None:
+            with _write_transaction(conn):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (entry_id, domain, session_id, "
+                    "step_id, step_version, input_fingerprint, shared, artifact_model, "
+                    "artifact_schema_version, created_at, last_used, expires_at, compute_ms, "
+                    "artifact_bytes, artifact) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if self._max_bytes is not None:
+                    _evict_to(conn, self._max_bytes, protected)
+
+        await self._run(write)
+
+    async def invalidate(self, key: CacheKey) -> None:
+        """Delete the entry for key (async)."""
+
+        def write(conn: sqlite3.Connection) -> None:
+            with _write_transaction(conn):
+                conn.execute("DELETE FROM cache_entries WHERE entry_id = ?", (_entry_id(key),))
+
+        await self._run(write)
+
+    async def stats(self) -> CacheStats:
+        """Summarize stored entries (async).
+
+        Returns:
+            Entry count and compressed artifact bytes, in total and per domain
+        """
+
+        def query(conn: sqlite3.Connection) -> CacheStats:
+            rows = conn.execute(
+                "SELECT domain, COUNT(*), SUM(artifact_bytes), SUM(shared) "
+                "FROM cache_entries GROUP BY domain ORDER BY domain"
+            ).fetchall()
+            return CacheStats(
+                entries=sum(row[1] for row in rows),
+                total_bytes=sum(row[2] for row in rows),
+                max_bytes=self._max_bytes,
+                bytes_by_domain={row[0]: row[2] for row in rows},
+                shared_entries=sum(row[3] for row in rows),
+            )
+
+        return await self._run(query)
+
+    async def gc(
+        self,
+        max_bytes: int | None = None,
+        *,
+        purge_incomplete: bool = False,
+    ) -> CacheGCResult:
+        """Remove expired entries and evict LRU entries down to a budget (async).
+
+        Args:
+            max_bytes: Size budget (default: the budget configured at init;
+                None for both only removes expired entries)
+            purge_incomplete: Accepted for FSCache parity; SQLite writes are
+                transactional, so there are never incomplete entries.
+
+        Returns:
+            Counts of removed and remaining entries and bytes
+        """
+        budget = max_bytes if max_bytes is not None else self._max_bytes
+
+        def write(conn: sqlite3.Connection) -> CacheGCResult:
+            where, params = self._live_filter()
+            with _write_transaction(conn):
+                removed, freed = conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(artifact_bytes), 0) "
+                    f"FROM cache_entries WHERE NOT ({where})",
+                    params,
+                ).fetchone()
+                conn.execute(f"DELETE FROM cache_entries WHERE NOT ({where})", params)
+                if budget is not None:
+                    evicted, evicted_bytes = _evict_to(conn, budget, set())
+                    removed += evicted
+                    freed += evicted_bytes
+                remaining, remaining_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(artifact_bytes), 0) FROM cache_entries"
+                ).fetchone()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return CacheGCResult(
+                removed_entries=removed,
+                freed_bytes=freed,
+                remaining_entries=remaining,
+                remaining_bytes=remaining_bytes,
+            )
+
+        return await self._run(write)
+
+    def _touch(self, conn: sqlite3.Connection, entry_ids: list[str], now: float) -> None:
+        """Refresh ``last_used`` if the write lock is free; skip it otherwise.
+
+        Recency only orders LRU eviction, so a read never waits for another
+        process's write lock just to record it.
+        """
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            with _write_transaction(conn):
+                conn.executemany(
+                    "UPDATE cache_entries SET last_used = ? WHERE entry_id = ?",
+                    [(now, entry_id) for entry_id in entry_ids],
+                )
+        except sqlite3.OperationalError:
+            pass  # Locked by a writer; the next read past the resolution retries
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_s * 1000)}")
+
+    def _live_filter(self) -> tuple[str, tuple[float, ...]]:
+        """SQL condition (and params) matching entries that have not expired."""
+        now = time.time()
+        if self._ttl_seconds is None:
+            return "(expires_at IS NULL OR expires_at > ?)", (now,)
+        return (
+            "(expires_at IS NULL OR expires_at > ?) AND created_at > ?",
+            (now, now - self._ttl_seconds),
+        )
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run a blocking database call in a worker thread."""
+
+        def call() -> R:
+            with self._lock:
+                return fn(self._connection())
+
+        return await asyncio.to_thread(call)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it on first use (lock held)."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self._busy_timeout_s,
+                isolation_level=None,  # Transactions are explicit (BEGIN IMMEDIATE)
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with _write_transaction(conn):
+                _create_schema(conn)
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """``BEGIN IMMEDIATE`` … ``COMMIT`` (rollback on error) on an autocommit connection.
+
+    Taking the write lock up front avoids deadlocks between processes that
+    would otherwise both try to upgrade a read transaction.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    for statement in _SCHEMA.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def _evict_to(conn: sqlite3.Connection, budget: int, protected: set[str]) -> tuple[int, int]:
+    """Delete least-recently-used rows until the total size fits the budget.
+
+    Must run inside a write transaction.
+
+    Returns:
+        (entries evicted, bytes freed)
+    """
+    (total,) = conn.execute("SELECT COALESCE(SUM(artifact_bytes), 0) FROM cache_entries").fetchone()
+    if total <= budget:
+        return 0, 0
+    victims: list[tuple[str]] = []
+    freed = 0
+    for entry_id, artifact_bytes in conn.execute(
+        "SELECT entry_id, artifact_bytes FROM cache_entries ORDER BY last_used, entry_id"
+    ):
+        if total <= budget:
+            break
+        if entry_id in protected:
+            continue
+        victims.append((entry_id,))
+        total -= artifact_bytes
+        freed += artifact_bytes
+    conn.executemany("DELETE FROM cache_entries WHERE entry_id = ?", victims)
+    return len(victims), freed
+
+
+def _chunks(items: list[str], size: int = 500) -> list[list[str]]:
+    """Split ids so ``IN (...)`` stays under SQLite's parameter limit."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class SQLiteCacheSync(SyncAdapter):
+    """Synchronous wrapper around SQLiteCache.
+
+    Delegates all method calls to a SQLiteCache instance via SyncAdapter.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize sync SQLite cache wrapper.
+
+        Args:
+            db_path: Path to the database file (created on first use)
+            ttl_seconds: Optional TTL in seconds for cache expiration
+            max_bytes: Optional compressed artifact size budget (None = unbounded)
+        """
+        super().__init__(SQLiteCache(db_path, ttl_seconds, max_bytes))
@@ -0,0 +1,46 @@
+"""Cache factory — selects and constructs the configured persistent backend."""
+
+from pathlib import Path
+
+from twinklr.core.caching.backends.fs import FSCache
+from twinklr.core.caching.backends.sqlite import SQLITE_CACHE_FILENAME, SQLiteCache
+from twinklr.core.caching.models import CacheBackend
+from twinklr.core.io import RealFileSystem, absolute_path
+
+
+def create_cache(
+    backend: CacheBackend,
+    cache_dir: str | Path,
+    *,
+    ttl_seconds: float | None = None,
+    max_bytes: int | None = None,
+) -> FSCache | SQLiteCache:
+    """Construct a persistent cache rooted at ``cache_dir``.
+
+    Args:
+        backend: ``"fs"`` for FSCache, ``"sqlite"`` for SQLiteCache (stored
+            as ``<cache_dir>/cache.sqlite3``)
+        cache_dir: Cache root directory
+        ttl_seconds: Optional TTL in seconds for cache expiration
+        max_bytes: Optional size budget (None = unbounded)
+
+    Returns:
+        Uninitialized cache (initializes lazily on first use)
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "fs":
+        return FSCache(
+            RealFileSystem(),
+            absolute_path(str(cache_dir)),
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+        )
+    if backend == "sqlite":
+        return SQLiteCache(
+            Path(cache_dir).resolve() / SQLITE_CACHE_FILENAME,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+        )
+    raise ValueError(f"Unknown cache backend: {backend!r}. Supported backends: 'fs', 'sqlite'.")
@@ -3,8 +3,13 @@
 Provides cache key, metadata, and configuration models.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+CacheBackend = Literal["fs", "sqlite"]
+"""Persistent cache backend: ``fs`` (directory per entry) or ``sqlite`` (one database file)."""
+
 
 class CacheKey(BaseModel):
     """
@@ -13,6 +18,7 @@ class CacheKey(BaseModel):
     Uniquely identifies a cached computation based on:
     - Step identity (id + version)
     - Input fingerprint (SHA256 of canonicalized inputs)
+    - Session, unless the key is marked session-independent
     """
 
     domain: str = Field(description="Cache domain (e.g., 'audio', 'sequencer')")
@@ -22,6 +28,13 @@ class CacheKey(BaseModel):
     step_id: str = Field(description="Stable step identifier (e.g., 'audio.features')")
     step_version: str = Field(description="Step version string (bump on logic/schema changes)")
     input_fingerprint: str = Field(description="SHA256 hex digest of canonicalized inputs")
+    session_scoped: bool = Field(
+        default=True,
+        description=(
+            "False for deterministic steps: the result is shared across sessions "
+            "(stored once, keyed by step_id + step_version + input_fingerprint)"
+        ),
+    )
 
     def __str__(self) -> str:
         return f"{self.step_id}:{self.step_version}:{self.input_fingerprint[:12]}"
@@ -69,3 +82,49 @@ class CacheOptions(BaseModel):
         default=None,
         description="Optional TTL (rarely needed for deterministic steps)",
     )
+
+
+class CacheStats(BaseModel):
+    """
+    Size summary of a cache root (committed entries only).
+    """
+
+    entries: int = Field(description="Number of committed entries")
+    total_bytes: int = Field(description="Sum of artifact sizes in bytes")
+    max_bytes: int | None = Field(default=None, description="Configured size budget, if any")
+    bytes_by_domain: dict[str, int] = Field(
+        default_factory=dict, description="Artifact bytes per cache domain"
+    )
+    shared_entries: int = Field(
+        default=0, description="Entries in the cross-session object store (included above)"
+    )
+    session_refs: int = Field(
+        default=0, description="Per-session index files pointing into the object store"
+    )
+
+
+class CacheGCResult(BaseModel):
+    """
+    Outcome of a garbage-collection pass over a cache root.
+    """
+
+    removed_entries: int = Field(description="Entries evicted (LRU, expired, or incomplete)")
+    freed_bytes: int = Field(description="Artifact bytes released")
+    remaining_entries: int = Field(description="Committed entries left after collection")
+    remaining_bytes: int = Field(description="Artifact bytes left after collection")
+
+
+class CacheRef(BaseModel):
+    """
+    Per-session index entry pointing at a cross-session object.
+
+    Written next to session-scoped entries (in place of artifact/meta) when a
+    session stores or loads a session-independent key.
+    """
+
+    domain: str
+    session_id: str
+    step_id: str
+    step_version: str
+    input_fingerprint: str
+    linked_at: float = Field(description="Unix timestamp (seconds) of the first link")
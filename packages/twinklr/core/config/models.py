@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
@@ -62,16 +62,49 @@ class LLMLoggingConfig(BaseModel):
         description="Sanitize sensitive data (API keys, emails, etc.) from logs",
     )
 
+    storage: Literal["files", "segments"] = Field(
+        default="files",
+        description=(
+            "'files' (one file per call) or 'segments' (background writer appending "
+            "to rotating gzip JSON-lines segments; format is ignored)"
+        ),
+    )
+    segment_max_mb: float = Field(
+        default=16.0, gt=0, description="Rotate a segment at this compressed size (segments)"
+    )
+    retention_max_age_days: float | None = Field(
+        default=None, gt=0, description="Delete segments older than this (segments)"
+    )
+    retention_max_mb: float | None = Field(
+        default=None, gt=0, description="Delete oldest segments beyond this total (segments)"
+    )
+    queue_size: int = Field(
+        default=1000, ge=1, description="Maximum call logs queued for the writer (segments)"
+    )
+    queue_full_policy: Literal["drop", "block"] = Field(
+        default="drop",
+        description="When the queue is full: 'drop' the log or 'block' the caller (segments)",
+    )
+
 
 class CacheConfig(BaseModel):
     """Cache configuration."""
 
     enabled: bool = Field(default=True, description="Enable cache")
+    backend: Literal["fs", "sqlite"] = Field(
+        default="fs",
+        description="Storage backend: 'fs' (directory per entry) or 'sqlite' (one WAL database)",
+    )
     cache_path: str = Field(default="data/cache", description="Path to cache")
     ttl_seconds: float | None = Field(
         default=None,
         description="Cache TTL in seconds (None = no expiration, fingerprint handles invalidation)",
     )
+    max_bytes: int | None = Field(
+        default=None,
+        gt=0,
+        description="Cache size budget in bytes; LRU entries are evicted past it (None = unbounded)",
+    )
 
 
 class AgentOrchestrationConfig(BaseModel):
@@ -334,6 +367,21 @@ class AudioEnhancementConfig(BaseModel):
         default=60.0, ge=1.0, description="Circuit breaker reset timeout (seconds)"
     )
 
+    # HTTP response cache (metadata + lyrics providers)
+    http_cache_enabled: bool = Field(
+        default=True, description="Cache provider HTTP responses on disk across runs"
+    )
+    http_cache_ttl_s: float = Field(
+        default=7 * 24 * 3600.0, ge=0.0, description="Default cached response lifetime (seconds)"
+    )
+    http_cache_ttl_by_host: dict[str, float] = Field(
+        default_factory=lambda: {"musicbrainz.org": 30 * 24 * 3600.0},
+        description="Per-host cached response lifetime overrides (seconds)",
+    )
+    http_cache_negative_ttl_s: float = Field(
+        default=24 * 3600.0, ge=0.0, description="Lifetime of cached not-found responses (seconds)"
+    )
+
     # Metadata merge policy
     metadata_merge_policy_version: str = Field(
         default="1.0", description="Metadata merge policy version"
@@ -423,6 +471,20 @@ class AppConfig(ConfigBase):
     model_config = ConfigDict(extra="ignore")
     output_dir: str = "artifacts"
     cache_dir: str = "data/audio_cache"
+    cache_backend: Literal["fs", "sqlite"] = Field(
+        default="fs",
+        description="Audio cache backend: 'fs' (directory per entry) or 'sqlite' (one WAL database)",
+    )
+    cache_max_bytes: int | None = Field(
+        default=None,
+        gt=0,
+        description="Audio cache size budget in bytes; LRU entries are evicted past it",
+    )
+    cache_memory_entries: int = Field(
+        default=8,
+        ge=0,
+        description="Analyzed songs kept in memory per process (0 = disk only)",
+    )
     audio_processing: AudioProcessingConfig = AudioProcessingConfig()
     planning: PlanningContextConfig = PlanningContextConfig()
     logging: LoggingConfig = LoggingConfig()
@@ -8,11 +8,16 @@ persistence.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from twinklr.core.feature_store.models import CorpusStats, ProfileRecord
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import numpy as np
+
     from twinklr.core.feature_engineering.models.phrases import EffectPhrase
     from twinklr.core.feature_engineering.models.propensity import EffectModelAffinity
     from twinklr.core.feature_engineering.models.stacks import EffectStack
@@ -160,6 +165,33 @@ class NullFeatureStore:
         """Return an empty tuple — no transitions stored."""
         return ()
 
+    # ------------------------------------------------------------------
+    # Bulk column scans
+    # ------------------------------------------------------------------
+
+    def scan_columns(
+        self,
+        table: str,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = 0,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Return an empty batch iterator."""
+        return iter(())
+
+    def export_parquet(
+        self,
+        table: str,
+        path: Path,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = 0,
+    ) -> int:
+        """Write nothing and return 0."""
+        return 0
+
     # ------------------------------------------------------------------
     # Metadata
     # ------------------------------------------------------------------
@@ -16,6 +16,12 @@ Usage::
         store.upsert_phrases(phrases)
     finally:
         store.close()
+
+Hot attributes of phrases, stacks, templates and transitions are stored in
+typed, indexed columns alongside ``data_json`` (the table's ``promoted``
+columns in ``tables.json``).  ``scan_columns`` streams them as NumPy column
+batches without rehydrating models; ``export_parquet`` writes the same
+batches to parquet through pyarrow.
 """
 
 from __future__ import annotations
@@ -23,8 +29,12 @@ from __future__ import annotations
 import json
 import re
 import sqlite3
+from collections.abc import Iterator
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from twinklr.core.feature_engineering.models.phrases import EffectPhrase
 from twinklr.core.feature_engineering.models.propensity import EffectModelAffinity
@@ -37,13 +47,28 @@ from twinklr.core.feature_store.bootstrap.schema import SchemaBootstrapper
 from twinklr.core.feature_store.models import (
     CorpusStats,
     FeatureStoreConfig,
+    FeatureStoreError,
     FeatureStoreSchemaError,
     ProfileRecord,
 )
 from twinklr.core.sequencer.templates.group.recipe import EffectRecipe
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
 _VALID_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# Rows fetched per column batch by scan_columns
+DEFAULT_SCAN_BATCH_SIZE = 65_536
+
 
 def _validate_identifier(name: str) -> str:
     """Validate a SQL identifier against allowlist pattern.
@@ -62,6 +87,54 @@ def _validate_identifier(name: str) -> str:
     return name
 
 
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build an ``INSERT OR REPLACE`` statement for *columns* of *table*."""
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def _promoted_values(model: BaseModel, columns: tuple[str, ...]) -> tuple[Any, ...]:
+    """Read promoted column values from the model attributes of the same name."""
+    values = (getattr(model, column) for column in columns)
+    return tuple(v.value if isinstance(v, Enum) else v for v in values)
+
+
+def _column_kind(decl_type: str, notnull: bool) -> str:
+    """Classify a declared SQLite column type as ``int``, ``float`` or ``text``.
+
+    Nullable integers scan as ``float`` so NULL can be represented as NaN.
+    """
+    decl = decl_type.upper()
+    if "INT" in decl:
+        return "int" if notnull else "float"
+    if any(token in decl for token in ("REAL", "FLOA", "DOUB")):
+        return "float"
+    return "text"
+
+
+def _to_array(values: tuple[Any, ...], kind: str) -> np.ndarray:
+    """Convert one fetched column to a NumPy array of its scan dtype."""
+    if kind == "int":
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    if kind == "float":
+        return np.fromiter(
+            (np.nan if v is None else v for v in values), dtype=np.float64, count=len(values)
+        )
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_arrow(values: np.ndarray, arrow_type: pa.DataType) -> pa.Array:
+    """Convert one scanned column to Arrow, writing NaN (scanned NULL) as null."""
+    if values.dtype != np.float64:
+        return pa.array(values, type=arrow_type)
+    mask = np.isnan(values)
+    if pa.types.is_integer(arrow_type):
+        values = np.where(mask, 0, values).astype(np.int64)
+    return pa.array(values, type=arrow_type, mask=mask if mask.any() else None)
+
+
 class SQLiteFeatureStore:
     """SQLite-backed feature store.
 
@@ -76,6 +149,8 @@ class SQLiteFeatureStore:
     def __init__(self, config: FeatureStoreConfig) -> None:
         self._config = config
         self._conn: sqlite3.Connection | None = None
+        self._promoted: dict[str, tuple[str, ...]] = {}
+        self._column_kinds: dict[str, dict[str, str]] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -101,14 +176,22 @@ class SQLiteFeatureStore:
 
         self._conn = conn
 
+        schema = SchemaBootstrapper(conn, self._config.schema_dir)
         if self._config.auto_bootstrap:
-            SchemaBootstrapper(conn, self._config.schema_dir).bootstrap(self._config.schema_version)
+            schema.bootstrap(self._config.schema_version)
+
+        # Only promote columns the database actually has (no bootstrap → old layout)
+        self._column_kinds = {}
+        self._promoted = {
+            table: tuple(column for column in columns if column in self._table_columns(table))
+            for table, columns in schema.promoted_columns().items()
+        }
 
         if self._config.reference_data_dir is not None:
             ReferenceDataLoader(conn).load_directory(self._config.reference_data_dir)
 
         # Version integrity check.
-        stored = SchemaBootstrapper(conn, self._config.schema_dir).get_version()
+        stored = schema.get_version()
         if stored != self._config.schema_version:
             raise FeatureStoreSchemaError(
                 f"Schema version mismatch: stored={stored!r}, "
@@ -137,6 +220,16 @@ class SQLiteFeatureStore:
         """
         if not phrases:
             return 0
+        promoted = self._promoted.get("phrases", ())
+        columns = (
+            "phrase_id",
+            "package_id",
+            "sequence_file_id",
+            "effect_family",
+            "target_name",
+            "data_json",
+            *promoted,
+        )
         rows = [
             (
                 p.phrase_id,
@@ -145,15 +238,13 @@ class SQLiteFeatureStore:
                 p.effect_family,
                 p.target_name,
                 p.model_dump_json(),
+                *_promoted_values(p, promoted),
             )
             for p in phrases
         ]
         with self._conn:  # type: ignore[union-attr]
             self._conn.executemany(  # type: ignore[union-attr]
-                "INSERT OR REPLACE INTO phrases "
-                "(phrase_id, package_id, sequence_file_id, effect_family, target_name, data_json) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                rows,
+                _insert_sql("phrases", columns), rows
             )
         return len(phrases)
 
@@ -168,6 +259,16 @@ class SQLiteFeatureStore:
         """
         if not templates:
             return 0
+        promoted = self._promoted.get("templates", ())
+        columns = (
+            "template_id",
+            "template_kind",
+            "effect_family",
+            "support_count",
+            "cross_pack_stability",
+            "data_json",
+            *promoted,
+        )
         rows = [
             (
                 t.template_id,
@@ -176,15 +277,13 @@ class SQLiteFeatureStore:
                 t.support_count,
                 t.cross_pack_stability,
                 t.model_dump_json(),
+                *_promoted_values(t, promoted),
             )
             for t in templates
         ]
         with self._conn:  # type: ignore[union-attr]
             self._conn.executemany(  # type: ignore[union-attr]
-                "INSERT OR REPLACE INTO templates "
-                "(template_id, template_kind, effect_family, support_count, "
-                "cross_pack_stability, data_json) VALUES (?, ?, ?, ?, ?, ?)",
-                rows,
+                _insert_sql("templates", columns), rows
             )
         return len(templates)
 
@@ -229,6 +328,16 @@ class SQLiteFeatureStore:
         """
         if not stacks:
             return 0
+        promoted = self._promoted.get("stacks", ())
+        columns = (
+            "stack_id",
+            "package_id",
+            "sequence_file_id",
+            "target_name",
+            "stack_signature",
+            "data_json",
+            *promoted,
+        )
         rows = [
             (
                 s.stack_id,
@@ -237,15 +346,13 @@ class SQLiteFeatureStore:
                 s.target_name,
                 s.stack_signature,
                 s.model_dump_json(),
+                *_promoted_values(s, promoted),
             )
             for s in stacks
         ]
         with self._conn:  # type: ignore[union-attr]
             self._conn.executemany(  # type: ignore[union-attr]
-                "INSERT OR REPLACE INTO stacks "
-                "(stack_id, package_id, sequence_file_id, target_name, stack_signature, data_json) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                rows,
+                _insert_sql("stacks", columns), rows
             )
         return len(stacks)
 
@@ -260,19 +367,20 @@ class SQLiteFeatureStore:
         """
         if not edges:
             return 0
+        promoted = self._promoted.get("transitions", ())
+        columns = ("source_template_id", "target_template_id", "data_json", *promoted)
         rows = [
             (
                 e.source_template_id,
                 e.target_template_id,
                 e.model_dump_json(),
+                *_promoted_values(e, promoted),
             )
             for e in edges
         ]
         with self._conn:  # type: ignore[union-attr]
             self._conn.executemany(  # type: ignore[union-attr]
-                "INSERT OR REPLACE INTO transitions "
-                "(source_template_id, target_template_id, data_json) VALUES (?, ?, ?)",
-                rows,
+                _insert_sql("transitions", columns), rows
             )
         return len(edges)
 
@@ -674,6 +782,155 @@ class SQLiteFeatureStore:
             ).fetchall()
         return tuple(TransitionEdge.model_validate(json.loads(r["data_json"])) for r in rows)
 
+    # ------------------------------------------------------------------
+    # Bulk column scans
+    # ------------------------------------------------------------------
+
+    def scan_columns(
+        self,
+        table: str,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Stream typed columns of *table* as NumPy batches (no model validation).
+
+        INTEGER NOT NULL columns scan as ``int64``; nullable INTEGER and REAL
+        columns as ``float64`` with NaN for NULL; everything else as ``object``.
+
+        Args:
+            table: Table name (e.g. ``"phrases"``).
+            columns: Columns to read. Defaults to every column except ``data_json``.
+            where: Equality filters (column → value); list/tuple/set values
+                match any member, ``None`` matches NULL.
+            batch_size: Rows per yielded batch.
+
+        Yields:
+            Dicts of column name → 1-D array, all of the batch's length.
+
+        Raises:
+            FeatureStoreError: If the table or a column does not exist.
+        """
+        kinds, names = self._resolve_scan(table, columns, where)
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (where or {}).items():
+            if value is None:
+                clauses.append(f"{column} IS NULL")
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                members = list(value)
+                if not members:
+                    return
+                clauses.append(f"{column} IN ({', '.join('?' * len(members))})")
+                params.extend(members)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(names)} FROM {table}"
+        if clauses:
+            sql += f" WHERE {' AND '.join(clauses)}"
+
+        cursor = self._conn.cursor()  # type: ignore[union-attr]
+        cursor.row_factory = None  # Plain tuples: no per-row Row objects
+        cursor.execute(sql, params)
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield {
+                    name: _to_array(values, kinds[name])
+                    for name, values in zip(names, zip(*rows, strict=True), strict=True)
+                }
+        finally:
+            cursor.close()
+
+    def export_parquet(
+        self,
+        table: str,
+        path: Path,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    ) -> int:
+        """Write typed columns of *table* to a parquet file, batch by batch.
+
+        NULLs are written as parquet nulls; nullable INTEGER columns keep an
+        ``int64`` type rather than the ``float64`` they scan as.
+
+        Args:
+            table: Table name.
+            path: Output parquet path.
+            columns: Columns to export. Defaults to every column except ``data_json``.
+            where: Equality filters, as for ``scan_columns``.
+            batch_size: Rows per row group.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            FeatureStoreError: If pyarrow is not installed, or the table or a
+                column does not exist.
+        """
+        if not _HAS_PYARROW:
+            raise FeatureStoreError("export_parquet requires pyarrow")
+
+        kinds, names = self._resolve_scan(table, columns, where)
+        integer_columns = self._integer_columns(table)
+        arrow_types = {"int": pa.int64(), "float": pa.float64(), "text": pa.string()}
+        schema = pa.schema(
+            [
+                (name, pa.int64() if name in integer_columns else arrow_types[kinds[name]])
+                for name in names
+            ]
+        )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with pq.ParquetWriter(str(path), schema) as writer:
+            for batch in self.scan_columns(table, names, where=where, batch_size=batch_size):
+                arrays = [_to_arrow(batch[field.name], field.type) for field in schema]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                written += len(arrays[0])
+        return written
+
+    def _resolve_scan(
+        self, table: str, columns: tuple[str, ...] | None, where: dict[str, Any] | None
+    ) -> tuple[dict[str, str], tuple[str, ...]]:
+        """Validate a scan's table, columns and filter keys against the schema."""
+        kinds = self._column_kinds_for(table)
+        names = columns if columns is not None else tuple(c for c in kinds if c != "data_json")
+        unknown = [c for c in (*names, *(where or {})) if c not in kinds]
+        if not names or unknown:
+            raise FeatureStoreError(f"Unknown columns for {table!r}: {unknown or 'none selected'}")
+        return kinds, names
+
+    def _table_columns(self, table: str) -> dict[str, str]:
+        """Return column name → scan kind for *table* (empty if it does not exist)."""
+        rows = self._conn.execute(  # type: ignore[union-attr]
+            f"PRAGMA table_info({_validate_identifier(table)})"
+        ).fetchall()
+        return {row[1]: _column_kind(row[2], bool(row[3]) or bool(row[5])) for row in rows}
+
+    def _integer_columns(self, table: str) -> set[str]:
+        """Return the columns of *table* declared with an INTEGER affinity."""
+        rows = self._conn.execute(  # type: ignore[union-attr]
+            f"PRAGMA table_info({_validate_identifier(table)})"
+        ).fetchall()
+        return {row[1] for row in rows if "INT" in row[2].upper()}
+
+    def _column_kinds_for(self, table: str) -> dict[str, str]:
+        """Cached ``_table_columns``; raises for unknown tables."""
+        if not _VALID_IDENTIFIER_RE.match(table):
+            raise FeatureStoreError(f"Unknown table: {table!r}")
+        kinds = self._column_kinds.get(table)
+        if kinds is None:
+            kinds = self._column_kinds[table] = self._table_columns(table)
+        if not kinds:
+            raise FeatureStoreError(f"Unknown table: {table!r}")
+        return kinds
+
     # ------------------------------------------------------------------
     # Metadata
     # ------------------------------------------------------------------
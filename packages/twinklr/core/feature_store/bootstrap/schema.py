@@ -4,6 +4,11 @@ Reads DDL from JSON schema files and applies them to a SQLite connection.
 This is the only place that creates tables, views, and indexes — no
 hardcoded DDL lives in the backend module (except the minimal schema_info
 bootstrap check performed here).
+
+Schema changes are additive: columns listed in ``tables.json`` that an
+existing table lacks are added with ``ALTER TABLE``.  A table's ``promoted``
+columns mirror model attributes of the same name and are backfilled from
+``data_json`` when added.
 """
 
 from __future__ import annotations
@@ -48,7 +53,9 @@ class SchemaBootstrapper:
         """Create all tables, views, and indexes; set schema version.
 
         Safe to call on an existing database — all DDL uses ``IF NOT EXISTS``
-        semantics so repeated calls are idempotent.
+        semantics so repeated calls are idempotent.  Columns missing from
+        existing tables are added (and promoted ones backfilled) before the
+        indexes that may reference them are created.
 
         Args:
             version: Schema version string to record in ``schema_info``.
@@ -62,6 +69,7 @@ class SchemaBootstrapper:
             for table in tables:
                 ddl = self._build_table_ddl(table)
                 self._conn.execute(ddl)
+                self._add_missing_columns(table)
             for view in views:
                 ddl = self._build_view_ddl(view)
                 self._conn.execute(ddl)
@@ -97,6 +105,18 @@ class SchemaBootstrapper:
             return None
         return str(row[0])
 
+    def promoted_columns(self) -> dict[str, tuple[str, ...]]:
+        """Return each table's promoted (typed, model-attribute) columns.
+
+        Returns:
+            Mapping of table name to promoted column names, in schema order.
+        """
+        return {
+            table["name"]: tuple(table["promoted"])
+            for table in self._load_json("tables.json")
+            if table.get("promoted")
+        }
+
     def needs_migration(self, expected: str) -> bool:
         """Return True when the stored version differs from *expected*.
 
@@ -116,6 +136,35 @@ class SchemaBootstrapper:
         """Create schema_info table if it does not exist."""
         self._conn.execute(_SCHEMA_INFO_DDL)
 
+    def _add_missing_columns(self, table: dict[str, Any]) -> list[str]:
+        """Add columns from a table spec that the existing table lacks.
+
+        Newly added promoted columns are backfilled from ``data_json``.
+
+        Args:
+            table: Dict with ``name``, ``columns``, and optional ``promoted``.
+
+        Returns:
+            Names of the columns added.
+        """
+        name: str = table["name"]
+        existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({name})")}
+        added: list[str] = []
+        for col_def in table["columns"]:
+            col_name = col_def.split()[0]
+            if col_name not in existing:
+                self._conn.execute(f"ALTER TABLE {name} ADD COLUMN {col_def}")
+                added.append(col_name)
+
+        promoted = set(table.get("promoted", ()))
+        backfill = [col for col in added if col in promoted]
+        if backfill and "data_json" in existing:
+            assignments = ", ".join(
+                f"{col} = json_extract(data_json, '$.{col}')" for col in backfill
+            )
+            self._conn.execute(f"UPDATE {name} SET {assignments}")
+        return added
+
     def _load_json(self, filename: str) -> list[Any]:
         """Load and parse a JSON schema file.
 
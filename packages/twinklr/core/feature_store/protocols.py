@@ -7,9 +7,14 @@ can guard with ``isinstance(store, FeatureStoreProviderSync)``.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import numpy as np
+
     from twinklr.core.feature_engineering.models.phrases import EffectPhrase
     from twinklr.core.feature_engineering.models.propensity import EffectModelAffinity
     from twinklr.core.feature_engineering.models.stacks import EffectStack
@@ -331,6 +336,54 @@ class FeatureStoreProviderSync(Protocol):
         """
         ...
 
+    # ------------------------------------------------------------------
+    # Bulk column scans
+    # ------------------------------------------------------------------
+
+    def scan_columns(
+        self,
+        table: str,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = ...,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Stream typed table columns as NumPy batches without rehydrating models.
+
+        Args:
+            table: Table name (e.g. ``"phrases"``).
+            columns: Columns to read; ``None`` for all typed columns.
+            where: Equality filters (column → value, sequence, or ``None``).
+            batch_size: Rows per yielded batch.
+
+        Yields:
+            Dicts of column name → 1-D array.
+        """
+        ...
+
+    def export_parquet(
+        self,
+        table: str,
+        path: Path,
+        columns: tuple[str, ...] | None = None,
+        *,
+        where: dict[str, Any] | None = None,
+        batch_size: int = ...,
+    ) -> int:
+        """Write typed table columns to a parquet file.
+
+        Args:
+            table: Table name.
+            path: Output parquet path.
+            columns: Columns to export; ``None`` for all typed columns.
+            where: Equality filters, as for ``scan_columns``.
+            batch_size: Rows per row group.
+
+        Returns:
+            Number of rows written.
+        """
+        ...
+
     # ------------------------------------------------------------------
     # Metadata
     # ------------------------------------------------------------------
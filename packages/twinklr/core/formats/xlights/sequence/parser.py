@@ -92,6 +92,37 @@ class XSQParser:
         except ET.ParseError as e:
             raise ValueError(f"Invalid XML: {e}") from e
 
+    def parse_head_element(self, head_elem: ET.Element) -> SequenceHead:
+        """Parse a detached ``<head>`` element.
+
+        Used by streaming readers that iterate the document instead of
+        building the full tree.
+
+        Args:
+            head_elem: Head XML element
+
+        Returns:
+            SequenceHead model
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        return self._parse_head(head_elem)
+
+    def parse_effect_element(self, effect_elem: ET.Element) -> Effect | None:
+        """Parse a detached ``<Effect>`` placement element.
+
+        Used by streaming readers that iterate the document instead of
+        building the full tree.
+
+        Args:
+            effect_elem: Effect XML element
+
+        Returns:
+            Effect model or None if invalid
+        """
+        return self._parse_effect(effect_elem)
+
     def _parse_tree(self, tree: ET.ElementTree[ET.Element[str]]) -> XSequence:
         """Parse ElementTree into XSequence model.
 
@@ -28,6 +28,7 @@ from twinklr.core.io.models import (
     relative_path,
 )
 from twinklr.core.io.protocols import FileSystem, FileSystemSync
+from twinklr.core.io.sync_adapter import run_in_private_loop, run_sync, shutdown_sync_bridge
 from twinklr.core.io.utils import sanitize_path_component
 
 __all__ = [
@@ -50,5 +51,8 @@ __all__ = [
     "FakeFileSystemSync",
     "NullFileSystemSync",
     # Utilities
+    "run_in_private_loop",
+    "run_sync",
     "sanitize_path_component",
+    "shutdown_sync_bridge",
 ]
@@ -4,10 +4,10 @@ Simulates filesystem operations without disk I/O.
 Async operations complete immediately but maintain async interface.
 """
 
-import asyncio
 from pathlib import Path
 
 from twinklr.core.io.models import AbsolutePath, WriteResult
+from twinklr.core.io.sync_adapter import run_sync
 
 
 class FakeFileSystem:
@@ -138,7 +138,7 @@ class FakeFileSystemSync:
     Synchronous wrapper around FakeFileSystem.
 
     Since fake operations are instant, this is a thin wrapper
-    using asyncio.run() for consistency with RealFileSystemSync.
+    using run_sync() (shared bridge loop) for consistency with RealFileSystemSync.
     """
 
     def __init__(self) -> None:
@@ -150,19 +150,19 @@ class FakeFileSystemSync:
 
     def exists(self, path: AbsolutePath) -> bool:
         """Check existence (blocking)."""
-        return asyncio.run(self._async_fs.exists(path))
+        return run_sync(self._async_fs.exists(path))
 
     def is_file(self, path: AbsolutePath) -> bool:
         """Check if file (blocking)."""
-        return asyncio.run(self._async_fs.is_file(path))
+        return run_sync(self._async_fs.is_file(path))
 
     def is_dir(self, path: AbsolutePath) -> bool:
         """Check if directory (blocking)."""
-        return asyncio.run(self._async_fs.is_dir(path))
+        return run_sync(self._async_fs.is_dir(path))
 
     def read_text(self, path: AbsolutePath, encoding: str = "utf-8") -> str:
         """Read text file (blocking)."""
-        return asyncio.run(self._async_fs.read_text(path, encoding))
+        return run_sync(self._async_fs.read_text(path, encoding))
 
     def write_text(
         self,
@@ -171,20 +171,20 @@ class FakeFileSystemSync:
         encoding: str = "utf-8",
     ) -> WriteResult:
         """Write text file (blocking)."""
-        return asyncio.run(self._async_fs.write_text(path, content, encoding))
+        return run_sync(self._async_fs.write_text(path, content, encoding))
 
     def mkdirs(self, path: AbsolutePath, exist_ok: bool = True) -> None:
         """Create directory (blocking)."""
-        asyncio.run(self._async_fs.mkdirs(path, exist_ok))
+        run_sync(self._async_fs.mkdirs(path, exist_ok))
 
     def listdir(self, path: AbsolutePath) -> list[str]:
         """List directory (blocking)."""
-        return asyncio.run(self._async_fs.listdir(path))
+        return run_sync(self._async_fs.listdir(path))
 
     def remove(self, path: AbsolutePath) -> None:
         """Remove file (blocking)."""
-        asyncio.run(self._async_fs.remove(path))
+        run_sync(self._async_fs.remove(path))
 
     def rmdir(self, path: AbsolutePath, recursive: bool = False) -> None:
         """Remove directory (blocking)."""
-        asyncio.run(self._async_fs.rmdir(path, recursive))
+        run_sync(self._async_fs.rmdir(path, recursive))
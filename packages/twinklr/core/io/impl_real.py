@@ -139,7 +139,7 @@ class RealFileSystemSync(SyncAdapter):
     """Synchronous wrapper around RealFileSystem.
 
     Delegates all method calls to a RealFileSystem instance via SyncAdapter.
-    Uses asyncio.run() to execute async operations in blocking mode.
+    Each call blocks on the process-wide sync bridge loop (``run_sync``).
     Suitable for simple scripts, tests, and non-async contexts.
     Maintains full backward compatibility: class name and public API are unchanged.
     """
@@ -158,8 +158,8 @@ class FileSystemSync(Protocol):
     Provides blocking versions of FileSystem operations for
     simple scripts, tests, and non-async contexts.
 
-    Implementations typically wrap an async FileSystem and use
-    asyncio.run() to execute operations.
+    Implementations typically wrap an async FileSystem with SyncAdapter,
+    which runs operations on the shared sync bridge loop (``run_sync``).
     """
 
     def join(self, base: AbsolutePath, *parts: str) -> AbsolutePath:
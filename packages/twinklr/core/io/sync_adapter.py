@@ -1,20 +1,174 @@
 """Generic synchronous adapter for async classes.
 
 Provides SyncAdapter: a universal wrapper that converts async methods into
-blocking calls using asyncio.run(), eliminating repetitive sync wrapper boilerplate.
+blocking calls, eliminating repetitive sync wrapper boilerplate.
+
+Coroutines run on one long-lived event loop in a background daemon thread
+(one per process, started on first use) instead of a fresh ``asyncio.run()``
+loop per call, so tight sync loops skip loop setup/teardown and sync calls
+also work from code that is already running inside an event loop.
+``run_in_private_loop`` is the escape hatch for long CPU-bound calls that
+should not hold up every other sync caller on the shared loop.
 """
 
 import asyncio
+import atexit
 import functools
-from typing import Any
+import os
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+_SHUTDOWN_TIMEOUT_S = 5.0
+
+
+class _LoopThread:
+    """A background thread running one event loop forever."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name="twinklr-sync-bridge", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def thread_id(self) -> int | None:
+        return self._thread.ident
+
+    def submit(self, coro: Coroutine[Any, Any, R]) -> "Future[R]":
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Cancel pending tasks, stop the loop and join the thread."""
+        if self.loop.is_closed():
+            return
+
+        async def _cancel_pending() -> None:
+            current = asyncio.current_task()
+            tasks = [t for t in asyncio.all_tasks() if t is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.loop.shutdown_asyncgens()
+
+        try:
+            self.submit(_cancel_pending()).result(_SHUTDOWN_TIMEOUT_S)
+        except Exception:
+            pass  # Best effort: the loop is stopped below regardless
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(_SHUTDOWN_TIMEOUT_S)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+_bridge: _LoopThread | None = None
+_bridge_lock = threading.Lock()
+
+
+def _get_bridge() -> _LoopThread:
+    """Return this process's loop thread, starting it on first use (and after fork)."""
+    global _bridge
+    bridge = _bridge
+    if bridge is not None and bridge.pid == os.getpid():
+        return bridge
+    with _bridge_lock:
+        if _bridge is None or _bridge.pid != os.getpid():
+            _bridge = _LoopThread()
+        return _bridge
+
+
+def run_sync(coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine to completion from synchronous code.
+
+    The coroutine is dispatched to the process-wide bridge loop with
+    ``run_coroutine_threadsafe`` and the calling thread blocks on the result.
+    Safe to call from any thread, including one with its own running event
+    loop (that loop is blocked for the duration of the call).
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from a coroutine already running on the
+            bridge loop (it would wait on itself forever).
+        Exception: Whatever the coroutine raises.
+
+    Example:
+        >>> run_sync(fs.read_text(path))
+    """
+    bridge = _get_bridge()
+    if threading.get_ident() == bridge.thread_id:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the sync bridge's own event loop")
+    return bridge.submit(coro).result()
+
+
+def run_in_private_loop(coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine to completion on a fresh event loop owned by this call.
+
+    Use this instead of ``run_sync`` for long, CPU-heavy coroutines: the shared
+    bridge loop runs one coroutine step at a time, so such work would
+    serialize every concurrent sync caller behind it. If the calling thread
+    already runs a loop, the private loop runs in a helper thread and the
+    caller blocks on it. Also safe to call from the bridge loop itself.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        Exception: Whatever the coroutine raises.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="twinklr-private-loop") as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def shutdown_sync_bridge() -> None:
+    """Stop the bridge loop thread, cancelling anything still pending.
+
+    Registered with ``atexit``; call it explicitly to release the thread
+    earlier. The next ``run_sync`` starts a new loop.
+    """
+    global _bridge
+    with _bridge_lock:
+        bridge, _bridge = _bridge, None
+    if bridge is not None and bridge.pid == os.getpid():
+        bridge.stop()
+
+
+def _reset_after_fork() -> None:
+    """Drop the parent's bridge in a forked child (its thread does not exist there)."""
+    global _bridge, _bridge_lock
+    _bridge = None
+    _bridge_lock = threading.Lock()
+
+
+atexit.register(shutdown_sync_bridge)
+os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class SyncAdapter:
     """Generic synchronous wrapper for async classes.
 
     Wraps any async object and converts coroutine methods into blocking
-    synchronous calls using asyncio.run(). Non-coroutine attributes and
-    methods are passed through unchanged.
+    synchronous calls via ``run_sync`` (shared background event loop).
+    Non-coroutine attributes and methods are passed through unchanged.
 
     Example:
         >>> class MyAsync:
@@ -40,7 +194,7 @@ class SyncAdapter:
     def __getattr__(self, name: str) -> Any:
         """Proxy attribute access to the wrapped object.
 
-        Coroutine functions are wrapped with asyncio.run(); all other
+        Coroutine functions are wrapped with ``run_sync``; all other
         attributes are returned as-is.
 
         Args:
@@ -59,7 +213,7 @@ class SyncAdapter:
             @functools.wraps(attr)
             def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Blocking wrapper that runs the coroutine synchronously."""
-                return asyncio.run(attr(*args, **kwargs))
+                return run_sync(attr(*args, **kwargs))
 
             return sync_wrapper
         return attr
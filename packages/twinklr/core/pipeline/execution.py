@@ -39,6 +39,7 @@ async def execute_step(
     cache_key_fn: Callable[[], Awaitable[str]] | None = None,
     cache_version: str = "1",
     cache_domain: str | None = None,
+    session_scoped: bool = True,
     state_handler: Callable[[T, PipelineContext], None] | None = None,
     metrics_handler: Callable[[T, PipelineContext], None] | None = None,
 ) -> StageResult[OutputT]:
@@ -60,6 +61,8 @@ async def execute_step(
         cache_version: Cache version string (bump to invalidate cache)
         cache_domain: Cache domain (folder name). Defaults to stage_name.
             Use this to group related stages (e.g., all group_planner sections).
+        session_scoped: Set False for stages whose result depends only on the
+            cache key inputs; the result is then reused across sessions.
         state_handler: Optional handler for additional state (extends defaults)
         metrics_handler: Optional handler for additional metrics (extends defaults)
 
@@ -118,6 +121,7 @@ async def execute_step(
                 step_id=stage_name,
                 step_version=cache_version,
                 input_fingerprint=cache_key_hash,
+                session_scoped=session_scoped,
             )
 
             # Try load from cache
@@ -219,6 +223,7 @@ async def execute_step(
             "domain": cache_key.domain if cache_key is not None else None,
             "input_fingerprint": (cache_key.input_fingerprint if cache_key is not None else None),
             "step_version": cache_key.step_version if cache_key is not None else None,
+            "session_scoped": session_scoped,
             "error": cache_error,
             "pipeline_run_id": context.get_state("pipeline_run_id"),
         },
@@ -1,5 +1,11 @@
 """Public API for sequence pack profiling."""
 
+from twinklr.core.profiling.models.batch import (
+    BatchProfileReport,
+    BatchProgress,
+    PackProfileJob,
+    PackProfileOutcome,
+)
 from twinklr.core.profiling.models.corpus import (
     CorpusManifest,
     CorpusQualityReport,
@@ -13,6 +19,7 @@ from twinklr.core.profiling.models.enums import (
     EffectDbParseStatus,
     FileKind,
     ModelCategory,
+    PackProfileStatus,
     ParameterValueType,
     SemanticSize,
     StartChannelFormat,
@@ -22,7 +29,7 @@ from twinklr.core.profiling.models.events import BaseEffectEventsFile, EffectEve
 from twinklr.core.profiling.models.layout import LayoutProfile
 from twinklr.core.profiling.models.pack import FileEntry, PackageManifest
 from twinklr.core.profiling.models.palette import ColorPaletteProfile
-from twinklr.core.profiling.models.profile import SequencePackProfile
+from twinklr.core.profiling.models.profile import SequencePackProfile, StreamedPackProfile
 from twinklr.core.profiling.profiler import SequencePackProfiler
 
 __all__ = [
@@ -38,6 +45,12 @@ __all__ = [
     "StartChannelFormat",
     "TargetKind",
     "SequencePackProfile",
+    "StreamedPackProfile",
+    "PackProfileJob",
+    "PackProfileOutcome",
+    "PackProfileStatus",
+    "BatchProgress",
+    "BatchProfileReport",
     "LayoutProfile",
     "EffectStatistics",
     "ColorPaletteProfile",
@@ -3,15 +3,112 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import IO, Any
 
 from pydantic import BaseModel
 
-from twinklr.core.profiling.models.profile import SequencePackProfile
+from twinklr.core.profiling.models.events import EffectEventRecord
+from twinklr.core.profiling.models.profile import (
+    EnrichedEventRecord,
+    SequencePackProfile,
+    StreamedPackProfile,
+)
 from twinklr.core.profiling.report import generate_layout_report_md, generate_profile_summary_md
 
 
+class EventArtifactStream:
+    """Incremental writer for the base and enriched event artifacts.
+
+    Produces the same JSON documents as ``ProfileArtifactWriter.write_json_bundle``
+    (an envelope with an ``events`` array, and a bare array of enriched
+    events), one compact row per event, without holding the events in memory.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        package_id: str,
+        sequence_file_id: str,
+        sequence_sha256: str,
+    ) -> None:
+        """Open both artifact files and write the document headers.
+
+        Args:
+            output_dir: Profile artifact directory.
+            package_id: Envelope package ID.
+            sequence_file_id: Envelope sequence file ID.
+            sequence_sha256: Envelope sequence digest.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self._base = (output_dir / "base_effect_events.json").open("w", encoding="utf-8")
+        self._enriched = (output_dir / "enriched_effect_events.json").open("w", encoding="utf-8")
+        self._count = 0
+
+        envelope = json.dumps(
+            {
+                "package_id": package_id,
+                "sequence_file_id": sequence_file_id,
+                "sequence_sha256": sequence_sha256,
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        # Re-open the envelope object to append the events array.
+        self._base.write(envelope[:-2] + ',\n  "events": [')
+        self._enriched.write("[")
+
+    @property
+    def count(self) -> int:
+        """Number of events written so far."""
+        return self._count
+
+    def write_batch(
+        self,
+        events: Sequence[EffectEventRecord],
+        enriched_events: Sequence[EnrichedEventRecord],
+    ) -> None:
+        """Append one batch of (already ordered) base and enriched events."""
+        if not events:
+            return
+        self._write_rows(self._base, events, indent="    ")
+        self._write_rows(self._enriched, enriched_events, indent="  ")
+        self._count += len(events)
+
+    def _write_rows(self, handle: IO[str], rows: Sequence[BaseModel], *, indent: str) -> None:
+        handle.write(",\n" if self._count else "\n")
+        handle.write(
+            ",\n".join(
+                indent
+                + json.dumps(row.model_dump(mode="json", exclude_none=True), ensure_ascii=False)
+                for row in rows
+            )
+        )
+
+    def close(self) -> None:
+        """Terminate both JSON documents and close the files."""
+        if self._base.closed:
+            return
+        self._base.write("\n  ]\n}" if self._count else "]\n}")
+        self._enriched.write("\n]" if self._count else "]")
+        self._base.close()
+        self._enriched.close()
+
+    def __enter__(self) -> EventArtifactStream:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
 class ProfileArtifactWriter:
     """Write JSON and markdown artifacts for profiling outputs."""
 
@@ -23,16 +120,47 @@ class ProfileArtifactWriter:
             data = obj
         path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
-    def write_json_bundle(self, output_dir: Path, profile: SequencePackProfile) -> None:
-        """Write canonical JSON outputs for a full profile."""
+    def open_event_stream(
+        self,
+        output_dir: Path,
+        *,
+        package_id: str,
+        sequence_file_id: str,
+        sequence_sha256: str,
+    ) -> EventArtifactStream:
+        """Open incremental writers for the event artifacts of a streamed profile."""
+        return EventArtifactStream(
+            output_dir,
+            package_id=package_id,
+            sequence_file_id=sequence_file_id,
+            sequence_sha256=sequence_sha256,
+        )
+
+    def write_json_bundle(
+        self, output_dir: Path, profile: SequencePackProfile | StreamedPackProfile
+    ) -> None:
+        """Write canonical JSON outputs for a full profile.
+
+        Streamed profiles have already written their event artifacts through
+        ``open_event_stream``; their report counts go to ``event_index.json``.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
         self._write_json(output_dir / "package_manifest.json", profile.manifest)
         self._write_json(output_dir / "sequence_metadata.json", profile.sequence_metadata)
-        self._write_json(output_dir / "base_effect_events.json", profile.base_events)
-        self._write_json(
-            output_dir / "enriched_effect_events.json",
-            [event.model_dump(exclude_none=True) for event in profile.enriched_events],
-        )
+        if isinstance(profile, SequencePackProfile):
+            self._write_json(output_dir / "base_effect_events.json", profile.base_events)
+            self._write_json(
+                output_dir / "enriched_effect_events.json",
+                [event.model_dump(exclude_none=True) for event in profile.enriched_events],
+            )
+        else:
+            self._write_json(
+                output_dir / "event_index.json",
+                {
+                    "layer_event_counts": profile.layer_event_counts,
+                    "target_kind_counts": profile.target_kind_counts,
+                },
+            )
         self._write_json(output_dir / "effect_statistics.json", profile.effect_statistics)
         self._write_json(output_dir / "color_palettes.json", profile.palette_profile)
         self._write_json(
@@ -66,7 +194,9 @@ class ProfileArtifactWriter:
                 }
             self._write_json(output_dir / "layout_semantics.json", layout_semantics)
 
-    def write_markdown_bundle(self, output_dir: Path, profile: SequencePackProfile) -> None:
+    def write_markdown_bundle(
+        self, output_dir: Path, profile: SequencePackProfile | StreamedPackProfile
+    ) -> None:
         """Write markdown summaries for full/layout profile outputs."""
         output_dir.mkdir(parents=True, exist_ok=True)
         (output_dir / "profile_summary.md").write_text(
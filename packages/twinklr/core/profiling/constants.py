@@ -6,3 +6,9 @@ EFFECTDB_PARSER_VERSION = "v0.1.0"
 CORPUS_MANIFEST_SCHEMA_VERSION = "v0.1.0"
 STRUCTURED_EFFECTDB_SCHEMA_VERSION = "v0_effectdb_structured_1"
 LEGACY_PROFILE_SCHEMA_VERSION = "legacy_profile_1"
+PROFILE_CACHE_DOMAIN = "profiling"
+LAYOUT_PROFILE_CACHE_STEP = "profiling.layout_profile"
+LAYOUT_PROFILE_CACHE_VERSION = "v1"
+SEQUENCE_EVENTS_CACHE_STEP = "profiling.sequence_events"
+SEQUENCE_EVENTS_CHUNK_CACHE_STEP = "profiling.sequence_events.chunk"
+SEQUENCE_EVENTS_CACHE_VERSION = f"v2-{EFFECTDB_PARSER_VERSION}"
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import contextlib
-import statistics
 from collections import Counter, defaultdict
-from collections.abc import Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence
 
 from twinklr.core.profiling.models.effects import (
     CategoricalValueProfile,
@@ -18,11 +16,8 @@ from twinklr.core.profiling.models.effects import (
 from twinklr.core.profiling.models.enums import ParameterValueType
 from twinklr.core.profiling.models.events import EffectEventRecord
 
-
-def is_high_cardinality(param_name: str, values: list[str], n_instances: int) -> bool:
-    """Return True when parameter cardinality makes profiles unhelpful/noisy."""
-    param_name_lower = param_name.lower()
-    exclude_keywords = {
+_HIGH_CARDINALITY_KEYWORDS = frozenset(
+    {
         "text",
         "font",
         "file",
@@ -35,8 +30,17 @@ def is_high_cardinality(param_name: str, values: list[str], n_instances: int) ->
         "label",
         "description",
     }
+)
+
+
+def _is_excluded_by_name(param_name: str) -> bool:
+    param_name_lower = param_name.lower()
+    return any(keyword in param_name_lower for keyword in _HIGH_CARDINALITY_KEYWORDS)
+
 
-    if any(keyword in param_name_lower for keyword in exclude_keywords):
+def is_high_cardinality(param_name: str, values: Collection[str], n_instances: int) -> bool:
+    """Return True when parameter cardinality makes profiles unhelpful/noisy."""
+    if _is_excluded_by_name(param_name):
         return True
 
     unique_count = len(set(values))
@@ -47,132 +51,198 @@ def _is_filtered_param(param_name: str) -> bool:
     return param_name == "bufferstyle" or param_name.startswith("mh") or "dmx" in param_name
 
 
-def compute_effect_statistics(events: Sequence[EffectEventRecord]) -> EffectStatistics:
-    """Compute aggregate and per-type parameter statistics from effect events."""
-    if not events:
-        return EffectStatistics(
-            total_events=0,
-            distinct_effect_types=0,
-            total_effect_duration_ms=0,
-            avg_effect_duration_ms=0.0,
-            total_targets_with_effects=0,
-            effect_type_counts={},
-            effect_type_durations_ms={},
-            effect_type_profiles={},
-            effects_per_target={},
-            layers_per_target={},
+def _weighted_median(counts: Mapping[int, int] | Mapping[float, int], total: int) -> float:
+    """Median of a value → occurrence-count histogram (matches ``statistics.median``)."""
+    lower_rank, upper_rank = (total - 1) // 2, total // 2
+    lower: float | None = None
+    seen = 0
+    for value, count in sorted(counts.items()):
+        seen += count
+        if lower is None and seen > lower_rank:
+            lower = value
+        if seen > upper_rank:
+            return (lower + value) / 2  # type: ignore[operator]
+    raise ValueError("median of empty histogram")
+
+
+def _float_histogram(values: Counter[str]) -> tuple[dict[float, int], int]:
+    """Parse a raw value histogram into float values, skipping non-numeric ones."""
+    histogram: dict[float, int] = defaultdict(int)
+    for raw, count in values.items():
+        try:
+            histogram[float(raw)] += count
+        except (ValueError, TypeError):
+            continue
+    return histogram, sum(histogram.values())
+
+
+class EffectStatisticsAccumulator:
+    """Incremental builder for ``EffectStatistics``.
+
+    Events are folded in one at a time (or in batches), so streaming
+    profilers can compute statistics without holding the event list.
+    Only bounded summaries are kept: per-type histograms of durations and
+    parameter values (not per-event lists), so memory grows with the number
+    of distinct values rather than with the number of events.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty accumulator."""
+        self._total_events = 0
+        self._total_duration = 0
+        self._effect_type_counts: Counter[str] = Counter()
+        self._effect_type_durations: Counter[str] = Counter()
+        self._effects_per_target: Counter[str] = Counter()
+        self._layers_per_target: dict[str, set[int]] = defaultdict(set)
+        self._per_type_durations: dict[str, Counter[int]] = defaultdict(Counter)
+        self._per_type_buffer_styles: dict[str, set[str]] = defaultdict(set)
+        # Occurrences per parameter; value histograms only for params not excluded by name
+        self._per_type_param_counts: dict[str, Counter[str]] = defaultdict(Counter)
+        self._per_type_params: dict[str, dict[str, Counter[str]]] = defaultdict(
+            lambda: defaultdict(Counter)
+        )
+        self._per_type_param_types: dict[str, dict[str, Counter[ParameterValueType]]] = defaultdict(
+            lambda: defaultdict(Counter)
         )
 
-    effect_type_counts: Counter[str] = Counter()
-    effect_type_durations: Counter[str] = Counter()
-    effects_per_target: Counter[str] = Counter()
-    layers_per_target: dict[str, set[int]] = defaultdict(set)
-
-    per_type_durations: dict[str, list[int]] = defaultdict(list)
-    per_type_buffer_styles: dict[str, set[str]] = defaultdict(set)
-    per_type_params: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
-    per_type_param_types: dict[str, dict[str, list[ParameterValueType]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-
-    total_duration = 0
-
-    for event in events:
+    def add(self, event: EffectEventRecord) -> None:
+        """Fold one event into the running statistics."""
         duration = max(0, event.end_ms - event.start_ms)
-        total_duration += duration
+        self._total_events += 1
+        self._total_duration += duration
 
-        effect_type_counts[event.effect_type] += 1
-        effect_type_durations[event.effect_type] += duration
-        effects_per_target[event.target_name] += 1
-        layers_per_target[event.target_name].add(event.layer_index)
+        self._effect_type_counts[event.effect_type] += 1
+        self._effect_type_durations[event.effect_type] += duration
+        self._effects_per_target[event.target_name] += 1
+        self._layers_per_target[event.target_name].add(event.layer_index)
 
-        per_type_durations[event.effect_type].append(duration)
+        self._per_type_durations[event.effect_type][duration] += 1
 
         buffer_style = "default"
+        type_param_counts = self._per_type_param_counts[event.effect_type]
+        type_params = self._per_type_params[event.effect_type]
+        type_param_types = self._per_type_param_types[event.effect_type]
         for param in event.effectdb_params:
             param_name = param.param_name_normalized
             param_value = param.value_raw
-            per_type_param_types[event.effect_type][param_name].append(param.value_type)
+            type_param_types[param_name][param.value_type] += 1
             if param_name == "bufferstyle":
                 buffer_style = param_value or "default"
             if _is_filtered_param(param_name):
                 continue
-            per_type_params[event.effect_type][param_name].append(param_value)
-        per_type_buffer_styles[event.effect_type].add(buffer_style)
-
-    effect_type_profiles: dict[str, EffectTypeProfile] = {}
-
-    for effect_type in sorted(effect_type_counts):
-        durations = per_type_durations.get(effect_type, [])
-        if durations:
-            duration_stats = DurationStats(
-                count=len(durations),
-                min_ms=min(durations),
-                max_ms=max(durations),
-                avg_ms=statistics.mean(durations),
-                median_ms=statistics.median(durations),
+            type_param_counts[param_name] += 1
+            if not _is_excluded_by_name(param_name):
+                type_params[param_name][param_value] += 1
+        self._per_type_buffer_styles[event.effect_type].add(buffer_style)
+
+    def extend(self, events: Iterable[EffectEventRecord]) -> None:
+        """Fold a batch of events into the running statistics."""
+        for event in events:
+            self.add(event)
+
+    def build(self) -> EffectStatistics:
+        """Produce statistics for all events added so far."""
+        if not self._total_events:
+            return EffectStatistics(
+                total_events=0,
+                distinct_effect_types=0,
+                total_effect_duration_ms=0,
+                avg_effect_duration_ms=0.0,
+                total_targets_with_effects=0,
+                effect_type_counts={},
+                effect_type_durations_ms={},
+                effect_type_profiles={},
+                effects_per_target={},
+                layers_per_target={},
             )
-        else:
-            duration_stats = DurationStats(count=0, min_ms=0, max_ms=0, avg_ms=0.0, median_ms=0.0)
-
-        parameter_profiles: dict[str, ParameterProfile] = {}
-        raw_params = per_type_params.get(effect_type, {})
 
-        for param_name in sorted(raw_params):
-            values = raw_params[param_name]
-            if is_high_cardinality(param_name, values, len(durations)):
-                continue
-
-            inferred_types = Counter(per_type_param_types.get(effect_type, {}).get(param_name, []))
-            primary_type = inferred_types.most_common(1)[0][0]
-
-            numeric_profile: NumericValueProfile | None = None
-            categorical_profile: CategoricalValueProfile | None = None
-
-            if primary_type in {ParameterValueType.INT, ParameterValueType.FLOAT}:
-                numeric_values: list[float] = []
-                for value in values:
-                    with contextlib.suppress(ValueError, TypeError):
-                        numeric_values.append(float(value))
-                if numeric_values:
-                    numeric_profile = NumericValueProfile(
-                        min=min(numeric_values),
-                        max=max(numeric_values),
-                        avg=statistics.mean(numeric_values),
-                        median=statistics.median(numeric_values),
-                    )
-            elif primary_type in {ParameterValueType.STRING, ParameterValueType.BOOL}:
-                distinct = tuple(sorted(set(values)))
-                if len(distinct) <= 50:
-                    categorical_profile = CategoricalValueProfile(
-                        distinct_values=distinct,
-                        distinct_count=len(distinct),
-                    )
-
-            parameter_profiles[param_name] = ParameterProfile(
-                type=primary_type,
-                count=len(values),
-                numeric_profile=numeric_profile,
-                categorical_profile=categorical_profile,
+        effect_type_counts = self._effect_type_counts
+        per_type_durations = self._per_type_durations
+        per_type_buffer_styles = self._per_type_buffer_styles
+        per_type_param_counts = self._per_type_param_counts
+        per_type_params = self._per_type_params
+        per_type_param_types = self._per_type_param_types
+        effect_type_profiles: dict[str, EffectTypeProfile] = {}
+
+        for effect_type in sorted(effect_type_counts):
+            durations = per_type_durations.get(effect_type, Counter())
+            n_durations = durations.total()
+            if n_durations:
+                duration_stats = DurationStats(
+                    count=n_durations,
+                    min_ms=min(durations),
+                    max_ms=max(durations),
+                    avg_ms=sum(d * n for d, n in durations.items()) / n_durations,
+                    median_ms=_weighted_median(durations, n_durations),
+                )
+            else:
+                duration_stats = DurationStats(
+                    count=0, min_ms=0, max_ms=0, avg_ms=0.0, median_ms=0.0
+                )
+
+            parameter_profiles: dict[str, ParameterProfile] = {}
+            param_counts = per_type_param_counts.get(effect_type, Counter())
+            raw_params = per_type_params.get(effect_type, {})
+
+            for param_name in sorted(param_counts):
+                values = raw_params.get(param_name, Counter())
+                if is_high_cardinality(param_name, values, n_durations):
+                    continue
+
+                inferred_types = per_type_param_types[effect_type][param_name]
+                primary_type = inferred_types.most_common(1)[0][0]
+
+                numeric_profile: NumericValueProfile | None = None
+                categorical_profile: CategoricalValueProfile | None = None
+
+                if primary_type in {ParameterValueType.INT, ParameterValueType.FLOAT}:
+                    numeric_values, n_numeric = _float_histogram(values)
+                    if n_numeric:
+                        numeric_profile = NumericValueProfile(
+                            min=min(numeric_values),
+                            max=max(numeric_values),
+                            avg=sum(v * n for v, n in numeric_values.items()) / n_numeric,
+                            median=_weighted_median(numeric_values, n_numeric),
+                        )
+                elif primary_type in {ParameterValueType.STRING, ParameterValueType.BOOL}:
+                    distinct = tuple(sorted(values))
+                    if len(distinct) <= 50:
+                        categorical_profile = CategoricalValueProfile(
+                            distinct_values=distinct,
+                            distinct_count=len(distinct),
+                        )
+
+                parameter_profiles[param_name] = ParameterProfile(
+                    type=primary_type,
+                    count=param_counts[param_name],
+                    numeric_profile=numeric_profile,
+                    categorical_profile=categorical_profile,
+                )
+
+            effect_type_profiles[effect_type] = EffectTypeProfile(
+                instance_count=effect_type_counts[effect_type],
+                duration_stats=duration_stats,
+                buffer_styles=tuple(sorted(per_type_buffer_styles.get(effect_type, {"default"}))),
+                parameter_names=tuple(sorted(param_counts)),
+                parameters=parameter_profiles,
             )
 
-        effect_type_profiles[effect_type] = EffectTypeProfile(
-            instance_count=effect_type_counts[effect_type],
-            duration_stats=duration_stats,
-            buffer_styles=tuple(sorted(per_type_buffer_styles.get(effect_type, {"default"}))),
-            parameter_names=tuple(sorted(raw_params.keys())),
-            parameters=parameter_profiles,
+        return EffectStatistics(
+            total_events=self._total_events,
+            distinct_effect_types=len(effect_type_counts),
+            total_effect_duration_ms=self._total_duration,
+            avg_effect_duration_ms=self._total_duration / self._total_events,
+            total_targets_with_effects=len(self._effects_per_target),
+            effect_type_counts=dict(effect_type_counts.most_common()),
+            effect_type_durations_ms=dict(self._effect_type_durations.most_common()),
+            effect_type_profiles=effect_type_profiles,
+            effects_per_target=dict(self._effects_per_target),
+            layers_per_target={k: len(v) for k, v in self._layers_per_target.items()},
         )
 
-    return EffectStatistics(
-        total_events=len(events),
-        distinct_effect_types=len(effect_type_counts),
-        total_effect_duration_ms=total_duration,
-        avg_effect_duration_ms=(total_duration / len(events)) if events else 0.0,
-        total_targets_with_effects=len(effects_per_target),
-        effect_type_counts=dict(effect_type_counts.most_common()),
-        effect_type_durations_ms=dict(effect_type_durations.most_common()),
-        effect_type_profiles=effect_type_profiles,
-        effects_per_target=dict(effects_per_target),
-        layers_per_target={k: len(v) for k, v in layers_per_target.items()},
-    )
+
+def compute_effect_statistics(events: Sequence[EffectEventRecord]) -> EffectStatistics:
+    """Compute aggregate and per-type parameter statistics from effect events."""
+    accumulator = EffectStatisticsAccumulator()
+    accumulator.extend(events)
+    return accumulator.build()
@@ -5,11 +5,15 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 from twinklr.core.formats.xlights.sequence.models.xsq import Effect, XSequence
 from twinklr.core.profiling.constants import EFFECTDB_PARSER_VERSION
-from twinklr.core.profiling.effects.effectdb_parser import parse_effectdb_settings
+from twinklr.core.profiling.effects.effectdb_parser import (
+    ParsedEffectDbSettings,
+    parse_effectdb_settings,
+)
 from twinklr.core.profiling.models.events import BaseEffectEventsFile, EffectEventRecord
 
 
@@ -21,27 +25,84 @@ def _config_fingerprint(config: dict[str, Any]) -> str:
     return hashlib.sha1(_canonical_json(config).encode("utf-8")).hexdigest()
 
 
+class EffectDbSettingsCache:
+    """Memoized EffectDB lookups keyed by ref.
+
+    Effects in a sequence share a small set of EffectDB entries, so each
+    distinct ref is resolved and parsed once and the (frozen) parse result is
+    reused for every effect that points at it.
+    """
+
+    def __init__(self, lookup: Callable[[int], str | None]) -> None:
+        """Initialize cache.
+
+        Args:
+            lookup: Resolves an EffectDB index to its raw settings string.
+        """
+        self._lookup = lookup
+        self._resolved: dict[int | None, tuple[str | None, ParsedEffectDbSettings]] = {}
+
+    def resolve(self, ref: int | None) -> tuple[str | None, ParsedEffectDbSettings]:
+        """Return ``(raw_settings, parsed_settings)`` for an effect's ref."""
+        cached = self._resolved.get(ref)
+        if cached is None:
+            settings = self._lookup(ref) if ref is not None else None
+            cached = (settings, parse_effectdb_settings(settings))
+            self._resolved[ref] = cached
+        return cached
+
+
+def effect_event_sort_key(event: EffectEventRecord) -> tuple[int, str, str, str]:
+    """Canonical event ordering: `(start_ms, layer_name, target_name, effect_type)`."""
+    return (event.start_ms, event.layer_name, event.target_name, event.effect_type)
+
+
 def _build_effect_config_dict(
-    sequence: XSequence,
     effect: Effect,
-) -> tuple[dict[str, Any], int | None, str | None]:
+    effectdb_settings: str | None,
+) -> dict[str, Any]:
     config: dict[str, Any] = {}
     config.update(effect.parameters)
     config["_palette"] = effect.palette
     config["_protected"] = effect.protected
     if effect.label is not None:
         config["_label"] = effect.label
+    if effectdb_settings is not None:
+        config["_effectdb_settings_raw"] = effectdb_settings
+    return config
 
-    effectdb_ref = effect.ref if isinstance(effect.ref, int) else None
-    effectdb_settings: str | None = None
-
-    if effectdb_ref is not None:
-        settings = sequence.effect_db.get(effectdb_ref)
-        if settings is not None:
-            effectdb_settings = settings
-            config["_effectdb_settings_raw"] = effectdb_settings
 
-    return config, effectdb_ref, effectdb_settings
+def build_effect_event(
+    effect: Effect,
+    *,
+    target_name: str,
+    layer_index: int,
+    layer_name: str,
+    effect_db: EffectDbSettingsCache,
+) -> EffectEventRecord:
+    """Flatten one parsed effect placement into an event record."""
+    effectdb_ref = effect.ref if isinstance(effect.ref, int) else None
+    effectdb_settings, parsed_settings = effect_db.resolve(effectdb_ref)
+    config = _build_effect_config_dict(effect, effectdb_settings)
+    return EffectEventRecord(
+        effect_event_id=str(uuid.uuid4()),
+        target_name=target_name,
+        layer_index=layer_index,
+        layer_name=layer_name,
+        effect_type=effect.effect_type,
+        start_ms=effect.start_time_ms,
+        end_ms=effect.end_time_ms,
+        config_fingerprint=_config_fingerprint(config),
+        effectdb_ref=effectdb_ref,
+        effectdb_settings_raw=effectdb_settings,
+        effectdb_parser_version=EFFECTDB_PARSER_VERSION,
+        effectdb_parse_status=parsed_settings.status,
+        effectdb_params=parsed_settings.params,
+        effectdb_parse_errors=parsed_settings.errors,
+        palette=effect.palette,
+        protected=effect.protected,
+        label=effect.label,
+    )
 
 
 def extract_effect_events(
@@ -55,39 +116,24 @@ def extract_effect_events(
     Events are sorted by `(start_ms, layer_name, target_name, effect_type)`.
     """
     events: list[EffectEventRecord] = []
+    effect_db = EffectDbSettingsCache(sequence.effect_db.get)
 
     for element in sequence.element_effects:
         target_name = element.element_name
         for layer in element.layers:
             layer_name = layer.name or f"layer_{layer.index}"
             for effect in layer.effects:
-                config, effectdb_ref, effectdb_settings = _build_effect_config_dict(
-                    sequence, effect
-                )
-                parsed_settings = parse_effectdb_settings(effectdb_settings)
                 events.append(
-                    EffectEventRecord(
-                        effect_event_id=str(uuid.uuid4()),
+                    build_effect_event(
+                        effect,
                         target_name=target_name,
                         layer_index=layer.index,
                         layer_name=layer_name,
-                        effect_type=effect.effect_type,
-                        start_ms=effect.start_time_ms,
-                        end_ms=effect.end_time_ms,
-                        config_fingerprint=_config_fingerprint(config),
-                        effectdb_ref=effectdb_ref,
-                        effectdb_settings_raw=effectdb_settings,
-                        effectdb_parser_version=EFFECTDB_PARSER_VERSION,
-                        effectdb_parse_status=parsed_settings.status,
-                        effectdb_params=parsed_settings.params,
-                        effectdb_parse_errors=parsed_settings.errors,
-                        palette=effect.palette,
-                        protected=effect.protected,
-                        label=effect.label,
+                        effect_db=effect_db,
                     )
                 )
 
-    events.sort(key=lambda e: (e.start_ms, e.layer_name, e.target_name, e.effect_type))
+    events.sort(key=effect_event_sort_key)
 
     return BaseEffectEventsFile(
         package_id=package_id,
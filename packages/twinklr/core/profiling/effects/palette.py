@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from collections.abc import Sequence
 
 from twinklr.core.formats.xlights.sequence.models.xsq import XSequence
 from twinklr.core.profiling.models.palette import (
@@ -191,7 +192,12 @@ def classify_palettes(
 
 def parse_color_palettes(sequence: XSequence) -> ColorPaletteProfile:
     """Parse and classify color palette entries from an XSequence."""
-    if not sequence.color_palettes:
+    return parse_palette_settings([palette.settings for palette in sequence.color_palettes])
+
+
+def parse_palette_settings(palette_settings: Sequence[str]) -> ColorPaletteProfile:
+    """Parse and classify raw ``<ColorPalette>`` settings strings, in document order."""
+    if not palette_settings:
         return ColorPaletteProfile(
             unique_colors=(),
             single_colors=(),
@@ -209,8 +215,8 @@ def parse_color_palettes(sequence: XSequence) -> ColorPaletteProfile:
     single_color_map: dict[str, list[int]] = {}
     multi_color_map: dict[tuple[str, ...], list[int]] = {}
 
-    for entry_index, color_palette in enumerate(sequence.color_palettes):
-        colors, _slots = _parse_palette_entry(color_palette.settings)
+    for entry_index, settings in enumerate(palette_settings):
+        colors, _slots = _parse_palette_entry(settings)
         if not colors:
             continue
 
@@ -0,0 +1,250 @@
+"""Streaming effect-event extraction from xLights sequence documents."""
+
+from __future__ import annotations
+
+import heapq
+import tempfile
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO
+
+import defusedxml.ElementTree as defused_ET  # safe parsing — blocks XXE and billion-laughs
+
+from twinklr.core.formats.xlights.sequence.models.xsq import SequenceHead
+from twinklr.core.formats.xlights.sequence.parser import XSQParser
+from twinklr.core.profiling.effects.extractor import (
+    EffectDbSettingsCache,
+    build_effect_event,
+    effect_event_sort_key,
+)
+from twinklr.core.profiling.models.events import EffectEventRecord
+
+DEFAULT_SORT_RUN_SIZE = 50_000
+
+# Depths below are 1-based: the <xsequence> root is depth 1.
+_SECTION_DEPTH = 2
+
+
+class XSQEventStream:
+    """Iterate effect events from an ``.xsq`` document without building the tree.
+
+    The document is walked with ``iterparse`` and every ``<Effect>``,
+    ``<EffectLayer>`` and ``<Element>`` is discarded as soon as it has been
+    read, so memory stays flat regardless of sequence size. The ``<head>`` and
+    ``<ColorPalettes>`` sections are captured along the way, and EffectDB
+    entries are parsed lazily, once per ref.
+
+    Events are yielded in document order; pass them through ``sort_events``
+    for the canonical profiling order.
+
+    Example:
+        >>> stream = XSQEventStream(lambda: path.open("rb"))
+        >>> for event in stream:
+        ...     ...
+        >>> stream.head.version
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[], IO[bytes]],
+        *,
+        xsq_parser: XSQParser | None = None,
+    ) -> None:
+        """Initialize stream.
+
+        Args:
+            opener: Returns a fresh binary handle on the document. Called once
+                per pass; a second pass is only needed when ``<EffectDB>``
+                comes after ``<ElementEffects>``.
+            xsq_parser: Parser used for ``<head>`` and ``<Effect>`` elements.
+        """
+        self._opener = opener
+        self._parser = xsq_parser or XSQParser()
+        self._head: SequenceHead | None = None
+        self._palette_settings: list[str] = []
+        self._event_count = 0
+
+    @property
+    def head(self) -> SequenceHead:
+        """Sequence head, available once the stream has been consumed.
+
+        Raises:
+            ValueError: If the document has no ``<head>`` section.
+        """
+        if self._head is None:
+            raise ValueError("Missing required <head> section")
+        return self._head
+
+    @property
+    def palette_settings(self) -> tuple[str, ...]:
+        """Raw ``<ColorPalette>`` settings strings, in document order."""
+        return tuple(self._palette_settings)
+
+    @property
+    def event_count(self) -> int:
+        """Number of events yielded so far."""
+        return self._event_count
+
+    def __iter__(self) -> Iterator[EffectEventRecord]:
+        self._head = None
+        self._palette_settings = []
+        self._event_count = 0
+        with self._opener() as handle:
+            try:
+                yield from self._iter_events(handle)
+            except ET.ParseError as e:
+                raise ValueError(f"Invalid XML: {e}") from e
+
+    def _iter_events(self, handle: IO[bytes]) -> Iterator[EffectEventRecord]:
+        effect_db_entries: list[str] = []
+        effect_db_complete = False
+        effect_db = EffectDbSettingsCache(lambda ref: _entry_at(effect_db_entries, ref))
+
+        stack: list[ET.Element] = []
+        target_name: str | None = None
+        layer_index = -1
+        layer_name = ""
+
+        for event, elem in defused_ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                depth = len(stack)
+                if depth == _SECTION_DEPTH:
+                    if elem.tag == "ElementEffects" and not effect_db_complete:
+                        # EffectDB normally precedes ElementEffects; if not, read it first.
+                        effect_db_entries.extend(self._prescan_effect_db())
+                        effect_db_complete = True
+                elif depth > _SECTION_DEPTH and stack[1].tag == "ElementEffects":
+                    if depth == 3 and elem.tag == "Element":
+                        name = elem.get("name", "")
+                        is_timing = elem.get("type", "model") == "timing"
+                        target_name = name if name and not is_timing else None
+                        layer_index = -1
+                    elif depth == 4 and elem.tag == "EffectLayer":
+                        layer_index += 1
+                        layer_name = elem.get("name") or f"layer_{layer_index}"
+                continue
+
+            depth = len(stack)
+            stack.pop()
+            if depth < _SECTION_DEPTH:
+                continue
+            parent = stack[-1]
+            section = stack[1].tag if depth > _SECTION_DEPTH else elem.tag
+
+            if depth == _SECTION_DEPTH:
+                if section == "head":
+                    self._head = self._parser.parse_head_element(elem)
+                elif section == "EffectDB":
+                    effect_db_complete = True
+            elif section == "ElementEffects":
+                if depth == 5 and elem.tag == "Effect" and target_name is not None:
+                    effect = self._parser.parse_effect_element(elem)
+                    if effect is not None:
+                        self._event_count += 1
+                        yield build_effect_event(
+                            effect,
+                            target_name=target_name,
+                            layer_index=layer_index,
+                            layer_name=layer_name,
+                            effect_db=effect_db,
+                        )
+                elif depth > 5:
+                    # Leave children in place until their <Effect> ends.
+                    continue
+            elif depth == 3 and section == "EffectDB" and elem.tag == "Effect":
+                if effect_db_complete:
+                    continue
+                effect_db_entries.append(elem.text or "")
+            elif depth == 3 and section == "ColorPalettes" and elem.tag == "ColorPalette":
+                self._palette_settings.append(elem.text or "")
+            else:
+                # Other sections are dropped wholesale when they end.
+                continue
+
+            elem.clear()
+            parent.remove(elem)
+
+    def _prescan_effect_db(self) -> list[str]:
+        """Collect ``<EffectDB>`` entries in a separate pass over the document."""
+        entries: list[str] = []
+        stack: list[ET.Element] = []
+        with self._opener() as handle:
+            for event, elem in defused_ET.iterparse(handle, events=("start", "end")):
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                depth = len(stack)
+                stack.pop()
+                if depth == 3 and stack[1].tag == "EffectDB" and elem.tag == "Effect":
+                    entries.append(elem.text or "")
+                elif depth == _SECTION_DEPTH and elem.tag == "EffectDB":
+                    break
+                if depth > 1:
+                    elem.clear()
+                    stack[-1].remove(elem)
+        return entries
+
+
+def _entry_at(entries: list[str], index: int) -> str | None:
+    """Mirror ``EffectDB.get``: None for out-of-range refs."""
+    if 0 <= index < len(entries):
+        return entries[index]
+    return None
+
+
+def sort_events(
+    events: Iterable[EffectEventRecord],
+    *,
+    run_size: int = DEFAULT_SORT_RUN_SIZE,
+) -> Iterator[EffectEventRecord]:
+    """Yield events in canonical order using bounded memory.
+
+    Events are buffered in runs of ``run_size``; each full run is sorted and
+    spilled to a temporary JSONL file, and the runs are merged lazily. Input
+    that fits in a single run is sorted in memory without touching disk. The
+    merge is stable, so ties keep document order exactly like ``list.sort``.
+
+    Args:
+        events: Events in document order.
+        run_size: Maximum number of events held in memory at once.
+
+    Yields:
+        Events ordered by ``(start_ms, layer_name, target_name, effect_type)``.
+    """
+    with tempfile.TemporaryDirectory(prefix="twinklr-events-") as tmp_dir:
+        run_paths: list[Path] = []
+        buffer: list[EffectEventRecord] = []
+        for event in events:
+            buffer.append(event)
+            if len(buffer) >= run_size:
+                run_paths.append(_spill_run(Path(tmp_dir) / f"run_{len(run_paths):05d}", buffer))
+                buffer = []
+        buffer.sort(key=effect_event_sort_key)
+
+        if not run_paths:
+            yield from buffer
+            return
+
+        with ExitStack() as stack:
+            runs = [
+                _read_run(stack.enter_context(path.open(encoding="utf-8"))) for path in run_paths
+            ]
+            runs.append(iter(buffer))
+            yield from heapq.merge(*runs, key=effect_event_sort_key)
+
+
+def _spill_run(path: Path, events: list[EffectEventRecord]) -> Path:
+    events.sort(key=effect_event_sort_key)
+    with path.open("w", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(event.model_dump_json())
+            handle.write("\n")
+    return path
+
+
+def _read_run(handle: IO[str]) -> Iterator[EffectEventRecord]:
+    for line in handle:
+        yield EffectEventRecord.model_validate_json(line)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
 from twinklr.core.profiling.models.enums import TargetKind
 from twinklr.core.profiling.models.events import EffectEventRecord
@@ -33,60 +33,69 @@ def _group_bbox(
     return min(xs), min(ys), max(xs), max(ys)
 
 
-def enrich_events(
-    events: Sequence[EffectEventRecord],
-    layout_profile: LayoutProfile | None,
-) -> tuple[EnrichedEventRecord, ...]:
-    """Enrich effect events with optional layout model/group context."""
-    model_lookup: dict[str, ModelProfile] = {}
-    group_lookup: dict[str, GroupProfile] = {}
-    if layout_profile is not None:
-        model_lookup = {model.name: model for model in layout_profile.models}
-        group_lookup = {group.name: group for group in layout_profile.groups}
-
-    enriched: list[EnrichedEventRecord] = []
-    for event in events:
-        model = model_lookup.get(event.target_name)
+class EventEnricher:
+    """Reusable event enricher with layout lookups built once.
+
+    Lets streaming profilers enrich events batch by batch without rebuilding
+    the model/group indexes for every batch.
+    """
+
+    def __init__(self, layout_profile: LayoutProfile | None) -> None:
+        """Initialize enricher.
+
+        Args:
+            layout_profile: Optional layout profile providing target context.
+        """
+        self._model_lookup: dict[str, ModelProfile] = {}
+        self._group_lookup: dict[str, GroupProfile] = {}
+        if layout_profile is not None:
+            self._model_lookup = {model.name: model for model in layout_profile.models}
+            self._group_lookup = {group.name: group for group in layout_profile.groups}
+
+    def enrich(self, events: Iterable[EffectEventRecord]) -> tuple[EnrichedEventRecord, ...]:
+        """Enrich a batch of events."""
+        return tuple(self.enrich_event(event) for event in events)
+
+    def enrich_event(self, event: EffectEventRecord) -> EnrichedEventRecord:
+        """Enrich one event with model, group, or unknown target context."""
+        model = self._model_lookup.get(event.target_name)
         if model is not None:
             x0, y0, x1, y1 = _model_bbox(model)
-            enriched.append(
-                EnrichedEventRecord(
-                    effect_event_id=event.effect_event_id,
-                    target_name=event.target_name,
-                    layer_index=event.layer_index,
-                    layer_name=event.layer_name,
-                    effect_type=event.effect_type,
-                    start_ms=event.start_ms,
-                    end_ms=event.end_ms,
-                    config_fingerprint=event.config_fingerprint,
-                    effectdb_ref=event.effectdb_ref,
-                    effectdb_settings_raw=event.effectdb_settings_raw,
-                    effectdb_parser_version=event.effectdb_parser_version,
-                    effectdb_parse_status=event.effectdb_parse_status,
-                    effectdb_params=event.effectdb_params,
-                    effectdb_parse_errors=event.effectdb_parse_errors,
-                    palette=event.palette,
-                    protected=event.protected,
-                    label=event.label,
-                    feat_duration_ms=event.end_ms - event.start_ms,
-                    target_kind=TargetKind.MODEL,
-                    target_semantic_tags=model.semantic_tags,
-                    target_category=model.category.value,
-                    target_pixel_count=model.pixel_count,
-                    target_string_type=model.string_type,
-                    target_layout_group=model.layout_group,
-                    target_is_homogeneous=None,
-                    target_x0=x0,
-                    target_y0=y0,
-                    target_x1=x1,
-                    target_y1=y1,
-                )
+            return EnrichedEventRecord(
+                effect_event_id=event.effect_event_id,
+                target_name=event.target_name,
+                layer_index=event.layer_index,
+                layer_name=event.layer_name,
+                effect_type=event.effect_type,
+                start_ms=event.start_ms,
+                end_ms=event.end_ms,
+                config_fingerprint=event.config_fingerprint,
+                effectdb_ref=event.effectdb_ref,
+                effectdb_settings_raw=event.effectdb_settings_raw,
+                effectdb_parser_version=event.effectdb_parser_version,
+                effectdb_parse_status=event.effectdb_parse_status,
+                effectdb_params=event.effectdb_params,
+                effectdb_parse_errors=event.effectdb_parse_errors,
+                palette=event.palette,
+                protected=event.protected,
+                label=event.label,
+                feat_duration_ms=event.end_ms - event.start_ms,
+                target_kind=TargetKind.MODEL,
+                target_semantic_tags=model.semantic_tags,
+                target_category=model.category.value,
+                target_pixel_count=model.pixel_count,
+                target_string_type=model.string_type,
+                target_layout_group=model.layout_group,
+                target_is_homogeneous=None,
+                target_x0=x0,
+                target_y0=y0,
+                target_x1=x1,
+                target_y1=y1,
             )
-            continue
 
-        group = group_lookup.get(event.target_name)
+        group = self._group_lookup.get(event.target_name)
         if group is not None:
-            bbox = _group_bbox(group, model_lookup)
+            bbox = _group_bbox(group, self._model_lookup)
             gx0: float | None = None
             gy0: float | None = None
             gx1: float | None = None
@@ -98,43 +107,7 @@ def enrich_events(
             if len(group.member_category_composition) == 1:
                 target_category = next(iter(group.member_category_composition.keys()))
 
-            enriched.append(
-                EnrichedEventRecord(
-                    effect_event_id=event.effect_event_id,
-                    target_name=event.target_name,
-                    layer_index=event.layer_index,
-                    layer_name=event.layer_name,
-                    effect_type=event.effect_type,
-                    start_ms=event.start_ms,
-                    end_ms=event.end_ms,
-                    config_fingerprint=event.config_fingerprint,
-                    effectdb_ref=event.effectdb_ref,
-                    effectdb_settings_raw=event.effectdb_settings_raw,
-                    effectdb_parser_version=event.effectdb_parser_version,
-                    effectdb_parse_status=event.effectdb_parse_status,
-                    effectdb_params=event.effectdb_params,
-                    effectdb_parse_errors=event.effectdb_parse_errors,
-                    palette=event.palette,
-                    protected=event.protected,
-                    label=event.label,
-                    feat_duration_ms=event.end_ms - event.start_ms,
-                    target_kind=TargetKind.GROUP,
-                    target_semantic_tags=group.semantic_tags,
-                    target_category=target_category,
-                    target_pixel_count=group.total_pixels,
-                    target_string_type=None,
-                    target_layout_group=group.layout_group,
-                    target_is_homogeneous=group.is_homogeneous,
-                    target_x0=gx0,
-                    target_y0=gy0,
-                    target_x1=gx1,
-                    target_y1=gy1,
-                )
-            )
-            continue
-
-        enriched.append(
-            EnrichedEventRecord(
+            return EnrichedEventRecord(
                 effect_event_id=event.effect_event_id,
                 target_name=event.target_name,
                 layer_index=event.layer_index,
@@ -153,8 +126,45 @@ def enrich_events(
                 protected=event.protected,
                 label=event.label,
                 feat_duration_ms=event.end_ms - event.start_ms,
-                target_kind=TargetKind.UNKNOWN,
+                target_kind=TargetKind.GROUP,
+                target_semantic_tags=group.semantic_tags,
+                target_category=target_category,
+                target_pixel_count=group.total_pixels,
+                target_string_type=None,
+                target_layout_group=group.layout_group,
+                target_is_homogeneous=group.is_homogeneous,
+                target_x0=gx0,
+                target_y0=gy0,
+                target_x1=gx1,
+                target_y1=gy1,
             )
+
+        return EnrichedEventRecord(
+            effect_event_id=event.effect_event_id,
+            target_name=event.target_name,
+            layer_index=event.layer_index,
+            layer_name=event.layer_name,
+            effect_type=event.effect_type,
+            start_ms=event.start_ms,
+            end_ms=event.end_ms,
+            config_fingerprint=event.config_fingerprint,
+            effectdb_ref=event.effectdb_ref,
+            effectdb_settings_raw=event.effectdb_settings_raw,
+            effectdb_parser_version=event.effectdb_parser_version,
+            effectdb_parse_status=event.effectdb_parse_status,
+            effectdb_params=event.effectdb_params,
+            effectdb_parse_errors=event.effectdb_parse_errors,
+            palette=event.palette,
+            protected=event.protected,
+            label=event.label,
+            feat_duration_ms=event.end_ms - event.start_ms,
+            target_kind=TargetKind.UNKNOWN,
         )
 
-    return tuple(enriched)
+
+def enrich_events(
+    events: Sequence[EffectEventRecord],
+    layout_profile: LayoutProfile | None,
+) -> tuple[EnrichedEventRecord, ...]:
+    """Enrich effect events with optional layout model/group context."""
+    return EventEnricher(layout_profile).enrich(events)
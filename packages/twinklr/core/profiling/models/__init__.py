@@ -1,5 +1,14 @@
 """Profiling models package."""
 
+from twinklr.core.profiling.models.batch import (
+    BatchProfileReport,
+    BatchProgress,
+    PackProfileJob,
+    PackProfileOutcome,
+    ProfileCacheStats,
+    SequenceEventsCacheEntry,
+    SequenceEventsChunk,
+)
 from twinklr.core.profiling.models.corpus import (
     CorpusManifest,
     CorpusQualityReport,
@@ -20,6 +29,7 @@ from twinklr.core.profiling.models.enums import (
     EffectDbParseStatus,
     FileKind,
     ModelCategory,
+    PackProfileStatus,
     ParameterValueType,
     SemanticSize,
     StartChannelFormat,
@@ -52,11 +62,14 @@ from twinklr.core.profiling.models.profile import (
     LineageIndex,
     SequenceMetadata,
     SequencePackProfile,
+    StreamedPackProfile,
 )
 
 __all__ = [
     "AssetInventory",
     "BaseEffectEventsFile",
+    "BatchProfileReport",
+    "BatchProgress",
     "CategoricalValueProfile",
     "ColorPaletteProfile",
     "CorpusManifest",
@@ -84,18 +97,25 @@ __all__ = [
     "ModelCategory",
     "ModelProfile",
     "NumericValueProfile",
+    "PackProfileJob",
+    "PackProfileOutcome",
+    "PackProfileStatus",
     "PackageManifest",
     "PaletteClassifications",
     "PaletteEntry",
     "ParameterProfile",
     "ParameterValueType",
     "PixelStats",
+    "ProfileCacheStats",
     "SemanticSize",
+    "SequenceEventsCacheEntry",
+    "SequenceEventsChunk",
     "SequenceMetadata",
     "SequencePackProfile",
     "SpatialStatistics",
     "StartChannelFormat",
     "StartChannelInfo",
+    "StreamedPackProfile",
     "SubModelProfile",
     "TargetKind",
 ]
@@ -0,0 +1,106 @@
+"""Bulk profiling job, outcome, and throughput models."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict
+
+from twinklr.core.formats.xlights.sequence.models.xsq import SequenceHead
+from twinklr.core.profiling.models.effects import EffectStatistics
+from twinklr.core.profiling.models.enums import PackProfileStatus
+from twinklr.core.profiling.models.events import EffectEventRecord
+from twinklr.core.profiling.models.profile import StreamedPackProfile
+
+
+class PackProfileJob(BaseModel):
+    """One archive to profile and the directory its artifacts go to."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    zip_path: Path
+    output_dir: Path
+
+
+class SequenceEventsCacheEntry(BaseModel):
+    """Everything derived from one sequence file, keyed by its content hash.
+
+    Events are cached separately in ``chunk_count`` ``SequenceEventsChunk``
+    entries (written as they stream past), so neither writing nor reading the
+    cache holds a whole sequence's events. Event IDs are re-minted when an
+    entry is reused so IDs stay unique per pack.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    head: SequenceHead
+    palette_settings: tuple[str, ...]
+    effect_statistics: EffectStatistics
+    chunk_count: int
+
+
+class SequenceEventsChunk(BaseModel):
+    """One batch of a cached sequence's sorted events."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    events: tuple[EffectEventRecord, ...]
+
+
+class ProfileCacheStats(BaseModel):
+    """Content-addressed artifact cache hits and misses."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    layout_hits: int = 0
+    layout_misses: int = 0
+    sequence_hits: int = 0
+    sequence_misses: int = 0
+
+    def merged(self, other: ProfileCacheStats) -> ProfileCacheStats:
+        """Return the element-wise sum of two stats snapshots."""
+        return ProfileCacheStats(
+            layout_hits=self.layout_hits + other.layout_hits,
+            layout_misses=self.layout_misses + other.layout_misses,
+            sequence_hits=self.sequence_hits + other.sequence_hits,
+            sequence_misses=self.sequence_misses + other.sequence_misses,
+        )
+
+
+class PackProfileOutcome(BaseModel):
+    """Result of profiling one pack in a bulk run."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    job: PackProfileJob
+    status: PackProfileStatus
+    profile: StreamedPackProfile | None = None
+    error: str | None = None
+    elapsed_s: float = 0.0
+    cache_stats: ProfileCacheStats = ProfileCacheStats()
+
+
+class BatchProgress(BaseModel):
+    """Progress and throughput snapshot for a bulk profiling run."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    total: int
+    completed: int
+    profiled: int
+    skipped: int
+    failed: int
+    events: int
+    elapsed_s: float
+    packs_per_s: float
+    events_per_s: float
+    cache_stats: ProfileCacheStats
+
+
+class BatchProfileReport(BaseModel):
+    """Per-pack outcomes (in job order) and final metrics of a bulk run."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    outcomes: tuple[PackProfileOutcome, ...]
+    metrics: BatchProgress
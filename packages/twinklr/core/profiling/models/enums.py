@@ -88,3 +88,11 @@ class EffectDbParseStatus(str, Enum):
     PARTIAL = "partial"
     FAILED = "failed"
     EMPTY = "empty"
+
+
+class PackProfileStatus(str, Enum):
+    """Outcome of one pack in a bulk profiling run."""
+
+    PROFILED = "profiled"
+    SKIPPED = "skipped"
+    FAILED = "failed"
@@ -30,5 +30,6 @@ class PackageManifest(BaseModel):
     zip_sha256: str
     source_extensions: frozenset[str]
     files: tuple[FileEntry, ...]
-    sequence_file_id: str | None
-    rgb_effects_file_id: str | None
+    # Nullable IDs default to None so artifacts written with exclude_none reload.
+    sequence_file_id: str | None = None
+    rgb_effects_file_id: str | None = None
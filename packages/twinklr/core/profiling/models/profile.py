@@ -87,9 +87,9 @@ class LineageIndex(BaseModel):
     package_id: str
     zip_sha256: str
     sequence_file: dict[str, str]
-    rgb_effects_file: dict[str, str] | None
-    layout_id: str | None
-    rgb_sha256: str | None
+    rgb_effects_file: dict[str, str] | None = None
+    layout_id: str | None = None
+    rgb_sha256: str | None = None
 
 
 class SequencePackProfile(BaseModel):
@@ -104,3 +104,25 @@ class SequencePackProfile(BaseModel):
     base_events: BaseEffectEventsFile
     enriched_events: tuple[EnrichedEventRecord, ...]
     lineage: LineageIndex
+
+
+class StreamedPackProfile(BaseModel):
+    """Sequence pack profile produced by the streaming profiler.
+
+    Carries the same aggregates as ``SequencePackProfile`` but not the event
+    tuples, which are written straight to the event artifacts. The per-layer
+    and per-target-kind event counts needed for the summary report are kept
+    instead.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    manifest: PackageManifest
+    sequence_metadata: SequenceMetadata
+    layout_profile: LayoutProfile | None
+    effect_statistics: EffectStatistics
+    palette_profile: ColorPaletteProfile
+    asset_inventory: AssetInventory
+    lineage: LineageIndex
+    layer_event_counts: dict[str, int]
+    target_kind_counts: dict[str, int]
@@ -6,6 +6,7 @@ import hashlib
 import shutil
 import uuid
 from pathlib import Path
+from typing import IO
 from zipfile import ZipFile
 
 import defusedxml.ElementTree as defused_ET  # safe parsing — blocks XXE and billion-laughs
@@ -126,10 +127,10 @@ def extract_zip_flat(
                 dest.unlink(missing_ok=True)
 
 
-def _sniff_xsequence(path: Path) -> bool:
+def _sniff_xsequence(source: Path | IO[bytes]) -> bool:
     """Return True if XML root tag is `xsequence` (case-insensitive)."""
     try:
-        for _event, elem in defused_ET.iterparse(path, events=["start"]):
+        for _event, elem in defused_ET.iterparse(source, events=["start"]):
             return elem.tag.lower() == "xsequence"  # type: ignore[no-any-return]
     except Exception:  # noqa: BLE001
         return False
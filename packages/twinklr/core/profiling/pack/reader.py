@@ -0,0 +1,222 @@
+"""Read sequence pack members in place, without extracting to disk."""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+import uuid
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO
+from zipfile import ZipFile, ZipInfo
+
+from twinklr.core.profiling.models.enums import FileKind
+from twinklr.core.profiling.models.pack import FileEntry, PackageManifest
+from twinklr.core.profiling.pack.ingestor import (
+    SEQUENCE_EXTENSIONS,
+    _classify_kind,
+    _detect_rgb_effects_file,
+    _is_ignored_filename,
+    _sniff_xsequence,
+    _validate_zip_entry,
+    is_zip_like,
+    sha256_file,
+)
+from twinklr.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_READ_CHUNK_SIZE = 1024 * 1024
+# Nested archives up to this size are spooled in memory, larger ones to a temp file.
+_NESTED_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class _Member:
+    """Location and digest of one flattened pack member."""
+
+    archive: ZipFile
+    info: ZipInfo
+    sha256: str
+
+
+class PackReader:
+    """Flattened, read-only view of a zip/xsqz sequence pack.
+
+    Mirrors ``ingest_zip`` (nested archives are flattened, ignored names are
+    skipped, later duplicate basenames win, and an ``.xml`` xsequence is
+    promoted to ``.xsq``) but members are hashed while streaming and read
+    straight from the archive, so nothing is extracted to disk. Nested
+    archives are spooled so they stay seekable.
+
+    Example:
+        >>> with PackReader(zip_path) as pack:
+        ...     with pack.open(pack.manifest.sequence_file_id) as handle:
+        ...         header = handle.read(64)
+    """
+
+    def __init__(self, zip_path: Path) -> None:
+        """Open the archive and build its manifest.
+
+        Args:
+            zip_path: Path to .zip or .xsqz package.
+
+        Raises:
+            ValueError: If an entry would escape the extraction directory.
+        """
+        self.zip_path = Path(zip_path)
+        self._stack = ExitStack()
+        self._members: dict[str, _Member] = {}
+        self._members_by_file_id: dict[str, _Member] = {}
+        self._seen_hashes: set[str] = set()
+        self._source_extensions: set[str] = set()
+        # Entries are validated against the directory ingest_zip would extract into.
+        self._virtual_root = self.zip_path.parent / f"{self.zip_path.stem}_extracted"
+
+        try:
+            zip_sha256 = sha256_file(self.zip_path)
+            self._seen_hashes.add(zip_sha256)
+            self._source_extensions.add(self.zip_path.suffix.lower())
+            self._scan(self._stack.enter_context(ZipFile(self.zip_path)))
+            self.manifest = self._build_manifest(zip_sha256)
+        except BaseException:
+            self._stack.close()
+            raise
+
+    def __enter__(self) -> PackReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive and any spooled nested archives."""
+        self._stack.close()
+
+    def open(self, file_id: str) -> IO[bytes]:
+        """Open a manifest file for streaming reads.
+
+        Args:
+            file_id: ``FileEntry.file_id`` from ``manifest``.
+
+        Returns:
+            Binary file object positioned at the start of the member.
+
+        Raises:
+            KeyError: If file_id is not in the manifest.
+        """
+        member = self._members_by_file_id[file_id]
+        return member.archive.open(member.info)
+
+    def _scan(self, archive: ZipFile) -> None:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            basename = Path(info.filename).name
+            if _is_ignored_filename(basename):
+                continue
+            # SEC-03: reject traversal entries exactly as flat extraction would.
+            _validate_zip_entry(info.filename, self._virtual_root)
+            if is_zip_like(Path(basename)):
+                self._scan_nested(archive, info)
+                continue
+
+            sha256 = self._hash_member(archive, info)
+            previous = self._members.get(basename)
+            if previous is not None and previous.sha256 != sha256:
+                logger.warning("filename collision during flat extraction: %s", basename)
+            self._members[basename] = _Member(archive=archive, info=info, sha256=sha256)
+
+    def _scan_nested(self, archive: ZipFile, info: ZipInfo) -> None:
+        spool = self._stack.enter_context(
+            tempfile.SpooledTemporaryFile(max_size=_NESTED_SPOOL_MAX_BYTES)
+        )
+        digest = hashlib.sha256()
+        with archive.open(info) as source:
+            for chunk in iter(lambda: source.read(_READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                spool.write(chunk)
+
+        archive_hash = digest.hexdigest()
+        if archive_hash in self._seen_hashes:
+            spool.close()
+            return
+        self._seen_hashes.add(archive_hash)
+        self._source_extensions.add(Path(info.filename).suffix.lower())
+
+        spool.seek(0)
+        self._scan(self._stack.enter_context(ZipFile(spool)))
+
+    @staticmethod
+    def _hash_member(archive: ZipFile, info: ZipInfo) -> str:
+        digest = hashlib.sha256()
+        with archive.open(info) as source:
+            for chunk in iter(lambda: source.read(_READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _build_manifest(self, zip_sha256: str) -> PackageManifest:
+        files: list[FileEntry] = []
+        for basename, member in sorted(self._members.items(), key=lambda item: item[0].lower()):
+            ext = Path(basename).suffix.lower()
+            entry = FileEntry(
+                file_id=str(uuid.uuid4()),
+                filename=basename,
+                ext=ext,
+                size=member.info.file_size,
+                sha256=member.sha256,
+                kind=_classify_kind(basename, ext),
+            )
+            files.append(entry)
+            self._members_by_file_id[entry.file_id] = member
+
+        sequence_file_id = self._detect_sequence_file(files)
+        rgb_effects_file_id = _detect_rgb_effects_file(files)
+
+        return PackageManifest(
+            package_id=str(uuid.uuid4()),
+            zip_sha256=zip_sha256,
+            source_extensions=frozenset(self._source_extensions),
+            files=tuple(sorted(files, key=lambda f: f.filename.lower())),
+            sequence_file_id=sequence_file_id,
+            rgb_effects_file_id=rgb_effects_file_id,
+        )
+
+    def _detect_sequence_file(self, files: list[FileEntry]) -> str | None:
+        for entry in sorted(files, key=lambda f: f.filename.lower()):
+            if entry.ext in SEQUENCE_EXTENSIONS:
+                return entry.file_id
+
+        xml_entries = sorted(
+            (f for f in files if f.ext == ".xml"), key=lambda f: f.filename.lower()
+        )
+        for entry in xml_entries:
+            with self.open(entry.file_id) as handle:
+                if not _sniff_xsequence(handle):
+                    continue
+
+            # Promotion is a rename only: the member bytes (and digest) are unchanged.
+            promoted_entry = FileEntry(
+                file_id=str(uuid.uuid4()),
+                filename=str(Path(entry.filename).with_suffix(".xsq")),
+                ext=".xsq",
+                size=entry.size,
+                sha256=entry.sha256,
+                kind=FileKind.SEQUENCE,
+                original_ext=".xml",
+            )
+            self._members_by_file_id[promoted_entry.file_id] = self._members_by_file_id.pop(
+                entry.file_id
+            )
+            files.remove(entry)
+            files.append(promoted_entry)
+            return promoted_entry.file_id
+
+        return None
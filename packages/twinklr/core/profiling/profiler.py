@@ -2,26 +2,63 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import shutil
+import tempfile
+import time
+import uuid
 import zipfile
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import batched
 from pathlib import Path
+from typing import Any, TypeVar
 
+from pydantic import BaseModel
+
+from twinklr.core.caching import CacheKey, CacheSync, FSCacheSync
 from twinklr.core.feature_store.backends.null import NullFeatureStore
 from twinklr.core.feature_store.models import ProfileRecord
 from twinklr.core.feature_store.protocols import FeatureStoreProviderSync
+from twinklr.core.formats.xlights.sequence.models.xsq import SequenceHead
 from twinklr.core.formats.xlights.sequence.parser import XSQParser
+from twinklr.core.io import RealFileSystem, absolute_path
 from twinklr.core.profiling.artifacts import ProfileArtifactWriter
-from twinklr.core.profiling.effects.analyzer import compute_effect_statistics
+from twinklr.core.profiling.constants import (
+    LAYOUT_PROFILE_CACHE_STEP,
+    LAYOUT_PROFILE_CACHE_VERSION,
+    PROFILE_CACHE_DOMAIN,
+    SEQUENCE_EVENTS_CACHE_STEP,
+    SEQUENCE_EVENTS_CACHE_VERSION,
+    SEQUENCE_EVENTS_CHUNK_CACHE_STEP,
+)
+from twinklr.core.profiling.effects.analyzer import (
+    EffectStatisticsAccumulator,
+    compute_effect_statistics,
+)
 from twinklr.core.profiling.effects.extractor import extract_effect_events
-from twinklr.core.profiling.effects.palette import parse_color_palettes
-from twinklr.core.profiling.enrich import enrich_events
+from twinklr.core.profiling.effects.palette import parse_color_palettes, parse_palette_settings
+from twinklr.core.profiling.effects.streaming import XSQEventStream, sort_events
+from twinklr.core.profiling.enrich import EventEnricher, enrich_events
 from twinklr.core.profiling.inventory import build_asset_inventory
 from twinklr.core.profiling.layout.profiler import LayoutProfiler
+from twinklr.core.profiling.models.batch import (
+    BatchProfileReport,
+    BatchProgress,
+    PackProfileJob,
+    PackProfileOutcome,
+    ProfileCacheStats,
+    SequenceEventsCacheEntry,
+    SequenceEventsChunk,
+)
 from twinklr.core.profiling.models.effects import EffectStatistics
+from twinklr.core.profiling.models.enums import PackProfileStatus
 from twinklr.core.profiling.models.events import BaseEffectEventsFile, EffectEventRecord
 from twinklr.core.profiling.models.layout import LayoutProfile
-from twinklr.core.profiling.models.pack import PackageManifest
+from twinklr.core.profiling.models.pack import FileEntry, PackageManifest
 from twinklr.core.profiling.models.palette import ColorPaletteProfile
 from twinklr.core.profiling.models.profile import (
     AssetInventory,
@@ -29,8 +66,17 @@ from twinklr.core.profiling.models.profile import (
     LineageIndex,
     SequenceMetadata,
     SequencePackProfile,
+    StreamedPackProfile,
 )
 from twinklr.core.profiling.pack.ingestor import ingest_zip, sha256_file
+from twinklr.core.profiling.pack.reader import PackReader
+from twinklr.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EVENT_BATCH_SIZE = 5_000
+
+_CachedT = TypeVar("_CachedT", bound=BaseModel)
 
 
 class SequencePackProfiler:
@@ -43,11 +89,15 @@ class SequencePackProfiler:
         xsq_parser: XSQParser | None = None,
         artifact_writer: ProfileArtifactWriter | None = None,
         store: FeatureStoreProviderSync | None = None,
+        cache: CacheSync | None = None,
     ) -> None:
         self._layout_profiler = layout_profiler or LayoutProfiler()
         self._xsq_parser = xsq_parser or XSQParser()
         self._artifact_writer = artifact_writer or ProfileArtifactWriter()
         self._store: FeatureStoreProviderSync = store or NullFeatureStore()
+        # Content-addressed cache for parsed layouts/sequences (streaming path only)
+        self._cache = cache
+        self._cache_counts: Counter[str] = Counter()
 
     def profile_layout(self, xml_path: Path) -> LayoutProfile:
         """Profile a standalone rgb effects layout file."""
@@ -128,24 +178,373 @@ class SequencePackProfiler:
         palette_profile = parse_color_palettes(sequence)
         asset_inventory = build_asset_inventory(manifest)
 
-        sequence_metadata = SequenceMetadata(
+        sequence_metadata = self._build_sequence_metadata(manifest, sequence_entry, sequence.head)
+        lineage = self._build_lineage(manifest, sequence_entry, rgb_entry, layout_profile)
+
+        profile = SequencePackProfile(
+            manifest=manifest,
+            sequence_metadata=sequence_metadata,
+            layout_profile=layout_profile,
+            effect_statistics=effect_statistics,
+            palette_profile=palette_profile,
+            asset_inventory=asset_inventory,
+            base_events=base_events,
+            enriched_events=enriched_events,
+            lineage=lineage,
+        )
+
+        self._artifact_writer.write_json_bundle(Path(output_dir), profile)
+        self._artifact_writer.write_markdown_bundle(Path(output_dir), profile)
+        self._register_profile(profile, output_dir)
+        return profile
+
+    def profile_streaming(
+        self,
+        zip_path: Path,
+        output_dir: Path,
+        *,
+        force: bool = False,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+    ) -> StreamedPackProfile:
+        """Run the profiling pipeline in bounded memory.
+
+        Writes the same artifacts as ``profile()``, but members are read
+        straight from the archive (nothing is extracted), the sequence is
+        walked with a streaming parser instead of being materialized as an
+        ``XSequence``, and events are sorted, enriched, aggregated and written
+        in batches. The returned profile carries aggregates only; events live
+        in the event artifact files.
+
+        Skip logic matches ``profile()``, except that only output directories
+        written by this method (which include ``event_index.json``) are reused.
+
+        Args:
+            zip_path: Path to .zip or .xsqz package.
+            output_dir: Directory for profile artifacts (JSON, markdown).
+            force: If True, always run full pipeline; ignore skip logic.
+            batch_size: Events per sort run and per artifact write batch.
+
+        Returns:
+            StreamedPackProfile (new or loaded from disk).
+
+        Raises:
+            ValueError: No sequence file found in package manifest.
+        """
+        output_dir = Path(output_dir)
+        if not force:
+            profile_dir = self._find_existing_profile_dir(zip_path, output_dir)
+            if profile_dir is not None and (profile_dir / "event_index.json").exists():
+                return self._load_existing_streamed_profile(profile_dir)
+
+        with PackReader(zip_path) as pack:
+            manifest = pack.manifest
+            files_by_id = {entry.file_id: entry for entry in manifest.files}
+
+            layout_profile = None
+            rgb_entry = files_by_id.get(manifest.rgb_effects_file_id or "")
+            if rgb_entry is not None:
+                layout_profile = self._profile_packed_layout(pack, rgb_entry)
+
+            sequence_entry = files_by_id.get(manifest.sequence_file_id or "")
+            if sequence_entry is None:
+                raise ValueError("No sequence file found in package manifest")
+
+            sequence_sha = sequence_entry.sha256
+            cached = self._load_cached_sequence(sequence_sha)
+            stream: XSQEventStream | None = None
+            statistics: EffectStatisticsAccumulator | None = None
+            events: Iterable[EffectEventRecord]
+            if cached is not None:
+                # Reused events get fresh IDs so they stay unique per pack.
+                events = (
+                    event.model_copy(update={"effect_event_id": str(uuid.uuid4())})
+                    for event in self._iter_cached_events(sequence_sha, cached.chunk_count)
+                )
+            else:
+                sequence_file_id = sequence_entry.file_id
+                stream = XSQEventStream(
+                    lambda: pack.open(sequence_file_id), xsq_parser=self._xsq_parser
+                )
+                statistics = EffectStatisticsAccumulator()
+                events = sort_events(stream, run_size=batch_size)
+            # A miss caches each batch as its own chunk entry as it streams past
+            cache_chunks = cached is None and self._cache is not None
+            chunk_count = 0
+
+            enricher = EventEnricher(layout_profile)
+            layer_counts: Counter[str] = Counter()
+            target_kind_counts: Counter[str] = Counter()
+
+            with self._artifact_writer.open_event_stream(
+                output_dir,
+                package_id=manifest.package_id,
+                sequence_file_id=sequence_entry.file_id,
+                sequence_sha256=sequence_entry.sha256,
+            ) as sink:
+                for batch in batched(events, batch_size):
+                    enriched = enricher.enrich(batch)
+                    if statistics is not None:
+                        statistics.extend(batch)
+                    if cache_chunks:
+                        self._cache_store(
+                            self._chunk_cache_key(sequence_sha, chunk_count),
+                            SequenceEventsChunk(events=tuple(batch)),
+                        )
+                        chunk_count += 1
+                    for event in enriched:
+                        layer_counts[event.layer_name or str(event.layer_index)] += 1
+                        target_kind_counts[
+                            event.target_kind.value if event.target_kind is not None else "unknown"
+                        ] += 1
+                    sink.write_batch(batch, enriched)
+
+            if cached is not None:
+                sequence = cached
+            else:
+                assert stream is not None and statistics is not None
+                sequence = SequenceEventsCacheEntry(
+                    head=stream.head,
+                    palette_settings=stream.palette_settings,
+                    effect_statistics=statistics.build(),
+                    chunk_count=chunk_count,
+                )
+                # Written after its chunks, so a cached header implies complete chunks
+                if cache_chunks:
+                    self._cache_store(self._sequence_cache_key(sequence_sha), sequence)
+
+        profile = StreamedPackProfile(
+            manifest=manifest,
+            sequence_metadata=self._build_sequence_metadata(
+                manifest, sequence_entry, sequence.head
+            ),
+            layout_profile=layout_profile,
+            effect_statistics=sequence.effect_statistics,
+            palette_profile=parse_palette_settings(sequence.palette_settings),
+            asset_inventory=build_asset_inventory(manifest),
+            lineage=self._build_lineage(manifest, sequence_entry, rgb_entry, layout_profile),
+            layer_event_counts=dict(layer_counts),
+            target_kind_counts=dict(target_kind_counts),
+        )
+
+        self._artifact_writer.write_json_bundle(output_dir, profile)
+        self._artifact_writer.write_markdown_bundle(output_dir, profile)
+        self._register_profile(profile, output_dir)
+        return profile
+
+    def profile_many(
+        self,
+        jobs: Iterable[PackProfileJob],
+        *,
+        max_workers: int | None = None,
+        cache_dir: Path | None = None,
+        force: bool = False,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+        fail_fast: bool = False,
+        progress_fn: Callable[[BatchProgress], None] | None = None,
+    ) -> BatchProfileReport:
+        """Profile many packs in a process pool with a shared artifact cache.
+
+        Each pack goes through ``profile_streaming`` in a worker process.
+        Parsed layout profiles and sequence events are keyed by member content
+        hash in a filesystem cache under ``cache_dir``, so a layout or
+        sequence shipped in several differently zipped packs is parsed once.
+        Skip checks and feature-store registration stay in this process.
+
+        Args:
+            jobs: Archives to profile with their output directories.
+            max_workers: Worker processes (default: CPU count). ``1`` profiles
+                in-process, which is also used when at most one pack needs work.
+            cache_dir: Root of the shared artifact cache (no caching when None).
+            force: If True, re-profile packs even if a profile exists.
+            batch_size: Events per sort run and per artifact write batch.
+            fail_fast: If True, stop at the first failing pack and re-raise.
+            progress_fn: Called with a metrics snapshot after every pack.
+
+        Returns:
+            Outcomes in job order plus final throughput and cache metrics.
+
+        Raises:
+            RuntimeError: A pack failed and ``fail_fast`` is set.
+        """
+        job_list = list(jobs)
+        outcomes: dict[int, PackProfileOutcome] = {}
+        tracker = _BatchTracker(total=len(job_list), progress_fn=progress_fn)
+
+        def record(index: int, outcome: PackProfileOutcome) -> None:
+            if outcome.status is PackProfileStatus.PROFILED and outcome.profile is not None:
+                self._register_profile(outcome.profile, outcome.job.output_dir)
+            outcomes[index] = outcome
+            tracker.record(outcome)
+            if fail_fast and outcome.status is PackProfileStatus.FAILED:
+                raise RuntimeError(f"Profiling failed for {outcome.job.zip_path}: {outcome.error}")
+
+        pending: list[tuple[int, PackProfileJob]] = []
+        for index, job in enumerate(job_list):
+            profile_dir = (
+                None if force else self._find_existing_profile_dir(job.zip_path, job.output_dir)
+            )
+            if profile_dir is not None and (profile_dir / "event_index.json").exists():
+                record(
+                    index,
+                    PackProfileOutcome(
+                        job=job,
+                        status=PackProfileStatus.SKIPPED,
+                        profile=self._load_existing_streamed_profile(profile_dir),
+                    ),
+                )
+            else:
+                pending.append((index, job))
+
+        worker = functools.partial(
+            _profile_pack_job,
+            layout_profiler=self._layout_profiler,
+            xsq_parser=self._xsq_parser,
+            artifact_writer=self._artifact_writer,
+            cache_dir=cache_dir,
+            batch_size=batch_size,
+        )
+        if max_workers == 1 or len(pending) <= 1:
+            for index, job in pending:
+                record(index, worker(job))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(worker, job): index for index, job in pending}
+                try:
+                    for future in as_completed(futures):
+                        record(futures[future], future.result())
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        return BatchProfileReport(
+            outcomes=tuple(outcomes[index] for index in sorted(outcomes)),
+            metrics=tracker.snapshot(),
+        )
+
+    def _profile_packed_layout(self, pack: PackReader, rgb_entry: FileEntry) -> LayoutProfile:
+        """Profile the layout member of an open pack.
+
+        The layout parser needs a file path, so only this (bounded-size) member
+        is copied to a temporary file; ``source_path`` records its archive location.
+        Profiles are reused across packs through the artifact cache, keyed by the
+        member's content hash.
+        """
+        cache_key = self._cache_key(
+            LAYOUT_PROFILE_CACHE_STEP, LAYOUT_PROFILE_CACHE_VERSION, rgb_entry.sha256
+        )
+        layout_profile = self._cache_load(cache_key, LayoutProfile, "layout")
+        if layout_profile is None:
+            with tempfile.TemporaryDirectory(prefix="twinklr-layout-") as tmp_dir:
+                xml_path = Path(tmp_dir) / rgb_entry.filename
+                with pack.open(rgb_entry.file_id) as source, xml_path.open("wb") as target:
+                    shutil.copyfileobj(source, target)
+                layout_profile = self._layout_profiler.profile(xml_path)
+            self._cache_store(cache_key, layout_profile)
+
+        metadata = layout_profile.metadata.model_copy(
+            update={"source_path": f"{pack.zip_path}!{rgb_entry.filename}"}
+        )
+        return layout_profile.model_copy(update={"metadata": metadata})
+
+    def cache_stats(self) -> ProfileCacheStats:
+        """Artifact cache hits/misses recorded by this profiler instance."""
+        return ProfileCacheStats(**self._cache_counts)
+
+    @staticmethod
+    def _cache_key(step_id: str, step_version: str, content_sha256: str) -> CacheKey:
+        return CacheKey(
+            domain=PROFILE_CACHE_DOMAIN,
+            step_id=step_id,
+            step_version=step_version,
+            input_fingerprint=content_sha256,
+        )
+
+    @classmethod
+    def _sequence_cache_key(cls, sequence_sha256: str) -> CacheKey:
+        return cls._cache_key(
+            SEQUENCE_EVENTS_CACHE_STEP, SEQUENCE_EVENTS_CACHE_VERSION, sequence_sha256
+        )
+
+    @classmethod
+    def _chunk_cache_key(cls, sequence_sha256: str, index: int) -> CacheKey:
+        return cls._cache_key(
+            SEQUENCE_EVENTS_CHUNK_CACHE_STEP,
+            SEQUENCE_EVENTS_CACHE_VERSION,
+            f"{sequence_sha256}-{index:06d}",
+        )
+
+    def _load_cached_sequence(self, sequence_sha256: str) -> SequenceEventsCacheEntry | None:
+        """Load a cached sequence header whose event chunks are all still present."""
+        if self._cache is None:
+            return None
+        entry = self._cache.load(
+            self._sequence_cache_key(sequence_sha256), SequenceEventsCacheEntry
+        )
+        if entry is not None and not all(
+            self._cache.exists(self._chunk_cache_key(sequence_sha256, index))
+            for index in range(entry.chunk_count)
+        ):
+            entry = None  # A chunk was evicted; derive the sequence again
+        self._cache_counts["sequence_hits" if entry is not None else "sequence_misses"] += 1
+        return entry
+
+    def _iter_cached_events(
+        self, sequence_sha256: str, chunk_count: int
+    ) -> Iterator[EffectEventRecord]:
+        """Yield a cached sequence's events one chunk at a time."""
+        assert self._cache is not None
+        for index in range(chunk_count):
+            chunk = self._cache.load(
+                self._chunk_cache_key(sequence_sha256, index), SequenceEventsChunk
+            )
+            if chunk is None:
+                raise RuntimeError(
+                    f"Cached events chunk {index} for sequence {sequence_sha256} disappeared"
+                )
+            yield from chunk.events
+
+    def _cache_load(self, key: CacheKey, model_cls: type[_CachedT], kind: str) -> _CachedT | None:
+        if self._cache is None:
+            return None
+        cached = self._cache.load(key, model_cls)
+        self._cache_counts[f"{kind}_hits" if cached is not None else f"{kind}_misses"] += 1
+        return cached
+
+    def _cache_store(self, key: CacheKey, artifact: BaseModel) -> None:
+        if self._cache is not None:
+            self._cache.store(key, artifact)
+
+    def _build_sequence_metadata(
+        self,
+        manifest: PackageManifest,
+        sequence_entry: FileEntry,
+        head: SequenceHead,
+    ) -> SequenceMetadata:
+        return SequenceMetadata(
             package_id=manifest.package_id,
             sequence_file_id=sequence_entry.file_id,
             sequence_sha256=sequence_entry.sha256,
-            xlights_version=sequence.version,
-            sequence_duration_ms=sequence.sequence_duration_ms,
-            media_file=sequence.media_file,
-            image_dir=sequence.head.image_dir,
+            xlights_version=head.version,
+            sequence_duration_ms=head.sequence_duration_ms,
+            media_file=head.media_file,
+            image_dir=head.image_dir,
             song=self._derive_song_title(
-                raw_song=sequence.head.song,
-                media_file=sequence.media_file,
+                raw_song=head.song,
+                media_file=head.media_file,
                 sequence_filename=sequence_entry.filename,
             ),
-            artist=sequence.head.artist,
-            album=sequence.head.album,
-            author=sequence.head.author,
+            artist=head.artist,
+            album=head.album,
+            author=head.author,
         )
 
+    @staticmethod
+    def _build_lineage(
+        manifest: PackageManifest,
+        sequence_entry: FileEntry,
+        rgb_entry: FileEntry | None,
+        layout_profile: LayoutProfile | None,
+    ) -> LineageIndex:
         rgb_lineage = None
         layout_id = None
         rgb_sha256 = None
@@ -157,33 +556,18 @@ class SequencePackProfiler:
             layout_id = layout_profile.metadata.file_sha256
             rgb_sha256 = rgb_entry.sha256
 
-        profile = SequencePackProfile(
-            manifest=manifest,
-            sequence_metadata=sequence_metadata,
-            layout_profile=layout_profile,
-            effect_statistics=effect_statistics,
-            palette_profile=palette_profile,
-            asset_inventory=asset_inventory,
-            base_events=base_events,
-            enriched_events=enriched_events,
-            lineage=LineageIndex(
-                package_id=manifest.package_id,
-                zip_sha256=manifest.zip_sha256,
-                sequence_file={
-                    "file_id": sequence_entry.file_id,
-                    "filename": sequence_entry.filename,
-                },
-                rgb_effects_file=rgb_lineage,
-                layout_id=layout_id,
-                rgb_sha256=rgb_sha256,
-            ),
+        return LineageIndex(
+            package_id=manifest.package_id,
+            zip_sha256=manifest.zip_sha256,
+            sequence_file={
+                "file_id": sequence_entry.file_id,
+                "filename": sequence_entry.filename,
+            },
+            rgb_effects_file=rgb_lineage,
+            layout_id=layout_id,
+            rgb_sha256=rgb_sha256,
         )
 
-        self._artifact_writer.write_json_bundle(Path(output_dir), profile)
-        self._artifact_writer.write_markdown_bundle(Path(output_dir), profile)
-        self._register_profile(profile, output_dir)
-        return profile
-
     def _check_existing(
         self,
         zip_path: Path,
@@ -198,6 +582,21 @@ class SequencePackProfiler:
         Returns:
             A loaded SequencePackProfile if skip conditions are met, else None.
         """
+        profile_dir = self._find_existing_profile_dir(zip_path, output_dir)
+        if profile_dir is None:
+            return None
+        return self._load_existing_profile(profile_dir)
+
+    def _find_existing_profile_dir(self, zip_path: Path, output_dir: Path) -> Path | None:
+        """Return the directory of a reusable profile for this archive, if any.
+
+        Args:
+            zip_path: Path to the source zip archive.
+            output_dir: Expected output directory for profile artifacts.
+
+        Returns:
+            Directory holding the existing profile artifacts, else None.
+        """
         # Store check (non-Null store)
         if not isinstance(self._store, NullFeatureStore):
             seq_sha = self._compute_sequence_sha(zip_path)
@@ -205,20 +604,19 @@ class SequencePackProfiler:
             if record is not None:
                 profile_dir = Path(record.profile_path)
                 if profile_dir.exists():
-                    return self._load_existing_profile(profile_dir)
+                    return profile_dir
             # Store configured — no file fallback
             return None
 
         # File fallback (NullFeatureStore or no store)
-        metadata_path = output_dir / "sequence_metadata.json"
-        if metadata_path.exists():
-            return self._load_existing_profile(output_dir)
+        if (output_dir / "sequence_metadata.json").exists():
+            return output_dir
 
         return None
 
     def _register_profile(
         self,
-        profile: SequencePackProfile,
+        profile: SequencePackProfile | StreamedPackProfile,
         output_dir: Path,
     ) -> None:
         """Register a newly profiled sequence in the feature store.
@@ -239,7 +637,7 @@ class SequencePackProfiler:
             song=profile.sequence_metadata.song,
             artist=profile.sequence_metadata.artist,
             duration_ms=profile.sequence_metadata.sequence_duration_ms,
-            effect_total_events=len(profile.base_events.events),
+            effect_total_events=profile.effect_statistics.total_events,
             fe_status="pending",
             profiled_at=datetime.now(UTC).isoformat(),
         )
@@ -254,12 +652,6 @@ class SequencePackProfiler:
         Returns:
             A SequencePackProfile reconstructed from the artifact files.
         """
-        manifest = PackageManifest.model_validate(
-            json.loads((profile_dir / "package_manifest.json").read_text(encoding="utf-8"))
-        )
-        sequence_metadata = SequenceMetadata.model_validate(
-            json.loads((profile_dir / "sequence_metadata.json").read_text(encoding="utf-8"))
-        )
         base_events = BaseEffectEventsFile.model_validate(
             json.loads((profile_dir / "base_effect_events.json").read_text(encoding="utf-8"))
         )
@@ -269,6 +661,37 @@ class SequencePackProfiler:
                 (profile_dir / "enriched_effect_events.json").read_text(encoding="utf-8")
             )
         )
+        return SequencePackProfile(
+            **self._load_profile_summary(profile_dir),
+            base_events=base_events,
+            enriched_events=enriched_events,
+        )
+
+    def _load_existing_streamed_profile(self, profile_dir: Path) -> StreamedPackProfile:
+        """Load a StreamedPackProfile from on-disk JSON artifacts (events are not read).
+
+        Args:
+            profile_dir: Directory containing profile JSON artifacts.
+
+        Returns:
+            A StreamedPackProfile reconstructed from the artifact files.
+        """
+        event_index = json.loads((profile_dir / "event_index.json").read_text(encoding="utf-8"))
+        return StreamedPackProfile(
+            **self._load_profile_summary(profile_dir),
+            layer_event_counts=event_index["layer_event_counts"],
+            target_kind_counts=event_index["target_kind_counts"],
+        )
+
+    @staticmethod
+    def _load_profile_summary(profile_dir: Path) -> dict[str, Any]:
+        """Load the event-independent profile artifacts as model field values."""
+        manifest = PackageManifest.model_validate(
+            json.loads((profile_dir / "package_manifest.json").read_text(encoding="utf-8"))
+        )
+        sequence_metadata = SequenceMetadata.model_validate(
+            json.loads((profile_dir / "sequence_metadata.json").read_text(encoding="utf-8"))
+        )
         effect_statistics = EffectStatistics.model_validate(
             json.loads((profile_dir / "effect_statistics.json").read_text(encoding="utf-8"))
         )
@@ -299,17 +722,15 @@ class SequencePackProfiler:
                 json.loads(rgbeffects_path.read_text(encoding="utf-8"))
             )
 
-        return SequencePackProfile(
-            manifest=manifest,
-            sequence_metadata=sequence_metadata,
-            layout_profile=layout_profile,
-            effect_statistics=effect_statistics,
-            palette_profile=palette_profile,
-            asset_inventory=asset_inventory,
-            base_events=base_events,
-            enriched_events=enriched_events,
-            lineage=lineage,
-        )
+        return {
+            "manifest": manifest,
+            "sequence_metadata": sequence_metadata,
+            "layout_profile": layout_profile,
+            "effect_statistics": effect_statistics,
+            "palette_profile": palette_profile,
+            "asset_inventory": asset_inventory,
+            "lineage": lineage,
+        }
 
     @staticmethod
     def _compute_sequence_sha(zip_path: Path) -> str:
@@ -330,8 +751,11 @@ class SequencePackProfiler:
             with zipfile.ZipFile(zip_path) as archive:
                 for name in archive.namelist():
                     if Path(name).suffix.lower() in {".xsq", ".seq"}:
-                        data = archive.read(name)
-                        return hashlib.sha256(data).hexdigest()
+                        digest = hashlib.sha256()
+                        with archive.open(name) as handle:
+                            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                                digest.update(chunk)
+                        return digest.hexdigest()
         except Exception:  # noqa: BLE001
             pass
         # Fallback: hash the zip itself (backward compat)
@@ -347,3 +771,84 @@ class SequencePackProfiler:
             Hex-encoded SHA-256 digest string.
         """
         return sha256_file(zip_path)
+
+
+class _BatchTracker:
+    """Accumulate bulk-run counters and emit progress snapshots."""
+
+    def __init__(self, *, total: int, progress_fn: Callable[[BatchProgress], None] | None) -> None:
+        self._total = total
+        self._progress_fn = progress_fn
+        self._started = time.perf_counter()
+        self._statuses: Counter[PackProfileStatus] = Counter()
+        self._events = 0
+        self._cache_stats = ProfileCacheStats()
+
+    def record(self, outcome: PackProfileOutcome) -> None:
+        self._statuses[outcome.status] += 1
+        if outcome.status is PackProfileStatus.PROFILED and outcome.profile is not None:
+            self._events += outcome.profile.effect_statistics.total_events
+        self._cache_stats = self._cache_stats.merged(outcome.cache_stats)
+        if self._progress_fn is not None:
+            self._progress_fn(self.snapshot())
+
+    def snapshot(self) -> BatchProgress:
+        elapsed = time.perf_counter() - self._started
+        completed = sum(self._statuses.values())
+        return BatchProgress(
+            total=self._total,
+            completed=completed,
+            profiled=self._statuses[PackProfileStatus.PROFILED],
+            skipped=self._statuses[PackProfileStatus.SKIPPED],
+            failed=self._statuses[PackProfileStatus.FAILED],
+            events=self._events,
+            elapsed_s=elapsed,
+            packs_per_s=completed / elapsed if elapsed > 0 else 0.0,
+            events_per_s=self._events / elapsed if elapsed > 0 else 0.0,
+            cache_stats=self._cache_stats,
+        )
+
+
+def _profile_pack_job(
+    job: PackProfileJob,
+    *,
+    layout_profiler: LayoutProfiler,
+    xsq_parser: XSQParser,
+    artifact_writer: ProfileArtifactWriter,
+    cache_dir: Path | None,
+    batch_size: int,
+) -> PackProfileOutcome:
+    """Profile one pack (worker entry point; must stay a picklable module function).
+
+    Runs without a feature store: the parent process registers results.
+    """
+    cache = (
+        FSCacheSync(RealFileSystem(), absolute_path(cache_dir)) if cache_dir is not None else None
+    )
+    profiler = SequencePackProfiler(
+        layout_profiler=layout_profiler,
+        xsq_parser=xsq_parser,
+        artifact_writer=artifact_writer,
+        cache=cache,
+    )
+    started = time.perf_counter()
+    try:
+        profile = profiler.profile_streaming(
+            job.zip_path, job.output_dir, force=True, batch_size=batch_size
+        )
+    except Exception as exc:  # noqa: BLE001 — reported per pack, never aborts the pool
+        logger.warning("Failed to profile %s: %s", job.zip_path, exc)
+        return PackProfileOutcome(
+            job=job,
+            status=PackProfileStatus.FAILED,
+            error=f"{type(exc).__name__}: {exc}",
+            elapsed_s=time.perf_counter() - started,
+            cache_stats=profiler.cache_stats(),
+        )
+    return PackProfileOutcome(
+        job=job,
+        status=PackProfileStatus.PROFILED,
+        profile=profile,
+        elapsed_s=time.perf_counter() - started,
+        cache_stats=profiler.cache_stats(),
+    )
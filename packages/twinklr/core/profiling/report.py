@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import Counter
 
 from twinklr.core.profiling.models.layout import LayoutProfile
-from twinklr.core.profiling.models.profile import SequencePackProfile
+from twinklr.core.profiling.models.profile import SequencePackProfile, StreamedPackProfile
 
 
 def _top_items(mapping: dict[str, int], limit: int = 20) -> list[tuple[str, int]]:
@@ -238,7 +238,23 @@ def generate_layout_report_md(layout_profile: LayoutProfile) -> str:
     return "\n".join(lines).strip() + "\n"
 
 
-def generate_profile_summary_md(profile: SequencePackProfile) -> str:
+def _event_breakdowns(
+    profile: SequencePackProfile | StreamedPackProfile,
+) -> tuple[Counter[str], Counter[str]]:
+    """Return (events per layer, events per target kind) for the summary report."""
+    if isinstance(profile, StreamedPackProfile):
+        return Counter(profile.layer_event_counts), Counter(profile.target_kind_counts)
+    layer_counts = Counter(
+        event.layer_name or str(event.layer_index) for event in profile.enriched_events
+    )
+    layout_coverage = Counter(
+        (event.target_kind.value if event.target_kind is not None else "unknown")
+        for event in profile.enriched_events
+    )
+    return layer_counts, layout_coverage
+
+
+def generate_profile_summary_md(profile: SequencePackProfile | StreamedPackProfile) -> str:
     """Generate human-readable markdown for full sequence pack profile."""
     lines: list[str] = []
     write = lines.append
@@ -303,34 +319,27 @@ def generate_profile_summary_md(profile: SequencePackProfile) -> str:
         )
         write("")
 
-    if profile.enriched_events:
-        layer_counts = Counter(
-            event.layer_name or str(event.layer_index) for event in profile.enriched_events
-        )
-        if layer_counts:
-            write("## Top Layers By Event Count (Top 20)")
-            write("| # | Layer | Events | Share |")
-            write("| --- | --- | ---: | ---: |")
-            for idx, (layer_name, count) in enumerate(layer_counts.most_common(20), start=1):
-                write(
-                    f"| {idx} | {layer_name} | {count} | "
-                    f"{_safe_pct(count, profile.effect_statistics.total_events):.1f}% |"
-                )
-            write("")
+    layer_counts, layout_coverage = _event_breakdowns(profile)
+    if layer_counts:
+        write("## Top Layers By Event Count (Top 20)")
+        write("| # | Layer | Events | Share |")
+        write("| --- | --- | ---: | ---: |")
+        for idx, (layer_name, count) in enumerate(layer_counts.most_common(20), start=1):
+            write(
+                f"| {idx} | {layer_name} | {count} | "
+                f"{_safe_pct(count, profile.effect_statistics.total_events):.1f}% |"
+            )
+        write("")
 
-        layout_coverage = Counter(
-            (event.target_kind.value if event.target_kind is not None else "unknown")
-            for event in profile.enriched_events
+    if layout_coverage:
+        write("## Enrichment Coverage")
+        _write_ranked_counts_table(
+            lines,
+            list(layout_coverage.items()),
+            profile.effect_statistics.total_events,
+            label_header="Target Kind",
         )
-        if layout_coverage:
-            write("## Enrichment Coverage")
-            _write_ranked_counts_table(
-                lines,
-                list(layout_coverage.items()),
-                profile.effect_statistics.total_events,
-                label_header="Target Kind",
-            )
-            write("")
+        write("")
 
     write("## Color Palettes")
     write(f"- Unique colors: {len(profile.palette_profile.unique_colors)}")
@@ -3,18 +3,27 @@
 Uses catalog analysis and opportunity context to generate novel,
 diverse EffectRecipe candidates via LLM. Falls back to deterministic
 generation when no LLM client is available or in dry-run mode.
+
+LLM requests run concurrently (bounded by ``max_concurrency``). Responses
+that fail recipe validation are resampled per opportunity; transient request
+failures are left to the client's own retries. Completed candidates are
+handed to an optional ``on_candidate`` callback (in a worker thread) as they
+arrive, while the returned list keeps opportunity order.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import random
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import ValidationError
 
+from twinklr.core.io import run_sync
 from twinklr.core.recipe_builder.evidence import format_analysis_for_prompt
 from twinklr.core.recipe_builder.models import (
     CatalogAnalysis,
@@ -340,84 +349,225 @@ def _parse_llm_response(raw: dict[str, Any]) -> EffectRecipe:
     return EffectRecipe.model_validate(raw)
 
 
-def generate_with_llm(
+async def _request_json(
+    llm_client: Any,
+    messages: list[dict[str, str]],
+    model: str,
+    temperature: float,
+) -> dict[str, Any]:
+    """Request one JSON completion, without blocking the event loop.
+
+    Uses the client's ``generate_json_async`` when available (LLMProvider);
+    sync-only clients (OpenAIClient) run in a worker thread. Provider
+    ``LLMResponse`` wrappers are unwrapped to their parsed content.
+
+    Raises:
+        TypeError: If the response is valid JSON but not an object.
+    """
+    if hasattr(llm_client, "generate_json_async"):
+        raw = await llm_client.generate_json_async(
+            messages=messages, model=model, temperature=temperature
+        )
+    else:
+        raw = await asyncio.to_thread(
+            llm_client.generate_json, messages=messages, model=model, temperature=temperature
+        )
+    content = raw.content if hasattr(raw, "content") else raw
+    if not isinstance(content, dict):
+        raise TypeError(f"Expected a JSON object from the LLM, got {type(content).__name__}")
+    return content
+
+
+async def _generate_one(
+    opp: Opportunity,
+    messages: list[dict[str, str]],
+    llm_client: Any,
+    model: str,
+    temperature: float,
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+    retry_delay: float,
+) -> RecipeCandidate | None:
+    """Generate a candidate for one opportunity, resampling invalid output.
+
+    Responses that are not a JSON object or fail recipe validation are
+    retried up to ``max_retries`` times with exponential backoff. Request
+    errors are not: LLMProvider and OpenAIClient already retry network,
+    rate-limit and server errors, so a failure here is final.
+    """
+    for attempt in range(max_retries + 1):
+        if attempt:
+            await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+        async with semaphore:
+            logger.info(
+                "Generating recipe for opportunity %s: %s (attempt %d)",
+                opp.opportunity_id,
+                opp.category,
+                attempt + 1,
+            )
+            try:
+                raw = await _request_json(llm_client, messages, model, temperature)
+            except TypeError as exc:
+                logger.warning(
+                    "LLM output was not a JSON object for opportunity %s: %s",
+                    opp.opportunity_id,
+                    exc,
+                )
+                continue
+            except Exception as exc:
+                logger.warning(
+                    "LLM generation failed for opportunity %s: %s",
+                    opp.opportunity_id,
+                    exc,
+                )
+                return None
+        try:
+            recipe = _parse_llm_response(raw)
+        except ValidationError as exc:
+            logger.warning(
+                "LLM output failed validation for opportunity %s: %s",
+                opp.opportunity_id,
+                exc,
+            )
+            continue
+
+        logger.info(
+            "Generated recipe '%s' (effect_family=%s, energy=%s, layers=%d)",
+            recipe.name,
+            recipe.effect_family,
+            recipe.style_markers.energy_affinity.value,
+            len(recipe.layers),
+        )
+        return RecipeCandidate(
+            candidate_id=uuid.uuid4().hex[:12],
+            source_opportunity_id=opp.opportunity_id,
+            recipe=recipe,
+            generation_mode="llm",
+            rationale=f"LLM generation for: {opp.description}",
+            confidence=0.8,
+        )
+
+    logger.warning(
+        "Giving up on opportunity %s after %d attempts", opp.opportunity_id, max_retries + 1
+    )
+    return None
+
+
+async def generate_with_llm_async(
     opportunities: list[Opportunity],
     analysis: CatalogAnalysis,
     catalog_recipes: list[EffectRecipe],
     llm_client: Any,
     model: str = "gpt-4.1",
     temperature: float = 0.9,
+    max_concurrency: int = 4,
+    max_retries: int = 1,
+    retry_delay: float = 1.0,
+    on_candidate: Callable[[RecipeCandidate], None] | None = None,
 ) -> list[RecipeCandidate]:
-    """Generate recipe candidates using LLM for each opportunity.
+    """Generate recipe candidates concurrently, one LLM request per opportunity.
 
     Args:
         opportunities: Identified creative opportunities.
         analysis: Catalog analysis for prompt context.
         catalog_recipes: Full catalog for example selection.
-        llm_client: OpenAIClient instance.
+        llm_client: LLMProvider or OpenAIClient instance.
         model: LLM model to use.
         temperature: Sampling temperature (higher = more creative).
+        max_concurrency: Maximum requests in flight at once.
+        max_retries: Extra attempts per opportunity after invalid output.
+        retry_delay: Base backoff in seconds between attempts.
+        on_candidate: Called with each candidate as soon as it is generated
+            (completion order), e.g. to start validating it. Runs in a worker
+            thread, one candidate at a time, so slow callbacks do not block
+            the event loop.
 
     Returns:
-        List of successfully generated RecipeCandidate instances.
+        Successfully generated candidates, in opportunity order.
     """
-    candidates: list[RecipeCandidate] = []
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
 
-    for opp in opportunities:
-        examples = _select_diverse_examples(catalog_recipes, opp)
-        user_prompt = _build_user_prompt(opp, analysis, examples)
-
-        messages = [
+    # Prompts are built up front so example sampling does not depend on timing
+    prompts = [
+        [
             {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
+            {
+                "role": "user",
+                "content": _build_user_prompt(
+                    opp, analysis, _select_diverse_examples(catalog_recipes, opp)
+                ),
+            },
         ]
+        for opp in opportunities
+    ]
 
-        try:
-            logger.info(
-                "Generating recipe for opportunity %s: %s",
-                opp.opportunity_id,
-                opp.category,
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks = [
+        asyncio.create_task(
+            _generate_one(
+                opp, messages, llm_client, model, temperature, semaphore, max_retries, retry_delay
             )
+        )
+        for opp, messages in zip(opportunities, prompts, strict=True)
+    ]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            candidate = await finished
+            if candidate is not None and on_candidate is not None:
+                await asyncio.to_thread(on_candidate, candidate)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
 
-            raw = llm_client.generate_json(
-                messages=messages,
-                model=model,
-                temperature=temperature,
-            )
+    return [c for task in tasks if (c := task.result()) is not None]
 
-            recipe = _parse_llm_response(raw)
 
-            candidate = RecipeCandidate(
-                candidate_id=uuid.uuid4().hex[:12],
-                source_opportunity_id=opp.opportunity_id,
-                recipe=recipe,
-                generation_mode="llm",
-                rationale=f"LLM generation for: {opp.description}",
-                confidence=0.8,
-            )
-            candidates.append(candidate)
-            logger.info(
-                "Generated recipe '%s' (effect_family=%s, energy=%s, layers=%d)",
-                recipe.name,
-                recipe.effect_family,
-                recipe.style_markers.energy_affinity.value,
-                len(recipe.layers),
-            )
+def generate_with_llm(
+    opportunities: list[Opportunity],
+    analysis: CatalogAnalysis,
+    catalog_recipes: list[EffectRecipe],
+    llm_client: Any,
+    model: str = "gpt-4.1",
+    temperature: float = 0.9,
+    max_concurrency: int = 4,
+    max_retries: int = 1,
+    on_candidate: Callable[[RecipeCandidate], None] | None = None,
+) -> list[RecipeCandidate]:
+    """Generate recipe candidates using LLM for each opportunity.
 
-        except ValidationError as exc:
-            logger.warning(
-                "LLM output failed validation for opportunity %s: %s",
-                opp.opportunity_id,
-                exc,
-            )
-        except Exception as exc:
-            logger.warning(
-                "LLM generation failed for opportunity %s: %s",
-                opp.opportunity_id,
-                exc,
-            )
+    Sync wrapper around ``generate_with_llm_async``, run on the shared
+    sync bridge loop so it is safe to call from any thread.
 
-    return candidates
+    Args:
+        opportunities: Identified creative opportunities.
+        analysis: Catalog analysis for prompt context.
+        catalog_recipes: Full catalog for example selection.
+        llm_client: LLMProvider or OpenAIClient instance.
+        model: LLM model to use.
+        temperature: Sampling temperature (higher = more creative).
+        max_concurrency: Maximum requests in flight at once.
+        max_retries: Extra attempts per opportunity after invalid output.
+        on_candidate: Called (in a worker thread) with each candidate as soon
+            as it is generated.
+
+    Returns:
+        List of successfully generated RecipeCandidate instances.
+    """
+    return run_sync(
+        generate_with_llm_async(
+            opportunities=opportunities,
+            analysis=analysis,
+            catalog_recipes=catalog_recipes,
+            llm_client=llm_client,
+            model=model,
+            temperature=temperature,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            on_candidate=on_candidate,
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -621,6 +771,9 @@ def generate_candidates(
     dry_run: bool = False,
     model: str = "gpt-4.1",
     temperature: float = 0.9,
+    max_concurrency: int = 4,
+    max_retries: int = 1,
+    on_candidate: Callable[[RecipeCandidate], None] | None = None,
 ) -> list[RecipeCandidate]:
     """Generate recipe candidates from opportunities.
 
@@ -631,10 +784,14 @@ def generate_candidates(
         opportunities: Creative opportunities to generate for.
         analysis: Catalog analysis for prompt context.
         catalog_recipes: Full catalog for example selection.
-        llm_client: Optional OpenAIClient instance.
+        llm_client: Optional LLMProvider or OpenAIClient instance.
         dry_run: Skip LLM calls, use deterministic fallback.
         model: LLM model to use.
         temperature: Sampling temperature.
+        max_concurrency: Maximum LLM requests in flight at once.
+        max_retries: Extra LLM attempts per opportunity after invalid output.
+        on_candidate: Called with each candidate as soon as it is generated
+            (LLM generation only).
 
     Returns:
         List of RecipeCandidate instances.
@@ -653,4 +810,7 @@ def generate_candidates(
         llm_client=llm_client,
         model=model,
         temperature=temperature,
+        max_concurrency=max_concurrency,
+        max_retries=max_retries,
+        on_candidate=on_candidate,
     )
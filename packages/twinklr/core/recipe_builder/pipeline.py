@@ -24,6 +24,7 @@ from twinklr.core.recipe_builder.evidence import (
 from twinklr.core.recipe_builder.generation import generate_candidates
 from twinklr.core.recipe_builder.models import (
     AdmissionReport,
+    CandidateValidationResult,
     CatalogAnalysis,
     MetadataEnrichmentCandidate,
     MetadataEnrichmentCollection,
@@ -35,7 +36,7 @@ from twinklr.core.recipe_builder.models import (
     SummaryMetrics,
     ValidationReport,
 )
-from twinklr.core.recipe_builder.validation import validate_all
+from twinklr.core.recipe_builder.validation import validate_all, validate_recipe_candidate
 from twinklr.core.sequencer.templates.group.recipe import EffectRecipe
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,8 @@ class PipelineConfig:
     llm_client: Any | None = None
     llm_model: str = "gpt-4.1"
     llm_temperature: float = 0.9
+    llm_max_concurrency: int = 4
+    llm_max_retries: int = 1
     max_opportunities: int = 10
     phases: tuple[str, ...] = field(default_factory=lambda: ALL_PHASES)
 
@@ -143,6 +146,14 @@ def run_pipeline(config: PipelineConfig) -> RunManifest:
     metadata_candidates: list[MetadataEnrichmentCandidate] = []
     validation_report: ValidationReport | None = None
     admission_report: AdmissionReport | None = None
+    streamed_results: dict[str, CandidateValidationResult] = {}
+
+    def _validate_streamed(candidate: RecipeCandidate) -> None:
+        # Validate LLM candidates while the remaining requests are in flight
+        # (called from a worker thread, one candidate at a time)
+        streamed_results[candidate.candidate_id] = validate_recipe_candidate(
+            candidate, catalog_recipes
+        )
 
     # ---- analysis ----
     if "analysis" in active_phases:
@@ -185,6 +196,9 @@ def run_pipeline(config: PipelineConfig) -> RunManifest:
                 dry_run=config.dry_run,
                 model=config.llm_model,
                 temperature=config.llm_temperature,
+                max_concurrency=config.llm_max_concurrency,
+                max_retries=config.llm_max_retries,
+                on_candidate=_validate_streamed if "validation" in active_phases else None,
             )
 
             collection = RecipeCandidateCollection(
@@ -242,6 +256,7 @@ def run_pipeline(config: PipelineConfig) -> RunManifest:
                 recipe_candidates,
                 metadata_candidates,
                 catalog_recipes,
+                precomputed=streamed_results,
             )
             _write_json(run_dir / "validation_report.json", validation_report)
 
@@ -317,6 +332,7 @@ def run_pipeline(config: PipelineConfig) -> RunManifest:
             "templates_dir": str(config.templates_dir or "default"),
             "dry_run": str(config.dry_run),
             "llm_model": config.llm_model,
+            "llm_max_concurrency": str(config.llm_max_concurrency),
             "max_opportunities": str(config.max_opportunities),
         },
         artifact_paths={
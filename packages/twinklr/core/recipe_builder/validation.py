@@ -70,10 +70,17 @@ def validate_all(
     recipe_candidates: list[RecipeCandidate],
     metadata_candidates: list[MetadataEnrichmentCandidate],
     library_recipes: list[EffectRecipe],
+    precomputed: dict[str, CandidateValidationResult] | None = None,
 ) -> ValidationReport:
-    """Run all checks on all candidates and return an aggregated report."""
+    """Run all checks on all candidates and return an aggregated report.
+
+    Recipe candidates whose id is in ``precomputed`` (already validated as
+    they were generated) reuse that result instead of being re-checked.
+    """
+    precomputed = precomputed or {}
     recipe_results = [
-        validate_recipe_candidate(c, library_recipes) for c in recipe_candidates
+        precomputed.get(c.candidate_id) or validate_recipe_candidate(c, library_recipes)
+        for c in recipe_candidates
     ]
     metadata_results = [
         validate_metadata_candidate(c, library_recipes) for c in metadata_candidates
@@ -7,6 +7,7 @@ flags for issues like clamping, discontinuities, and limited range.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
 import numpy as np
 
@@ -22,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 def analyze_curve(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     config: EvalConfig,
     curve_type: str | None = None,
 ) -> tuple[CurveStats, list[ReportFlag]]:
@@ -46,7 +47,7 @@ def analyze_curve(
         >>> stats.clamp_pct
         80.0
     """
-    if not samples:
+    if len(samples) == 0:
         # Empty curve
         return (
             CurveStats(
@@ -143,7 +144,7 @@ def analyze_curve(
 
 
 def check_loop_continuity(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     threshold: float = 0.05,
     curve_type: str | None = None,
     channel: str | None = None,
@@ -9,6 +9,7 @@ Analyzes transitions between sections to detect:
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 
 import numpy as np
 
@@ -21,8 +22,8 @@ logger = logging.getLogger(__name__)
 def analyze_section_transition(
     from_section_name: str,
     to_section_name: str,
-    from_curves: dict[str, dict[str, list[float]]],  # role -> channel -> samples
-    to_curves: dict[str, dict[str, list[float]]],
+    from_curves: Mapping[str, Mapping[str, Sequence[float] | np.ndarray]],
+    to_curves: Mapping[str, Mapping[str, Sequence[float] | np.ndarray]],
     config: EvalConfig,
 ) -> TransitionAnalysis:
     """Analyze transition between two sections.
@@ -30,7 +31,7 @@ def analyze_section_transition(
     Args:
         from_section_name: Name of source section
         to_section_name: Name of destination section
-        from_curves: Curves from end of source section (by role and channel)
+        from_curves: Curves from end of source section (role -> channel -> samples)
         to_curves: Curves from start of destination section (by role and channel)
         config: Evaluation configuration
 
@@ -160,8 +161,8 @@ def analyze_section_transition(
 
 
 def _check_position_continuity(
-    from_samples: list[float],
-    to_samples: list[float],
+    from_samples: Sequence[float] | np.ndarray,
+    to_samples: Sequence[float] | np.ndarray,
     channel: str,
     role: str,
     config: EvalConfig,
@@ -180,7 +181,7 @@ def _check_position_continuity(
     Returns:
         Position delta (normalized 0-1)
     """
-    if not from_samples or not to_samples:
+    if len(from_samples) == 0 or len(to_samples) == 0:
         return 0.0
 
     # Get last position of first section and first position of second section
@@ -191,7 +192,7 @@ def _check_position_continuity(
     last_pos_norm = last_pos_dmx / 255.0
     first_pos_norm = first_pos_dmx / 255.0
 
-    delta = abs(first_pos_norm - last_pos_norm)
+    delta = float(abs(first_pos_norm - last_pos_norm))
 
     if delta > config.position_discontinuity_threshold:
         issues.append(
@@ -202,8 +203,8 @@ def _check_position_continuity(
 
 
 def _check_velocity_continuity(
-    from_samples: list[float],
-    to_samples: list[float],
+    from_samples: Sequence[float] | np.ndarray,
+    to_samples: Sequence[float] | np.ndarray,
     channel: str,
     role: str,
     config: EvalConfig,
@@ -239,7 +240,7 @@ def _check_velocity_continuity(
     return delta
 
 
-def _estimate_velocity(samples: list[float]) -> float:
+def _estimate_velocity(samples: Sequence[float] | np.ndarray) -> float:
     """Estimate velocity from samples using linear regression.
 
     Args:
@@ -265,8 +266,8 @@ def _estimate_velocity(samples: list[float]) -> float:
 
 
 def _check_dimmer_snap(
-    from_samples: list[float],
-    to_samples: list[float],
+    from_samples: Sequence[float] | np.ndarray,
+    to_samples: Sequence[float] | np.ndarray,
     role: str,
     config: EvalConfig,
     issues: list[str],
@@ -283,7 +284,7 @@ def _check_dimmer_snap(
     Returns:
         True if snap detected
     """
-    if not from_samples or not to_samples:
+    if len(from_samples) == 0 or len(to_samples) == 0:
         return False
 
     last_dimmer_dmx = from_samples[-1]
@@ -293,7 +294,7 @@ def _check_dimmer_snap(
     last_dimmer_norm = last_dimmer_dmx / 255.0
     first_dimmer_norm = first_dimmer_dmx / 255.0
 
-    delta = abs(first_dimmer_norm - last_dimmer_norm)
+    delta = float(abs(first_dimmer_norm - last_dimmer_norm))
 
     if delta > config.dimmer_snap_threshold:
         issues.append(
@@ -1,25 +1,78 @@
 """Extract curve samples from IR segments.
 
-This module samples curves from FixtureSegment IR over time windows,
-producing arrays of values for analysis and plotting.
+This module rasterizes FixtureSegment IR over time windows into dense DMX
+frames, producing arrays of values for analysis and plotting.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Literal
 
-from twinklr.core.sequencer.models.enum import ChannelName
+import numpy as np
+
+from twinklr.core.sequencer.moving_heads.export.raster import FrameRaster, rasterize_segments
 
 logger = logging.getLogger(__name__)
 
 
+def rasterize_for_evaluation(
+    segments: list[Any],
+    samples_per_bar: int,
+    bar_duration_ms: float,
+    window_ms: tuple[int, int] | None = None,
+) -> FrameRaster:
+    """Rasterize segments at the evaluation sample rate.
+
+    The frame rate is chosen so one bar spans ``samples_per_bar`` frames.
+    Rasterize the whole show once and slice sections with
+    ``FrameRaster.window`` instead of re-sampling each window.
+
+    Args:
+        segments: List of FixtureSegment IR objects
+        samples_per_bar: Number of samples to take per bar
+        bar_duration_ms: Duration of one bar in milliseconds
+        window_ms: Optional (start_ms, end_ms) range (default: all segments)
+
+    Returns:
+        FrameRaster of pan/tilt/dimmer DMX frames
+    """
+    fps = samples_per_bar * 1000.0 / bar_duration_ms
+    if window_ms is None:
+        return rasterize_segments(segments, fps=fps)
+    start_ms, end_ms = window_ms
+    return rasterize_segments(segments, fps=fps, start_ms=start_ms, end_ms=end_ms)
+
+
+def curves_from_raster(
+    raster: FrameRaster,
+    space: Literal["norm", "dmx"] = "norm",
+) -> dict[str, dict[str, np.ndarray]]:
+    """Split a raster into per-fixture, per-channel sample arrays.
+
+    Args:
+        raster: Rasterized frames
+        space: "norm" for float samples in 0-1, "dmx" for uint8 DMX values
+
+    Returns:
+        Dict mapping fixture_id -> {channel_name -> samples}
+    """
+    curves: dict[str, dict[str, np.ndarray]] = {}
+    for row, fixture_id in enumerate(raster.fixture_ids):
+        fixture_curves: dict[str, np.ndarray] = {}
+        for col, channel in enumerate(raster.channels):
+            frames = raster.frames[row, col]
+            fixture_curves[channel.value] = frames / 255.0 if space == "norm" else frames
+        curves[fixture_id] = fixture_curves
+    return curves
+
+
 def extract_curves_from_segments(
     segments: list[Any],
     section_window_ms: tuple[int, int],
     samples_per_bar: int,
     bar_duration_ms: float,
-) -> dict[str, dict[str, list[float]]]:
+) -> dict[str, dict[str, np.ndarray]]:
     """Extract curve samples from segments within a time window.
 
     Samples curves at regular intervals across the section window,
@@ -32,7 +85,7 @@ def extract_curves_from_segments(
         bar_duration_ms: Duration of one bar in milliseconds
 
     Returns:
-        Dict mapping fixture_id -> {channel_name -> [samples]}
+        Dict mapping fixture_id -> {channel_name -> samples (normalized 0-1)}
 
     Example:
         >>> curves = extract_curves_from_segments(
@@ -46,156 +99,17 @@ def extract_curves_from_segments(
         >>> "PAN" in curves["fixture_01"]
         True
     """
-    start_ms, end_ms = section_window_ms
-    duration_ms = end_ms - start_ms
-    num_samples = int((duration_ms / bar_duration_ms) * samples_per_bar)
+    raster = rasterize_for_evaluation(
+        segments,
+        samples_per_bar=samples_per_bar,
+        bar_duration_ms=bar_duration_ms,
+        window_ms=section_window_ms,
+    )
 
     logger.debug(
-        f"Extracting curves: window={start_ms}-{end_ms}ms, "
-        f"samples={num_samples}, "
-        f"duration={duration_ms}ms"
+        f"Extracting curves: window={section_window_ms[0]}-{section_window_ms[1]}ms, "
+        f"samples={raster.n_frames}, "
+        f"fixtures={len(raster.fixture_ids)}"
     )
 
-    # Initialize result structure
-    curves: dict[str, dict[str, list[float]]] = {}
-
-    # Group segments by fixture
-    by_fixture: dict[str, list[Any]] = {}
-    for seg in segments:
-        # Skip segments outside window
-        if seg.t0_ms >= end_ms or seg.t1_ms <= start_ms:
-            continue
-        by_fixture.setdefault(seg.fixture_id, []).append(seg)
-
-    logger.debug(f"Found {len(by_fixture)} fixtures with segments in window")
-
-    # Sample each fixture's curves
-    for fixture_id, fixture_segments in by_fixture.items():
-        fixture_curves = {}
-
-        for channel in [ChannelName.PAN, ChannelName.TILT, ChannelName.DIMMER]:
-            samples = _sample_channel_over_window(
-                segments=fixture_segments,
-                channel=channel,
-                window_ms=(start_ms, end_ms),
-                num_samples=num_samples,
-            )
-            fixture_curves[channel.value] = samples
-
-        curves[fixture_id] = fixture_curves
-
-    return curves
-
-
-def _sample_channel_over_window(
-    segments: list[Any],
-    channel: ChannelName,
-    window_ms: tuple[int, int],
-    num_samples: int,
-) -> list[float]:
-    """Sample a single channel over a time window.
-
-    Args:
-        segments: Segments for this fixture
-        channel: Channel to sample
-        window_ms: (start_ms, end_ms)
-        num_samples: Number of samples to take
-
-    Returns:
-        List of sampled values (normalized 0-1)
-    """
-    start_ms, end_ms = window_ms
-    duration_ms = end_ms - start_ms
-
-    if num_samples == 0 or duration_ms == 0:
-        return []
-
-    samples = []
-
-    for i in range(num_samples):
-        # Calculate sample time
-        t_ms = start_ms + (i / num_samples) * duration_ms
-
-        # Sample at this time
-        value = _sample_at_time(segments, channel, t_ms)
-        samples.append(value)
-
-    return samples
-
-
-def _sample_at_time(
-    segments: list[Any],
-    channel: ChannelName,
-    t_ms: float,
-) -> float:
-    """Sample channel value at a specific time.
-
-    Finds the active segment at t_ms and interpolates the curve value.
-    Returns 0 if no segment is active.
-
-    Args:
-        segments: Segments to search
-        channel: Channel to sample
-        t_ms: Time in milliseconds
-
-    Returns:
-        Normalized value (0-1)
-    """
-    # Find segment containing t_ms
-    for seg in segments:
-        if seg.t0_ms <= t_ms < seg.t1_ms:
-            channel_value = seg.channels.get(channel)
-            if not channel_value:
-                continue
-
-            # Check for curve points
-            if channel_value.value_points:
-                # Interpolate within segment
-                seg_duration = seg.t1_ms - seg.t0_ms
-                t_norm = (t_ms - seg.t0_ms) / seg_duration if seg_duration > 0 else 0.0
-
-                return _interpolate_curve_points(channel_value.value_points, t_norm)
-
-            # Static value
-            elif channel_value.static_dmx is not None:
-                # Convert DMX to normalized
-                return float(channel_value.static_dmx) / 255.0
-
-    # No segment found - return 0
-    return 0.0
-
-
-def _interpolate_curve_points(points: list[Any], t_norm: float) -> float:
-    """Linear interpolation in curve points.
-
-    Args:
-        points: List of CurvePoint objects with .t and .v attributes
-        t_norm: Normalized time (0-1) within segment
-
-    Returns:
-        Interpolated value at t_norm
-    """
-    if not points:
-        return 0.0
-
-    # Handle edge cases
-    if len(points) == 1:
-        return float(points[0].v)
-
-    # Find bracketing points
-    for i in range(len(points) - 1):
-        p0, p1 = points[i], points[i + 1]
-
-        if p0.t <= t_norm <= p1.t:
-            # Linear interpolation
-            t_range = p1.t - p0.t
-            if t_range > 0:
-                alpha = (t_norm - p0.t) / t_range
-                return float(p0.v + alpha * (p1.v - p0.v))
-            else:
-                return float(p0.v)
-
-    # Outside range - use nearest
-    if t_norm <= points[0].t:
-        return float(points[0].v)
-    return float(points[-1].v)
+    return curves_from_raster(raster)
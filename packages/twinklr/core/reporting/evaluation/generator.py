@@ -8,6 +8,8 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+import numpy as np
+
 from twinklr.core.reporting.evaluation.analyze import analyze_curve, check_loop_continuity
 from twinklr.core.reporting.evaluation.collect import (
     build_run_metadata,
@@ -17,7 +19,10 @@ from twinklr.core.reporting.evaluation.collect import (
 from twinklr.core.reporting.evaluation.compliance import verify_template_compliance
 from twinklr.core.reporting.evaluation.config import EvalConfig
 from twinklr.core.reporting.evaluation.continuity import analyze_section_transition
-from twinklr.core.reporting.evaluation.extract import extract_curves_from_segments
+from twinklr.core.reporting.evaluation.extract import (
+    curves_from_raster,
+    rasterize_for_evaluation,
+)
 from twinklr.core.reporting.evaluation.models import (
     CurveAnalysis,
     EvaluationReport,
@@ -38,6 +43,8 @@ from twinklr.core.reporting.evaluation.validate import (
     validate_plan_structure,
     validation_to_flags,
 )
+from twinklr.core.sequencer.models.enum import ChannelName
+from twinklr.core.sequencer.moving_heads.export.raster import FrameRaster
 
 logger = logging.getLogger(__name__)
 
@@ -182,6 +189,13 @@ async def generate_evaluation_report(
         song_structure=structure_info,
     )
 
+    # Rasterize the whole show once; sections and transitions slice it
+    show_raster = rasterize_for_evaluation(
+        render_data.segments,
+        samples_per_bar=config.samples_per_bar,
+        bar_duration_ms=song_metadata.bar_duration_ms,
+    )
+
     # Expand plan sections (segments → individual sections)
     # This matches the rendering pipeline's behavior
     expanded_sections = _expand_plan_sections(plan)
@@ -202,6 +216,7 @@ async def generate_evaluation_report(
         section_report = _process_section(
             plan_section=plan_section,
             render_data=render_data,
+            show_raster=show_raster,
             song_metadata=song_metadata,
             output_dir=output_dir,
             config=config,
@@ -255,11 +270,8 @@ async def generate_evaluation_report(
                 )  # Last 10% or 100ms min
 
                 current_boundary_start = current_end_ms - boundary_window_ms
-                current_boundary_curves = extract_curves_from_segments(
-                    segments=render_data.segments,
-                    section_window_ms=(current_boundary_start, current_end_ms),
-                    samples_per_bar=config.samples_per_bar,
-                    bar_duration_ms=song_metadata.bar_duration_ms,
+                current_boundary_curves = curves_from_raster(
+                    show_raster.window(current_boundary_start, current_end_ms), space="dmx"
                 )
 
                 # Extract first 10% of next section
@@ -272,15 +284,12 @@ async def generate_evaluation_report(
                 )  # First 10% or 100ms min
 
                 next_boundary_end = next_start_ms + next_boundary_window_ms
-                next_boundary_curves = extract_curves_from_segments(
-                    segments=render_data.segments,
-                    section_window_ms=(next_start_ms, next_boundary_end),
-                    samples_per_bar=config.samples_per_bar,
-                    bar_duration_ms=song_metadata.bar_duration_ms,
+                next_boundary_curves = curves_from_raster(
+                    show_raster.window(next_start_ms, next_boundary_end), space="dmx"
                 )
 
                 # Organize curves by role and channel for transition analysis
-                from_curves_by_role: dict[str, dict[str, list[float]]] = {}
+                from_curves_by_role: dict[str, dict[str, np.ndarray]] = {}
                 for fixture_id, channels in current_boundary_curves.items():
                     # Find role for this fixture
                     fixture_ctx = next(
@@ -290,7 +299,7 @@ async def generate_evaluation_report(
                     role = fixture_ctx.role if fixture_ctx else fixture_id
                     from_curves_by_role[role] = channels
 
-                to_curves_by_role: dict[str, dict[str, list[float]]] = {}
+                to_curves_by_role: dict[str, dict[str, np.ndarray]] = {}
                 for fixture_id, channels in next_boundary_curves.items():
                     fixture_ctx = next(
                         (f for f in render_data.fixture_contexts if f.fixture_id == fixture_id),
@@ -367,6 +376,7 @@ async def generate_evaluation_report(
 def _process_section(
     plan_section,
     render_data,
+    show_raster: FrameRaster,
     song_metadata: SongMetadata,
     output_dir: Path,
     config: EvalConfig,
@@ -376,6 +386,7 @@ def _process_section(
     Args:
         plan_section: PlanSection from choreography plan
         render_data: RerenderResult from sequencer
+        show_raster: DMX frames for the whole show
         song_metadata: Song timing information
         output_dir: Output directory for plots
         config: Evaluation configuration
@@ -408,12 +419,8 @@ def _process_section(
     )
 
     # Extract curves
-    curves_by_fixture = extract_curves_from_segments(
-        segments=render_data.segments,
-        section_window_ms=(start_ms, end_ms),
-        samples_per_bar=config.samples_per_bar,
-        bar_duration_ms=song_metadata.bar_duration_ms,
-    )
+    section_raster = show_raster.window(start_ms, end_ms)
+    curves_by_fixture = curves_from_raster(section_raster)
 
     # Analyze curves and generate plots
     curve_analyses = []
@@ -504,7 +511,7 @@ def _process_section(
             if config.enable_physics_checks and channel_name.lower() in ["pan", "tilt"]:
                 section_duration_ms = end_ms - start_ms
                 physics_check = check_physics_constraints(
-                    samples=samples,
+                    samples=section_raster.channel(fixture_id, ChannelName(channel_name)),
                     channel=channel_name.lower(),  # type: ignore[arg-type]
                     duration_ms=section_duration_ms,
                     config=config,
@@ -10,6 +10,7 @@ Validates curves against real-world moving head limitations:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Literal
 
 import numpy as np
@@ -21,7 +22,7 @@ logger = logging.getLogger(__name__)
 
 
 def check_physics_constraints(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     channel: Literal["pan", "tilt", "dimmer"],
     duration_ms: float,
     config: EvalConfig,
@@ -126,7 +127,7 @@ def check_physics_constraints(
 
 
 def check_settle_time(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     duration_ms: float,
     config: EvalConfig,
 ) -> list[str]:
@@ -176,7 +177,7 @@ def check_settle_time(
 
 
 def check_dmx_resolution(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     sample_rate_hz: float,
     config: EvalConfig,
 ) -> list[str]:
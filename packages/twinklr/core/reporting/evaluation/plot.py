@@ -6,6 +6,7 @@ This module creates matplotlib plots of curves for visual inspection.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 
 import matplotlib
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 
 def plot_curve(
-    samples: list[float],
+    samples: Sequence[float] | np.ndarray,
     *,
     title: str,
     output_path: Path,
@@ -52,7 +53,7 @@ def plot_curve(
         ...     section_bar_range=(1.0, 21.0),
         ... )
     """
-    if not samples:
+    if len(samples) == 0:
         logger.warning(f"No samples to plot for {title}")
         return
 
@@ -16,6 +16,8 @@ xLights ValueCurve format (native curve):
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from twinklr.core.curves.generator import CurveGenerator
 from twinklr.core.curves.library import CurveLibrary
 from twinklr.core.curves.models import CurvePoint
@@ -24,6 +26,7 @@ from twinklr.core.curves.models import CurvePoint
 _generator = CurveGenerator()
 
 
+@lru_cache(maxsize=1024)
 def build_value_curve_string(
     curve_id: CurveLibrary,
     param_id: str,
@@ -38,7 +41,8 @@ def build_value_curve_string(
 
     Uses ``CurveGenerator`` to produce normalized curve points, then
     formats them into the xLights ``Active=TRUE|...|Values=t:v;...|``
-    format expected by ``E_VALUECURVE_*`` keys.
+    format expected by ``E_VALUECURVE_*`` keys. Results are memoized on
+    the arguments, since the same curves recur across many events.
 
     Args:
         curve_id: Curve type from the ``CurveLibrary`` enum.
@@ -103,19 +107,38 @@ def curve_points_to_xlights_string(
     if not points:
         return ""
 
+    return _encode_value_curve(
+        tuple((pt.t, pt.v) for pt in points), param_id, float(min_val), float(max_val)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _encode_value_curve(
+    pairs_tv: tuple[tuple[float, float], ...],
+    param_id: str,
+    min_val: float,
+    max_val: float,
+) -> str:
+    """Format (t, v) pairs as a ValueCurve string, memoized by content.
+
+    The same handful of curves is encoded for many events, so the string is
+    cached on the point values rather than rebuilt per call.
+    """
     # Build time:value pairs (both normalised 0-1, 2 decimal places).
     pairs: list[str] = []
-    for pt in points:
-        t_r = round(pt.t, 2)
-        v_r = round(pt.v, 2)
+    for t, v in pairs_tv:
+        t_r = round(t, 2)
+        v_r = round(v, 2)
         pairs.append(f"{t_r:.2f}:{v_r:.2f}")
 
     # Ensure anchors at t=0.0 and t=1.0
-    if points[0].t > 0.01:
-        v_start = round(points[0].v, 2)
+    first_t, first_v = pairs_tv[0]
+    last_t, last_v = pairs_tv[-1]
+    if first_t > 0.01:
+        v_start = round(first_v, 2)
         pairs.insert(0, f"0.00:{v_start:.2f}")
-    if points[-1].t < 0.99:
-        v_end = round(points[-1].v, 2)
+    if last_t < 0.99:
+        v_end = round(last_v, 2)
         pairs.append(f"1.00:{v_end:.2f}")
 
     values_str = ";".join(pairs)
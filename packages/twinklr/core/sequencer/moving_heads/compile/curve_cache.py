@@ -0,0 +1,140 @@
+"""Per-compile memoization of handler curves shared across fixtures.
+
+Within one template compile, every fixture targeted by a step asks the same
+movement and dimmer handlers for curves. The inputs only differ per fixture
+through the geometry base pose, calibration and phase offset. Movement curves
+are generated once as a pose-independent shape and then centered on each
+fixture's base pose; dimmer curves do not depend on the pose at all.
+StepCurveCache keys each handler call on the inputs that affect it, with
+calibration reduced to its values by ``calibration_fingerprint``, so fixtures
+share shapes, dimmer curves and phase-shifted variants.
+"""
+
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from twinklr.core.curves.models import CurvePoint
+from twinklr.core.curves.phase import apply_phase_shift_samples
+
+R = TypeVar("R")
+
+# Calibration entries that are per-fixture objects rather than limits read by
+# movement and dimmer handlers (geometry handlers use them before caching)
+_UNKEYED_CALIBRATION = frozenset({"fixture_config"})
+
+
+def calibration_fingerprint(calibration: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Return the calibration values that movement and dimmer curves depend on.
+
+    Args:
+        calibration: Fixture calibration dict from the compile context
+
+    Returns:
+        Copy of ``calibration`` without per-fixture objects such as the
+        ``fixture_config`` model, suitable for a cache key.
+    """
+    if not calibration:
+        return {}
+    return {k: v for k, v in calibration.items() if k not in _UNKEYED_CALIBRATION}
+
+
+class StepCurveCache:
+    """Memo of handler results and phase-shifted curves for one compile.
+
+    Keys are built from handler identity and call arguments. Objects that are
+    keyed by identity (handlers, pydantic models such as the beat grid or a
+    library movement pattern) are held by the cache, so an ``id()`` cannot be
+    reused by a different object while the cache is alive. Create one cache
+    per ``compile_template`` call and drop it afterwards.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that ran the generator.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[Hashable, Any] = {}
+        self._pinned: dict[int, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_or_generate(
+        self,
+        kind: str,
+        handler: object,
+        params: Mapping[str, Any],
+        generate: Callable[[], R],
+        **call_args: Any,
+    ) -> R:
+        """Return the memoized handler result, generating it on first use.
+
+        Args:
+            kind: Handler family ("movement", "dimmer")
+            handler: Handler instance (keyed by identity)
+            params: Handler params dict as passed to ``generate``
+            generate: Zero-argument callable producing the result
+            **call_args: Remaining ``generate`` arguments (part of the key)
+
+        Returns:
+            The cached or freshly generated result. Treat it as read-only:
+            it is shared with every fixture that has the same inputs.
+        """
+        key = (kind, self._pin(handler), self._freeze(params), self._freeze(call_args))
+        return self._lookup(key, generate)
+
+    def phase_shifted(
+        self,
+        points: list[CurvePoint] | None,
+        offset_norm: float,
+        n_samples: int,
+    ) -> list[CurvePoint] | None:
+        """Return ``points`` phase-shifted by ``offset_norm`` (wrapped), memoized.
+
+        Args:
+            points: Base curve (typically a cached handler curve), or None
+            offset_norm: Phase offset in normalized time
+            n_samples: Number of output samples
+
+        Returns:
+            Shifted curve, or None if ``points`` is None
+        """
+        if points is None or offset_norm == 0.0:
+            return points
+        key = ("phase", self._pin(points), offset_norm, n_samples)
+        return self._lookup(
+            key, lambda: apply_phase_shift_samples(points, offset_norm, n_samples, wrap=True)
+        )
+
+    def _lookup(self, key: Hashable, generate: Callable[[], R]) -> R:
+        if key in self._results:
+            self.hits += 1
+            result: R = self._results[key]
+            return result
+        self.misses += 1
+        value = generate()
+        self._results[key] = value
+        return value
+
+    def _pin(self, obj: object) -> int:
+        """Key an object by identity, keeping it alive for the cache's lifetime."""
+        self._pinned[id(obj)] = obj
+        return id(obj)
+
+    def _freeze(self, value: Any) -> Hashable:
+        """Convert params into a hashable key (models and unhashables by identity)."""
+        if isinstance(value, Mapping):
+            return tuple(sorted((str(k), self._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(self._freeze(v) for v in value)
+        if isinstance(value, BaseModel):
+            return ("model", self._pin(value))
+        try:
+            hash(value)
+        except TypeError:
+            return ("object", self._pin(value))
+        return (type(value).__name__, value)
@@ -15,11 +15,19 @@ from twinklr.core.sequencer.models.context import StepCompileContext
 from twinklr.core.sequencer.models.enum import ChannelName
 from twinklr.core.sequencer.models.template import TemplateStep
 from twinklr.core.sequencer.moving_heads.channels.state import FixtureSegment
+from twinklr.core.sequencer.moving_heads.compile.curve_cache import (
+    StepCurveCache,
+    calibration_fingerprint,
+)
+from twinklr.core.sequencer.moving_heads.handlers.protocols import PosedMovementHandler
 from twinklr.core.utils.logging import get_renderer_logger, log_performance
 
 logger = logging.getLogger(__name__)
 renderer_log = get_renderer_logger()
 
+# Movement params that vary per fixture; kept out of the shared shape key
+_POSE_PARAMS = frozenset({"base_pan_norm", "base_tilt_norm", "calibration"})
+
 
 class StepCompileResult(BaseModel):
     """Result of compiling a step.
@@ -45,6 +53,7 @@ def compile_step(
     step: TemplateStep,
     context: StepCompileContext,
     phase_offset_norm: float = 0.0,
+    curve_cache: StepCurveCache | None = None,
 ) -> StepCompileResult:
     """Compile a template step to IR segments.
 
@@ -55,6 +64,10 @@ def compile_step(
         step: The template step to compile.
         context: Compilation context with fixture info and registries.
         phase_offset_norm: Optional phase offset [0, 1] to apply to curves.
+        curve_cache: Optional per-compile cache. When given, movement shapes,
+            dimmer curves and phase-shifted variants are shared with other
+            fixtures instead of being regenerated; only the base pose is
+            applied per fixture.
 
     Returns:
         StepCompileResult with pan, tilt, and dimmer segments.
@@ -106,12 +119,55 @@ def compile_step(
     )
 
     # Generate movement curves (use the params dict that has movement_id injected)
-    movement_result = movement_handler.generate(
-        params=movement_params,
-        n_samples=context.n_samples,
-        cycles=step.movement.cycles,
-        intensity=step.movement.intensity,
-    )
+    def _generate_movement() -> Any:
+        return movement_handler.generate(
+            params=movement_params,
+            n_samples=context.n_samples,
+            cycles=step.movement.cycles,
+            intensity=step.movement.intensity,
+        )
+
+    if curve_cache is not None and isinstance(movement_handler, PosedMovementHandler):
+        # Share the pose-independent shape across fixtures, then center it on
+        # this fixture's base pose (shared again by fixtures with the same pose)
+        handler = movement_handler
+        shape = curve_cache.get_or_generate(
+            "movement_shape",
+            handler,
+            {k: v for k, v in movement_params.items() if k not in _POSE_PARAMS},
+            lambda: handler.generate_shape(
+                params=movement_params,
+                n_samples=context.n_samples,
+                cycles=step.movement.cycles,
+                intensity=step.movement.intensity,
+            ),
+            n_samples=context.n_samples,
+            cycles=step.movement.cycles,
+            intensity=step.movement.intensity,
+        )
+        movement_result = curve_cache.get_or_generate(
+            "movement",
+            handler,
+            {
+                "base_pan_norm": base_pan_norm,
+                "base_tilt_norm": base_tilt_norm,
+                "calibration": calibration_fingerprint(context.calibration),
+            },
+            lambda: handler.apply_pose(shape, movement_params),
+            shape=shape,
+        )
+    elif curve_cache is not None:
+        movement_result = curve_cache.get_or_generate(
+            "movement",
+            movement_handler,
+            {**movement_params, "calibration": calibration_fingerprint(context.calibration)},
+            _generate_movement,
+            n_samples=context.n_samples,
+            cycles=step.movement.cycles,
+            intensity=step.movement.intensity,
+        )
+    else:
+        movement_result = _generate_movement()
 
     # Build dimmer segment (absolute, not offset-centered)
     dimmer_params = dict(step.dimmer.params)
@@ -121,23 +177,43 @@ def compile_step(
     )
 
     # Generate dimmer curve (use the params dict that has dimmer_id injected)
-    dimmer_result = dimmer_handler.generate(
-        params=dimmer_params,
-        n_samples=context.n_samples,
-        cycles=step.dimmer.cycles,
-        intensity=step.dimmer.intensity,
-        min_norm=step.dimmer.min_norm,
-        max_norm=step.dimmer.max_norm,
-        template_duration_ms=context.duration_ms,  # Pass template duration for period conversion
-        beat_grid=context.beat_grid,  # Pass beat grid for period conversion
-    )
+    dimmer_args: dict[str, Any] = {
+        "n_samples": context.n_samples,
+        "cycles": step.dimmer.cycles,
+        "intensity": step.dimmer.intensity,
+        "min_norm": step.dimmer.min_norm,
+        "max_norm": step.dimmer.max_norm,
+        "template_duration_ms": context.duration_ms,  # Pass template duration for period conversion
+        "beat_grid": context.beat_grid,  # Pass beat grid for period conversion
+    }
+
+    def _generate_dimmer() -> Any:
+        return dimmer_handler.generate(params=dimmer_params, **dimmer_args)
+
+    if curve_cache is not None:
+        dimmer_result = curve_cache.get_or_generate(
+            "dimmer",
+            dimmer_handler,
+            {**dimmer_params, "calibration": calibration_fingerprint(context.calibration)},
+            _generate_dimmer,
+            **dimmer_args,
+        )
+    else:
+        dimmer_result = _generate_dimmer()
 
     # Apply phase offset if needed
     pan_points = movement_result.pan_curve
     tilt_points = movement_result.tilt_curve
     dimmer_points = dimmer_result.dimmer_curve
 
-    if phase_offset_norm != 0.0:
+    if curve_cache is not None:
+        # Fixtures sharing a base curve and offset share the shifted curve too
+        pan_points = curve_cache.phase_shifted(pan_points, phase_offset_norm, context.n_samples)
+        tilt_points = curve_cache.phase_shifted(tilt_points, phase_offset_norm, context.n_samples)
+        dimmer_points = curve_cache.phase_shifted(
+            dimmer_points, phase_offset_norm, context.n_samples
+        )
+    elif phase_offset_norm != 0.0:
         # Phase Offsets are time-domain based only shifts curves, no impact on static DMX values
         if pan_points is not None:
             pan_points = apply_phase_shift_samples(
@@ -18,6 +18,7 @@ from twinklr.core.sequencer.models.template import (
     TemplateStep,
 )
 from twinklr.core.sequencer.moving_heads.channels.state import ChannelValue, FixtureSegment
+from twinklr.core.sequencer.moving_heads.compile.curve_cache import StepCurveCache
 from twinklr.core.sequencer.moving_heads.compile.phase_offset import (
     PhaseOffsetResult,
     calculate_fixture_offsets,
@@ -113,8 +114,10 @@ def compile_template(
         step_durations=step_durations,
     )
 
-    # Compile each scheduled instance for each fixture
+    # Compile each scheduled instance for each fixture. Handler curves are
+    # memoized per compile so fixtures with identical inputs share them.
     all_segments: list[FixtureSegment] = []
+    curve_cache = StepCurveCache()
 
     for instance in schedule_result.instances:
         renderer_log.debug(f"Step: {instance.step_id}")
@@ -198,7 +201,7 @@ def compile_template(
             )
 
             # Compile the step
-            step_result = compile_step(step, step_context, phase_offset_norm)
+            step_result = compile_step(step, step_context, phase_offset_norm, curve_cache)
 
             # Mark segment as non-groupable if template uses phase offsets
             if uses_phase_offsets:
@@ -207,6 +210,8 @@ def compile_template(
             # Add segments
             all_segments.append(step_result.segment)
 
+    renderer_log.debug(f"Curve cache: {curve_cache.hits} hits, {curve_cache.misses} misses")
+
     # Clip segments to section boundary for TRUNCATE/FADE_OUT policies
     if schedule_result.remainder_policy in (RemainderPolicy.TRUNCATE, RemainderPolicy.FADE_OUT):
         section_end_ms = context.start_ms + int(context.duration_bars * context.ms_per_bar)
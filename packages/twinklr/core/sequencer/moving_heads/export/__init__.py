@@ -2,7 +2,15 @@
 
 from twinklr.core.sequencer.moving_heads.export.dmx_settings_builder import (
     DmxSettingsBuilder,
+    DmxSettingsCache,
 )
+from twinklr.core.sequencer.moving_heads.export.raster import FrameRaster, rasterize_segments
 from twinklr.core.sequencer.moving_heads.export.xsq_adapter import XsqAdapter
 
-__all__ = ["DmxSettingsBuilder", "XsqAdapter"]
+__all__ = [
+    "DmxSettingsBuilder",
+    "DmxSettingsCache",
+    "FrameRaster",
+    "XsqAdapter",
+    "rasterize_segments",
+]
@@ -7,6 +7,7 @@ Follows separation of concerns - only builds settings strings, no business logic
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -38,6 +39,46 @@ class DmxSettingsBuilder:
         self.fixture = fixture
         self.dmx_mapping = fixture.config.dmx_mapping
         self.inversions = fixture.config.inversions
+        self._channel_numbers = {name: self._get_dmx_channel_number(name) for name in ChannelName}
+        self._inversion_dict = self._get_inversion_dict()
+
+        # Everything about the fixture that affects settings strings: fixtures
+        # with the same channel mapping and inversions build identical strings.
+        self.fixture_key: Hashable = (
+            tuple(sorted((name.value, ch) for name, ch in self._channel_numbers.items())),
+            tuple(sorted(self._inversion_dict.items())),
+        )
+
+    def segment_fingerprint(self, segment: FixtureSegment) -> Hashable:
+        """Content key for the parts of a segment that affect its settings string.
+
+        Timing, ids and metadata are excluded; curve points are keyed by value.
+        Channel order is kept because it determines value-curve order in the string.
+
+        Args:
+            segment: FixtureSegment with channel values
+
+        Returns:
+            Hashable fingerprint, equal for segments that build the same string
+        """
+        channels = []
+        for channel_name, cv in segment.channels.items():
+            if self._channel_numbers.get(channel_name) is None:
+                continue
+            points = tuple((p.t, p.v) for p in cv.value_points) if cv.value_points else None
+            channels.append(
+                (
+                    channel_name.value,
+                    cv.static_dmx,
+                    cv.base_dmx,
+                    cv.amplitude_dmx,
+                    cv.offset_centered,
+                    cv.clamp_min,
+                    cv.clamp_max,
+                    points,
+                )
+            )
+        return tuple(channels)
 
     def build_settings_string(self, segment: FixtureSegment) -> str:
         """Build xLights DMX effect settings string from FixtureSegment.
@@ -65,7 +106,7 @@ class DmxSettingsBuilder:
         parts.append("B_CHOICE_BufferStyle=Per Model Default")
 
         # 2. Inversion flags for all channels (required)
-        inv_dict = self._get_inversion_dict()
+        inv_dict = self._inversion_dict
         for ch in range(1, max_channel + 1):
             parts.append(f"E_CHECKBOX_INVDMX{ch}={int(inv_dict.get(ch, 0))}")
 
@@ -105,7 +146,7 @@ class DmxSettingsBuilder:
             channel_curves: Output dict for value curves
         """
         # Get DMX channel number from fixture mapping
-        dmx_channel = self._get_dmx_channel_number(channel_name)
+        dmx_channel = self._channel_numbers.get(channel_name)
         if dmx_channel is None:
             return
 
@@ -326,3 +367,61 @@ class DmxSettingsBuilder:
 
         # xLights format requires trailing pipe
         return "|".join(parts) + "|"
+
+
+class DmxSettingsCache:
+    """Content-keyed memo of DMX settings strings across fixtures and segments.
+
+    Shows repeat the same few hundred settings across tens of thousands of
+    segments. Strings are keyed on the fixture's DMX mapping and inversions
+    plus the segment fingerprint, so repeats skip channel extraction, DMX
+    conversion and value-curve encoding entirely.
+
+    Example:
+        >>> cache = DmxSettingsCache()
+        >>> key = cache.fingerprint(segment, fixture)
+        >>> settings = cache.settings_for(key, segment, fixture)
+    """
+
+    def __init__(self) -> None:
+        self._builders: dict[str, tuple[FixtureInstance, DmxSettingsBuilder]] = {}
+        self._strings: dict[Hashable, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def builder_for(self, fixture: FixtureInstance) -> DmxSettingsBuilder:
+        """Return a builder for ``fixture``, reused while the fixture object is unchanged."""
+        cached = self._builders.get(fixture.fixture_id)
+        if cached is not None and cached[0] is fixture:
+            return cached[1]
+        builder = DmxSettingsBuilder(fixture)
+        self._builders[fixture.fixture_id] = (fixture, builder)
+        return builder
+
+    def fingerprint(self, segment: FixtureSegment, fixture: FixtureInstance) -> Hashable:
+        """Return the settings key for ``segment`` rendered on ``fixture``."""
+        builder = self.builder_for(fixture)
+        return (builder.fixture_key, builder.segment_fingerprint(segment))
+
+    def settings_for(self, key: Hashable, segment: FixtureSegment, fixture: FixtureInstance) -> str:
+        """Return the settings string for a fingerprint, building it on first use.
+
+        Args:
+            key: Fingerprint from ``fingerprint(segment, fixture)``
+            segment: FixtureSegment with channel values
+            fixture: Fixture instance providing DMX mapping and inversion flags
+
+        Returns:
+            xLights DMX effect settings string
+        """
+        settings = self._strings.get(key)
+        if settings is not None:
+            self.hits += 1
+            return settings
+        self.misses += 1
+        settings = self.builder_for(fixture).build_settings_string(segment)
+        self._strings[key] = settings
+        return settings
@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from collections.abc import Hashable
 from typing import TYPE_CHECKING
 
 from twinklr.core.formats.xlights.sequence.models.effect_placement import EffectPlacement
 from twinklr.core.sequencer.moving_heads.export.dmx_settings_builder import (
-    DmxSettingsBuilder,
+    DmxSettingsCache,
 )
 from twinklr.core.utils.fixtures import build_semantic_groups
 
@@ -31,7 +32,7 @@ class XsqAdapter:
     Handles:
     - Resolving xLights model names
     - Converting channel values to DMX settings strings
-    - Adding settings to XSQ EffectDB
+    - Adding settings to XSQ EffectDB (one entry per distinct settings fingerprint)
     - Creating EffectPlacement dataclasses with correct refs
     - Writing to groups when possible, individuals otherwise
 
@@ -40,6 +41,12 @@ class XsqAdapter:
         >>> placements = adapter.convert(segments, fixture_group, xsq)
     """
 
+    def __init__(self) -> None:
+        self._settings_cache = DmxSettingsCache()
+        # EffectDB refs by settings fingerprint, valid for _refs_xsq only
+        self._refs: dict[Hashable, int] = {}
+        self._refs_xsq: XSequence | None = None
+
     def convert(
         self,
         segments: list[FixtureSegment],
@@ -187,8 +194,7 @@ class XsqAdapter:
             # Convert segment to DMX settings string and add to EffectDB
             ref = 0
             if xsq is not None:
-                settings_str = self._segment_to_settings(segment, fixture)
-                ref = xsq.append_effectdb(settings_str)
+                ref = self._effectdb_ref(segment, fixture, xsq)
             else:
                 logger.debug("No XSQ provided, using ref=0 (no DMX channel data)")
 
@@ -316,10 +322,7 @@ class XsqAdapter:
                 # Convert to DMX settings string
                 ref = 0
                 if xsq is not None:
-                    settings_str = self._segment_to_settings(
-                        representative_segment, representative_fixture
-                    )
-                    ref = xsq.append_effectdb(settings_str)
+                    ref = self._effectdb_ref(representative_segment, representative_fixture, xsq)
 
                 # Create group effect with layer_index
                 placements.append(
@@ -398,15 +401,30 @@ class XsqAdapter:
 
         return True
 
-    def _segment_to_settings(self, segment: FixtureSegment, fixture: FixtureInstance) -> str:
-        """Convert FixtureSegment to DMX settings string.
+    def _effectdb_ref(
+        self, segment: FixtureSegment, fixture: FixtureInstance, xsq: XSequence
+    ) -> int:
+        """Get the EffectDB index for a segment, appending its settings on first use.
+
+        Segments with the same settings fingerprint share one EffectDB entry, and
+        repeats skip settings string construction entirely.
 
         Args:
             segment: FixtureSegment with channel values
             fixture: Fixture instance for DMX mapping
+            xsq: XSequence whose EffectDB receives the settings
 
         Returns:
-            xLights DMX effect settings string
+            EffectDB index for the segment's settings
         """
-        builder = DmxSettingsBuilder(fixture)
-        return builder.build_settings_string(segment)
+        if xsq is not self._refs_xsq:
+            self._refs = {}
+            self._refs_xsq = xsq
+
+        key = self._settings_cache.fingerprint(segment, fixture)
+        ref = self._refs.get(key)
+        if ref is None:
+            settings_str = self._settings_cache.settings_for(key, segment, fixture)
+            ref = xsq.append_effectdb(settings_str)
+            self._refs[key] = ref
+        return ref
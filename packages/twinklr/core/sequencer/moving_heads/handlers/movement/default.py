@@ -13,7 +13,7 @@ from twinklr.core.curves.library import CurveLibrary
 from twinklr.core.curves.models import CurvePoint
 from twinklr.core.curves.semantics import CurveKind
 from twinklr.core.sequencer.models.enum import Intensity
-from twinklr.core.sequencer.moving_heads.handlers.protocols import MovementResult
+from twinklr.core.sequencer.moving_heads.handlers.protocols import MovementResult, MovementShape
 from twinklr.core.sequencer.moving_heads.libraries.movement import DEFAULT_MOVEMENT_PARAMS
 from twinklr.core.utils.logging import get_renderer_logger, log_performance
 
@@ -68,6 +68,33 @@ class DefaultMovementHandler:
         Returns:
             MovementResult with curves scaled to fit within DMX constraints.
 
+        Raises:
+            ValueError: If handler is not correctly configured.
+        """
+        shape = self.generate_shape(
+            params=params, n_samples=n_samples, cycles=cycles, intensity=intensity
+        )
+        return self.apply_pose(shape, params)
+
+    def generate_shape(
+        self,
+        params: dict[str, Any],
+        n_samples: int,
+        cycles: float,
+        intensity: Intensity,
+    ) -> MovementShape:
+        """Generate the raw pan/tilt curves, independent of base pose and calibration.
+
+        Args:
+            params: Handler parameters (see ``generate``); base_pan_norm,
+                base_tilt_norm and calibration are not read.
+            n_samples: Number of samples to generate.
+            cycles: Number of movement cycles.
+            intensity: Intensity level (SLOW, SMOOTH, FAST, DRAMATIC).
+
+        Returns:
+            MovementShape with unscaled curves in [0, 1].
+
         Raises:
             ValueError: If handler is not correctly configured.
         """
@@ -91,6 +118,50 @@ class DefaultMovementHandler:
                 "Handler is not correctly configured. 'geometry' is missing from params."
             )
 
+        # Resolve amplitude (allow param override)
+        amplitude = self._resolve_amplitude(params, categorical_params.amplitude)
+        renderer_log.debug(f"Resolved Amplitude: {amplitude}")
+
+        renderer_log.debug(
+            f"Generating Pan Curve - type: {pattern.pan_curve.value}, amplitude: {amplitude}, frequency: {categorical_params.frequency}, center: {categorical_params.center_offset}"
+        )
+        pan_shape = self._generate_shape(
+            curve_type=pattern.pan_curve,
+            n_samples=n_samples,
+            cycles=cycles,
+            frequency=categorical_params.frequency,
+            params=self._filter_base_params("curve", "pan", base_params),
+        )
+
+        tilt_curve_def = pattern.resolve_tilt_curve(geometry)
+        tilt_shape = self._generate_shape(
+            curve_type=tilt_curve_def,
+            n_samples=n_samples,
+            cycles=cycles,
+            frequency=categorical_params.frequency,
+            params=self._filter_base_params("curve", "tilt", base_params),
+        )
+
+        return MovementShape(
+            pan_curve_type=pattern.pan_curve,
+            pan_shape=pan_shape,
+            tilt_curve_type=tilt_curve_def,
+            tilt_shape=tilt_shape,
+            amplitude=amplitude,
+            center_offset=categorical_params.center_offset,
+        )
+
+    def apply_pose(self, shape: MovementShape, params: dict[str, Any]) -> MovementResult:
+        """Center a shape on the fixture's base pose within its DMX limits.
+
+        Args:
+            shape: Result of ``generate_shape``.
+            params: Handler parameters with base_pan_norm, base_tilt_norm
+                and calibration (see ``generate``).
+
+        Returns:
+            MovementResult with curves scaled to fit within DMX constraints.
+        """
         calibration = params.get("calibration", {})
         pan_min = calibration.get("pan_min_dmx", 0) if calibration else 0
         pan_max = calibration.get("pan_max_dmx", 255) if calibration else 255
@@ -125,24 +196,14 @@ class DefaultMovementHandler:
             f"Max safe amplitude (norm): pan={pan_max_amplitude_norm:.3f}, tilt={tilt_max_amplitude_norm:.3f}"
         )
 
-        # Resolve amplitude (allow param override)
-        amplitude = self._resolve_amplitude(params, categorical_params.amplitude)
-        renderer_log.debug(f"Resolved Amplitude: {amplitude}")
-
-        # Generate pan curve scaled to fit within pan_min/pan_max
-        renderer_log.debug(
-            f"Generating Pan Curve - type: {pattern.pan_curve.value}, amplitude: {amplitude}, frequency: {categorical_params.frequency}, center: {categorical_params.center_offset}"
-        )
-        pan_curve = self._generate_curve(
-            curve_type=pattern.pan_curve,
-            n_samples=n_samples,
-            cycles=cycles,
-            amplitude=amplitude,
-            frequency=categorical_params.frequency,
-            center=categorical_params.center_offset,
+        # Scale pan curve to fit within pan_min/pan_max
+        pan_curve = self._place_curve(
+            curve_type=shape.pan_curve_type,
+            shape=shape.pan_shape,
+            amplitude=shape.amplitude,
+            center=shape.center_offset,
             base_norm=base_pan_norm,
             max_amplitude_norm=pan_max_amplitude_norm,
-            params=self._filter_base_params("curve", "pan", base_params),
         )
 
         if not pan_curve:
@@ -150,19 +211,14 @@ class DefaultMovementHandler:
         else:
             pan_static_dmx = None
 
-        # Generate tilt curve scaled to fit within tilt_min/tilt_max
-        tilt_curve_def = pattern.resolve_tilt_curve(geometry)
-
-        tilt_curve = self._generate_curve(
-            curve_type=tilt_curve_def,
-            n_samples=n_samples,
-            cycles=cycles,
-            amplitude=amplitude,
-            frequency=categorical_params.frequency,
-            center=categorical_params.center_offset,
+        # Scale tilt curve to fit within tilt_min/tilt_max
+        tilt_curve = self._place_curve(
+            curve_type=shape.tilt_curve_type,
+            shape=shape.tilt_shape,
+            amplitude=shape.amplitude,
+            center=shape.center_offset,
             base_norm=base_tilt_norm,
             max_amplitude_norm=tilt_max_amplitude_norm,
-            params=self._filter_base_params("curve", "tilt", base_params),
         )
 
         if not tilt_curve:
@@ -171,10 +227,10 @@ class DefaultMovementHandler:
             tilt_static_dmx = None
 
         return MovementResult(
-            pan_curve_type=pattern.pan_curve,
+            pan_curve_type=shape.pan_curve_type,
             pan_curve=pan_curve,
             pan_static_dmx=pan_static_dmx,
-            tilt_curve_type=tilt_curve_def,
+            tilt_curve_type=shape.tilt_curve_type,
             tilt_curve=tilt_curve,
             tilt_static_dmx=tilt_static_dmx,
         )
@@ -222,44 +278,81 @@ class DefaultMovementHandler:
         # Use default from categorical params
         return default_amplitude
 
-    def _generate_curve(
+    def _generate_shape(
         self,
         *,
         curve_type: CurveLibrary,
         n_samples: int,
         cycles: float,
-        amplitude: float,
         frequency: float,
-        center: float,
-        base_norm: float,
-        max_amplitude_norm: float,
         params: dict[str, Any] | None = None,
     ) -> list[CurvePoint] | None:
-        """Generate a movement curve scaled to fit within DMX constraints.
+        """Generate the unscaled movement curve in normalized [0, 1] space.
 
-        Intensity parameters (amplitude, frequency) are passed to the curve generator
-        to modulate the base curve shape. The center_offset parameter is applied here
-        at the handler level by offsetting the base position.
+        Intensity frequency is passed to the curve generator to modulate the
+        base curve shape. Amplitude and center offset are applied later by
+        ``_place_curve``, since they depend on the base pose.
 
         Args:
             curve_type: CurveLibrary enum value.
             n_samples: Number of samples.
             cycles: Number of cycles (base value, multiplied by frequency in curve).
-            amplitude: Requested amplitude [0, 1] from categorical params (scaled later).
             frequency: Frequency multiplier from categorical params (passed to curve).
+            params: Optional parameters to override defaults/presets.
+
+        Returns:
+            Raw curve points, or None for HOLD.
+        """
+        if curve_type == CurveLibrary.HOLD:
+            return None
+
+        # Build curve generation parameters with intensity params
+        curve_params = {
+            "cycles": cycles,
+            "frequency": frequency,  # Pass frequency to curve function
+            # NOTE: amplitude is NOT passed here - it's applied to the generated curve
+            # in _place_curve because we need to scale by max_amplitude_norm first
+            **(params or {}),
+        }
+
+        # Generate base curve - already in normalized [0, 1] space
+        return self._curve_gen.generate_custom_points(
+            curve_id=curve_type.value,
+            num_points=n_samples,
+            **curve_params,
+        )
+
+    def _place_curve(
+        self,
+        *,
+        curve_type: CurveLibrary,
+        shape: list[CurvePoint] | None,
+        amplitude: float,
+        center: float,
+        base_norm: float,
+        max_amplitude_norm: float,
+    ) -> list[CurvePoint] | None:
+        """Scale a raw movement curve to fit within DMX constraints.
+
+        The center_offset parameter is applied here by offsetting the base
+        position.
+
+        Args:
+            curve_type: CurveLibrary enum value the shape was generated from.
+            shape: Raw curve from ``_generate_shape`` (None for HOLD).
+            amplitude: Requested amplitude [0, 1] from categorical params.
             center: Center offset [0, 1] from categorical params (applied to base_norm).
             base_norm: Base position from geometry [0, 1].
             max_amplitude_norm: Maximum safe amplitude in normalized space before hitting constraints.
-            params: Optional parameters to override defaults/presets.
 
         Returns:
             List of curve points scaled to fit within fixture DMX limits.
 
         Note:
-            The curve is generated centered at base_norm (adjusted by center offset)
+            The curve is centered at base_norm (adjusted by center offset)
             with amplitude scaled to stay within fixture movement limits.
         """
-        if curve_type == CurveLibrary.HOLD:
+        if shape is None:
             return None
 
         # Apply center offset to base position (center is [0, 1] where 0.5 = no shift)
@@ -277,22 +370,6 @@ class DefaultMovementHandler:
             )
         adjusted_base_norm = max(0.0, min(1.0, adjusted_base_norm))
 
-        # Build curve generation parameters with intensity params
-        curve_params = {
-            "cycles": cycles,
-            "frequency": frequency,  # Pass frequency to curve function
-            # NOTE: amplitude is NOT passed here - it's applied to the generated curve below
-            # This is because we need to scale by max_amplitude_norm first
-            **(params or {}),
-        }
-
-        # Generate base curve - already in normalized [0, 1] space
-        base_curve = self._curve_gen.generate_custom_points(
-            curve_id=curve_type.value,
-            num_points=n_samples,
-            **curve_params,
-        )
-
         # Get curve definition to check kind
         curve_def = self._curve_gen._registry.get(curve_type.value)
 
@@ -323,7 +400,7 @@ class DefaultMovementHandler:
         if curve_def.kind == CurveKind.MOVEMENT_OFFSET:
             # Movement offset curves are already centered at 0.5
             # Re-center at adjusted_base_norm and scale amplitude
-            for point in base_curve:
+            for point in shape:
                 # Convert from [0, 1] centered at 0.5 to offset [-0.5, 0.5]
                 offset = point.v - 0.5
                 # Scale by effective amplitude
@@ -344,7 +421,7 @@ class DefaultMovementHandler:
         elif curve_def.kind == CurveKind.DIMMER_ABSOLUTE:
             # Absolute curves go from 0 to 1
             # Center them at adjusted_base_norm and apply amplitude
-            for point in base_curve:
+            for point in shape:
                 # Convert absolute [0, 1] to offset [-0.5, 0.5]
                 normalized_offset = point.v - 0.5
                 # Scale by effective amplitude
@@ -364,7 +441,7 @@ class DefaultMovementHandler:
 
         else:
             # Unknown curve kind - treat as offset for safety
-            for point in base_curve:
+            for point in shape:
                 offset = point.v - 0.5
                 scaled_offset = offset * (effective_amplitude / 0.5)
                 new_v = adjusted_base_norm + scaled_offset
@@ -10,7 +10,7 @@ and dimmer handlers. Each handler type has a specific contract:
 All handlers are pure functions that produce deterministic outputs.
 """
 
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -71,6 +71,32 @@ class MovementResult(BaseModel):
     tilt_static_dmx: int | None = None
 
 
+class MovementShape(BaseModel):
+    """Pose-independent movement curves from a movement handler.
+
+    Holds the raw generated curves before they are centered on a base pose
+    and scaled to a fixture's DMX limits, so fixtures that only differ in
+    pose or calibration can share them.
+
+    Attributes:
+        pan_curve_type: Curve used for pan.
+        pan_shape: Raw pan curve in [0, 1] (None for HOLD).
+        tilt_curve_type: Curve used for tilt.
+        tilt_shape: Raw tilt curve in [0, 1] (None for HOLD).
+        amplitude: Requested amplitude [0, 1].
+        center_offset: Center offset [0, 1] (0.5 = no shift).
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    pan_curve_type: CurveLibrary
+    pan_shape: list[CurvePoint] | None = None
+    tilt_curve_type: CurveLibrary
+    tilt_shape: list[CurvePoint] | None = None
+    amplitude: float
+    center_offset: float
+
+
 class DimmerResult(BaseModel):
     """Result from a dimmer handler.
 
@@ -166,6 +192,47 @@ class MovementHandler(Protocol):
         ...
 
 
+@runtime_checkable
+class PosedMovementHandler(MovementHandler, Protocol):
+    """Movement handler that can split generation at the base pose.
+
+    ``generate`` must equal ``apply_pose(generate_shape(...), params)``.
+    The step compiler uses the split to share shapes across fixtures.
+    """
+
+    def generate_shape(
+        self,
+        params: dict[str, Any],
+        n_samples: int,
+        cycles: float,
+        intensity: Intensity,
+    ) -> MovementShape:
+        """Generate the pose-independent curves.
+
+        Args:
+            params: Handler parameters; base pose and calibration are ignored.
+            n_samples: Number of samples to generate.
+            cycles: Number of motion cycles.
+            intensity: Intensity level (e.g., "SMOOTH", "DRAMATIC").
+
+        Returns:
+            MovementShape with raw pan/tilt curves.
+        """
+        ...
+
+    def apply_pose(self, shape: MovementShape, params: dict[str, Any]) -> MovementResult:
+        """Center a shape on the base pose within the calibration limits.
+
+        Args:
+            shape: Result of ``generate_shape``.
+            params: Handler parameters with base pose and calibration.
+
+        Returns:
+            MovementResult for the fixture.
+        """
+        ...
+
+
 class DimmerHandler(Protocol):
     """Protocol for dimmer handlers.
 
@@ -6,6 +6,11 @@ from dataclasses import dataclass
 from typing import Any
 
 from twinklr.core.sequencer.models.template import TemplateDoc
+from twinklr.core.sequencer.templates.shared.snapshot import (
+    RegistryStats,
+    SnapshotCache,
+    TemplateHandle,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +37,17 @@ class TemplateInfo:
 
 class TemplateRegistry:
     """
-    Registry stores factories so callers always get a fresh Template instance.
+    Registry stores factories and materializes each template once.
 
-    Factories return Template objects (Pydantic models).
+    Factories return Template objects (Pydantic models). get() hands out a
+    shared, deeply frozen snapshot; checkout() gives a copy-on-write handle.
     """
 
     def __init__(self) -> None:
         self._factories_by_id: dict[str, Callable[[], TemplateDoc]] = {}
         self._aliases: dict[str, str] = {}  # alias_key -> template_id
         self._info_by_id: dict[str, TemplateInfo] = {}
+        self._snapshots: SnapshotCache[str, TemplateDoc] = SnapshotCache()
 
     def register(
         self,
@@ -77,20 +84,31 @@ class TemplateRegistry:
             tags=tags,
         )
 
-    def get(self, key: str, *, deep_copy: bool = True) -> TemplateDoc:
-        """
-        Lookup by template_id OR name/alias (case/format insensitive).
-
-        deep_copy=True ensures no shared state between callers.
-        """
+    def _resolve(self, key: str) -> tuple[str, Callable[[], TemplateDoc]]:
         tid = self._aliases.get(_norm_key(key), key)
         factory = self._factories_by_id.get(tid)
         if not factory:
             raise TemplateNotFoundError(f"Unknown template: {key}")
+        return tid, factory
+
+    def get(self, key: str) -> TemplateDoc:
+        """
+        Lookup by template_id OR name/alias (case/format insensitive).
+
+        Returns the shared, deeply frozen snapshot (materialized once).
+        Use checkout() when the caller needs to mutate.
+        """
+        tid, factory = self._resolve(key)
+        return self._snapshots.get(tid, factory)
 
-        t = factory()
+    def checkout(self, key: str) -> TemplateHandle[TemplateDoc]:
+        """Copy-on-write handle: shared snapshot until mutable() is called."""
+        tid, factory = self._resolve(key)
+        return self._snapshots.checkout(tid, factory)
 
-        return t.model_copy(deep=True) if deep_copy else t
+    def stats(self) -> RegistryStats:
+        """Lookup, materialization and copy counters."""
+        return self._snapshots.stats()
 
     def list_all(self) -> list[TemplateInfo]:
         """List all registered templates sorted by category and name."""
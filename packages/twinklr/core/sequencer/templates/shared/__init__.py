@@ -16,11 +16,29 @@ from twinklr.core.sequencer.templates.shared.registry import (
     TemplateRegistry,
     normalize_key,
 )
+from twinklr.core.sequencer.templates.shared.snapshot import (
+    FrozenDict,
+    FrozenList,
+    RegistryStats,
+    SnapshotCache,
+    SnapshotMutationError,
+    TemplateHandle,
+    freeze_model,
+    thaw_model,
+)
 
 __all__ = [
     "BaseTemplateInfo",
+    "FrozenDict",
+    "FrozenList",
+    "RegistryStats",
+    "SnapshotCache",
+    "SnapshotMutationError",
+    "TemplateHandle",
     "TemplateNotFoundError",
     "TemplateProtocol",
     "TemplateRegistry",
+    "freeze_model",
     "normalize_key",
+    "thaw_model",
 ]
@@ -3,8 +3,10 @@
 Provides a type-safe, factory-based template registry that can be
 specialized for different template types (group, asset, etc.).
 
-Pattern: Factory-based registration prevents shared state bugs.
-Each get() call materializes a fresh instance from the factory.
+Pattern: Factory-based registration with copy-on-write snapshots.
+Each template is materialized once into a deeply frozen snapshot that is
+shared by every get() caller; checkout() hands out a copy-on-write handle
+for callers that need to mutate.
 """
 
 from __future__ import annotations
@@ -15,6 +17,12 @@ from typing import Generic, Protocol, TypeVar, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict
 
+from twinklr.core.sequencer.templates.shared.snapshot import (
+    RegistryStats,
+    SnapshotCache,
+    TemplateHandle,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,8 +89,9 @@ class BaseTemplateInfo(BaseModel):
 class TemplateRegistry(Generic[T, TInfo]):
     """Generic factory-based template registry.
 
-    Pattern: Factory-based registration prevents shared state bugs.
-    Each get() call materializes a fresh instance from the factory.
+    Pattern: Factory-based registration with copy-on-write snapshots.
+    get() returns a shared, deeply frozen snapshot materialized once per
+    template; checkout() returns a TemplateHandle for callers that mutate.
 
     Type Parameters:
         T: The template type (e.g., GroupPlanTemplate, AssetTemplate).
@@ -93,7 +102,8 @@ class TemplateRegistry(Generic[T, TInfo]):
         ...     info_factory=lambda t: TemplateInfo(...)
         ... )
         >>> registry.register(my_factory)
-        >>> template = registry.get("my_template")
+        >>> template = registry.get("my_template")  # frozen, shared
+        >>> editable = registry.checkout("my_template").mutable()  # private copy
     """
 
     def __init__(
@@ -113,6 +123,7 @@ class TemplateRegistry(Generic[T, TInfo]):
         self._info_by_id: dict[str, TInfo] = {}
         self._info_factory = info_factory
         self._name = name
+        self._snapshots: SnapshotCache[str, T] = SnapshotCache()
 
     def register(
         self,
@@ -150,32 +161,62 @@ class TemplateRegistry(Generic[T, TInfo]):
 
         logger.debug(f"Registered {self._name}: {tid}")
 
-    def get(self, key: str, *, deep_copy: bool = True) -> T:
+    def _resolve(self, key: str) -> tuple[str, Callable[[], T]]:
+        """Resolve key to (template_id, factory).
+
+        Raises:
+            TemplateNotFoundError: If template not found.
+        """
+        tid = self._aliases.get(normalize_key(key), key)
+        factory = self._factories_by_id.get(tid)
+
+        if not factory:
+            raise TemplateNotFoundError(f"Unknown {self._name}: {key}")
+
+        return tid, factory
+
+    def get(self, key: str) -> T:
         """Lookup template by template_id, name, or alias.
 
+        The template is materialized on first lookup and the same deeply
+        frozen snapshot is returned to every caller. Use checkout() to
+        obtain a mutable copy.
+
         Args:
             key: Template identifier (id, name, or alias).
-            deep_copy: Whether to return a deep copy (default: True).
 
         Returns:
-            Template instance.
+            Shared, immutable template snapshot.
 
         Raises:
             TemplateNotFoundError: If template not found.
         """
-        # Normalize key and lookup template_id
-        tid = self._aliases.get(normalize_key(key), key)
-        factory = self._factories_by_id.get(tid)
+        tid, factory = self._resolve(key)
+        return self._snapshots.get(tid, factory)
 
-        if not factory:
-            raise TemplateNotFoundError(f"Unknown {self._name}: {key}")
+    def checkout(self, key: str) -> TemplateHandle[T]:
+        """Get a copy-on-write handle for a template.
 
-        # Materialize fresh instance
-        t = factory()
+        Args:
+            key: Template identifier (id, name, or alias).
+
+        Returns:
+            Handle whose ``value`` is the shared snapshot until ``mutable()``
+            is called, which copies it once.
 
-        # Return deep copy to prevent shared state
-        # mypy doesn't understand that T.model_copy() returns T, not TemplateProtocol
-        return t.model_copy(deep=True) if deep_copy else t  # type: ignore[return-value]
+        Raises:
+            TemplateNotFoundError: If template not found.
+        """
+        tid, factory = self._resolve(key)
+        return self._snapshots.checkout(tid, factory)
+
+    def stats(self) -> RegistryStats:
+        """Get lookup, materialization and copy counters.
+
+        Returns:
+            RegistryStats snapshot.
+        """
+        return self._snapshots.stats()
 
     def get_info(self, key: str) -> TInfo | None:
         """Get template info by key without materializing.
@@ -0,0 +1,334 @@
+"""Immutable template snapshots with copy-on-write handles.
+
+Registries materialize each template once, deep-freeze it, and share the
+frozen snapshot between all readers. Callers that need to mutate a template
+check out a ``TemplateHandle`` that copies the snapshot on first write.
+
+Freezing is done in place:
+- Pydantic models are re-classed to a cached ``frozen=True`` subclass, so
+  ``isinstance`` checks and pydantic field validation keep working.
+- Lists and dicts are replaced with ``FrozenList``/``FrozenDict``, which
+  subclass the builtins (serialization is unchanged) but reject mutation.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, NoReturn, TypeVar, cast
+
+from pydantic import BaseModel, ConfigDict
+
+M = TypeVar("M", bound=BaseModel)
+# Snapshot type for handles/caches; registries bind it to template protocols
+S = TypeVar("S")
+
+
+class SnapshotMutationError(TypeError):
+    """Raised when attempting to mutate a frozen template snapshot."""
+
+    pass
+
+
+def _reject(*_args: Any, **_kwargs: Any) -> NoReturn:
+    raise SnapshotMutationError(
+        "Template snapshots are immutable; use checkout() to get a mutable copy"
+    )
+
+
+class FrozenList(list[Any]):
+    """List that rejects in-place mutation.
+
+    Subclasses ``list`` so pydantic serialization and ``isinstance`` checks
+    behave exactly as for the original field value.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _reject
+    append = extend = insert = pop = remove = clear = sort = reverse = _reject
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self) -> tuple[type[list[Any]], tuple[list[Any]]]:
+        return (list, (list(self),))
+
+
+class FrozenDict(dict[Any, Any]):
+    """Dict that rejects in-place mutation.
+
+    Subclasses ``dict`` so pydantic serialization and ``isinstance`` checks
+    behave exactly as for the original field value.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _reject
+    pop = popitem = clear = update = setdefault = _reject
+
+    def __copy__(self) -> dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[Any, Any]:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self) -> tuple[type[dict[Any, Any]], tuple[dict[Any, Any]]]:
+        return (dict, (dict(self),))
+
+
+# Frozen subclass -> original class (and the reverse cache)
+_ORIGINAL_BY_FROZEN: dict[type[BaseModel], type[BaseModel]] = {}
+_FROZEN_BY_ORIGINAL: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+def _original_class(model: BaseModel) -> type[BaseModel]:
+    cls = type(model)
+    return _ORIGINAL_BY_FROZEN.get(cls, cls)
+
+
+def _frozen_eq(self: BaseModel, other: object) -> object:
+    """Compare a frozen snapshot against frozen or mutable instances of the same model."""
+    if not isinstance(other, BaseModel) or _original_class(self) is not _original_class(other):
+        return NotImplemented
+    return bool(
+        self.__dict__ == other.__dict__
+        and self.__pydantic_private__ == other.__pydantic_private__
+        and self.__pydantic_extra__ == other.__pydantic_extra__
+    )
+
+
+def _frozen_class(cls: type[BaseModel]) -> type[BaseModel]:
+    """Get (or build once) the ``frozen=True`` subclass for a model class."""
+    frozen = _FROZEN_BY_ORIGINAL.get(cls)
+    if frozen is None:
+        frozen = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "model_config": ConfigDict(**{**cls.model_config, "frozen": True}),
+                "__eq__": _frozen_eq,
+                "__hash__": None,
+            },
+        )
+        _FROZEN_BY_ORIGINAL[cls] = frozen
+        _ORIGINAL_BY_FROZEN[frozen] = cls
+    return frozen
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return freeze_model(value)
+    if isinstance(value, FrozenList | FrozenDict):
+        return value
+    if isinstance(value, list):
+        return FrozenList(_freeze_value(v) for v in value)
+    if isinstance(value, dict):
+        return FrozenDict({k: _freeze_value(v) for k, v in value.items()})
+    if isinstance(value, tuple):
+        return tuple(_freeze_value(v) for v in value)
+    return value
+
+
+def freeze_model(model: M) -> M:
+    """Deep-freeze a pydantic model in place.
+
+    Nested models, lists and dicts are frozen recursively. Freezing is
+    idempotent, so shared sub-models are safe.
+
+    Args:
+        model: Model instance to freeze (typically fresh from a factory).
+
+    Returns:
+        The same instance, now immutable.
+    """
+    cls = type(model)
+    if cls not in _ORIGINAL_BY_FROZEN and not cls.model_config.get("frozen"):
+        object.__setattr__(model, "__class__", _frozen_class(cls))
+
+    fields = model.__dict__
+    for name, value in fields.items():
+        fields[name] = _freeze_value(value)
+    return model
+
+
+def is_frozen(model: BaseModel) -> bool:
+    """Check whether a model instance is a frozen snapshot."""
+    return type(model) in _ORIGINAL_BY_FROZEN or bool(model.model_config.get("frozen"))
+
+
+def _thaw_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return thaw_model(value)
+    if isinstance(value, list):
+        return [_thaw_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _thaw_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_thaw_value(v) for v in value)
+    return copy.deepcopy(value)
+
+
+def thaw_model(model: M) -> M:
+    """Build a mutable deep copy of a (possibly frozen) model.
+
+    Field values were validated when the snapshot was built, so the copy is
+    assembled without re-validation.
+
+    Args:
+        model: Frozen snapshot (or any model instance).
+
+    Returns:
+        New instance of the original (non-frozen) model class.
+    """
+    thawed = model.model_copy()
+    object.__setattr__(thawed, "__class__", _original_class(model))
+    fields = thawed.__dict__
+    for name, value in fields.items():
+        fields[name] = _thaw_value(value)
+    if thawed.__pydantic_private__:
+        object.__setattr__(
+            thawed, "__pydantic_private__", copy.deepcopy(thawed.__pydantic_private__)
+        )
+    return thawed
+
+
+class TemplateHandle(Generic[S]):
+    """Copy-on-write handle over a shared template snapshot.
+
+    ``value`` exposes the current view (the shared snapshot until the first
+    write). ``mutable()`` copies the snapshot once and returns the private copy
+    on every subsequent call.
+
+    Example:
+        >>> handle = registry.checkout("my_template")
+        >>> handle.value.name  # shared snapshot, no copy
+        >>> handle.mutable().tags.append("custom")  # copies once
+    """
+
+    __slots__ = ("_copy", "_on_copy", "_snapshot")
+
+    def __init__(self, snapshot: S, *, on_copy: Callable[[], None] | None = None) -> None:
+        """Initialize handle.
+
+        Args:
+            snapshot: Frozen shared snapshot.
+            on_copy: Optional callback invoked when the snapshot is copied.
+        """
+        self._snapshot = snapshot
+        self._copy: S | None = None
+        self._on_copy = on_copy
+
+    @property
+    def value(self) -> S:
+        """Current view: the private copy if written, else the shared snapshot."""
+        return self._copy if self._copy is not None else self._snapshot
+
+    @property
+    def is_copied(self) -> bool:
+        """Whether the snapshot has been copied for writing."""
+        return self._copy is not None
+
+    def mutable(self) -> S:
+        """Get a mutable private copy, copying the snapshot on first call."""
+        if self._copy is None:
+            self._copy = cast(S, thaw_model(cast(BaseModel, self._snapshot)))
+            if self._on_copy is not None:
+                self._on_copy()
+        return self._copy
+
+
+class RegistryStats(BaseModel):
+    """Lookup and materialization counters for a snapshot-caching registry.
+
+    Attributes:
+        lookups: Number of successful get()/checkout() lookups.
+        materializations: Number of factory calls made to build snapshots.
+        copies: Number of copy-on-write copies made from snapshots.
+        cached: Number of snapshots currently held.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    lookups: int = 0
+    materializations: int = 0
+    copies: int = 0
+    cached: int = 0
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SnapshotCache(Generic[K, S]):
+    """Materialize-once cache of frozen model snapshots.
+
+    Shared by template registries: each key's factory is called at most once
+    (until invalidated) and the frozen result is handed to every caller.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty cache with zeroed counters."""
+        self._snapshots: dict[K, S] = {}
+        self._lookups = 0
+        self._materializations = 0
+        self._copies = 0
+
+    def get(self, key: K, factory: Callable[[], S]) -> S:
+        """Get the frozen snapshot for key, materializing it on first use.
+
+        Args:
+            key: Cache key (template_id).
+            factory: Factory producing a fresh instance for the key.
+
+        Returns:
+            Shared, deeply frozen snapshot.
+        """
+        self._lookups += 1
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = cast(S, freeze_model(cast(BaseModel, factory())))
+            self._materializations += 1
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def checkout(self, key: K, factory: Callable[[], S]) -> TemplateHandle[S]:
+        """Get a copy-on-write handle for key.
+
+        Args:
+            key: Cache key (template_id).
+            factory: Factory producing a fresh instance for the key.
+
+        Returns:
+            Handle wrapping the shared snapshot.
+        """
+        return TemplateHandle(self.get(key, factory), on_copy=self._count_copy)
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop one cached snapshot (or all when key is None)."""
+        if key is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(key, None)
+
+    def stats(self) -> RegistryStats:
+        """Snapshot of lookup/materialization counters."""
+        return RegistryStats(
+            lookups=self._lookups,
+            materializations=self._materializations,
+            copies=self._copies,
+            cached=len(self._snapshots),
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the counters (cached snapshots are kept)."""
+        self._lookups = 0
+        self._materializations = 0
+        self._copies = 0
+
+    def _count_copy(self) -> None:
+        self._copies += 1
@@ -21,12 +21,11 @@ from uuid import uuid4
 from twinklr.core.agents.logging import LLMCallLogger, NullLLMCallLogger, create_llm_logger
 from twinklr.core.agents.providers.base import LLMProvider
 from twinklr.core.agents.providers.factory import create_llm_provider
-from twinklr.core.audio.analyzer import AudioAnalyzer
-from twinklr.core.caching import Cache
+from twinklr.core.caching import Cache, create_cache
 from twinklr.core.caching.backends.fs import FSCache
 from twinklr.core.caching.backends.null import NullCache
+from twinklr.core.caching.backends.sqlite import SQLiteCache
 from twinklr.core.config.models import AppConfig, ConfigBase, JobConfig
-from twinklr.core.io import RealFileSystem, absolute_path
 
 T = TypeVar("T", bound=ConfigBase)
 
@@ -146,13 +145,14 @@ class TwinklrSession:
         """
         if not hasattr(self, "_agent_cache"):
             cache_enabled = self.job_config.agent.agent_cache.enabled if self.job_config else False
-            agent_cache: FSCache | NullCache
+            agent_cache: FSCache | SQLiteCache | NullCache
             if cache_enabled:
                 cache_config = self.job_config.agent.agent_cache
-                agent_cache = FSCache(
-                    RealFileSystem(),
-                    absolute_path(cache_config.cache_path),
+                agent_cache = create_cache(
+                    cache_config.backend,
+                    cache_config.cache_path,
                     ttl_seconds=cache_config.ttl_seconds,
+                    max_bytes=cache_config.max_bytes,
                 )
             else:
                 agent_cache = NullCache()
@@ -191,12 +191,23 @@ class TwinklrSession:
             enabled = self.job_config.agent.llm_logging.enabled if self.job_config else False
 
             if enabled:
+                logging_config = self.job_config.agent.llm_logging
                 self._llm_logger = create_llm_logger(
                     enabled=enabled,
-                    output_dir=self.job_config.agent.llm_logging.log_path,
+                    output_dir=logging_config.log_path,
                     session_id=self.session_id,
-                    log_level=self.job_config.agent.llm_logging.log_level,
-                    format=self.job_config.agent.llm_logging.format,
+                    log_level=logging_config.log_level,
+                    format=logging_config.format,
+                    storage=logging_config.storage,
+                    segment_max_bytes=int(logging_config.segment_max_mb * 1024 * 1024),
+                    retention_max_age_days=logging_config.retention_max_age_days,
+                    retention_max_bytes=(
+                        int(logging_config.retention_max_mb * 1024 * 1024)
+                        if logging_config.retention_max_mb is not None
+                        else None
+                    ),
+                    queue_size=logging_config.queue_size,
+                    queue_full_policy=logging_config.queue_full_policy,
                 )
             else:
                 self._llm_logger = NullLLMCallLogger()
@@ -213,5 +224,8 @@ class TwinklrSession:
             AudioAnalyzer instance configured with session configs
         """
         if not hasattr(self, "_audio"):
+            # Deferred: pulls in librosa/numba/g2p, which CLI startup must not pay
+            from twinklr.core.audio.analyzer import AudioAnalyzer
+
             self._audio = AudioAnalyzer(self.app_config, self.job_config)
         return self._audio
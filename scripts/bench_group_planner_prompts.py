@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Benchmark: prompt preparation overhead of a full group-planner run.
+
+Runs GroupPlannerOrchestrator over several sections against a zero-latency
+fake provider (planner → validator → section judge, with one refinement
+iteration per section), so wall time is almost entirely prompt loading,
+rendering, schema/taxonomy injection and validation.
+
+Two modes are compared:
+- cold: prompt file, schema-example and taxonomy caches are cleared before
+  every LLM call (the previous behaviour: re-read + re-parse every call)
+- warm: caches persist across calls (compiled-pack cache)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+from typing import Any
+
+from twinklr.core.agents.prompts.loader import clear_prompt_cache
+from twinklr.core.agents.providers.base import (
+    LLMResponse,
+    ProviderType,
+    ResponseMetadata,
+    TokenUsage,
+)
+from twinklr.core.agents.schema_utils import _schema_example_cached
+from twinklr.core.agents.sequencer.group_planner.context import SectionPlanningContext
+from twinklr.core.agents.sequencer.group_planner.orchestrator import GroupPlannerOrchestrator
+from twinklr.core.agents.sequencer.group_planner.timing import (
+    BarInfo,
+    SectionBounds,
+    TimingContext,
+)
+from twinklr.core.agents.taxonomy_utils import _get_taxonomy_cached
+from twinklr.core.sequencer.templates.group.catalog import TemplateCatalog, TemplateInfo
+from twinklr.core.sequencer.templates.group.models.choreography import (
+    ChoreographyGraph,
+    ChoreoGroup,
+)
+from twinklr.core.sequencer.timing import TimeRef
+from twinklr.core.sequencer.vocabulary import GroupTemplateType, GroupVisualIntent
+from twinklr.core.sequencer.vocabulary.timing import TimeRefKind
+
+_BAR_MS = 2000
+
+
+def _clear_caches() -> None:
+    clear_prompt_cache()
+    _schema_example_cached.cache_clear()
+    _get_taxonomy_cached.cache_clear()
+
+
+class FakeProvider:
+    """Zero-latency provider: canned plan for the planner, verdicts for the judge.
+
+    The judge soft-fails the first evaluation of each section and approves
+    the second, so every section exercises the refinement prompt path.
+    """
+
+    def __init__(self, before_call: Callable[[], None] | None = None) -> None:
+        self._before_call = before_call
+        self._usage = TokenUsage()
+        self._judge_calls: dict[str, int] = {}
+        self.calls = 0
+        self.section_id = ""
+
+    @property
+    def provider_type(self) -> ProviderType:
+        return ProviderType.OPENAI
+
+    def get_token_usage(self) -> TokenUsage:
+        return self._usage
+
+    def reset_token_tracking(self) -> None:
+        self._usage = TokenUsage()
+
+    def _respond(self, content: dict[str, Any]) -> LLMResponse:
+        self.calls += 1
+        self._usage = TokenUsage(
+            prompt_tokens=self._usage.prompt_tokens + 1000,
+            completion_tokens=self._usage.completion_tokens + 200,
+            total_tokens=self._usage.total_tokens + 1200,
+        )
+        return LLMResponse(
+            content=content,
+            metadata=ResponseMetadata(token_usage=TokenUsage(1000, 200, 1200), model="fake"),
+        )
+
+    async def generate_json_with_conversation_async(self, **kwargs: Any) -> LLMResponse:
+        if self._before_call:
+            self._before_call()
+        return self._respond(_plan(self.section_id))
+
+    async def generate_json_async(self, **kwargs: Any) -> LLMResponse:
+        if self._before_call:
+            self._before_call()
+        n = self._judge_calls.get(self.section_id, 0)
+        self._judge_calls[self.section_id] = n + 1
+        score = 6.0 if n == 0 else 8.5
+        return self._respond(
+            {
+                "status": "SOFT_FAIL" if n == 0 else "APPROVE",
+                "score": score,
+                "confidence": 0.8,
+                "strengths": ["Clear focus", "Good pacing"],
+                "issues": [],
+                "overall_assessment": "Solid section plan.",
+                "feedback_for_planner": "Add a little more contrast.",
+                "score_breakdown": {"musicality": score},
+                "iteration": n,
+            }
+        )
+
+
+def _plan(section_id: str) -> dict[str, Any]:
+    return {
+        "section_id": section_id,
+        "theme": {
+            "theme_id": "christmas.test_theme",
+            "scope": "SECTION",
+            "tags": ["test"],
+            "palette_id": None,
+        },
+        "lane_plans": [
+            {
+                "lane": "ACCENT",
+                "target_roles": ["HERO"],
+                "coordination_plans": [
+                    {
+                        "coordination_mode": "UNIFIED",
+                        "targets": [{"type": "group", "id": "HERO_1"}],
+                        "placements": [
+                            {
+                                "placement_id": "p1",
+                                "target": {"type": "group", "id": "HERO_1"},
+                                "template_id": "gtpl_accent_flash",
+                                "start": {"bar": 1, "beat": 1},
+                                "duration": "HIT",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def _section_contexts(n_sections: int) -> list[SectionPlanningContext]:
+    graph = ChoreographyGraph(
+        graph_id="bench",
+        groups=[ChoreoGroup(id="HERO_1", role="HERO"), ChoreoGroup(id="ARCHES_1", role="ARCHES")],
+    )
+    catalog = TemplateCatalog(
+        entries=[
+            TemplateInfo(
+                template_id="gtpl_base_glow_warm",
+                version="1.0",
+                name="Warm BG",
+                template_type=GroupTemplateType.BASE,
+                visual_intent=GroupVisualIntent.ABSTRACT,
+                tags=(),
+            ),
+            TemplateInfo(
+                template_id="gtpl_accent_flash",
+                version="1.0",
+                name="Flash",
+                template_type=GroupTemplateType.ACCENT,
+                visual_intent=GroupVisualIntent.TEXTURE,
+                tags=(),
+            ),
+        ]
+    )
+    bars_per_section = 4
+    n_bars = n_sections * bars_per_section
+    timing = TimingContext(
+        song_duration_ms=n_bars * _BAR_MS,
+        beats_per_bar=4,
+        bar_map={
+            b: BarInfo(bar=b, start_ms=(b - 1) * _BAR_MS, duration_ms=_BAR_MS)
+            for b in range(1, n_bars + 1)
+        },
+        section_bounds={
+            f"section_{i}": SectionBounds(
+                section_id=f"section_{i}",
+                start=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=i * bars_per_section + 1, beat=1),
+                end=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=(i + 1) * bars_per_section, beat=4),
+            )
+            for i in range(n_sections)
+        },
+    )
+    return [
+        SectionPlanningContext(
+            section_id=f"section_{i}",
+            section_name="verse",
+            start_ms=i * bars_per_section * _BAR_MS,
+            end_ms=(i + 1) * bars_per_section * _BAR_MS,
+            energy_target="MED",
+            motion_density="MED",
+            choreography_style="HYBRID",
+            primary_focus_targets=["HERO"],
+            secondary_targets=["ARCHES"],
+            notes=None,
+            choreo_graph=graph,
+            template_catalog=catalog,
+            timing_context=timing,
+        )
+        for i in range(n_sections)
+    ]
+
+
+async def _run(contexts: list[SectionPlanningContext], *, cold: bool) -> tuple[float, int, int]:
+    _clear_caches()
+    provider = FakeProvider(before_call=_clear_caches if cold else None)
+    orchestrator = GroupPlannerOrchestrator(
+        provider=provider,  # type: ignore[arg-type]
+        max_iterations=3,
+    )
+    approved = 0
+    start = time.perf_counter()
+    for ctx in contexts:
+        provider.section_id = ctx.section_id
+        result = await orchestrator.run(ctx, run_id="bench")
+        approved += int(result.success)
+    return time.perf_counter() - start, provider.calls, approved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=12, help="Sections per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best is kept)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    contexts = _section_contexts(args.sections)
+    rows = []
+    for mode in ("cold", "warm"):
+        runs = [asyncio.run(_run(contexts, cold=mode == "cold")) for _ in range(args.repeat)]
+        elapsed, calls, approved = min(runs)
+        rows.append((mode, elapsed, calls, approved))
+
+    print(f"{'mode':<6}{'total (ms)':>12}{'calls':>8}{'per call (ms)':>15}{'approved':>10}")
+    for mode, elapsed, calls, approved in rows:
+        per_call = elapsed / max(calls, 1) * 1e3
+        print(f"{mode:<6}{elapsed * 1e3:>12.1f}{calls:>8}{per_call:>15.2f}{approved:>10}")
+    print(f"speedup: {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-call overhead of sync wrappers around async methods.
+
+Compares a fresh ``asyncio.run()`` per call (the previous SyncAdapter
+behaviour) with ``run_sync()`` on the shared bridge loop, for a trivial
+coroutine and for FSCacheSync.exists() on a real cache root.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+import tempfile
+import time
+
+from twinklr.core.caching import CacheKey, FSCache
+from twinklr.core.io import RealFileSystem, absolute_path, run_sync, shutdown_sync_bridge
+
+
+async def _noop() -> None:
+    return None
+
+
+def _per_call_us(fn: Callable[[], object], calls: int) -> float:
+    fn()  # Warm up (starts the bridge thread on first run_sync)
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FSCache(RealFileSystem(), absolute_path(str(Path(tmp))))
+        key = CacheKey(domain="bench", step_id="bench", step_version="1", input_fingerprint="x")
+
+        rows = [
+            (
+                "noop coroutine",
+                _per_call_us(lambda: asyncio.run(_noop()), args.calls),
+                _per_call_us(lambda: run_sync(_noop()), args.calls),
+            ),
+            (
+                "FSCache.exists (miss)",
+                _per_call_us(lambda: asyncio.run(cache.exists(key)), args.calls),
+                _per_call_us(lambda: run_sync(cache.exists(key)), args.calls),
+            ),
+        ]
+    shutdown_sync_bridge()
+
+    print(f"{'call':<24}{'asyncio.run (us)':>18}{'run_sync (us)':>16}{'speedup':>10}")
+    for name, before, after in rows:
+        print(f"{name:<24}{before:>18.1f}{after:>16.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,10 +28,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from twinklr.core.agents.assets.catalog import (
-    load_catalog,
-    save_catalog,
-)
+from twinklr.core.agents.assets.catalog import AssetCatalogStore
 from twinklr.core.agents.assets.generator import generate_asset
 from twinklr.core.agents.assets.image_client import OpenAIImageClient
 from twinklr.core.agents.assets.models import (
@@ -543,8 +540,9 @@ async def run_pipeline(
     # Step 2: Load catalog for reuse check
     # -----------------------------------------------------------------------
     assets_dir = output_dir / "assets"
-    catalog_path = assets_dir / "asset_catalog.json"
-    catalog = load_catalog(catalog_path)
+    catalog_path = assets_dir / "asset_catalog.jsonl"
+    catalog_store = AssetCatalogStore(catalog_path, legacy_path=assets_dir / "asset_catalog.json")
+    catalog = catalog_store.load()
     print_section("Step 2: Check Existing Catalog")
     print(f"  Existing entries: {len(catalog.entries)}")
 
@@ -704,7 +702,7 @@ async def run_pipeline(
     # -----------------------------------------------------------------------
     print_section("Step 5: Update Catalog")
     catalog.merge(new_entries)
-    save_catalog(catalog, catalog_path)
+    catalog_store.save(catalog)
     print(f"  Catalog saved: {catalog_path}")
     print(f"  Total entries: {len(catalog.entries)}")
     print(f"  Created: {catalog.total_created}")
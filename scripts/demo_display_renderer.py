@@ -345,20 +345,23 @@ def print_result_summary(result: RenderResult) -> None:
 
 
 def load_catalog(catalog_path: Path) -> object:
-    """Load an AssetCatalog from a JSON file.
+    """Load an AssetCatalog from its JSON Lines log (or a legacy JSON catalog).
 
     Args:
-        catalog_path: Path to asset_catalog.json.
+        catalog_path: Path to asset_catalog.jsonl, or a legacy asset_catalog.json
+            (imported into a sibling .jsonl log on first load).
 
     Returns:
         AssetCatalog with all entries.
     """
-    from twinklr.core.agents.assets.models import AssetCatalog
+    from twinklr.core.agents.assets.catalog import AssetCatalogStore
 
     logger.info("Loading asset catalog from %s", catalog_path)
-    with catalog_path.open() as f:
-        data = json.load(f)
-    catalog = AssetCatalog.model_validate(data)
+    if catalog_path.suffix == ".jsonl":
+        store = AssetCatalogStore(catalog_path)
+    else:
+        store = AssetCatalogStore(catalog_path.with_suffix(".jsonl"), legacy_path=catalog_path)
+    catalog = store.load()
     logger.info(
         "Catalog loaded: %d entries (%d created, %d cached, %d failed)",
         len(catalog.entries),
@@ -416,7 +419,7 @@ def main() -> None:
         "--catalog",
         type=Path,
         default=None,
-        help="Path to asset_catalog.json (enables asset overlay rendering)",
+        help="Path to asset_catalog.jsonl (enables asset overlay rendering)",
     )
     parser.add_argument(
         "--asset-base-path",
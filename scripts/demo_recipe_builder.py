@@ -75,6 +75,12 @@ def parse_args() -> argparse.Namespace:
         default=0.9,
         help="LLM sampling temperature (higher = more creative).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum LLM requests in flight at once.",
+    )
     parser.add_argument(
         "--promote",
         action="store_true",
@@ -119,6 +125,7 @@ def main() -> int:
     print(f"  max_opportunities : {args.max_opportunities}")
     print(f"  model             : {args.model}")
     print(f"  temperature       : {args.temperature}")
+    print(f"  concurrency       : {args.concurrency}")
 
     # Create LLM client (unless dry-run)
     llm_client = None
@@ -143,6 +150,7 @@ def main() -> int:
         llm_client=llm_client,
         llm_model=args.model,
         llm_temperature=args.temperature,
+        llm_max_concurrency=args.concurrency,
         max_opportunities=args.max_opportunities,
     )
 
@@ -1,5 +1,6 @@
 """Tests for IssueRepository and cross-job learning system."""
 
+import asyncio
 import json
 from pathlib import Path
 import tempfile
@@ -7,7 +8,7 @@ import time
 
 import pytest
 
-from twinklr.core.agents.analytics.repository import IssueRecord, IssueRepository
+from twinklr.core.agents.analytics.repository import IssueRecord, IssueRepository, VerdictRecord
 from twinklr.core.agents.issues import (
     Issue,
     IssueCategory,
@@ -448,3 +449,134 @@ def test_empty_issues_list(repository):
 
     # No file should be created
     assert not (repository.storage_dir / "test_judge_issues.jsonl").exists()
+
+
+def test_verdict_round_trip(repository):
+    """Verdict samples are stored per agent and read back oldest first."""
+    for i, score in enumerate([8.5, 4.0, 7.0]):
+        repository.record_verdict(
+            VerdictRecord(
+                agent_name="test_judge",
+                job_id=f"job_{i}",
+                iteration=1,
+                score=score,
+                status="APPROVE" if score >= 7.0 else "SOFT_FAIL",
+                features={"coverage": 0.1 * i},
+                timestamp=time.time(),
+            )
+        )
+
+    verdicts = repository.read_verdicts("test_judge")
+
+    assert [v.score for v in verdicts] == [8.5, 4.0, 7.0]
+    assert verdicts[2].features == {"coverage": pytest.approx(0.2)}
+    assert repository.read_verdicts("test_judge", max_records=1)[0].job_id == "job_2"
+    assert (repository.storage_dir / "test_judge_verdicts.jsonl").exists()
+    assert repository.get_top_issues("test_judge") == []
+
+
+def test_verdicts_recorded_in_event_loop_are_written_off_loop(repository):
+    """Inside a running loop, record_verdict buffers instead of writing inline."""
+    path = repository.storage_dir / "test_judge_verdicts.jsonl"
+
+    async def record() -> bool:
+        repository.record_verdict(
+            VerdictRecord(
+                agent_name="test_judge",
+                job_id="job_0",
+                iteration=1,
+                score=8.0,
+                status="APPROVE",
+                timestamp=time.time(),
+            )
+        )
+        written_inline = path.exists()
+        await repository.aflush()
+        return written_inline
+
+    assert asyncio.run(record()) is False
+    assert [v.job_id for v in repository.read_verdicts("test_judge")] == ["job_0"]
+
+
+def _record(repository: IssueRepository, issue: Issue, job_id: str) -> None:
+    repository.record_issues(
+        issues=[issue],
+        agent_name="test_judge",
+        job_id=job_id,
+        iteration=1,
+        verdict_score=6.0,
+        timestamp=time.time(),
+    )
+
+
+def test_index_reloads_from_snapshot_and_tail(repository, sample_issue, temp_storage, monkeypatch):
+    """A fresh process resumes from the snapshot and scans only appended lines."""
+    from twinklr.core.agents.analytics import repository as repository_module
+
+    for i in range(3):
+        _record(repository, sample_issue, f"job_{i}")
+
+    snapshot = json.loads((temp_storage / "test_judge_issues.index.json").read_text())
+    assert snapshot["total"] == 3
+    assert snapshot["offset"] == (temp_storage / "test_judge_issues.jsonl").stat().st_size
+
+    # Another writer appends past the snapshot offset
+    external = IssueRecord(
+        issue=sample_issue.model_copy(update={"category": IssueCategory.COVERAGE}),
+        agent_name="test_judge",
+        job_id="job_external",
+        iteration=1,
+        verdict_score=5.0,
+        timestamp=time.time(),
+    )
+    with (temp_storage / "test_judge_issues.jsonl").open("a") as f:
+        f.write(external.model_dump_json() + "\n")
+
+    monkeypatch.setattr(repository_module, "_LOGS", {})
+    stats = IssueRepository(storage_dir=temp_storage).get_stats("test_judge")
+
+    assert stats["total_issues"] == 4
+    assert stats["unique_categories"] == 2
+    assert stats["most_common_category"] == "VARIETY"
+
+
+def test_history_beyond_window_reads_log(repository, sample_issue, monkeypatch):
+    """Queries wider than the in-memory window fall back to the log."""
+    from twinklr.core.agents.analytics import repository as repository_module
+
+    monkeypatch.setattr(repository_module, "INDEX_WINDOW", 2)
+    for i in range(5):
+        _record(repository, sample_issue, f"job_{i}")
+
+    assert len(repository._recent_records("test_judge", max_records=2)) == 2
+    records = repository._recent_records("test_judge", max_records=None)
+    assert [r.job_id for r in records] == [f"job_{i}" for i in range(5)]
+    assert repository.get_stats("test_judge")["total_issues"] == 5
+
+
+def test_record_in_event_loop_buffers_until_flush(repository, sample_issue, temp_storage):
+    """Inside a running loop appends are indexed immediately and written off-loop."""
+
+    async def record_and_flush() -> int:
+        for i in range(3):
+            _record(repository, sample_issue, f"job_{i}")
+        # Learning context is served from the index before anything hits disk
+        assert "(3x)" in repository.format_learning_context("test_judge")
+        await repository.aflush()
+        return len((temp_storage / "test_judge_issues.jsonl").read_text().splitlines())
+
+    assert asyncio.run(record_and_flush()) == 3
+
+
+def test_most_common_category_counts_whole_log(repository, sample_issue, monkeypatch):
+    """The top category reflects all recorded issues, not just the recent window."""
+    from twinklr.core.agents.analytics import repository as repository_module
+
+    monkeypatch.setattr(repository_module, "INDEX_WINDOW", 2)
+    coverage_issue = sample_issue.model_copy(update={"category": IssueCategory.COVERAGE})
+    for i in range(3):
+        _record(repository, sample_issue, f"job_{i}")
+    for i in range(2):
+        _record(repository, coverage_issue, f"job_cov_{i}")
+
+    assert repository.get_stats("test_judge")["most_common_category"] == "VARIETY"
@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from PIL import Image
+
 from twinklr.core.agents.assets.catalog import (
+    AssetCatalogStore,
     check_reuse,
+    check_reuse_similar,
     compute_prompt_hash,
     load_catalog,
     save_catalog,
@@ -17,6 +21,7 @@ from twinklr.core.agents.assets.models import (
     AssetStatus,
     CatalogEntry,
 )
+from twinklr.core.agents.assets.perceptual_hash import perceptual_hash_file
 from twinklr.core.sequencer.vocabulary import BackgroundMode
 
 
@@ -284,3 +289,114 @@ class TestCheckReuseBySpecId:
 
         result = check_reuse_by_spec_id(catalog, spec)
         assert result is None
+
+
+class TestAssetCatalogStore:
+    """Tests for the append-only JSON Lines catalog store."""
+
+    def test_save_appends_only_changed_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "asset_catalog.jsonl"
+        store = AssetCatalogStore(path, compact_ratio=10.0)
+        catalog = store.load()
+        catalog.merge([_make_entry(asset_id="a1"), _make_entry(asset_id="a2")])
+
+        assert store.save(catalog) == 2
+        assert store.save(catalog) == 0
+
+        catalog.merge([_make_entry(asset_id="a1", prompt_hash="new_hash")])
+        assert store.save(catalog) == 1
+        assert len(path.read_text().splitlines()) == 3
+
+        reloaded = AssetCatalogStore(path).load()
+        assert len(reloaded.entries) == 2
+        entry = reloaded.get("a1")
+        assert entry is not None
+        assert entry.prompt_hash == "new_hash"
+
+    def test_append_writes_one_entry_and_save_skips_it(self, tmp_path: Path) -> None:
+        path = tmp_path / "asset_catalog.jsonl"
+        store = AssetCatalogStore(path, compact_ratio=10.0)
+        catalog = store.load()
+        entry = _make_entry(asset_id="a1")
+        catalog.merge([entry])
+
+        assert store.append(entry) is True
+        assert store.append(entry) is False
+        assert store.save(catalog) == 0
+        assert [e.asset_id for e in AssetCatalogStore(path).load().entries] == ["a1"]
+
+    def test_compacts_when_superseded_lines_dominate(self, tmp_path: Path) -> None:
+        path = tmp_path / "asset_catalog.jsonl"
+        store = AssetCatalogStore(path, compact_ratio=2.0)
+        catalog = store.load()
+        for i in range(3):
+            catalog.merge([_make_entry(asset_id="a1", prompt_hash=f"h{i}")])
+            store.save(catalog)
+
+        assert len(path.read_text().splitlines()) <= 2
+        reloaded = AssetCatalogStore(path).load()
+        assert [e.prompt_hash for e in reloaded.entries] == ["h2"]
+
+    def test_imports_legacy_json_and_skips_corrupt_lines(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "asset_catalog.json"
+        save_catalog(AssetCatalog(catalog_id="old", entries=[_make_entry()]), legacy)
+        path = tmp_path / "asset_catalog.jsonl"
+
+        catalog = AssetCatalogStore(path, legacy_path=legacy).load()
+        assert len(catalog.entries) == 1
+        assert path.exists()
+
+        with path.open("a") as f:
+            f.write('{"asset_id": "torn"\n')
+        reloaded = AssetCatalogStore(path, legacy_path=legacy).load()
+        assert [e.asset_id for e in reloaded.entries] == ["test_asset"]
+
+
+class TestCheckReuseSimilar:
+    """Tests for perceptual-hash backed reuse across specs of the same subject."""
+
+    def _image_entry(self, tmp_path: Path, color: tuple[int, int, int]) -> CatalogEntry:
+        file_path = tmp_path / "snowman.png"
+        img = Image.new("RGB", (64, 64), color)
+        img.paste((255, 255, 255), (16, 8, 48, 56))
+        img.save(file_path)
+        spec = _make_spec().model_copy(
+            update={"spec_id": "asset_image_cutout_d1", "narrative_subject": "Snowman"}
+        )
+        return _make_entry(asset_id="asset_image_cutout_d1", file_path=str(file_path)).model_copy(
+            update={"spec": spec, "perceptual_hash": perceptual_hash_file(file_path)}
+        )
+
+    def _new_spec(self, subject: str) -> AssetSpec:
+        return _make_spec(prompt=None).model_copy(  # type: ignore[arg-type]
+            update={"spec_id": "asset_image_cutout_d9", "narrative_subject": subject}
+        )
+
+    def test_same_subject_reuses_existing_image(self, tmp_path: Path) -> None:
+        entry = self._image_entry(tmp_path, (0, 0, 0))
+        catalog = AssetCatalog(catalog_id="test", entries=[entry])
+
+        result = check_reuse_similar(catalog, self._new_spec("snowman"))
+        assert result is not None
+        assert result.asset_id == "asset_image_cutout_d1"
+        assert check_reuse_similar(catalog, self._new_spec("reindeer")) is None
+
+    def test_same_subject_with_different_description_is_not_reused(self, tmp_path: Path) -> None:
+        entry = self._image_entry(tmp_path, (0, 0, 0))
+        catalog = AssetCatalog(catalog_id="test", entries=[entry])
+
+        melting = self._new_spec("snowman").model_copy(
+            update={"narrative_description": "A snowman melting in the spring sun"}
+        )
+        assert check_reuse_similar(catalog, melting) is None
+
+    def test_file_changed_on_disk_is_not_reused(self, tmp_path: Path) -> None:
+        entry = self._image_entry(tmp_path, (0, 0, 0))
+        catalog = AssetCatalog(catalog_id="test", entries=[entry])
+
+        # Overwrite with a visually different image (gradient)
+        img = Image.new("L", (64, 64))
+        img.putdata([(x * 4) % 256 for _ in range(64) for x in range(64)][::-1])
+        img.save(entry.file_path)
+
+        assert check_reuse_similar(catalog, self._new_spec("snowman")) is None
@@ -175,3 +175,23 @@ class TestGenerateAsset:
         entry = await generate_asset(spec, tmp_path, image_client=mock_client)
         assert entry.status == AssetStatus.FAILED
         assert "API exploded" in (entry.error or "")
+
+    @pytest.mark.asyncio
+    async def test_image_dimension_mismatch_fails_without_reading_file(
+        self, tmp_path: Path
+    ) -> None:
+        """Validation uses the client's in-memory result; no file is decoded."""
+        spec = _make_image_spec()
+        mock_client = _make_mock_image_client(
+            result=ImageResult(
+                file_path=str(tmp_path / "never_written.png"),
+                content_hash="sha256_abc",
+                file_size_bytes=4096,
+                width=512,
+                height=512,
+            )
+        )
+
+        entry = await generate_asset(spec, tmp_path, image_client=mock_client)
+        assert entry.status == AssetStatus.FAILED
+        assert "Dimension mismatch" in (entry.error or "")
@@ -376,3 +376,15 @@ class TestAssetCatalog:
         """build_index on empty catalog returns empty dict."""
         catalog = AssetCatalog(catalog_id="empty", entries=[])
         assert catalog.build_index() == {}
+
+    def test_indexes_follow_merge_and_direct_append(self) -> None:
+        """Lookups see entries added by merge and by appending to entries."""
+        catalog = AssetCatalog(catalog_id="cat_001", entries=[_make_entry(asset_id="a1")])
+        assert catalog.get("a1") is not None
+
+        catalog.merge([_make_entry(asset_id="a2", prompt_hash="h2")])
+        catalog.entries.append(_make_entry(asset_id="a3", prompt_hash="h3"))
+
+        assert catalog.find_by_prompt_hash("h2") is not None
+        assert catalog.get("a3") is not None
+        assert len(catalog.find_by_category(AssetCategory.IMAGE_TEXTURE)) == 3
@@ -0,0 +1,136 @@
+"""Tests for the per-backend asset job scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from twinklr.core.agents.assets.models import (
+    AssetCategory,
+    AssetSpec,
+    AssetStatus,
+    CatalogEntry,
+)
+from twinklr.core.agents.assets.scheduler import AssetJobScheduler
+from twinklr.core.sequencer.vocabulary import BackgroundMode
+
+
+def _spec(spec_id: str, category: AssetCategory, section_id: str = "s1") -> AssetSpec:
+    return AssetSpec(
+        spec_id=spec_id,
+        category=category,
+        theme_id="theme.holiday.traditional",
+        section_ids=[section_id],
+        background=BackgroundMode.OPAQUE,
+    )
+
+
+def _entry(spec: AssetSpec) -> CatalogEntry:
+    return CatalogEntry(
+        asset_id=spec.spec_id,
+        spec=spec,
+        file_path=f"{spec.spec_id}.png",
+        content_hash="sha256",
+        status=AssetStatus.CREATED,
+        width=spec.width,
+        height=spec.height,
+        file_size_bytes=1,
+        created_at="2026-02-10T12:00:00Z",
+        source_plan_id="plan_001",
+        generation_model="test-model",
+        prompt_hash="hash",
+    )
+
+
+class TestAssetJobScheduler:
+    @pytest.mark.asyncio
+    async def test_concurrency_capped_per_backend(self) -> None:
+        """Image and text jobs each stay within their own cap."""
+        active = {"image": 0, "text": 0}
+        peak = {"image": 0, "text": 0}
+
+        async def generate(spec: AssetSpec) -> CatalogEntry:
+            backend = "image" if spec.category.is_image() else "text"
+            active[backend] += 1
+            peak[backend] = max(peak[backend], active[backend])
+            await asyncio.sleep(0.01)
+            active[backend] -= 1
+            return _entry(spec)
+
+        specs = [_spec(f"img{i}", AssetCategory.IMAGE_TEXTURE) for i in range(6)]
+        specs += [_spec(f"txt{i}", AssetCategory.TEXT_BANNER) for i in range(4)]
+        scheduler = AssetJobScheduler(concurrency={"image": 2, "text": 3})
+
+        entries = await scheduler.run(specs, generate)
+
+        assert [e.asset_id for e in entries] == [s.spec_id for s in specs]
+        assert peak == {"image": 2, "text": 3}
+
+    @pytest.mark.asyncio
+    async def test_priority_order_and_progress_callback(self) -> None:
+        """Lower priority ranks start first; each completion is reported."""
+        started: list[str] = []
+        completed: list[str] = []
+        rank = {"intro": 0, "verse": 1, "outro": 2}
+
+        async def generate(spec: AssetSpec) -> CatalogEntry:
+            started.append(spec.spec_id)
+            return _entry(spec)
+
+        specs = [
+            _spec("outro_art", AssetCategory.IMAGE_CUTOUT, "outro"),
+            _spec("intro_art", AssetCategory.IMAGE_CUTOUT, "intro"),
+            _spec("verse_art", AssetCategory.IMAGE_CUTOUT, "verse"),
+        ]
+        scheduler = AssetJobScheduler(
+            concurrency={"image": 1},
+            on_complete=lambda entry: completed.append(entry.asset_id),
+        )
+
+        await scheduler.run(specs, generate, priority=lambda s: rank[s.section_ids[0]])
+
+        assert started == ["intro_art", "verse_art", "outro_art"]
+        assert completed == started
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_jobs(self) -> None:
+        """A raising job stops sibling workers; queued jobs never run or record."""
+        started: list[str] = []
+        completed: list[str] = []
+        release = asyncio.Event()
+
+        async def generate(spec: AssetSpec) -> CatalogEntry:
+            started.append(spec.spec_id)
+            if spec.spec_id == "boom":
+                raise RuntimeError("generator failed")
+            await release.wait()
+            return _entry(spec)
+
+        specs = [
+            _spec("boom", AssetCategory.IMAGE_CUTOUT),
+            _spec("blocked", AssetCategory.IMAGE_CUTOUT),
+            _spec("queued1", AssetCategory.IMAGE_CUTOUT),
+            _spec("queued2", AssetCategory.IMAGE_CUTOUT),
+        ]
+        scheduler = AssetJobScheduler(
+            concurrency={"image": 2},
+            on_complete=lambda entry: completed.append(entry.asset_id),
+        )
+
+        with pytest.raises(RuntimeError, match="generator failed"):
+            await scheduler.run(specs, generate)
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert started == ["boom", "blocked"]
+        assert completed == []
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self) -> None:
+        async def generate(spec: AssetSpec) -> CatalogEntry:
+            raise AssertionError("not called")
+
+        assert await AssetJobScheduler().run([], generate) == []
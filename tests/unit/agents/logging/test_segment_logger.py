@@ -0,0 +1,161 @@
+"""Tests for the batched, segmented LLM call logger."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from twinklr.core.agents.logging import (
+    SegmentedLLMLogger,
+    export_call_files,
+    prune_segments,
+    read_call_logs,
+)
+
+_PROMPTS = {"system": "sys", "user": "Plan the chorus.", "developer": "dev"}
+
+
+def _make_logger(tmp_path: Path, **kwargs: object) -> SegmentedLLMLogger:
+    return SegmentedLLMLogger(
+        output_dir=tmp_path, run_id="run", session_id="sess", sanitize=False, **kwargs
+    )
+
+
+async def _log_call(logger: SegmentedLLMLogger, agent: str, iteration: int, ok: bool) -> str:
+    call_id = await logger.start_call_async(
+        agent_name=agent,
+        agent_mode="oneshot",
+        iteration=iteration,
+        model="gpt-test",
+        temperature=0.5,
+        prompts=_PROMPTS,
+        context={"section_id": "chorus_1"},
+    )
+    await logger.complete_call_async(
+        call_id=call_id,
+        raw_response={"raw": True},
+        validated_response={"plan": iteration} if ok else None,
+        validation_errors=[] if ok else ["bad plan"],
+        tokens_used=100,
+        prompt_tokens=80,
+        completion_tokens=20,
+        duration_seconds=1.0,
+        success=ok,
+        repair_attempts=0,
+    )
+    return call_id
+
+
+@pytest.mark.asyncio
+async def test_calls_land_in_one_segment_with_summary(tmp_path: Path) -> None:
+    """Calls are appended to a single gzip segment; the summary is kept incrementally."""
+    logger = _make_logger(tmp_path)
+    ids = [await _log_call(logger, "planner", i, ok=i != 2) for i in range(1, 4)]
+    await logger.close_async()
+
+    segments = list((tmp_path / "segments" / "sess").iterdir())
+    assert [p.name for p in segments] == ["calls-000001.jsonl.gz"]
+    assert not (tmp_path / "planner").exists()
+
+    logs = list(read_call_logs(tmp_path / "segments"))
+    assert [log.call_id for log in logs] == ids
+    assert logs[0].validated_response == {"plan": 1}
+    assert [log.call_id for log in read_call_logs(segments[0], call_id=ids[1])] == [ids[1]]
+
+    summary = json.loads((tmp_path / "summary_sess.json").read_text())
+    assert summary["total_calls"] == 3
+    assert summary["failed_calls"] == 1
+    assert summary["status"] == "partial"
+    assert summary["errors"] == ["bad plan"]
+
+
+@pytest.mark.asyncio
+async def test_segments_rotate_and_export_per_call_files(tmp_path: Path) -> None:
+    """Small segments rotate per batch; export rebuilds the per-call layout."""
+    logger = _make_logger(tmp_path, segment_max_bytes=1)
+    for i in range(1, 4):
+        await _log_call(logger, "planner", i, ok=True)
+        await logger.flush_async()
+    await _log_call(logger, "judge", 1, ok=True)
+    await logger.close_async()
+
+    assert len(list((tmp_path / "segments" / "sess").glob("*.jsonl.gz"))) == 4
+
+    out = tmp_path / "export"
+    assert export_call_files(tmp_path / "segments", out, format="json", agent_name="planner") == 3
+    files = sorted(p.name for p in (out / "planner" / "sess").iterdir())
+    assert files == ["iter_01_call_001.json", "iter_02_call_002.json", "iter_03_call_003.json"]
+    exported = json.loads((out / "planner" / "sess" / files[0]).read_text())
+    assert "call_num" not in exported
+    assert exported["agent_name"] == "planner"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_instead_of_blocking(tmp_path: Path) -> None:
+    """With the drop policy a full queue never stalls the caller."""
+    logger = _make_logger(tmp_path, queue_size=1)
+    for i in range(1, 4):
+        await _log_call(logger, "planner", i, ok=True)
+    await logger.close_async()
+
+    assert logger.dropped_records == 2
+    assert len(list(read_call_logs(tmp_path / "segments"))) == 1
+    summary = json.loads((tmp_path / "summary_sess.json").read_text())
+    assert summary["total_calls"] == 3
+    assert summary["errors"] == ["2 call logs dropped"]
+
+
+@pytest.mark.asyncio
+async def test_truncated_segment_reads_complete_batches(tmp_path: Path) -> None:
+    """A batch cut off mid-write does not hide the batches before it."""
+    logger = _make_logger(tmp_path)
+    await _log_call(logger, "planner", 1, ok=True)
+    await logger.close_async()
+
+    segment = logger.current_segment
+    partial = gzip.compress(b'{"call_id": "lost"}\n' * 50)
+    with segment.open("ab") as f:
+        f.write(partial[:10])  # Header of a member whose data never made it
+
+    assert [log.iteration for log in read_call_logs(segment)] == [1]
+
+
+def test_prune_segments_by_age_and_size(tmp_path: Path) -> None:
+    """Expired segments go first, then the oldest until under the size cap."""
+    session = tmp_path / "sess"
+    session.mkdir()
+    now = time.time()
+    for n, age_days in ((1, 40), (2, 3), (3, 2), (4, 1)):
+        path = session / f"calls-{n:06d}.jsonl.gz"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    assert prune_segments(tmp_path, max_age_days=30) == 1
+    kept = session / "calls-000002.jsonl.gz"
+    assert prune_segments(tmp_path, max_total_bytes=250, keep={kept}) == 1
+    assert sorted(p.name for p in session.iterdir()) == [
+        "calls-000002.jsonl.gz",
+        "calls-000004.jsonl.gz",
+    ]
+
+
+def test_prune_segments_accepts_session_dir_and_segment_file(tmp_path: Path) -> None:
+    """Pruning a session directory or a single segment file removes expired segments."""
+    old = time.time() - 40 * 86400
+    paths = []
+    for session in ("a", "b"):
+        (tmp_path / session).mkdir()
+        for n in (1, 2):
+            path = tmp_path / session / f"calls-{n:06d}.jsonl.gz"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (old, old))
+            paths.append(path)
+
+    assert prune_segments(tmp_path / "a", max_age_days=30) == 2
+    assert prune_segments(tmp_path / "b" / "calls-000001.jsonl.gz", max_age_days=30) == 1
+    assert [p.exists() for p in paths] == [False, False, False, True]
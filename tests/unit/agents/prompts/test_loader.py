@@ -196,3 +196,51 @@ def test_load_with_refinement_fallback_to_user():
 
     # Should fall back to user.j2
     assert "user" in prompts
+
+
+def test_compiled_templates_reused_until_file_changes(tmp_path: Path):
+    """Templates compile once per file version and recompile after an edit."""
+    import os
+
+    from twinklr.core.agents.prompts.loader import clear_prompt_cache
+
+    clear_prompt_cache()
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    system = pack / "system.j2"
+    system.write_text("Hello {{ name }}")
+
+    loader = PromptPackLoader(base_path=tmp_path)
+    compile_calls: list[str] = []
+    original_compile = loader.renderer.compile
+
+    def counting_compile(template: str):
+        compile_calls.append(template)
+        return original_compile(template)
+
+    loader.renderer.compile = counting_compile  # type: ignore[method-assign]
+
+    assert loader.load_and_render("pack", {"name": "a"})["system"] == "Hello a"
+    assert loader.load_and_render("pack", {"name": "b"})["system"] == "Hello b"
+    assert len(compile_calls) == 1
+
+    # Shared across loader instances
+    other = PromptPackLoader(base_path=tmp_path)
+    assert other.load_and_render("pack", {"name": "c"})["system"] == "Hello c"
+    assert len(compile_calls) == 1
+
+    system.write_text("Goodbye {{ name }}!")
+    stat = system.stat()
+    os.utime(system, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert loader.load_and_render("pack", {"name": "d"})["system"] == "Goodbye d!"
+    assert len(compile_calls) == 2
+
+
+def test_cached_examples_not_shared_between_calls():
+    """Mutating a returned examples list does not corrupt the cache."""
+    loader = PromptPackLoader(base_path=FIXTURES_PATH)
+
+    first = loader.load("test_pack")["examples"]
+    first.append({"role": "user", "content": "extra"})
+
+    assert len(loader.load("test_pack")["examples"]) == 2
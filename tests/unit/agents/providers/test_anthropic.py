@@ -6,7 +6,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from twinklr.core.agents.providers.base import LLMResponse, ProviderType, TokenUsage
+from twinklr.core.agents.providers.base import (
+    CACHE_BREAKPOINT_KEY,
+    LLMResponse,
+    ProviderType,
+    TokenUsage,
+)
 from twinklr.core.agents.providers.conversation import generate_conversation_id
 from twinklr.core.agents.providers.errors import LLMProviderError
 
@@ -462,3 +467,74 @@ def test_factory_creates_anthropic_provider() -> None:
 
     assert isinstance(provider, AnthropicProvider)
     assert provider.provider_type == ProviderType.ANTHROPIC
+
+
+# ---------------------------------------------------------------------------
+# Prompt caching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_cache_breakpoints_become_cache_control(mock_anthropic_clients: dict) -> None:
+    """Marked messages end cached blocks; the marker key never reaches the API."""
+    provider = _make_provider(mock_anthropic_clients)
+    async_client = mock_anthropic_clients["async_client"]
+
+    messages = [
+        {"role": "developer", "content": "schema", CACHE_BREAKPOINT_KEY: "1"},
+        {"role": "system", "content": "rules", CACHE_BREAKPOINT_KEY: "1"},
+        {"role": "user", "content": "catalog", CACHE_BREAKPOINT_KEY: "1"},
+        {"role": "user", "content": "plan"},
+    ]
+    await provider.generate_json_async(messages=messages, model="claude-sonnet-4-20250514")
+
+    call_kwargs = async_client.messages.create.call_args.kwargs
+    assert call_kwargs["system"] == [
+        {"type": "text", "text": "schema", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}},
+    ]
+    assert call_kwargs["messages"] == [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "catalog", "cache_control": {"type": "ephemeral"}}
+            ],
+        },
+        {"role": "user", "content": "plan"},
+    ]
+
+
+def test_cached_tokens_folded_into_prompt_tokens(mock_anthropic_clients: dict) -> None:
+    """Cache reads/writes count as prompt tokens; reads are reported as cached."""
+    provider = _make_provider(mock_anthropic_clients)
+    usage = mock_anthropic_clients["sync_msg"].usage
+    usage.input_tokens = 50
+    usage.cache_creation_input_tokens = 0
+    usage.cache_read_input_tokens = 2000
+
+    result = provider.generate_json(
+        messages=[{"role": "user", "content": "test"}], model="claude-sonnet-4-20250514"
+    )
+
+    assert result.metadata.token_usage.prompt_tokens == 2050
+    assert result.metadata.token_usage.cached_prompt_tokens == 2000
+    assert provider.get_token_usage().cached_prompt_tokens == 2000
+
+
+def test_conversation_system_prompt_is_cached(mock_anthropic_clients: dict) -> None:
+    """A conversation's fixed system prompt is sent as a cached block each turn."""
+    provider = _make_provider(mock_anthropic_clients)
+    sync_client = mock_anthropic_clients["sync_client"]
+    conv_id = generate_conversation_id("planner", 0)
+
+    for text in ("Plan", "Refine"):
+        provider.generate_json_with_conversation(
+            user_message=text,
+            conversation_id=conv_id,
+            model="claude-sonnet-4-20250514",
+            system_prompt="You are a planner.",
+        )
+
+    first, second = (c.kwargs["system"] for c in sync_client.messages.create.call_args_list)
+    assert first == second
+    assert first[0]["cache_control"] == {"type": "ephemeral"}
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
 import pytest
 
-from twinklr.core.agents.providers.base import ProviderType, TokenUsage
+from twinklr.core.agents.providers.base import CACHE_BREAKPOINT_KEY, ProviderType, TokenUsage
 from twinklr.core.agents.providers.conversation import generate_conversation_id
 from twinklr.core.agents.providers.errors import LLMProviderError
 from twinklr.core.agents.providers.openai import OpenAIProvider
@@ -328,6 +328,43 @@ async def test_generate_json_async_passes_supported_kwargs() -> None:
     assert request_kwargs["max_output_tokens"] == 120
 
 
+@pytest.mark.asyncio
+async def test_generate_json_async_strips_markers_and_reports_cached_tokens() -> None:
+    """Cache markers are removed from the request; cached input tokens are reported."""
+    response = MagicMock()
+    response.output_text = '{"ok": true}'
+    response.id = "resp_3"
+    response.usage = MagicMock(input_tokens=3000, output_tokens=20, total_tokens=3020)
+    response.usage.prompt_tokens = None
+    response.usage.completion_tokens = None
+    response.usage.input_tokens_details = MagicMock(cached_tokens=2048)
+
+    messages = [
+        {"role": "developer", "content": "schema", CACHE_BREAKPOINT_KEY: "1"},
+        {"role": "user", "content": "plan"},
+    ]
+
+    with (
+        patch("twinklr.core.agents.providers.openai.OpenAIClient"),
+        patch("twinklr.core.agents.providers.openai.AsyncOpenAI") as mock_async_openai,
+    ):
+        mock_client = MagicMock()
+        mock_client.responses.create = AsyncMock(return_value=response)
+        mock_async_openai.return_value = mock_client
+        provider = OpenAIProvider(api_key="test-key")
+
+        result = await provider.generate_json_async(messages=messages, model="gpt-5")
+
+    sent = mock_client.responses.create.call_args.kwargs["input"]
+    assert sent == [
+        {"role": "developer", "content": "schema"},
+        {"role": "user", "content": "plan"},
+    ]
+    assert result.metadata.token_usage.prompt_tokens == 3000
+    assert result.metadata.token_usage.cached_prompt_tokens == 2048
+    assert provider.get_token_usage().cached_prompt_tokens == 2048
+
+
 @pytest.mark.asyncio
 async def test_generate_json_async_retries_transient_errors() -> None:
     """Async path should retry transient OpenAI API errors before succeeding."""
@@ -250,3 +250,23 @@ class TestGroupPlannerOrchestrator:
         assert variables["energy_target"] == "MED"
         assert "display_graph" in variables
         assert "template_catalog" in variables
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_prejudge_settings(
+        self,
+        mock_provider: MagicMock,
+        sample_section_context: SectionPlanningContext,
+    ) -> None:
+        """Pre-judge settings change the cached plan key."""
+        orchestrator = GroupPlannerOrchestrator(provider=mock_provider)
+        base_key = await orchestrator.get_cache_key(sample_section_context)
+
+        orchestrator.config = orchestrator.config.model_copy(update={"enable_prejudge": False})
+        disabled_key = await orchestrator.get_cache_key(sample_section_context)
+
+        orchestrator.config = orchestrator.config.model_copy(
+            update={"enable_prejudge": True, "prejudge_approve_threshold": 0.99}
+        )
+        stricter_key = await orchestrator.get_cache_key(sample_section_context)
+
+        assert len({base_key, disabled_key, stricter_key}) == 3
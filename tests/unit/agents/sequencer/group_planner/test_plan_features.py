@@ -0,0 +1,143 @@
+"""Tests for section-plan pre-judge features."""
+
+from __future__ import annotations
+
+import pytest
+
+from twinklr.core.agents.sequencer.group_planner.context import SectionPlanningContext
+from twinklr.core.agents.sequencer.group_planner.plan_features import (
+    FEATURE_HINTS,
+    build_section_plan_featurizer,
+)
+from twinklr.core.agents.sequencer.group_planner.timing import (
+    BarInfo,
+    SectionBounds,
+    TimingContext,
+)
+from twinklr.core.sequencer.planning import LanePlan, SectionCoordinationPlan
+from twinklr.core.sequencer.templates.group.catalog import TemplateCatalog, TemplateInfo
+from twinklr.core.sequencer.templates.group.models import CoordinationPlan, GroupPlacement
+from twinklr.core.sequencer.templates.group.models.choreography import (
+    ChoreographyGraph,
+    ChoreoGroup,
+)
+from twinklr.core.sequencer.templates.group.models.coordination import PlanTarget
+from twinklr.core.sequencer.timing import TimeRef
+from twinklr.core.sequencer.vocabulary import (
+    CoordinationMode,
+    EffectDuration,
+    GroupTemplateType,
+    GroupVisualIntent,
+    IntensityLevel,
+    LaneKind,
+    PlanningTimeRef,
+)
+from twinklr.core.sequencer.vocabulary.choreography import TargetType
+from twinklr.core.sequencer.vocabulary.timing import TimeRefKind
+
+from .conftest import DEFAULT_THEME
+
+TemplateInfo.model_rebuild()
+
+
+@pytest.fixture
+def section_context() -> SectionPlanningContext:
+    """HIGH-energy two-bar section over a three-group display."""
+    return SectionPlanningContext(
+        section_id="verse_1",
+        section_name="verse",
+        start_ms=0,
+        end_ms=4000,
+        energy_target="HIGH",
+        motion_density="MED",
+        choreography_style="HYBRID",
+        primary_focus_targets=["HERO_1"],
+        secondary_targets=["ARCHES_1"],
+        choreo_graph=ChoreographyGraph(
+            graph_id="test",
+            groups=[
+                ChoreoGroup(id="HERO_1", role="HERO"),
+                ChoreoGroup(id="ARCHES_1", role="ARCHES"),
+                ChoreoGroup(id="WREATHS", role="WREATHS"),
+            ],
+        ),
+        template_catalog=TemplateCatalog(
+            entries=[
+                TemplateInfo(
+                    template_id="gtpl_accent_flash",
+                    version="1.0",
+                    name="Flash",
+                    template_type=GroupTemplateType.ACCENT,
+                    visual_intent=GroupVisualIntent.TEXTURE,
+                    tags=(),
+                ),
+            ]
+        ),
+        timing_context=TimingContext(
+            song_duration_ms=8000,
+            beats_per_bar=4,
+            bar_map={
+                bar: BarInfo(bar=bar, start_ms=(bar - 1) * 2000, duration_ms=2000)
+                for bar in range(1, 5)
+            },
+            section_bounds={
+                "verse_1": SectionBounds(
+                    section_id="verse_1",
+                    start=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=1, beat=1),
+                    end=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=3, beat=1),
+                ),
+            },
+        ),
+    )
+
+
+def _accent(placement_id: str, bar: int, intensity: IntensityLevel) -> GroupPlacement:
+    return GroupPlacement(
+        placement_id=placement_id,
+        target=PlanTarget(type=TargetType.GROUP, id="HERO_1"),
+        template_id="gtpl_accent_flash",
+        start=PlanningTimeRef(bar=bar, beat=1),
+        duration=EffectDuration.HIT,
+        intensity=intensity,
+    )
+
+
+def test_features_summarise_plan(section_context: SectionPlanningContext) -> None:
+    """Coverage, diversity and accent features reflect the plan."""
+    plan = SectionCoordinationPlan(
+        section_id="verse_1",
+        theme=DEFAULT_THEME,
+        lane_plans=[
+            LanePlan(
+                lane=LaneKind.ACCENT,
+                target_roles=["HERO"],
+                coordination_plans=[
+                    CoordinationPlan(
+                        coordination_mode=CoordinationMode.UNIFIED,
+                        targets=[PlanTarget(type=TargetType.GROUP, id="HERO_1")],
+                        placements=[
+                            _accent("p1", 1, IntensityLevel.PEAK),
+                            _accent("p2", 2, IntensityLevel.MED),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
+
+    featurizer = build_section_plan_featurizer(section_context)
+    features = featurizer.extract(plan)
+
+    assert features["lane_count"] == 1.0
+    assert features["has_accent_lane"] == 1.0
+    assert features["has_base_lane"] == 0.0
+    assert features["placements_per_bar"] == pytest.approx(1.0)
+    assert features["group_coverage"] == pytest.approx(1 / 3)
+    assert features["primary_coverage"] == 1.0
+    assert features["secondary_coverage"] == 0.0
+    assert features["template_unique_ratio"] == pytest.approx(0.5)
+    assert features["template_max_consecutive"] == 2.0
+    assert features["accent_strong_share"] == pytest.approx(0.5)
+    assert features["intensity_energy_gap"] == pytest.approx(0.0)
+    assert all(isinstance(v, float) for v in features.values())
+    assert featurizer.hints is FEATURE_HINTS
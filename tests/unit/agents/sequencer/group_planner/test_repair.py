@@ -0,0 +1,223 @@
+"""Tests for deterministic auto-repair of GroupPlanner output."""
+
+from __future__ import annotations
+
+import pytest
+
+from twinklr.core.agents.sequencer.group_planner.repair import PlanRepairer, apply_fixes
+from twinklr.core.agents.sequencer.group_planner.timing import (
+    BarInfo,
+    SectionBounds,
+    TimingContext,
+)
+from twinklr.core.agents.sequencer.group_planner.validators import (
+    FixAction,
+    FixKind,
+    SectionPlanValidator,
+)
+from twinklr.core.sequencer.planning import LanePlan, SectionCoordinationPlan
+from twinklr.core.sequencer.templates.group.catalog import TemplateCatalog, TemplateInfo
+from twinklr.core.sequencer.templates.group.models import (
+    CoordinationConfig,
+    CoordinationPlan,
+    GroupPlacement,
+    PlacementWindow,
+)
+from twinklr.core.sequencer.templates.group.models.choreography import (
+    ChoreographyGraph,
+    ChoreoGroup,
+)
+from twinklr.core.sequencer.templates.group.models.coordination import PlanTarget
+from twinklr.core.sequencer.timing import TimeRef
+from twinklr.core.sequencer.vocabulary import (
+    CoordinationMode,
+    EffectDuration,
+    GroupTemplateType,
+    GroupVisualIntent,
+    LaneKind,
+    PlanningTimeRef,
+)
+from twinklr.core.sequencer.vocabulary.choreography import TargetType
+from twinklr.core.sequencer.vocabulary.timing import TimeRefKind
+
+from .conftest import DEFAULT_THEME
+
+TemplateInfo.model_rebuild()
+
+
+@pytest.fixture
+def validator() -> SectionPlanValidator:
+    """Validator over a 4-bar song whose verse_1 spans bars 1-2."""
+    return SectionPlanValidator(
+        choreo_graph=ChoreographyGraph(
+            graph_id="test_display",
+            groups=[
+                ChoreoGroup(id="HERO_1", role="HERO"),
+                ChoreoGroup(id="HERO_2", role="HERO"),
+                ChoreoGroup(id="WREATHS", role="WREATHS"),
+            ],
+        ),
+        template_catalog=TemplateCatalog(
+            entries=[
+                TemplateInfo(
+                    template_id="gtpl_accent_bell",
+                    version="1.0",
+                    name="Bell Accent",
+                    template_type=GroupTemplateType.ACCENT,
+                    visual_intent=GroupVisualIntent.TEXTURE,
+                    tags=(),
+                ),
+            ]
+        ),
+        timing_context=TimingContext(
+            song_duration_ms=8000,
+            beats_per_bar=4,
+            bar_map={
+                bar: BarInfo(bar=bar, start_ms=(bar - 1) * 2000, duration_ms=2000)
+                for bar in range(1, 5)
+            },
+            section_bounds={
+                "verse_1": SectionBounds(
+                    section_id="verse_1",
+                    start=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=1, beat=1),
+                    end=TimeRef(kind=TimeRefKind.BAR_BEAT, bar=3, beat=1),
+                ),
+            },
+        ),
+    )
+
+
+def _group(group_id: str) -> PlanTarget:
+    return PlanTarget(type=TargetType.GROUP, id=group_id)
+
+
+def _accent(
+    placement_id: str, group_id: str, bar: int, template_id: str = "gtpl_accent_bell"
+) -> GroupPlacement:
+    return GroupPlacement(
+        placement_id=placement_id,
+        target=_group(group_id),
+        template_id=template_id,
+        start=PlanningTimeRef(bar=bar, beat=1),
+        duration=EffectDuration.HIT,
+    )
+
+
+def _plan(*coordination_plans: CoordinationPlan) -> SectionCoordinationPlan:
+    return SectionCoordinationPlan(
+        section_id="verse_1",
+        theme=DEFAULT_THEME,
+        lane_plans=[
+            LanePlan(
+                lane=LaneKind.ACCENT,
+                target_roles=["HERO"],
+                coordination_plans=list(coordination_plans),
+            )
+        ],
+    )
+
+
+def test_mechanical_issues_repaired_in_place(validator: SectionPlanValidator) -> None:
+    """Aliased ids and out-of-section placements are fixed without the LLM."""
+    plan = _plan(
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.UNIFIED,
+            targets=[_group("WREATH")],
+            placements=[_accent("p1", "WREATH", 1), _accent("late", "WREATH", 4)],
+        )
+    )
+
+    outcome = PlanRepairer(validator).repair(plan)
+
+    assert outcome.result.is_valid
+    coord = plan.lane_plans[0].coordination_plans[0]
+    assert [t.id for t in coord.targets] == ["WREATHS"]
+    assert [(p.placement_id, p.target.id) for p in coord.placements] == [("p1", "WREATHS")]
+    assert {fix.kind for fix in outcome.applied} == {
+        FixKind.REPLACE_GROUP_ID,
+        FixKind.DROP_PLACEMENT,
+    }
+
+
+def test_plan_emptied_by_repair_is_dropped_next_pass(validator: SectionPlanValidator) -> None:
+    """Fixes exposed by earlier fixes are applied on a later pass."""
+    plan = _plan(
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.UNIFIED,
+            targets=[_group("HERO_1")],
+            placements=[_accent("p1", "HERO_1", 1)],
+        ),
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.UNIFIED,
+            targets=[_group("HERO_2")],
+            placements=[_accent("late", "HERO_2", 4)],
+        ),
+    )
+
+    outcome = PlanRepairer(validator).repair(plan)
+
+    assert outcome.result.is_valid
+    assert outcome.passes == 3
+    assert [c.targets[0].id for c in plan.lane_plans[0].coordination_plans] == ["HERO_1"]
+
+
+def test_sequenced_group_order_and_window_repaired(validator: SectionPlanValidator) -> None:
+    """Duplicate/unknown group_order entries are removed and the window end clamped."""
+    plan = _plan(
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.SEQUENCED,
+            targets=[_group("HERO_1"), _group("HERO_2")],
+            window=PlacementWindow(
+                start=PlanningTimeRef(bar=1, beat=1),
+                end=PlanningTimeRef(bar=4, beat=1),
+                template_id="gtpl_accent_bell",
+            ),
+            config=CoordinationConfig(group_order=["HERO_1", "HERO_2", "HERO_1", "ARCHES_9"]),
+        )
+    )
+
+    outcome = PlanRepairer(validator).repair(plan)
+
+    coord = plan.lane_plans[0].coordination_plans[0]
+    assert outcome.result.is_valid
+    assert outcome.result.warnings == []
+    assert coord.config is not None
+    assert coord.config.group_order == ["HERO_1", "HERO_2"]
+    assert coord.window is not None
+    assert coord.window.end == PlanningTimeRef(bar=2, beat=1)
+
+
+def test_unrepairable_errors_are_left_for_planner(validator: SectionPlanValidator) -> None:
+    """Issues without a fix survive repair unchanged."""
+    plan = _plan(
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.UNIFIED,
+            targets=[_group("HERO_1")],
+            placements=[_accent("p1", "HERO_1", 1, template_id="NONEXISTENT")],
+        )
+    )
+
+    outcome = PlanRepairer(validator).repair(plan)
+
+    assert outcome.applied == []
+    assert [issue.code for issue in outcome.result.errors] == ["UNKNOWN_TEMPLATE"]
+
+
+def test_apply_fixes_ignores_stale_and_duplicate_fixes() -> None:
+    """Fixes pointing at nothing are skipped; duplicates apply once."""
+    plan = _plan(
+        CoordinationPlan(
+            coordination_mode=CoordinationMode.UNIFIED,
+            targets=[_group("HERO_1")],
+            placements=[_accent("p1", "HERO_1", 1), _accent("p2", "HERO_1", 2)],
+        )
+    )
+    drop = FixAction(
+        kind=FixKind.DROP_PLACEMENT, lane_index=0, coordination_index=0, placement_id="p2"
+    )
+    stale = FixAction(kind=FixKind.DROP_COORDINATION_PLAN, lane_index=3, coordination_index=0)
+
+    applied = apply_fixes(plan, [drop, drop, stale])
+
+    assert applied == [drop]
+    assert [p.placement_id for p in plan.lane_plans[0].coordination_plans[0].placements] == ["p1"]
@@ -10,6 +10,7 @@ from twinklr.core.agents.sequencer.group_planner.timing import (
     TimingContext,
 )
 from twinklr.core.agents.sequencer.group_planner.validators import (
+    FixKind,
     SectionPlanValidator,
 )
 from twinklr.core.sequencer.planning import LanePlan, SectionCoordinationPlan
@@ -542,3 +543,90 @@ class TestSectionPlanValidator:
         result = validator.validate(plan)
 
         assert result.is_valid
+
+
+def _accent_plan(target_id: str, *placements: GroupPlacement) -> SectionCoordinationPlan:
+    return SectionCoordinationPlan(
+        section_id="verse_1",
+        theme=DEFAULT_THEME,
+        lane_plans=[
+            LanePlan(
+                lane=LaneKind.ACCENT,
+                target_roles=["HERO"],
+                coordination_plans=[
+                    CoordinationPlan(
+                        coordination_mode=CoordinationMode.UNIFIED,
+                        targets=[PlanTarget(type=TargetType.GROUP, id=target_id)],
+                        placements=list(placements),
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+def _accent(placement_id: str, target_id: str, bar: int, beat: int = 1) -> GroupPlacement:
+    return GroupPlacement(
+        placement_id=placement_id,
+        target=PlanTarget(type=TargetType.GROUP, id=target_id),
+        template_id="gtpl_accent_bell",
+        start=PlanningTimeRef(bar=bar, beat=beat),
+        duration=EffectDuration.BURST,
+    )
+
+
+class TestFixActions:
+    """Mechanical issues carry machine-applicable fixes."""
+
+    @pytest.fixture
+    def validator(
+        self,
+        sample_choreo_graph: ChoreographyGraph,
+        sample_template_catalog: TemplateCatalog,
+        sample_timing_context: TimingContext,
+    ) -> SectionPlanValidator:
+        return SectionPlanValidator(
+            choreo_graph=sample_choreo_graph,
+            template_catalog=sample_template_catalog,
+            timing_context=sample_timing_context,
+        )
+
+    def test_case_drifted_group_id_gets_replace_fix(self, validator: SectionPlanValidator) -> None:
+        """A near-miss group id resolves to the single confident match."""
+        result = validator.validate(_accent_plan("hero_1", _accent("p1", "hero_1", 1)))
+
+        fixes = {issue.fix for issue in result.errors if issue.code == "UNKNOWN_GROUP"}
+        assert len(fixes) == 1
+        (fix,) = fixes
+        assert fix is not None
+        assert fix.kind == FixKind.REPLACE_GROUP_ID
+        assert (fix.old_value, fix.new_value) == ("hero_1", "HERO_1")
+        assert (fix.lane_index, fix.coordination_index) == (0, 0)
+
+    def test_unresolvable_group_id_has_no_fix(self, validator: SectionPlanValidator) -> None:
+        """Ambiguous or unknown ids are left for the planner."""
+        result = validator.validate(_accent_plan("SPINNER", _accent("p1", "SPINNER", 1)))
+
+        unknown = [issue for issue in result.errors if issue.code == "UNKNOWN_GROUP"]
+        assert unknown
+        assert all(issue.fix is None for issue in unknown)
+
+    def test_out_of_section_and_overlap_get_drop_fixes(
+        self, validator: SectionPlanValidator
+    ) -> None:
+        """Out-of-section placements and the later overlapping placement are dropped."""
+        plan = _accent_plan(
+            "HERO_1",
+            _accent("p1", "HERO_1", 1),
+            _accent("p2", "HERO_1", 1, beat=3),
+            _accent("late", "HERO_1", 4),
+        )
+        result = validator.validate(plan)
+
+        dropped = {
+            issue.code: issue.fix.placement_id
+            for issue in result.errors
+            if issue.fix is not None and issue.fix.kind == FixKind.DROP_PLACEMENT
+        }
+        assert dropped["PLACEMENT_OUTSIDE_SECTION"] == "late"
+        assert dropped["WITHIN_COORDINATION_OVERLAP"] == "p2"
@@ -1,10 +1,12 @@
 """Unit tests for StandardIterationController."""
 
 import logging
-from unittest.mock import AsyncMock, Mock
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from twinklr.core.agents.result import AgentResult
 from twinklr.core.agents.shared.judge.controller import (
     IterationConfig,
     StandardIterationController,
@@ -12,6 +14,14 @@ from twinklr.core.agents.shared.judge.controller import (
 from twinklr.core.agents.shared.judge.feedback import FeedbackManager
 from twinklr.core.agents.shared.judge.models import (
     JudgeVerdict,
+    VerdictStatus,
+)
+from twinklr.core.agents.shared.judge.prejudge import (
+    PlanFeaturizer,
+    PreJudge,
+    PreJudgeAction,
+    PreJudgeModel,
+    prejudge_model_path,
 )
 from twinklr.core.agents.spec import AgentSpec
 
@@ -88,3 +98,221 @@ class TestStandardIterationControllerInit:
         assert controller.config == iteration_config
         assert controller.feedback == feedback_manager
         assert isinstance(controller.logger, logging.Logger)
+
+
+def _save_prejudge_model(storage_dir, agent_name: str = "test_judge") -> None:
+    """Save a model that approves plans with x > 0 and fails plans with x < 0."""
+    PreJudgeModel(
+        agent_name=agent_name,
+        feature_names=["x"],
+        means=[0.0],
+        scales=[1.0],
+        weights=[10.0],
+        bias=0.0,
+        n_samples=100,
+        approval_rate=0.5,
+    ).save(prejudge_model_path(storage_dir, agent_name))
+
+
+def _verdict(score: float) -> JudgeVerdict:
+    status = VerdictStatus.APPROVE if score >= 7.0 else VerdictStatus.SOFT_FAIL
+    return JudgeVerdict(
+        status=status,
+        score=score,
+        confidence=0.9,
+        overall_assessment="Assessment.",
+        feedback_for_planner="Feedback.",
+        iteration=0,
+    )
+
+
+class TestPreJudgeStage:
+    """Tests for the local pre-judge in StandardIterationController.run."""
+
+    @pytest.fixture
+    def featurizer(self) -> PlanFeaturizer[dict]:
+        return PlanFeaturizer(extract=lambda plan: {"x": plan["x"]}, hints={"x": "Raise x."})
+
+    def _config(self, tmp_path, **overrides: Any) -> IterationConfig:
+        return IterationConfig(
+            issue_tracking_storage_dir=tmp_path,
+            include_historical_learning=False,
+            **overrides,
+        )
+
+    async def _run(
+        self,
+        controller: StandardIterationController[dict],
+        plans: list[dict],
+        scores: list[float],
+        planner_spec: AgentSpec,
+        judge_spec: AgentSpec,
+        featurizer: PlanFeaturizer[dict] | None,
+    ) -> tuple[Any, list[str]]:
+        """Run the controller with scripted planner outputs and judge scores."""
+        calls: list[str] = []
+        plan_iter = iter(plans)
+        score_iter = iter(scores)
+
+        async def fake_run(*, spec: AgentSpec, variables: dict, state: Any = None) -> AgentResult:
+            calls.append(spec.name)
+            if spec.name == judge_spec.name:
+                data: Any = _verdict(next(score_iter))
+            else:
+                data = next(plan_iter)
+            return AgentResult(success=True, data=data, duration_seconds=0.0, tokens_used=10)
+
+        with patch("twinklr.core.agents.shared.judge.controller.AsyncAgentRunner") as MockRunner:
+            MockRunner.return_value.run = AsyncMock(side_effect=fake_run)
+            result = await controller.run(
+                planner_spec=planner_spec,
+                judge_spec=judge_spec,
+                initial_variables={},
+                validator=lambda plan: [],
+                provider=Mock(),
+                llm_logger=Mock(),
+                plan_featurizer=featurizer,
+            )
+        return result, calls
+
+    @pytest.mark.asyncio
+    async def test_approve_skips_judge(self, tmp_path, planner_spec, judge_spec, featurizer):
+        """A confident local approval returns success without calling the judge."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path)
+        )
+
+        result, calls = await self._run(
+            controller, [{"x": 1.0}], [], planner_spec, judge_spec, featurizer
+        )
+
+        assert result.success
+        assert result.plan == {"x": 1.0}
+        assert calls == ["test_planner"]
+        assert result.context.final_verdict is None
+        assert [d.action for d in result.context.prejudge_decisions] == [PreJudgeAction.APPROVE]
+        assert controller.issue_repository is not None
+        assert controller.issue_repository.read_verdicts("test_judge") == []
+
+    @pytest.mark.asyncio
+    async def test_revise_then_judge_sees_next_plan(
+        self, tmp_path, planner_spec, judge_spec, featurizer
+    ):
+        """A local revision is followed by a judged iteration, never two in a row."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path)
+        )
+
+        result, calls = await self._run(
+            controller,
+            [{"x": -1.0}, {"x": -1.0}],
+            [8.0],
+            planner_spec,
+            judge_spec,
+            featurizer,
+        )
+
+        assert result.success
+        assert calls == ["test_planner", "test_planner", "test_judge"]
+        assert [d.action for d in result.context.prejudge_decisions] == [
+            PreJudgeAction.REVISE,
+            PreJudgeAction.DEFER,
+        ]
+        assert result.context.revision_requests[0].specific_fixes == ["Raise x."]
+        assert result.context.final_verdict is not None
+
+    @pytest.mark.asyncio
+    async def test_final_iteration_always_judged(
+        self, tmp_path, planner_spec, judge_spec, featurizer
+    ):
+        """On the last iteration a likely failure still goes to the judge."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path, max_iterations=1)
+        )
+
+        result, calls = await self._run(
+            controller, [{"x": -1.0}], [4.0], planner_spec, judge_spec, featurizer
+        )
+
+        assert not result.success
+        assert calls == ["test_planner", "test_judge"]
+        assert [d.action for d in result.context.prejudge_decisions] == [PreJudgeAction.DEFER]
+
+    @pytest.mark.asyncio
+    async def test_judge_verdict_recorded_with_features(
+        self, tmp_path, planner_spec, judge_spec, featurizer
+    ):
+        """Judged plans are recorded with their features for offline fitting."""
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path)
+        )
+
+        result, calls = await self._run(
+            controller, [{"x": 0.5}], [8.0], planner_spec, judge_spec, featurizer
+        )
+
+        assert result.success
+        assert calls == ["test_planner", "test_judge"]
+        assert result.context.prejudge_decisions == []
+        assert controller.issue_repository is not None
+        records = controller.issue_repository.read_verdicts("test_judge")
+        assert len(records) == 1
+        assert records[0].features == {"x": 0.5}
+        assert records[0].score == 8.0
+        assert records[0].job_id == controller.job_id
+
+    @pytest.mark.asyncio
+    async def test_no_featurizer_records_nothing(self, tmp_path, planner_spec, judge_spec):
+        """Without a featurizer the judge runs and no verdict sample is written."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path)
+        )
+
+        result, calls = await self._run(
+            controller, [{"x": 1.0}], [8.0], planner_spec, judge_spec, None
+        )
+
+        assert result.success
+        assert calls == ["test_planner", "test_judge"]
+        assert controller.issue_repository is not None
+        assert controller.issue_repository.read_verdicts("test_judge") == []
+
+    def test_load_pre_judge_disabled(self, tmp_path):
+        """A fitted model is ignored when the pre-judge is disabled."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path, enable_prejudge=False)
+        )
+
+        assert controller._load_pre_judge("test_judge") is None
+
+    def test_load_pre_judge_missing_model(self, tmp_path):
+        """No fitted model means every plan goes to the judge."""
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(tmp_path)
+        )
+
+        assert controller._load_pre_judge("test_judge") is None
+
+    def test_load_pre_judge_applies_thresholds(self, tmp_path):
+        """The loaded pre-judge uses the configured thresholds."""
+        _save_prejudge_model(tmp_path)
+        controller: StandardIterationController[dict] = StandardIterationController(
+            config=self._config(
+                tmp_path,
+                prejudge_approve_threshold=0.9,
+                prejudge_fail_threshold=0.8,
+                prejudge_min_samples=10,
+            )
+        )
+
+        pre_judge = controller._load_pre_judge("test_judge")
+
+        assert isinstance(pre_judge, PreJudge)
+        assert pre_judge.approve_threshold == 0.9
+        assert pre_judge.fail_threshold == 0.8
+        assert pre_judge.min_samples == 10
@@ -0,0 +1,128 @@
+"""Tests for the calibrated local pre-judge."""
+
+from pathlib import Path
+
+import pytest
+
+from twinklr.core.agents.analytics.repository import VerdictRecord
+from twinklr.core.agents.shared.judge.models import RevisionPriority
+from twinklr.core.agents.shared.judge.prejudge import (
+    PreJudge,
+    PreJudgeAction,
+    PreJudgeDecision,
+    PreJudgeModel,
+    evaluate_prejudge,
+    prejudge_model_path,
+)
+
+
+def _record(i: int, coverage: float, score: float) -> VerdictRecord:
+    return VerdictRecord(
+        agent_name="test_judge",
+        job_id=f"job_{i}",
+        iteration=1,
+        score=score,
+        status="APPROVE" if score >= 7.0 else "SOFT_FAIL",
+        features={"coverage": coverage, "noise": float(i % 3)},
+        timestamp=float(i),
+    )
+
+
+@pytest.fixture
+def records() -> list[VerdictRecord]:
+    """60 verdicts: the judge approves exactly the high-coverage plans."""
+    return [_record(i, coverage=i / 60, score=8.5 if i >= 30 else 4.0) for i in range(60)]
+
+
+@pytest.fixture
+def model(records: list[VerdictRecord]) -> PreJudgeModel:
+    """Model fit on the separable records."""
+    return PreJudgeModel.fit("test_judge", records)
+
+
+def test_fit_learns_feature_direction(model: PreJudgeModel) -> None:
+    """Approval probability rises with the feature the judge rewards."""
+    assert model.n_samples == 60
+    assert model.approval_rate == pytest.approx(0.5)
+    assert model.feature_names == ["coverage", "noise"]
+    assert model.approval_probability({"coverage": 0.95, "noise": 1.0}) > 0.95
+    assert model.approval_probability({"coverage": 0.05, "noise": 1.0}) < 0.05
+
+
+def test_fit_fills_missing_features_with_training_mean(records: list[VerdictRecord]) -> None:
+    """Training and prediction treat an absent feature as its training mean."""
+    sparse = [
+        r.model_copy(update={"features": {**r.features, "tempo": 120.0 + i % 4}}) if i % 2 else r
+        for i, r in enumerate(records)
+    ]
+    model = PreJudgeModel.fit("test_judge", sparse)
+
+    assert model.means[model.feature_names.index("tempo")] == pytest.approx(122.0)
+    assert model.approval_probability({"coverage": 0.5, "noise": 1.0}) == pytest.approx(
+        model.approval_probability({"coverage": 0.5, "noise": 1.0, "tempo": 122.0})
+    )
+
+
+def test_fit_rejects_empty_records() -> None:
+    """There is nothing to calibrate against without verdicts."""
+    with pytest.raises(ValueError):
+        PreJudgeModel.fit("test_judge", [])
+
+
+def test_decide_thresholds(model: PreJudgeModel) -> None:
+    """Confident predictions skip the judge; uncertain ones defer."""
+    pre_judge = PreJudge(model, min_samples=10)
+
+    assert pre_judge.decide({"coverage": 0.95}).action == PreJudgeAction.APPROVE
+    fail = pre_judge.decide({"coverage": 0.05})
+    assert fail.action == PreJudgeAction.REVISE
+    assert fail.reasons[0] == "coverage"
+    assert pre_judge.decide({"coverage": 0.5}).action == PreJudgeAction.DEFER
+    assert pre_judge.decide({"coverage": 0.05}, allow_revise=False).action == PreJudgeAction.DEFER
+
+
+def test_undertrained_model_always_defers(model: PreJudgeModel) -> None:
+    """A model fit on fewer than min_samples verdicts never skips the judge."""
+    pre_judge = PreJudge(model, min_samples=100)
+
+    assert pre_judge.decide({"coverage": 0.95}).action == PreJudgeAction.DEFER
+    assert pre_judge.decide({"coverage": 0.05}).action == PreJudgeAction.DEFER
+
+
+def test_revision_request_uses_feature_hints() -> None:
+    """Local revisions carry the hints for the failing features."""
+    decision = PreJudgeDecision(
+        action=PreJudgeAction.REVISE, approval_probability=0.02, reasons=["coverage", "other"]
+    )
+
+    request = PreJudge.revision_request(decision, {"coverage": "Cover more groups."})
+
+    assert request.priority == RevisionPriority.HIGH
+    assert request.specific_fixes == ["Cover more groups."]
+    assert request.focus_areas == ["coverage", "other"]
+
+
+def test_save_load_round_trip(model: PreJudgeModel, tmp_path: Path) -> None:
+    """Models persist next to the judge's analytics files."""
+    path = prejudge_model_path(tmp_path, "test_judge")
+    model.save(path)
+
+    assert path == tmp_path / "test_judge_prejudge.json"
+    assert PreJudgeModel.load(path) == model
+    assert PreJudgeModel.load(tmp_path / "missing.json") is None
+
+    path.write_text("{not json")
+    assert PreJudgeModel.load(path) is None
+
+
+def test_evaluate_reports_agreement(model: PreJudgeModel, records: list[VerdictRecord]) -> None:
+    """Replaying recorded verdicts reports skip coverage and agreement."""
+    report = evaluate_prejudge(PreJudge(model, min_samples=10), records)
+
+    assert report.n_samples == 60
+    assert report.approved == 30
+    assert report.skipped_approve > 0
+    assert report.skipped_revise > 0
+    assert report.agreement == pytest.approx(1.0)
+    assert report.accuracy == pytest.approx(1.0)
+    assert 0.0 < report.coverage < 1.0
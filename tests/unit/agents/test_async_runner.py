@@ -8,7 +8,13 @@ import pytest
 
 from twinklr.core.agents.async_runner import AsyncAgentRunner
 from twinklr.core.agents.logging import NullLLMCallLogger
-from twinklr.core.agents.providers.base import LLMResponse, ResponseMetadata, TokenUsage
+from twinklr.core.agents.providers.base import (
+    CACHE_BREAKPOINT_KEY,
+    LLMResponse,
+    ProviderType,
+    ResponseMetadata,
+    TokenUsage,
+)
 from twinklr.core.agents.spec import AgentMode, AgentSpec
 from twinklr.core.agents.state import AgentState
 
@@ -481,3 +487,101 @@ class TestSchemaRepairTrimming:
         assert result.data.result == "finally_good"
         assert result.data.count == 42
         assert result.metadata["schema_repair_attempts"] == 2
+
+
+class PrefixRecordingProvider:
+    """Fake provider that records requests and reports a warm prefix cache."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[dict[str, str]]] = []
+        self.system_prompts: list[str | None] = []
+        self._usage = TokenUsage()
+
+    @property
+    def provider_type(self) -> ProviderType:
+        return ProviderType.OPENAI
+
+    def get_token_usage(self) -> TokenUsage:
+        return self._usage
+
+    def _respond(self) -> LLMResponse:
+        cached = 80 if len(self.requests) + len(self.system_prompts) > 1 else 0
+        self._usage = TokenUsage(
+            prompt_tokens=self._usage.prompt_tokens + 100,
+            completion_tokens=self._usage.completion_tokens + 10,
+            total_tokens=self._usage.total_tokens + 110,
+            cached_prompt_tokens=self._usage.cached_prompt_tokens + cached,
+        )
+        return LLMResponse(
+            content={"result": "ok", "count": 1},
+            metadata=ResponseMetadata(token_usage=TokenUsage(100, 10, 110, cached)),
+        )
+
+    async def generate_json_async(self, messages, model, temperature=None, **kwargs):
+        self.requests.append([dict(m) for m in messages])
+        return self._respond()
+
+    async def generate_json_with_conversation_async(
+        self, user_message, conversation_id, model, system_prompt=None, **kwargs
+    ):
+        self.system_prompts.append(system_prompt)
+        return self._respond()
+
+
+def _cached_prefix(messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    last = max(i for i, m in enumerate(messages) if m.get(CACHE_BREAKPOINT_KEY))
+    return messages[: last + 1]
+
+
+class TestPromptPrefixCaching:
+    """Static prompt content forms a byte-identical, marked prefix."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_stable_across_iterations(self, mock_llm_logger) -> None:
+        spec = AgentSpec(name="judge", prompt_pack="cached_pack", response_model=SampleResponse)
+        provider = PrefixRecordingProvider()
+        runner = AsyncAgentRunner(provider, FIXTURES_PATH, llm_logger=mock_llm_logger)
+
+        base = {"agent_name": "judge", "catalog": ["gtpl_a", "gtpl_b"]}
+        await runner.run(spec, {**base, "iteration": 0, "feedback": None})
+        second = await runner.run(spec, {**base, "iteration": 1, "feedback": "Add contrast."})
+
+        first_msgs, second_msgs = provider.requests
+        assert [m["role"] for m in first_msgs] == ["developer", "system", "user", "user"]
+        assert [bool(m.get(CACHE_BREAKPOINT_KEY)) for m in first_msgs] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert "gtpl_a" in first_msgs[2]["content"]
+        assert _cached_prefix(first_msgs) == _cached_prefix(second_msgs)
+        assert first_msgs[-1]["content"] != second_msgs[-1]["content"]
+        assert "Add contrast." in second_msgs[-1]["content"]
+
+        assert second.metadata["cached_prompt_tokens"] == 80
+        completed = mock_llm_logger.complete_call_async.call_args_list[-1].kwargs
+        assert completed["cached_prompt_tokens"] == 80
+        assert completed["prompt_tokens"] == 100
+
+    @pytest.mark.asyncio
+    async def test_conversational_context_joins_system_prompt(self) -> None:
+        spec = AgentSpec(
+            name="planner",
+            prompt_pack="cached_pack",
+            response_model=SampleResponse,
+            mode=AgentMode.CONVERSATIONAL,
+        )
+        provider = PrefixRecordingProvider()
+        runner = AsyncAgentRunner(provider, FIXTURES_PATH)
+        state = AgentState(name="planner")
+
+        await runner.run(
+            spec,
+            {"agent_name": "planner", "catalog": ["gtpl_a"], "iteration": 0, "feedback": None},
+            state,
+        )
+
+        system_prompt = provider.system_prompts[0]
+        assert system_prompt is not None
+        assert system_prompt.index("Response Schema") < system_prompt.index("gtpl_a")
@@ -62,3 +62,17 @@ def test_motif_filtering_consistency():
 
     assert catalog_motifs == supported
     assert ids_motifs == supported
+
+
+def test_get_taxonomy_dict_returns_independent_copies():
+    """Callers may extend the taxonomy without affecting later calls."""
+    from twinklr.core.agents.taxonomy_utils import get_taxonomy_dict, inject_taxonomy
+
+    first = get_taxonomy_dict()
+    first["CompoundMotionTerm"] = ["swirl"]
+    first["LayerRole"].append("BOGUS")
+
+    second = get_taxonomy_dict()
+    assert "CompoundMotionTerm" not in second
+    assert "BOGUS" not in second["LayerRole"]
+    assert inject_taxonomy({})["taxonomy"] == second
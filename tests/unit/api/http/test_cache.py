@@ -0,0 +1,122 @@
+"""Tests for CachingAsyncTransport (persistent HTTP response cache).
+
+The inner transport is an httpx.MockTransport acting as a local stub server.
+"""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from twinklr.core.api.http.cache import CachingAsyncTransport, HttpCachePolicy
+from twinklr.core.api.http.client import AsyncApiClient
+from twinklr.core.api.http.config import HttpClientConfig
+from twinklr.core.api.http.errors import ClientError
+from twinklr.core.caching import MemoryCache
+
+_JSON = {"content-type": "application/json"}
+
+
+def _client(transport: CachingAsyncTransport) -> AsyncApiClient:
+    return AsyncApiClient(HttpClientConfig(base_url="https://example.test"), transport=transport)
+
+
+@pytest.mark.anyio
+async def test_fresh_entry_served_without_network() -> None:
+    """A second GET within the TTL never reaches the stub server."""
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"id": "abc"}, headers=_JSON)
+
+    transport = CachingAsyncTransport(MemoryCache(), transport=httpx.MockTransport(handler))
+    async with _client(transport) as c:
+        first = c.json(await c.get("/recording/abc", params={"fmt": "json"}))
+        second = c.json(await c.get("/recording/abc", params={"fmt": "json"}))
+        other = c.json(await c.get("/recording/def", params={"fmt": "json"}))
+
+    assert first == second == other == {"id": "abc"}
+    assert calls["n"] == 2
+    assert transport.hits == 1
+
+
+@pytest.mark.anyio
+async def test_not_found_is_cached_as_negative_result() -> None:
+    """404 responses are cached and still surface as ClientError."""
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(404, text="missing")
+
+    transport = CachingAsyncTransport(MemoryCache(), transport=httpx.MockTransport(handler))
+    async with _client(transport) as c:
+        for _ in range(2):
+            with pytest.raises(ClientError):
+                await c.get("/lyrics/none")
+
+    assert calls["n"] == 1
+
+
+@pytest.mark.anyio
+async def test_stale_entry_revalidated_with_etag() -> None:
+    """Stale entries send If-None-Match; a 304 replays the cached body."""
+    seen_etags: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"v": 1}, headers={**_JSON, "ETag": '"v1"'})
+
+    policy = HttpCachePolicy(default_ttl_s=0.0)
+    transport = CachingAsyncTransport(MemoryCache(), policy, transport=httpx.MockTransport(handler))
+    async with _client(transport) as c:
+        first = await c.get("/search")
+        second = await c.get("/search")
+
+    assert seen_etags == [None, '"v1"']
+    assert second.status_code == 200
+    assert c.json(first) == c.json(second) == {"v": 1}
+    assert transport.revalidated == 1
+
+
+@pytest.mark.anyio
+async def test_post_and_no_store_are_not_cached() -> None:
+    """Non-cacheable methods and Cache-Control: no-store always hit the network."""
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={}, headers={**_JSON, "Cache-Control": "no-store"})
+
+    transport = CachingAsyncTransport(MemoryCache(), transport=httpx.MockTransport(handler))
+    async with _client(transport) as c:
+        await c.post("/submit", json_body={"a": 1})
+        await c.post("/submit", json_body={"a": 1})
+        await c.get("/volatile")
+        await c.get("/volatile")
+
+    assert calls["n"] == 4
+
+
+@pytest.mark.anyio
+async def test_network_requests_spaced_per_host() -> None:
+    """Requests to a rate-limited host are spaced by min_interval_by_host."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={}, headers=_JSON)
+
+    policy = HttpCachePolicy(min_interval_by_host={"example.test": 0.05})
+    transport = CachingAsyncTransport(MemoryCache(), policy, transport=httpx.MockTransport(handler))
+    async with _client(transport) as c:
+        start = time.monotonic()
+        await c.get("/a")
+        await c.get("/b")
+        await c.get("/a")  # cache hit: not rate limited
+        elapsed = time.monotonic() - start
+
+    assert 0.05 <= elapsed < 0.5
@@ -6,11 +6,14 @@ Testing chromaprint computation, duration bucketing, and error handling.
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from twinklr.core.audio.metadata.fingerprint import (
+    CHROMAPRINT_SAMPLE_RATE,
     ChromaprintError,
     compute_chromaprint_fingerprint,
+    compute_chromaprint_from_pcm,
 )
 
 
@@ -179,5 +182,37 @@ class TestComputeChromaprintFingerprint:
             assert duration == 3725.8
 
 
+class TestComputeChromaprintFromPcm:
+    """Test in-process chromaprint computation from decoded PCM."""
+
+    def test_feeds_resampled_int16_pcm(self):
+        """Waveform is truncated, resampled to 11025 Hz and passed as int16 PCM."""
+        sr = 22050
+        y = np.zeros(sr * 200, dtype=np.float32)  # 200 s of silence
+        fake_acoustid = MagicMock(have_chromaprint=True)
+        fake_acoustid.fingerprint.return_value = b"AQAAPCM"
+
+        with patch.dict("sys.modules", {"acoustid": fake_acoustid}):
+            fingerprint, duration = compute_chromaprint_from_pcm(y, sr)
+
+        assert fingerprint == "AQAAPCM"
+        assert duration == 200.0
+        samplerate, channels, pcmiter = fake_acoustid.fingerprint.call_args.args
+        pcm = b"".join(pcmiter)
+        assert (samplerate, channels) == (CHROMAPRINT_SAMPLE_RATE, 1)
+        # 120 s at 11025 Hz, 2 bytes per sample
+        assert len(pcm) == 120 * CHROMAPRINT_SAMPLE_RATE * 2
+
+    def test_missing_chromaprint_library(self):
+        """Unavailable libchromaprint raises ChromaprintError (caller falls back)."""
+        fake_acoustid = MagicMock(have_chromaprint=False)
+
+        with (
+            patch.dict("sys.modules", {"acoustid": fake_acoustid}),
+            pytest.raises(ChromaprintError),
+        ):
+            compute_chromaprint_from_pcm(np.zeros(1000, dtype=np.float32), 22050)
+
+
 class TestChromaprintError:
     """Test ChromaprintError exception."""
@@ -119,6 +119,30 @@ class TestMetadataPipeline:
             assert bundle.fingerprint.chromaprint_fingerprint == "FINGERPRINT123"
             assert bundle.fingerprint.chromaprint_duration_s == 180.5
 
+    async def test_pipeline_uses_precomputed_chromaprint(self, pipeline):
+        """A precomputed chromaprint skips the fpcalc subprocess."""
+        pipeline.config.enable_acoustid = True
+        pipeline.config.enable_musicbrainz = False
+        pipeline.acoustid_client = None
+
+        with (
+            patch("twinklr.core.audio.metadata.pipeline.extract_embedded_metadata") as mock_extract,
+            patch(
+                "twinklr.core.audio.metadata.pipeline.compute_chromaprint_fingerprint"
+            ) as mock_fingerprint,
+            patch("twinklr.core.audio.metadata.pipeline.compute_file_hash") as mock_hash,
+        ):
+            mock_extract.return_value = EmbeddedMetadata(title="Test")
+            mock_hash.return_value = "abc123hash"
+
+            bundle = await pipeline.extract("/test/audio.mp3", chromaprint=("PCMFP", 200.04))
+
+            mock_fingerprint.assert_not_called()
+            assert bundle.fingerprint is not None
+            assert bundle.fingerprint.chromaprint_fingerprint == "PCMFP"
+            assert bundle.fingerprint.chromaprint_duration_s == 200.04
+            assert bundle.fingerprint.chromaprint_duration_bucket == 200.0
+
     async def test_pipeline_with_acoustid(self, pipeline, mock_acoustid_client):
         """Pipeline queries AcoustID when enabled."""
         # Configure to enable AcoustID only
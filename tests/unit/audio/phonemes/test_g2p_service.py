@@ -6,11 +6,19 @@ Tests cover:
 - normalize_phoneme() function
 - G2PService protocol
 - G2PImpl implementation
+- G2PEngine caching, dictionary fast path and persistent lexicon
 - Import error handling
 """
 
+import json
+from pathlib import Path
+
+import pytest
+
+from twinklr.core.audio.phonemes import g2p_service
 from twinklr.core.audio.phonemes.g2p_service import (
     G2PConfig,
+    G2PEngine,
     G2PImpl,
     normalize_phoneme,
     word_to_phonemes,
@@ -87,3 +95,111 @@ class TestG2PConfig:
 
 class TestG2PImportError:
     """Test G2P import error handling."""
+
+
+class _CountingModel:
+    """Stand-in for the g2p_en model that records the words it is asked for."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> list[str]:
+        self.calls.append(text)
+        return ["Z", "IH1", "NG", " ", "!"]
+
+
+@pytest.fixture
+def model(monkeypatch: pytest.MonkeyPatch) -> _CountingModel:
+    """Replace the shared model and dictionary for one test."""
+    fake = _CountingModel()
+    monkeypatch.setattr(g2p_service, "_get_model", lambda: fake)
+    monkeypatch.setattr(
+        g2p_service,
+        "_get_dictionary",
+        lambda: ({"hello": [["HH", "AH0", "L", "OW1"]], "read": [["R", "IY1", "D"]]}, {"read"}),
+    )
+    return fake
+
+
+class TestG2PEngine:
+    """Test cached G2P conversion."""
+
+    def test_dictionary_words_skip_model(self, model: _CountingModel):
+        """Plain in-vocabulary words are answered from CMUdict."""
+        engine = G2PEngine()
+
+        assert engine.convert(" Hello ") == ["HH", "AH", "L", "OW"]
+        assert model.calls == []
+
+    def test_homographs_and_oov_words_use_model_once(self, model: _CountingModel):
+        """Words needing the model are converted once, then cached."""
+        engine = G2PEngine()
+        config = G2PConfig(strip_stress=False)
+
+        assert engine.convert("read", config=config) == ["Z", "IH1", "NG"]
+        assert engine.convert("READ", config=config) == ["Z", "IH1", "NG"]
+        assert engine.convert("zing!", config=config) == ["Z", "IH1", "NG"]
+        assert model.calls == ["read", "zing!"]
+
+    def test_cache_is_keyed_by_config(self, model: _CountingModel):
+        """Different configs get their own post-processing of one pronunciation."""
+        engine = G2PEngine()
+
+        raw = engine.convert("zing", config=G2PConfig(strip_stress=False, filter_punctuation=False))
+
+        assert raw == ["Z", "IH1", "NG", " ", "!"]
+        assert engine.convert("zing") == ["Z", "IH", "NG"]
+
+    def test_batch_converts_distinct_words_once(self, model: _CountingModel):
+        """Batch results keep input order; repeated words are converted once."""
+        engine = G2PEngine()
+
+        results = engine.convert_batch(["zing", "hello", "Zing", ""])
+
+        assert results == [["Z", "IH", "NG"], ["HH", "AH", "L", "OW"], ["Z", "IH", "NG"], []]
+        assert model.calls == ["zing"]
+
+    def test_batch_failures_yield_empty_lists(self, monkeypatch: pytest.MonkeyPatch):
+        """A failing word is reported as empty instead of aborting the batch."""
+
+        def broken(word: str) -> list[str]:
+            raise RuntimeError("model failure")
+
+        monkeypatch.setattr(g2p_service, "_get_model", lambda: broken)
+        monkeypatch.setattr(g2p_service, "_get_dictionary", lambda: ({}, frozenset()))
+
+        assert G2PEngine().convert_batch(["zing", "zap"]) == [[], []]
+
+    def test_batch_reraises_missing_library(self, monkeypatch: pytest.MonkeyPatch):
+        """A missing g2p_en install is an error, not a batch of empty words."""
+
+        def missing() -> None:
+            raise ImportError("g2p_en not installed")
+
+        monkeypatch.setattr(g2p_service, "_get_model", missing)
+        monkeypatch.setattr(g2p_service, "_get_dictionary", lambda: ({}, frozenset()))
+
+        with pytest.raises(ImportError):
+            G2PEngine().convert_batch(["zing"])
+
+    def test_lexicon_persists_model_predictions(self, model: _CountingModel, tmp_path: Path):
+        """Model output is flushed to disk and reused by a fresh engine."""
+        path = tmp_path / "g2p_lexicon.json"
+        G2PEngine(lexicon_path=path).convert_batch(["zing", "hello"])
+
+        entries = json.loads(path.read_text())["entries"]
+        assert entries == {"zing": ["Z", "IH1", "NG", " ", "!"]}
+
+        model.calls.clear()
+        assert G2PEngine(lexicon_path=path).convert("zing") == ["Z", "IH", "NG"]
+        assert model.calls == []
+
+    def test_stale_lexicon_is_ignored(self, model: _CountingModel, tmp_path: Path):
+        """Lexicons written by another g2p_en version are not trusted."""
+        path = tmp_path / "g2p_lexicon.json"
+        path.write_text(
+            json.dumps({"format": 1, "g2p_en": "0.0-other", "entries": {"zing": ["X"]}})
+        )
+
+        assert G2PEngine(lexicon_path=path).convert("zing") == ["Z", "IH", "NG"]
+        assert model.calls == ["zing"]
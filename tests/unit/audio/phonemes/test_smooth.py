@@ -3,10 +3,23 @@
 Tests cover:
 - coalesce_adjacent() - merge identical consecutive visemes
 - smooth_visemes() - full smoothing pipeline (min-hold, burst merge, boundary soften)
+- smooth_timeline() - columnar single-pass kernel, equivalent to the stage functions
 """
 
+import random
+
+import pytest
+
 from twinklr.core.audio.models.phonemes import VisemeEvent
-from twinklr.core.audio.phonemes.smooth import coalesce_adjacent, smooth_visemes
+from twinklr.core.audio.phonemes.smooth import (
+    VisemeTimeline,
+    _apply_boundary_soften,
+    _apply_burst_merge,
+    _apply_min_hold,
+    coalesce_adjacent,
+    smooth_timeline,
+    smooth_visemes,
+)
 
 
 class TestCoalesceAdjacent:
@@ -198,3 +211,97 @@ class TestSmoothVisemes:
 
         # Should have fewer events after smoothing
         assert len(result) < len(events)
+
+
+def _reference_smooth(
+    events: list[VisemeEvent],
+    *,
+    min_hold_ms: int,
+    min_burst_ms: int,
+    boundary_soften_ms: int,
+    duration_ms: int,
+) -> tuple[list[VisemeEvent], int]:
+    """The spec pipeline as separate list passes over VisemeEvent models."""
+    if not events:
+        return [], 0
+    smoothed = coalesce_adjacent(events)
+    smoothed = coalesce_adjacent(_apply_min_hold(smoothed, min_hold_ms))
+    smoothed, burst_merge_count = _apply_burst_merge(smoothed, min_burst_ms)
+    smoothed = coalesce_adjacent(smoothed)
+    smoothed = _apply_boundary_soften(smoothed, boundary_soften_ms, duration_ms)
+    return smoothed, burst_merge_count
+
+
+def _random_events(rng: random.Random) -> tuple[list[VisemeEvent], int]:
+    """Random contiguous-ish viseme track heavy on short events."""
+    events = []
+    t = rng.randint(0, 50)
+    for _ in range(rng.randint(0, 30)):
+        duration = rng.choice([0, 5, 10, 20, 30, 39, 40, 45, 50, 60, 100, 200])
+        events.append(
+            VisemeEvent(
+                viseme=rng.choice("AEO"),
+                start_ms=t,
+                end_ms=t + duration,
+                confidence=round(rng.random(), 2),
+            )
+        )
+        t += duration + rng.choice([0, 0, 0, 5])
+    return events, t + rng.choice([0, 10, 100])
+
+
+class TestSmoothTimeline:
+    """Property tests: the columnar kernel matches the stage-by-stage pipeline."""
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_equivalent_to_reference_pipeline(self, seed: int):
+        """Same events and burst_merge_count for random tracks and parameters."""
+        rng = random.Random(seed)
+        events, duration_ms = _random_events(rng)
+        params = {
+            "min_hold_ms": rng.choice([0, 30, 50, 80]),
+            "min_burst_ms": rng.choice([0, 20, 40, 60]),
+            "boundary_soften_ms": rng.choice([0, 10, 15]),
+            "duration_ms": duration_ms,
+        }
+
+        expected = _reference_smooth([e.model_copy() for e in events], **params)
+        timeline, burst_merge_count = smooth_timeline(VisemeTimeline.from_events(events), **params)
+
+        assert (timeline.to_events(), burst_merge_count) == expected
+        assert smooth_visemes(events, **params) == expected
+
+    def test_timeline_is_reusable_across_parameter_sweeps(self):
+        """Smoothing does not consume or modify the raw timeline."""
+        timeline = VisemeTimeline()
+        for i in range(10):
+            timeline.append("A" if i % 3 else "E", i * 25, (i + 1) * 25, confidence=0.9)
+
+        first = [
+            smooth_timeline(
+                timeline,
+                min_hold_ms=hold,
+                min_burst_ms=40,
+                boundary_soften_ms=10,
+                duration_ms=250,
+            )
+            for hold in (0, 30, 60)
+        ]
+        again = smooth_timeline(
+            timeline, min_hold_ms=0, min_burst_ms=40, boundary_soften_ms=10, duration_ms=250
+        )
+
+        assert len(timeline) == 10
+        assert again[0].to_events() == first[0][0].to_events()
+        assert again[1] == first[0][1]
+
+    def test_covered_ms(self):
+        """Coverage is the summed event span."""
+        timeline = VisemeTimeline.from_events(
+            [
+                VisemeEvent(viseme="A", start_ms=0, end_ms=100),
+                VisemeEvent(viseme="E", start_ms=150, end_ms=200),
+            ]
+        )
+
+        assert timeline.covered_ms() == 150
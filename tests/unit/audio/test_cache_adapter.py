@@ -136,6 +136,7 @@ class TestLoadAudioFeatures:
                     step_id="audio.features",
                     step_version="3",
                     input_fingerprint=audio_hash,
+                    session_scoped=False,
                 )
                 await cache.store(key, bundle)
 
@@ -0,0 +1,85 @@
+"""Tests for FSCache size budget, stats and garbage collection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel
+import pytest
+
+from twinklr.core.caching import CacheKey, FSCache
+from twinklr.core.io import RealFileSystem, absolute_path
+
+
+class Blob(BaseModel):
+    data: str
+
+
+def _key(name: str, domain: str = "audio") -> CacheKey:
+    return CacheKey(domain=domain, step_id="test.blob", step_version="1", input_fingerprint=name)
+
+
+def _cache(root: Path, **kwargs: object) -> FSCache:
+    return FSCache(RealFileSystem(), absolute_path(str(root)), **kwargs)  # type: ignore[arg-type]
+
+
+def _size(blob: Blob) -> int:
+    return len(blob.model_dump_json(indent=2).encode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used_past_budget(tmp_path: Path) -> None:
+    blob = Blob(data="x" * 100)
+    cache = _cache(tmp_path, max_bytes=_size(blob) * 2)
+
+    await cache.store(_key("a"), blob)
+    await cache.store(_key("b"), blob)
+    assert await cache.load(_key("a"), Blob) == blob  # "a" is now more recent than "b"
+    await cache.store(_key("c"), blob)
+
+    assert await cache.exists(_key("a"))
+    assert not await cache.exists(_key("b"))
+    assert await cache.exists(_key("c"))
+
+
+@pytest.mark.asyncio
+async def test_oversized_entry_is_kept(tmp_path: Path) -> None:
+    cache = _cache(tmp_path, max_bytes=10)
+
+    await cache.store(_key("big"), Blob(data="y" * 100))
+
+    assert await cache.exists(_key("big"))
+
+
+@pytest.mark.asyncio
+async def test_stats_and_gc_see_entries_from_other_instances(tmp_path: Path) -> None:
+    blob = Blob(data="z" * 50)
+    writer = _cache(tmp_path)
+    for name in ("a", "b", "c"):
+        await writer.store(_key(name), blob)
+    await writer.store(_key("d", domain="agents"), blob)
+    (tmp_path / "audio" / "default" / "test.blob" / "orphan").mkdir()
+
+    stats = await _cache(tmp_path).stats()
+    assert stats.entries == 4
+    assert stats.total_bytes == 4 * _size(blob)
+    assert stats.bytes_by_domain == {"agents": _size(blob), "audio": 3 * _size(blob)}
+
+    result = await _cache(tmp_path).gc(max_bytes=2 * _size(blob), purge_incomplete=True)
+
+    assert result.removed_entries == 3  # two evicted + one orphan
+    assert result.freed_bytes == 2 * _size(blob)
+    assert result.remaining_entries == 2
+    assert not (tmp_path / "audio" / "default" / "test.blob" / "orphan").exists()
+
+
+@pytest.mark.asyncio
+async def test_gc_removes_expired_entries(tmp_path: Path) -> None:
+    await _cache(tmp_path, ttl_seconds=-1.0).store(_key("stale"), Blob(data="s"))
+    await _cache(tmp_path).store(_key("fresh"), Blob(data="f"))
+
+    result = await _cache(tmp_path).gc()
+
+    assert result.removed_entries == 1
+    assert result.remaining_entries == 1
+    assert await _cache(tmp_path).exists(_key("fresh"))
@@ -0,0 +1,86 @@
+"""Tests for the in-process memory tier and LayeredCache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import BaseModel, ConfigDict
+import pytest
+
+from twinklr.core.caching import (
+    CacheKey,
+    FSCache,
+    LayeredCache,
+    MemoryCache,
+    shared_memory_cache,
+)
+from twinklr.core.io import RealFileSystem, absolute_path
+
+
+class Bundle(BaseModel):
+    values: list[int]
+
+
+class FrozenBundle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+
+
+def _key(name: str) -> CacheKey:
+    return CacheKey(domain="audio", step_id="test", step_version="1", input_fingerprint=name)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_is_bounded_lru() -> None:
+    memory = MemoryCache(max_entries=2)
+    for name in ("a", "b"):
+        await memory.store(_key(name), Bundle(values=[1]))
+    await memory.load(_key("a"), Bundle)
+    await memory.store(_key("c"), Bundle(values=[3]))
+
+    assert len(memory) == 2
+    assert await memory.exists(_key("a"))
+    assert not await memory.exists(_key("b"))
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_isolates_mutable_models() -> None:
+    memory = MemoryCache()
+    frozen = FrozenBundle(name="x")
+    await memory.store(_key("m"), Bundle(values=[1]))
+    await memory.store(_key("f"), frozen)
+
+    loaded = await memory.load(_key("m"), Bundle)
+    assert loaded is not None
+    loaded.values.append(2)
+
+    assert await memory.load(_key("m"), Bundle) == Bundle(values=[1])
+    assert await memory.load(_key("f"), FrozenBundle) is frozen
+    assert await memory.load(_key("f"), Bundle) is None  # class mismatch is a miss
+
+
+def test_shared_memory_cache_is_keyed_by_scope_only() -> None:
+    first = shared_memory_cache("test-scope-only", 4)
+
+    assert shared_memory_cache("test-scope-only", 64) is first
+    assert shared_memory_cache("test-scope-only") is first
+    assert shared_memory_cache("test-other-scope", 4) is not first
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_serves_repeat_loads_from_memory(tmp_path: Path) -> None:
+    backend = FSCache(RealFileSystem(), absolute_path(str(tmp_path)))
+    await backend.store(_key("song"), Bundle(values=[1, 2, 3]))
+    cache = LayeredCache(backend, MemoryCache())
+
+    with patch.object(backend, "load", wraps=backend.load) as backend_load:
+        first = await cache.load(_key("song"), Bundle)
+        second = await cache.load(_key("song"), Bundle)
+
+    assert first == second == Bundle(values=[1, 2, 3])
+    assert backend_load.call_count == 1
+
+    await cache.invalidate(_key("song"))
+    assert await cache.load(_key("song"), Bundle) is None
@@ -0,0 +1,88 @@
+"""Tests for the cross-session object store used by session-independent keys."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pydantic import BaseModel
+import pytest
+
+from twinklr.core.caching import CacheKey, FSCache, MemoryCache
+from twinklr.core.io import RealFileSystem, absolute_path
+
+
+class Blob(BaseModel):
+    data: str
+
+
+def _key(
+    session_id: str | None, *, session_scoped: bool = False, domain: str = "audio_profile"
+) -> CacheKey:
+    return CacheKey(
+        domain=domain,
+        session_id=session_id,
+        step_id="audio_profile",
+        step_version="1",
+        input_fingerprint="abc123",
+        session_scoped=session_scoped,
+    )
+
+
+def _cache(root: Path, **kwargs: object) -> FSCache:
+    return FSCache(RealFileSystem(), absolute_path(str(root)), **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_shared_key_is_stored_once_and_indexed_per_session(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    blob = Blob(data="profile")
+
+    await cache.store(_key("alice"), blob)
+    assert await cache.load(_key("bob"), Blob) == blob
+
+    objects = list((tmp_path / "_objects").rglob("artifact.json"))
+    assert [p.relative_to(tmp_path / "_objects").parts[:3] for p in objects] == [
+        ("audio_profile", "1", "abc123")
+    ]
+    for session_id in ("alice", "bob"):
+        ref_path = tmp_path / "audio_profile" / session_id / "audio_profile" / "abc123" / "ref.json"
+        assert json.loads(ref_path.read_text())["session_id"] == session_id
+        assert not (ref_path.parent / "artifact.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_session_scoped_keys_stay_isolated(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+
+    await cache.store(_key("alice", session_scoped=True), Blob(data="mine"))
+
+    assert await cache.load(_key("bob", session_scoped=True), Blob) is None
+    assert await cache.load(_key("bob"), Blob) is None
+
+
+@pytest.mark.asyncio
+async def test_stats_and_gc_count_objects_and_drop_dangling_refs(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    await cache.store(_key("alice"), Blob(data="x"))
+    await cache.load(_key("bob"), Blob)
+    await cache.store(_key("alice", session_scoped=True), Blob(data="y"))
+
+    stats = await cache.stats()
+    assert (stats.entries, stats.shared_entries, stats.session_refs) == (2, 1, 2)
+
+    await cache.invalidate(_key("alice"))
+    result = await cache.gc(purge_incomplete=True)
+
+    assert result.remaining_entries == 1
+    assert not (tmp_path / "audio_profile" / "bob" / "audio_profile" / "abc123").exists()
+    assert (await cache.stats()).session_refs == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_shares_across_sessions_and_domains() -> None:
+    cache = MemoryCache()
+    await cache.store(_key("alice"), Blob(data="x"))
+
+    assert await cache.load(_key("bob", domain="other"), Blob) == Blob(data="x")
+    assert await cache.load(_key("bob", session_scoped=True), Blob) is None
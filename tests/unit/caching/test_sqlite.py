@@ -0,0 +1,164 @@
+"""Tests for the SQLite cache backend."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+from pydantic import BaseModel
+import pytest
+
+from twinklr.core.caching import CacheKey, FSCache, SQLiteCache, create_cache
+
+
+class Blob(BaseModel):
+    data: str
+
+
+def _key(name: str, domain: str = "group_planner", session_id: str | None = "s1") -> CacheKey:
+    return CacheKey(
+        domain=domain,
+        session_id=session_id,
+        step_id="test.blob",
+        step_version="1",
+        input_fingerprint=name,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_load_roundtrip_uses_wal_and_compression(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    blob = Blob(data="x" * 10_000)
+
+    await cache.store(_key("a"), blob)
+
+    assert await cache.load(_key("a"), Blob) == blob
+    assert await cache.exists(_key("a"))
+    assert await cache.load(_key("a", session_id="s2"), Blob) is None
+    conn = sqlite3.connect(tmp_path / "cache.sqlite3")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    (stored_bytes,) = conn.execute("SELECT artifact_bytes FROM cache_entries").fetchone()
+    assert stored_bytes < len(blob.model_dump_json())
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_load_many_and_store_many(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    await cache.store_many([(_key(name), Blob(data=name)) for name in ("a", "b", "c")])
+
+    loaded = await cache.load_many([_key("c"), _key("missing"), _key("a"), _key("c")], Blob)
+
+    assert [b.data if b else None for b in loaded] == ["c", None, "a", "c"]
+    assert (await cache.stats()).entries == 3
+
+
+@pytest.mark.asyncio
+async def test_wrong_model_and_ttl_are_misses(tmp_path: Path) -> None:
+    class Other(BaseModel):
+        value: int
+
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", ttl_seconds=0.05)
+    await cache.store(_key("a"), Blob(data="x"))
+    assert await cache.load(_key("a"), Other) is None
+
+    await asyncio.sleep(0.1)
+
+    assert not await cache.exists(_key("a"))
+    result = await cache.gc()
+    assert (result.removed_entries, result.remaining_entries) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_budget_evicts_least_recently_used(tmp_path: Path) -> None:
+    probe = SQLiteCache(tmp_path / "probe.sqlite3")
+    await probe.store(_key("p"), Blob(data="y" * 200))
+    entry_bytes = (await probe.stats()).total_bytes
+    cache = SQLiteCache(
+        tmp_path / "cache.sqlite3", max_bytes=entry_bytes * 2, recency_resolution_s=0.0
+    )
+
+    await cache.store(_key("a"), Blob(data="y" * 200))
+    await cache.store(_key("b"), Blob(data="y" * 200))
+    assert await cache.load(_key("a"), Blob) is not None  # "a" is now more recent than "b"
+    await cache.store(_key("c"), Blob(data="y" * 200))
+
+    assert await cache.exists(_key("a"))
+    assert not await cache.exists(_key("b"))
+    assert await cache.exists(_key("c"))
+
+
+@pytest.mark.asyncio
+async def test_reads_skip_recency_writes_when_recent_or_locked(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache.sqlite3"
+    cache = SQLiteCache(db_path, recency_resolution_s=0.0)
+    await cache.store(_key("a"), Blob(data="a"))
+
+    def last_used() -> float:
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("SELECT last_used FROM cache_entries").fetchone()[0]
+
+    before = last_used()
+    writer = sqlite3.connect(db_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")  # Another process holds the write lock
+    try:
+        started = time.monotonic()
+        assert await cache.load(_key("a"), Blob) == Blob(data="a")
+        assert time.monotonic() - started < 1.0
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    assert last_used() == before
+
+    assert await cache.load(_key("a"), Blob) is not None
+    assert last_used() > before
+    lazy = SQLiteCache(db_path)  # Default resolution: a fresh entry is not touched
+    touched = last_used()
+    assert await lazy.load(_key("a"), Blob) is not None
+    assert last_used() == touched
+
+
+@pytest.mark.asyncio
+async def test_session_independent_keys_share_a_row(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    shared = _key("a").model_copy(update={"session_scoped": False})
+
+    await cache.store(shared, Blob(data="x"))
+
+    other_session = shared.model_copy(update={"session_id": "s2", "domain": "other"})
+    assert await cache.load(other_session, Blob) == Blob(data="x")
+    assert (await cache.stats()).shared_entries == 1
+
+
+def _store_from_worker(db_path: Path, worker: int) -> None:
+    cache = SQLiteCache(db_path)
+    items = [(_key(f"{worker}-{i}"), Blob(data=str(i))) for i in range(25)]
+    for start in range(0, len(items), 5):
+        asyncio.run(cache.store_many(items[start : start + 5]))
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="uses the fork start method")
+def test_concurrent_writers_from_several_processes(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache.sqlite3"
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_store_from_worker, args=(db_path, n)) for n in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+
+    assert [process.exitcode for process in workers] == [0] * 4
+    assert asyncio.run(SQLiteCache(db_path).stats()).entries == 100
+
+
+def test_create_cache_selects_backend(tmp_path: Path) -> None:
+    assert isinstance(create_cache("fs", tmp_path), FSCache)
+    sqlite_cache = create_cache("sqlite", tmp_path, max_bytes=1024)
+    assert isinstance(sqlite_cache, SQLiteCache)
+    assert sqlite_cache.db_path == tmp_path.resolve() / "cache.sqlite3"
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        create_cache("redis", tmp_path)  # type: ignore[arg-type]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
-from twinklr.cli.main import _resolve_fixture_config_path
+import pytest
+
+from twinklr.cli.main import COMMANDS, _parse_size, _resolve_fixture_config_path, build_arg_parser
 
 
 def test_resolve_fixture_config_path_relative_to_job_config_dir() -> None:
@@ -20,3 +23,43 @@ def test_resolve_fixture_config_path_keeps_absolute_path() -> None:
     fixture_path = Path("/etc/twinklr/fixtures.json")
     resolved = _resolve_fixture_config_path(job_config_path, str(fixture_path))
     assert resolved == fixture_path
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("1048576", 1048576), ("512MB", 512 * 1024**2), ("1.5gb", int(1.5 * 1024**3))],
+)
+def test_parse_size_accepts_units(text: str, expected: int) -> None:
+    """Cache size arguments accept plain bytes and binary unit suffixes."""
+    assert _parse_size(text) == expected
+
+
+def test_parse_size_rejects_garbage() -> None:
+    """Unknown units are argparse errors, not crashes."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_size("12XB")
+
+
+def test_cache_gc_command_evicts_to_size(tmp_path: Path) -> None:
+    """`twinklr cache gc --max-size` shrinks the cache root."""
+    import asyncio
+
+    from pydantic import BaseModel
+
+    from twinklr.core.caching import CacheKey, FSCache
+    from twinklr.core.io import RealFileSystem, absolute_path
+
+    class Blob(BaseModel):
+        data: str
+
+    cache = FSCache(RealFileSystem(), absolute_path(str(tmp_path)))
+    for name in ("a", "b"):
+        key = CacheKey(domain="d", step_id="s", step_version="1", input_fingerprint=name)
+        asyncio.run(cache.store(key, Blob(data="x" * 100)))
+
+    args = build_arg_parser().parse_args(
+        ["cache", "gc", "--root", str(tmp_path), "--max-size", "150"]
+    )
+    COMMANDS[args.cmd](args)
+
+    assert asyncio.run(cache.stats()).entries == 1
@@ -0,0 +1,86 @@
+"""Import-time budget for the twinklr CLI.
+
+The CLI is launched once per song by job runners, so its startup cost is
+multiplied by library size. These tests run the import in a fresh
+interpreter and guard both the heavy-module boundary and a wall-clock budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must only load when a command actually needs them
+HEAVY_MODULES = (
+    "anthropic",
+    "g2p_en",
+    "librosa",
+    "numba",
+    "openai",
+    "scipy",
+    "twinklr.core.audio.analyzer",
+    "twinklr.core.pipeline",
+    "twinklr.core.sequencer.moving_heads.templates.builtins",
+)
+
+# Generous ceiling: cold import was ~6s before lazy loading, ~0.1s after
+STARTUP_BUDGET_S = 1.5
+
+_PACKAGES_DIR = Path(__file__).resolve().parents[3] / "packages"
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import twinklr.cli.main as cli
+cli.build_arg_parser().format_help()
+elapsed = time.perf_counter() - t0
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _probe_cli_import() -> dict[str, object]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_PACKAGES_DIR), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def cli_import() -> dict[str, object]:
+    return _probe_cli_import()
+
+
+def test_cli_import_does_not_load_heavy_modules(cli_import: dict[str, object]) -> None:
+    """`twinklr --help` must not import audio, LLM SDKs or builtin templates."""
+    assert cli_import["heavy"] == []
+
+
+@pytest.mark.slow
+def test_cli_import_within_startup_budget(cli_import: dict[str, object]) -> None:
+    """Cold CLI import + parser construction stays within the startup budget."""
+    assert cli_import["elapsed"] < STARTUP_BUDGET_S
+
+
+def test_commands_cover_parser_subcommands() -> None:
+    """Every parser subcommand has a deferred handler in COMMANDS."""
+    from twinklr.cli.main import COMMANDS, build_arg_parser
+
+    parser = build_arg_parser()
+    subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    assert set(subparsers.choices) == set(COMMANDS)
@@ -244,3 +244,29 @@ def test_reference_loader_upserts_on_reload(tmp_path: Path) -> None:
 
     row = conn.execute("SELECT data_json FROM reference_data WHERE data_key='effects'").fetchone()
     assert json.loads(row[0]) == {"v": 2}
+
+
+def test_bootstrap_adds_and_backfills_promoted_columns() -> None:
+    """Bootstrapping a pre-promotion DB adds typed columns filled from data_json."""
+    conn = _make_conn()
+    conn.execute(
+        "CREATE TABLE phrases (phrase_id TEXT PRIMARY KEY, package_id TEXT NOT NULL, "
+        "sequence_file_id TEXT NOT NULL, effect_family TEXT NOT NULL, "
+        "target_name TEXT NOT NULL, data_json TEXT NOT NULL)"
+    )
+    data = {"motion_class": "sweep", "start_ms": 250, "map_confidence": 0.75}
+    conn.execute(
+        "INSERT INTO phrases VALUES ('p1', 'pkg1', 'seq1', 'wave', 'Arch', ?)",
+        (json.dumps(data),),
+    )
+
+    bootstrapper = SchemaBootstrapper(conn)
+    bootstrapper.bootstrap()
+    bootstrapper.bootstrap()  # Second run finds nothing to add
+
+    row = conn.execute(
+        "SELECT motion_class, start_ms, map_confidence, section_label FROM phrases"
+    ).fetchone()
+    assert tuple(row) == ("sweep", 250, 0.75, None)
+    assert "idx_phrases_classes" in _index_names(conn)
+    assert "start_ms" in bootstrapper.promoted_columns()["phrases"]
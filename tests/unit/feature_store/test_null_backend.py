@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from twinklr.core.feature_store.backends.null import NullFeatureStore
@@ -191,3 +193,9 @@ def test_lifecycle_sequence(store: NullFeatureStore) -> None:
     store.initialize()
     assert store.get_schema_version() == "null"
     store.close()
+
+
+def test_scan_columns_yields_nothing(store: NullFeatureStore, tmp_path: Path) -> None:
+    """Bulk scans are empty and exports write no rows."""
+    assert list(store.scan_columns("phrases")) == []
+    assert store.export_parquet("phrases", tmp_path / "phrases.parquet") == 0
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from twinklr.core.feature_engineering.models.phrases import (
@@ -39,7 +40,7 @@ from twinklr.core.feature_engineering.models.transitions import (
     TransitionType,
 )
 from twinklr.core.feature_store.backends.sqlite import SQLiteFeatureStore
-from twinklr.core.feature_store.models import FeatureStoreConfig
+from twinklr.core.feature_store.models import FeatureStoreConfig, FeatureStoreError
 from twinklr.core.feature_store.protocols import FeatureStoreProviderSync
 from twinklr.core.sequencer.templates.group.models.template import TimingHints
 from twinklr.core.sequencer.templates.group.recipe import (
@@ -550,3 +551,95 @@ def test_upsert_template_assignments(store: SQLiteFeatureStore) -> None:
     a2 = _make_assignment("pkg1", "seq1", "p2", "t1")
     count = store.upsert_template_assignments((a1, a2))
     assert count == 2
+
+
+# ---------------------------------------------------------------------------
+# Bulk column scans
+# ---------------------------------------------------------------------------
+
+
+def test_scan_columns_returns_typed_batches(store: SQLiteFeatureStore) -> None:
+    """Promoted columns come back as typed NumPy arrays, in batches."""
+    store.upsert_phrases(
+        tuple(_make_phrase(phrase_id=f"p{i}", target_name=f"T{i % 2}") for i in range(5))
+    )
+
+    batches = list(
+        store.scan_columns(
+            "phrases", ("phrase_id", "start_ms", "map_confidence", "motion_class"), batch_size=2
+        )
+    )
+
+    assert [len(b["phrase_id"]) for b in batches] == [2, 2, 1]
+    first = batches[0]
+    assert first["start_ms"].dtype == np.float64  # Nullable INTEGER → NaN-able float
+    assert first["map_confidence"].tolist() == [0.9, 0.9]
+    assert first["motion_class"].dtype == object
+    assert first["motion_class"][0] == MotionClass.STATIC.value
+
+
+def test_scan_columns_where_filters(store: SQLiteFeatureStore) -> None:
+    """Equality, IN and IS NULL filters are applied in SQL."""
+    store.upsert_phrases(
+        tuple(_make_phrase(phrase_id=f"p{i}", target_name=f"T{i % 3}") for i in range(6))
+    )
+
+    def ids(**where: object) -> list[str]:
+        return [
+            pid
+            for batch in store.scan_columns("phrases", ("phrase_id",), where=where)
+            for pid in batch["phrase_id"]
+        ]
+
+    assert sorted(ids(target_name="T0")) == ["p0", "p3"]
+    assert sorted(ids(target_name=["T1", "T2"])) == ["p1", "p2", "p4", "p5"]
+    assert len(ids(section_label=None)) == 6
+    assert ids(target_name=[]) == []
+
+
+def test_scan_columns_rejects_unknown_names(store: SQLiteFeatureStore) -> None:
+    """Unknown tables and columns raise instead of building SQL from them."""
+    with pytest.raises(FeatureStoreError):
+        list(store.scan_columns("nope"))
+    with pytest.raises(FeatureStoreError):
+        list(store.scan_columns("phrases", ("phrase_id", "bogus")))
+    with pytest.raises(FeatureStoreError):
+        list(store.scan_columns("phrases", where={"1=1 OR x": 1}))
+
+
+def test_export_parquet_writes_nulls(store: SQLiteFeatureStore, tmp_path: Path) -> None:
+    """NULL numeric values export as parquet nulls; nullable INTEGER stays int64."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    store.upsert_phrases(tuple(_make_phrase(phrase_id=f"p{i}") for i in range(3)))
+    store._conn.execute(  # type: ignore[attr-defined]
+        "UPDATE phrases SET start_ms = NULL WHERE phrase_id = 'p1'"
+    )
+    out = tmp_path / "phrases.parquet"
+
+    written = store.export_parquet(
+        "phrases", out, ("phrase_id", "start_ms", "onset_sync_score"), batch_size=2
+    )
+
+    table = pq.read_table(out)
+    assert written == 3
+    assert table.schema.field("start_ms").type == pa.int64()
+    assert table.schema.field("onset_sync_score").type == pa.float64()
+    assert table.column("start_ms").to_pylist() == [0, None, 0]
+    assert table.column("onset_sync_score").to_pylist() == [None, None, None]
+
+
+def test_promoted_columns_written_for_templates_and_transitions(
+    store: SQLiteFeatureStore,
+) -> None:
+    """Template and transition upserts populate their typed columns."""
+    store.upsert_templates((_make_template("t1"),))
+    store.upsert_transitions((_make_transition(),))
+
+    (templates,) = store.scan_columns("templates", ("template_signature", "distinct_pack_count"))
+    assert templates["template_signature"].tolist() == ["sig_t1"]
+    assert templates["distinct_pack_count"].tolist() == [2.0]
+
+    (edges,) = store.scan_columns("transitions", ("edge_count", "confidence", "mean_gap_ms"))
+    assert edges["edge_count"].tolist() == [5.0]
+    assert edges["confidence"].tolist() == [0.8]
@@ -3,13 +3,18 @@
 Verifies:
 - SyncAdapter wraps async methods and returns correct results
 - SyncAdapter passes non-async attributes through
+- run_sync reuses one bridge loop, works inside a running loop, shuts down cleanly
+- run_in_private_loop runs concurrent callers in parallel, even from the bridge
 - NullFileSystemSync backward compat (same API, same behavior)
 - RealFileSystemSync backward compat (same API, same behavior)
 - FSCacheSync backward compat (same API, same behavior)
 - Protocol conformance preserved
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import time
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -20,7 +25,12 @@ from twinklr.core.caching.models import CacheKey
 from twinklr.core.io import AbsolutePath, absolute_path
 from twinklr.core.io.impl_null import NullFileSystemSync
 from twinklr.core.io.impl_real import RealFileSystem, RealFileSystemSync
-from twinklr.core.io.sync_adapter import SyncAdapter
+from twinklr.core.io.sync_adapter import (
+    SyncAdapter,
+    run_in_private_loop,
+    run_sync,
+    shutdown_sync_bridge,
+)
 
 if TYPE_CHECKING:
     from twinklr.core.io import FileSystemSync
@@ -111,6 +121,75 @@ class TestSyncAdapterPassthroughNonAsync:
             _ = adapter.nonexistent_attribute
 
 
+class TestSyncBridge:
+    """run_sync dispatches to one long-lived background event loop."""
+
+    def test_calls_share_one_loop(self) -> None:
+        """Consecutive calls run on the same loop and thread."""
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    def test_works_inside_running_loop(self) -> None:
+        """Sync wrappers can be called from code already inside an event loop."""
+        adapter = SyncAdapter(_SimpleAsyncObj())
+
+        async def caller() -> int:
+            return adapter.async_with_args(1, 2)
+
+        assert asyncio.run(caller()) == 3
+
+    def test_reentrant_call_from_bridge_loop_raises(self) -> None:
+        """Calling run_sync on the bridge loop fails fast instead of deadlocking."""
+
+        async def reenter() -> None:
+            run_sync(_SimpleAsyncObj().async_return_value())
+
+        with pytest.raises(RuntimeError, match="bridge"):
+            run_sync(reenter())
+
+    def test_shutdown_then_restart(self) -> None:
+        """After shutdown, the next call starts a fresh loop."""
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        before = run_sync(current_loop())
+        shutdown_sync_bridge()
+        after = run_sync(current_loop())
+
+        assert before.is_closed()
+        assert after is not before
+
+
+class TestPrivateLoop:
+    """run_in_private_loop gives each call its own event loop."""
+
+    def test_concurrent_callers_do_not_serialize(self) -> None:
+        """Blocking work in two callers overlaps instead of queueing on one loop."""
+
+        async def blocking_work() -> float:
+            time.sleep(0.2)  # CPU-bound stand-in that never yields
+            return time.monotonic()
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(run_in_private_loop, blocking_work()) for _ in range(2)]
+            finished = [f.result() for f in futures]
+
+        assert max(finished) - started < 0.35
+
+    def test_callable_from_bridge_loop(self) -> None:
+        """A sync wrapper nested inside a run_sync call does not raise."""
+
+        async def nested() -> str:
+            return run_in_private_loop(_SimpleAsyncObj().async_return_value())
+
+        assert run_sync(nested()) == "async_result"
+
+
 # ---------------------------------------------------------------------------
 # NullFileSystemSync backward compat
 # ---------------------------------------------------------------------------
@@ -11,12 +11,15 @@ Tests for execute_step() which handles:
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 from pydantic import BaseModel
 import pytest
 
+from twinklr.core.caching import FSCache
+from twinklr.core.io import RealFileSystem, absolute_path
 from twinklr.core.pipeline.execution import execute_step
 from twinklr.core.pipeline.result import StageResult
 
@@ -613,6 +616,36 @@ async def test_execute_step_cache_key_structure(
     assert cache_key.step_id == "my_stage"
     assert cache_key.step_version == "v2"
     assert cache_key.input_fingerprint == cache_key_hash
+    assert cache_key.session_scoped is True
+
+
+@pytest.mark.asyncio
+async def test_execute_step_session_independent_reuses_other_session(
+    mock_context: MagicMock, tmp_path: Path
+) -> None:
+    """Test session_scoped=False: a result stored by one session is a hit in another."""
+    mock_context.cache = FSCache(RealFileSystem(), absolute_path(str(tmp_path)))
+    compute = AsyncMock(return_value=SimpleResult(value="shared"))
+
+    async def run(session_id: str) -> StageResult[str]:
+        mock_context.session.session_id = session_id
+        mock_context.state = {}
+        return await execute_step(
+            stage_name="audio_profile",
+            context=mock_context,
+            compute=compute,
+            result_extractor=lambda r: r.value,
+            result_type=SimpleResult,
+            cache_key_fn=make_async_cache_key("same_inputs"),
+            session_scoped=False,
+        )
+
+    first = await run("session_a")
+    second = await run("session_b")
+
+    assert first.output == second.output == "shared"
+    compute.assert_awaited_once()
+    mock_context.add_metric.assert_any_call("audio_profile_from_cache", True)
 
 
 # ============================================================================
@@ -113,3 +113,20 @@ def test_parameter_profile_generated() -> None:
     profile = stats.effect_type_profiles["Bars"]
     assert "eff_speed" in profile.parameters
     assert profile.parameters["eff_speed"].type is ParameterValueType.INT
+
+
+def test_statistics_from_value_histograms() -> None:
+    """Repeated durations/values fold into histograms with exact avg and median."""
+    first, second = _events()
+    stats = compute_effect_statistics([first, first, first, second])
+
+    bars = stats.effect_type_profiles["Bars"]
+    assert bars.duration_stats.count == 4
+    assert bars.duration_stats.avg_ms == 225.0
+    assert bars.duration_stats.median_ms == 200.0
+    speed = bars.parameters["eff_speed"]
+    assert speed.count == 4
+    assert speed.numeric_profile is not None
+    assert speed.numeric_profile.avg == 12.5
+    assert speed.numeric_profile.median == 10.0
+    assert bars.parameter_names == ("eff_speed",)
@@ -0,0 +1,134 @@
+"""Unit tests for bulk pack profiling with the content-addressed cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+from twinklr.core.profiling.models.batch import PackProfileJob
+from twinklr.core.profiling.models.enums import PackProfileStatus
+from twinklr.core.profiling.profiler import SequencePackProfiler
+
+if TYPE_CHECKING:
+    from twinklr.core.profiling.models.batch import BatchProgress
+
+_XSQ = b"""<xsequence>
+  <head>
+    <version>2024.10</version>
+    <mediaFile>song.mp3</mediaFile>
+    <sequenceDuration>4.0</sequenceDuration>
+  </head>
+  <EffectDB><Effect>E_SLIDER_Speed=12</Effect></EffectDB>
+  <ElementEffects>
+    <Element type="model" name="Arch">
+      <EffectLayer>
+        <Effect ref="0" name="On" startTime="0" endTime="500"/>
+        <Effect ref="0" name="Bars" startTime="500" endTime="1000"/>
+      </EffectLayer>
+    </Element>
+  </ElementEffects>
+</xsequence>"""
+
+
+def _write_pack(path: Path, *, compression: int = ZIP_DEFLATED) -> Path:
+    with ZipFile(path, "w", compression=compression) as archive:
+        archive.writestr("sequence.xsq", _XSQ)
+    return path
+
+
+def _jobs(tmp_path: Path, *zip_paths: Path) -> list[PackProfileJob]:
+    return [
+        PackProfileJob(zip_path=zip_path, output_dir=tmp_path / "out" / zip_path.stem)
+        for zip_path in zip_paths
+    ]
+
+
+def test_identical_sequence_parsed_once_across_packs(tmp_path: Path) -> None:
+    jobs = _jobs(
+        tmp_path,
+        _write_pack(tmp_path / "a.zip"),
+        _write_pack(tmp_path / "b.zip", compression=ZIP_STORED),
+    )
+
+    report = SequencePackProfiler().profile_many(jobs, max_workers=1, cache_dir=tmp_path / "cache")
+
+    assert [o.status for o in report.outcomes] == [PackProfileStatus.PROFILED] * 2
+    assert report.metrics.cache_stats.sequence_misses == 1
+    assert report.metrics.cache_stats.sequence_hits == 1
+    first, second = (o.profile for o in report.outcomes)
+    assert first is not None and second is not None
+    assert first.effect_statistics == second.effect_statistics
+    assert first.manifest.zip_sha256 != second.manifest.zip_sha256
+    assert (jobs[1].output_dir / "base_effect_events.json").exists()
+
+
+def test_cached_events_stream_back_in_chunks(tmp_path: Path) -> None:
+    """Events are cached one batch per entry and replayed in order on a hit."""
+    jobs = _jobs(tmp_path, _write_pack(tmp_path / "a.zip"), _write_pack(tmp_path / "b.zip"))
+    cache_dir = tmp_path / "cache"
+
+    report = SequencePackProfiler().profile_many(
+        jobs, max_workers=1, cache_dir=cache_dir, batch_size=1
+    )
+
+    assert report.metrics.cache_stats.sequence_hits == 1
+    assert report.metrics.events == 4
+    first, second = (o.profile for o in report.outcomes)
+    assert first is not None and second is not None
+    assert first.layer_event_counts == second.layer_event_counts
+
+
+def test_rerun_skips_profiled_packs(tmp_path: Path) -> None:
+    jobs = _jobs(tmp_path, _write_pack(tmp_path / "a.zip"))
+    profiler = SequencePackProfiler()
+    profiler.profile_many(jobs)
+
+    report = profiler.profile_many(jobs)
+
+    assert report.outcomes[0].status is PackProfileStatus.SKIPPED
+    assert report.outcomes[0].profile is not None
+    assert report.metrics.skipped == 1
+    assert profiler.profile_many(jobs, force=True).metrics.profiled == 1
+
+
+def test_failed_pack_is_reported_and_progress_emitted(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.zip"
+    with ZipFile(bad, "w") as archive:
+        archive.writestr("readme.txt", b"no sequence here")
+    jobs = _jobs(tmp_path, _write_pack(tmp_path / "a.zip"), bad)
+    snapshots: list[BatchProgress] = []
+
+    report = SequencePackProfiler().profile_many(jobs, max_workers=1, progress_fn=snapshots.append)
+
+    assert [o.status for o in report.outcomes] == [
+        PackProfileStatus.PROFILED,
+        PackProfileStatus.FAILED,
+    ]
+    assert "No sequence file" in (report.outcomes[1].error or "")
+    assert [s.completed for s in snapshots] == [1, 2]
+    assert report.metrics.events == 2
+    assert report.metrics.failed == 1
+
+
+def test_fail_fast_raises(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.zip"
+    with ZipFile(bad, "w") as archive:
+        archive.writestr("readme.txt", b"no sequence here")
+
+    with pytest.raises(RuntimeError, match=r"bad\.zip"):
+        SequencePackProfiler().profile_many(_jobs(tmp_path, bad), fail_fast=True)
+
+
+def test_process_pool_preserves_job_order(tmp_path: Path) -> None:
+    zip_paths = [_write_pack(tmp_path / f"pack_{i}.zip") for i in range(3)]
+    jobs = _jobs(tmp_path, *zip_paths)
+
+    report = SequencePackProfiler().profile_many(jobs, max_workers=2, cache_dir=tmp_path / "cache")
+
+    assert [o.job for o in report.outcomes] == jobs
+    assert report.metrics.profiled == 3
+    stats = report.metrics.cache_stats
+    assert stats.sequence_hits + stats.sequence_misses == 3
@@ -0,0 +1,222 @@
+"""Unit tests for the streaming (bounded-memory) profiling path."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+from zipfile import ZipFile
+
+import pytest
+
+from twinklr.core.formats.xlights.sequence.parser import XSQParser
+from twinklr.core.profiling.effects import extractor
+from twinklr.core.profiling.effects.extractor import extract_effect_events
+from twinklr.core.profiling.effects.streaming import XSQEventStream, sort_events
+from twinklr.core.profiling.models.enums import FileKind
+from twinklr.core.profiling.models.events import BaseEffectEventsFile
+from twinklr.core.profiling.models.profile import StreamedPackProfile
+from twinklr.core.profiling.pack.reader import PackReader
+from twinklr.core.profiling.profiler import SequencePackProfiler
+
+if TYPE_CHECKING:
+    from twinklr.core.profiling.models.events import EffectEventRecord
+
+_HEAD = """
+  <head>
+    <version>2024.10</version>
+    <mediaFile>C:\\\\shows\\\\Jingle Bells.mp3</mediaFile>
+    <sequenceDuration>12.5</sequenceDuration>
+    <artist>Band</artist>
+  </head>
+"""
+_PALETTES = """
+  <ColorPalettes>
+    <ColorPalette>C_BUTTON_Palette1=#FF0000,C_CHECKBOX_Palette1=1</ColorPalette>
+    <ColorPalette>C_BUTTON_Palette1=#00FF00,C_CHECKBOX_Palette1=1,C_BUTTON_Palette2=#0000FF,C_CHECKBOX_Palette2=1</ColorPalette>
+  </ColorPalettes>
+"""
+_EFFECTDB = """
+  <EffectDB>
+    <Effect>E_TEXTCTRL_Bars_BarCount=3,T_CHOICE_BufferStyle=Per Model</Effect>
+    <Effect>E_SLIDER_Speed=12</Effect>
+  </EffectDB>
+"""
+_ELEMENT_EFFECTS = """
+  <ElementEffects>
+    <Element type="timing" name="Beats">
+      <EffectLayer>
+        <Effect label="1" startTime="0" endTime="500"/>
+      </EffectLayer>
+    </Element>
+    <Element type="model" name="Arch 1">
+      <EffectLayer>
+        <Effect ref="0" name="Bars" startTime="1000" endTime="2000" palette="0"/>
+        <Effect ref="1" name="On" startTime="0" endTime="500" palette="1" protected="1"/>
+      </EffectLayer>
+      <EffectLayer name="Accent">
+        <Effect ref="0" name="Bars" startTime="0" endTime="250" palette="0" Custom="x"/>
+      </EffectLayer>
+    </Element>
+    <Element type="model" name="Tree">
+      <EffectLayer>
+        <Effect ref="7" name="Twinkle" startTime="0" endTime="500" label="sparkle"/>
+        <Effect name="Bad" startTime="oops" endTime="500"/>
+      </EffectLayer>
+    </Element>
+    <Element type="model" name="">
+      <EffectLayer>
+        <Effect name="Ignored" startTime="0" endTime="500"/>
+      </EffectLayer>
+    </Element>
+  </ElementEffects>
+"""
+
+
+def _xsq(*, effectdb_last: bool = False) -> bytes:
+    sections = [_HEAD, _PALETTES]
+    sections += [_ELEMENT_EFFECTS, _EFFECTDB] if effectdb_last else [_EFFECTDB, _ELEMENT_EFFECTS]
+    return f"<xsequence>{''.join(sections)}</xsequence>".encode()
+
+
+def _comparable(events: tuple[EffectEventRecord, ...] | list[EffectEventRecord]) -> list[dict]:
+    return [event.model_dump(exclude={"effect_event_id"}) for event in events]
+
+
+def _reference_events(data: bytes) -> tuple[EffectEventRecord, ...]:
+    sequence = XSQParser().parse_string(data.decode())
+    return extract_effect_events(sequence, "pkg", "seq", "sha").events
+
+
+def _write_zip(path: Path, members: dict[str, bytes]) -> None:
+    with ZipFile(path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+
+@pytest.mark.parametrize("effectdb_last", [False, True])
+def test_stream_matches_materialized_extraction(effectdb_last: bool) -> None:
+    data = _xsq(effectdb_last=effectdb_last)
+    stream = XSQEventStream(lambda: io.BytesIO(data))
+
+    events = list(sort_events(stream))
+
+    assert _comparable(events) == _comparable(_reference_events(data))
+    assert stream.event_count == 4
+    assert stream.head.version == "2024.10"
+    assert stream.head.sequence_duration_ms == 12_500
+    assert len(stream.palette_settings) == 2
+
+
+def test_stream_layer_naming_and_effectdb_resolution() -> None:
+    data = _xsq()
+    by_type = {e.effect_type + e.layer_name: e for e in XSQEventStream(lambda: io.BytesIO(data))}
+
+    assert by_type["Barslayer_0"].effectdb_settings_raw.startswith("E_TEXTCTRL_Bars")
+    assert by_type["BarsAccent"].layer_index == 1
+    assert by_type["Onlayer_0"].protected is True
+    # Out-of-range refs keep the ref but resolve no settings.
+    assert by_type["Twinklelayer_0"].effectdb_ref == 7
+    assert by_type["Twinklelayer_0"].effectdb_settings_raw is None
+
+
+def test_effectdb_parsed_once_per_ref(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str | None] = []
+    original = extractor.parse_effectdb_settings
+
+    def counting(settings: str | None):
+        calls.append(settings)
+        return original(settings)
+
+    monkeypatch.setattr(extractor, "parse_effectdb_settings", counting)
+    data = _xsq()
+
+    list(XSQEventStream(lambda: io.BytesIO(data)))
+
+    # Refs 0 (twice), 1 and 7: three distinct lookups.
+    assert len(calls) == 3
+
+
+def test_stream_requires_head() -> None:
+    stream = XSQEventStream(
+        lambda: io.BytesIO(b"<xsequence>" + _EFFECTDB.encode() + b"</xsequence>")
+    )
+    assert list(stream) == []
+    with pytest.raises(ValueError, match="head"):
+        _ = stream.head
+
+
+def test_sort_events_spills_runs_and_preserves_order() -> None:
+    data = _xsq()
+    document_order = list(XSQEventStream(lambda: io.BytesIO(data))) * 3
+
+    spilled = list(sort_events(document_order, run_size=2))
+
+    assert [e.effect_event_id for e in spilled] == [
+        e.effect_event_id for e in sorted(document_order, key=extractor.effect_event_sort_key)
+    ]
+
+
+def test_pack_reader_flattens_nested_archives_without_extracting(tmp_path: Path) -> None:
+    inner = io.BytesIO()
+    with ZipFile(inner, "w") as archive:
+        archive.writestr("show/sequence.xml", _xsq())
+        archive.writestr("._sequence.xml", b"resource fork")
+    zip_path = tmp_path / "pack.zip"
+    _write_zip(zip_path, {"inner.xsqz": inner.getvalue(), "media/song.mp3": b"ID3"})
+
+    with PackReader(zip_path) as pack:
+        manifest = pack.manifest
+        sequence = next(f for f in manifest.files if f.file_id == manifest.sequence_file_id)
+        with pack.open(sequence.file_id) as handle:
+            assert handle.read() == _xsq()
+
+    assert manifest.source_extensions == frozenset({".zip", ".xsqz"})
+    assert sequence.filename == "sequence.xsq"
+    assert sequence.original_ext == ".xml"
+    assert {f.filename for f in manifest.files} == {"sequence.xsq", "song.mp3"}
+    assert next(f for f in manifest.files if f.filename == "song.mp3").kind is FileKind.ASSET
+    assert not (tmp_path / "pack_extracted").exists()
+
+
+def test_profile_streaming_matches_profile(tmp_path: Path) -> None:
+    zip_path = tmp_path / "pack.zip"
+    _write_zip(zip_path, {"sequence.xsq": _xsq()})
+    profiler = SequencePackProfiler()
+
+    full = profiler.profile(zip_path, tmp_path / "full", force=True)
+    streamed = profiler.profile_streaming(zip_path, tmp_path / "streamed", batch_size=2)
+
+    assert isinstance(streamed, StreamedPackProfile)
+    assert streamed.effect_statistics == full.effect_statistics
+    assert streamed.palette_profile == full.palette_profile
+    assert streamed.sequence_metadata.song == "Jingle Bells"
+
+    out = tmp_path / "streamed"
+    base = BaseEffectEventsFile.model_validate(
+        json.loads((out / "base_effect_events.json").read_text(encoding="utf-8"))
+    )
+    enriched = json.loads((out / "enriched_effect_events.json").read_text(encoding="utf-8"))
+    assert _comparable(base.events) == _comparable(full.base_events.events)
+    assert [e["target_kind"] for e in enriched] == ["unknown"] * 4
+    assert (out / "profile_summary.md").read_text(encoding="utf-8").count("## Top Layers") == 1
+
+    reloaded = profiler.profile_streaming(zip_path, out)
+    assert reloaded.layer_event_counts == streamed.layer_event_counts
+    assert reloaded.effect_statistics == streamed.effect_statistics
+
+
+def test_profile_streaming_empty_sequence_writes_valid_json(tmp_path: Path) -> None:
+    zip_path = tmp_path / "pack.zip"
+    _write_zip(zip_path, {"sequence.xsq": f"<xsequence>{_HEAD}</xsequence>".encode()})
+
+    profile = SequencePackProfiler().profile_streaming(zip_path, tmp_path / "out")
+
+    base = json.loads((tmp_path / "out" / "base_effect_events.json").read_text(encoding="utf-8"))
+    enriched = json.loads(
+        (tmp_path / "out" / "enriched_effect_events.json").read_text(encoding="utf-8")
+    )
+    assert base["events"] == []
+    assert enriched == []
+    assert profile.effect_statistics.total_events == 0
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
 
 from twinklr.core.recipe_builder.generation import (
     generate_candidates,
     generate_deterministic,
+    generate_with_llm,
+    generate_with_llm_async,
 )
 from twinklr.core.recipe_builder.models import (
     Opportunity,
@@ -164,3 +170,193 @@ def test_generate_deterministic_motion_target():
     recipe = candidates[0].recipe
     motions = [m.value for layer in recipe.layers for m in layer.motion]
     assert "ROLL" in motions
+
+
+# ---------------------------------------------------------------------------
+# Concurrent LLM generation
+# ---------------------------------------------------------------------------
+
+
+class RecordedLLMClient:
+    """Sync-only client (like OpenAIClient) replaying recorded JSON responses.
+
+    Recordings map an opportunity description to a list of (delay, response)
+    pairs, consumed one per request. The delay is seconds to sleep or an
+    ``asyncio.Event`` to wait for (async client only). A response that is an
+    exception is raised instead of returned.
+    """
+
+    def __init__(self, recordings: dict[str, list[tuple[float | asyncio.Event, Any]]]) -> None:
+        self._recordings = {key: list(replies) for key, replies in recordings.items()}
+        self.calls: list[str] = []
+
+    def _next(self, messages: list[dict[str, str]]) -> tuple[float | asyncio.Event, Any]:
+        prompt = messages[-1]["content"]
+        key = next(k for k in self._recordings if k in prompt)
+        self.calls.append(key)
+        return self._recordings[key].pop(0)
+
+    def generate_json(
+        self, messages: list[dict[str, str]], model: str, temperature: float | None = None
+    ) -> dict[str, Any]:
+        response = self._next(messages)[1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class RecordedAsyncLLMClient(RecordedLLMClient):
+    """Async client (like an LLMProvider) that also tracks requests in flight."""
+
+    def __init__(self, recordings: dict[str, list[tuple[float | asyncio.Event, Any]]]) -> None:
+        super().__init__(recordings)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate_json_async(
+        self, messages: list[dict[str, str]], model: str, temperature: float | None = None
+    ) -> dict[str, Any]:
+        delay, response = self._next(messages)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if isinstance(delay, asyncio.Event):
+                await delay.wait()
+            else:
+                await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _opportunities(n: int) -> list[Opportunity]:
+    return [
+        Opportunity(
+            opportunity_id=f"opp_{i}",
+            category="missing_effect_type",
+            description=f"Recorded opportunity {i}",
+            priority=0.5,
+        )
+        for i in range(n)
+    ]
+
+
+def _response(recipe: EffectRecipe, i: int) -> dict[str, Any]:
+    return recipe.model_copy(update={"recipe_id": f"rb_recorded_{i}_v1"}).model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_llm_generation_is_concurrent_and_ordered(
+    sample_recipe: EffectRecipe,
+    sample_analysis: CatalogAnalysis,
+    sample_recipes: list[EffectRecipe],
+):
+    """A later opportunity finishes first, yet output follows opportunity order."""
+    opps = _opportunities(4)
+    gates = [asyncio.Event() for _ in opps]
+    client = RecordedAsyncLLMClient(
+        {opp.description: [(gates[i], _response(sample_recipe, i))] for i, opp in enumerate(opps)}
+    )
+    streamed: list[str] = []
+    loop = asyncio.get_running_loop()
+
+    def on_candidate(candidate: RecipeCandidate) -> None:
+        # Runs in a worker thread: release the other requests once the
+        # first candidate has been handed off
+        streamed.append(candidate.source_opportunity_id)
+        for gate in gates:
+            loop.call_soon_threadsafe(gate.set)
+
+    gates[1].set()  # opp_1 completes while opp_0 is still in flight
+    candidates = await generate_with_llm_async(
+        opps,
+        sample_analysis,
+        sample_recipes,
+        client,
+        max_concurrency=2,
+        on_candidate=on_candidate,
+    )
+
+    assert [c.source_opportunity_id for c in candidates] == ["opp_0", "opp_1", "opp_2", "opp_3"]
+    assert [c.recipe.recipe_id for c in candidates] == [f"rb_recorded_{i}_v1" for i in range(4)]
+    assert all(c.generation_mode == "llm" for c in candidates)
+    assert client.peak_in_flight == 2
+    assert streamed[0] == "opp_1"  # Handed off in completion order
+    assert sorted(streamed) == ["opp_0", "opp_1", "opp_2", "opp_3"]
+
+
+@pytest.mark.asyncio
+async def test_llm_generation_retries_per_opportunity(
+    sample_recipe: EffectRecipe,
+    sample_analysis: CatalogAnalysis,
+    sample_recipes: list[EffectRecipe],
+):
+    """Invalid output is retried; opportunities that never succeed are dropped."""
+    opps = _opportunities(2)
+    client = RecordedAsyncLLMClient(
+        {
+            opps[0].description: [(0.0, {"name": "broken"}), (0.0, _response(sample_recipe, 0))],
+            opps[1].description: [(0.0, {}), (0.0, {})],
+        }
+    )
+
+    candidates = await generate_with_llm_async(
+        opps, sample_analysis, sample_recipes, client, max_retries=1, retry_delay=0.0
+    )
+
+    assert [c.source_opportunity_id for c in candidates] == ["opp_0"]
+    assert client.calls.count(opps[0].description) == 2
+    assert client.calls.count(opps[1].description) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_errors_are_left_to_client_retries(
+    sample_recipe: EffectRecipe,
+    sample_analysis: CatalogAnalysis,
+    sample_recipes: list[EffectRecipe],
+):
+    """Failed requests are final; non-object JSON is resampled like invalid output."""
+    opps = _opportunities(2)
+    client = RecordedAsyncLLMClient(
+        {
+            opps[0].description: [(0.0, RuntimeError("retries exhausted"))],
+            opps[1].description: [
+                (0.0, ["not", "an", "object"]),
+                (0.0, _response(sample_recipe, 1)),
+            ],
+        }
+    )
+    callback_threads: list[int] = []
+
+    candidates = await generate_with_llm_async(
+        opps,
+        sample_analysis,
+        sample_recipes,
+        client,
+        max_retries=2,
+        retry_delay=0.0,
+        on_candidate=lambda c: callback_threads.append(threading.get_ident()),
+    )
+
+    assert [c.source_opportunity_id for c in candidates] == ["opp_1"]
+    assert client.calls.count(opps[0].description) == 1
+    assert client.calls.count(opps[1].description) == 2
+    assert callback_threads and threading.get_ident() not in callback_threads
+
+
+def test_sync_client_runs_in_worker_threads(
+    sample_recipe: EffectRecipe,
+    sample_analysis: CatalogAnalysis,
+    sample_recipes: list[EffectRecipe],
+):
+    """Sync-only clients go through the same concurrent path from sync callers."""
+    opps = _opportunities(3)
+    client = RecordedLLMClient(
+        {opp.description: [(0.0, _response(sample_recipe, i))] for i, opp in enumerate(opps)}
+    )
+
+    candidates = generate_with_llm(opps, sample_analysis, sample_recipes, client)
+
+    assert [c.source_opportunity_id for c in candidates] == ["opp_0", "opp_1", "opp_2"]
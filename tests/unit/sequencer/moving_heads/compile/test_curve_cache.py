@@ -0,0 +1,163 @@
+"""Unit tests for the per-compile step curve cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from twinklr.core.agents.sequencer.moving_heads.models import ChoreographyPlan, PlanSection
+from twinklr.core.config.fixtures import FixtureGroup
+from twinklr.core.config.fixtures.dmx import DmxMapping
+from twinklr.core.config.fixtures.instances import FixtureConfig, FixtureInstance
+from twinklr.core.config.models import JobConfig
+from twinklr.core.curves.models import CurvePoint
+from twinklr.core.curves.phase import apply_phase_shift_samples
+from twinklr.core.sequencer.moving_heads.compile import template_compiler
+from twinklr.core.sequencer.moving_heads.compile.curve_cache import (
+    StepCurveCache,
+    calibration_fingerprint,
+)
+from twinklr.core.sequencer.moving_heads.compile.step_compiler import compile_step
+from twinklr.core.sequencer.moving_heads.pipeline import RenderingPipeline
+from twinklr.core.sequencer.timing.beat_grid import BeatGrid
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _points() -> list[CurvePoint]:
+    return [CurvePoint(t=i / 7, v=(i % 4) / 3) for i in range(8)]
+
+
+def test_get_or_generate_reuses_result_for_equal_inputs() -> None:
+    """Equal params and call args share one generated result."""
+    cache = StepCurveCache()
+    handler = object()
+    calls: list[int] = []
+
+    def generate() -> list[int]:
+        calls.append(1)
+        return [len(calls)]
+
+    params_a = {"base_pan_norm": 0.5, "calibration": {"pan_min": 0}}
+    params_b = {"calibration": {"pan_min": 0}, "base_pan_norm": 0.5}
+
+    first = cache.get_or_generate("movement", handler, params_a, generate, n_samples=8)
+    second = cache.get_or_generate("movement", handler, params_b, generate, n_samples=8)
+
+    assert first is second
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_get_or_generate_separates_differing_inputs() -> None:
+    """A different base pose, sample count or handler generates a new result."""
+    cache = StepCurveCache()
+    handler = object()
+    params = {"base_pan_norm": 0.5}
+
+    cache.get_or_generate("movement", handler, params, lambda: 1, n_samples=8)
+    cache.get_or_generate("movement", handler, {"base_pan_norm": 0.6}, lambda: 2, n_samples=8)
+    cache.get_or_generate("movement", handler, params, lambda: 3, n_samples=16)
+    cache.get_or_generate("movement", object(), params, lambda: 4, n_samples=8)
+    cache.get_or_generate("dimmer", handler, params, lambda: 5, n_samples=8)
+
+    assert cache.misses == 5
+    assert cache.hits == 0
+    assert len(cache) == 5
+
+
+def test_calibration_fingerprint_keys_on_values_not_fixture_config() -> None:
+    """Fixtures with equal limits but their own FixtureConfig share one key."""
+    cache = StepCurveCache()
+    handler = object()
+
+    def calibration(fid: str) -> dict[str, Any]:
+        mapping = DmxMapping(pan_channel=11, tilt_channel=13, dimmer_channel=15)
+        return {
+            "pan_min_dmx": 10,
+            "fixture_config": FixtureConfig(fixture_id=fid, dmx_mapping=mapping),
+        }
+
+    for fid in ("MH1", "MH2"):
+        params = {"calibration": calibration_fingerprint(calibration(fid))}
+        cache.get_or_generate("dimmer", handler, params, lambda: 1, n_samples=8)
+
+    assert calibration_fingerprint(calibration("MH1")) == {"pan_min_dmx": 10}
+    assert calibration_fingerprint(None) == {}
+    assert cache.hits == 1
+
+
+def test_phase_shifted_matches_direct_shift_and_is_memoized() -> None:
+    """Shifted curves equal apply_phase_shift_samples and are shared per offset."""
+    cache = StepCurveCache()
+    points = _points()
+
+    shifted = cache.phase_shifted(points, 0.25, 8)
+    again = cache.phase_shifted(points, 0.25, 8)
+
+    assert shifted == apply_phase_shift_samples(points, 0.25, 8, wrap=True)
+    assert shifted is again
+    assert cache.hits == 1
+
+
+def test_phase_shifted_passthrough_for_zero_offset_and_none() -> None:
+    """Zero offset returns the base curve itself; None stays None."""
+    cache = StepCurveCache()
+    points = _points()
+
+    assert cache.phase_shifted(points, 0.0, 8) is points
+    assert cache.phase_shifted(None, 0.5, 8) is None
+    assert len(cache) == 0
+
+
+def _render(sections: list[tuple[str, int, int, str]]) -> list[dict[str, Any]]:
+    group = FixtureGroup(group_id="test_group")
+    for i in range(4):
+        fid = f"MH{i + 1}"
+        mapping = DmxMapping(pan_channel=11, tilt_channel=13, dimmer_channel=15)
+        cfg = FixtureConfig(fixture_id=fid, dmx_mapping=mapping)
+        group.add_fixture(FixtureInstance(fixture_id=fid, config=cfg, xlights_model_name=fid))
+    plan = ChoreographyPlan(
+        sections=[
+            PlanSection(section_name=name, start_bar=s, end_bar=e, template_id=tid)
+            for name, s, e, tid in sections
+        ],
+    )
+    pipeline = RenderingPipeline(
+        choreography_plan=plan,
+        beat_grid=BeatGrid.from_tempo(tempo_bpm=120.0, total_bars=8),
+        fixture_group=group,
+        job_config=JobConfig(),
+    )
+    return [segment.model_dump() for segment in pipeline.render()]
+
+
+def test_compiled_output_is_identical_with_and_without_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Sharing curves across fixtures never changes the compiled segments."""
+    sections = [
+        ("intro", 1, 4, "sweep_lr_fan_hold"),
+        ("verse", 5, 8, "pendulum_chevron_breathe"),
+    ]
+    caches: list[StepCurveCache] = []
+
+    class RecordingCache(StepCurveCache):
+        def __init__(self) -> None:
+            super().__init__()
+            caches.append(self)
+
+    monkeypatch.setattr(template_compiler, "StepCurveCache", RecordingCache)
+    cached = _render(sections)
+
+    def uncached_compile_step(
+        step: Any, context: Any, phase_offset_norm: float = 0.0, curve_cache: Any = None
+    ) -> Any:
+        return compile_step(step, context, phase_offset_norm)
+
+    monkeypatch.setattr(template_compiler, "compile_step", uncached_compile_step)
+    uncached = _render(sections)
+
+    assert sum(cache.hits for cache in caches) > 0
+    assert cached == uncached
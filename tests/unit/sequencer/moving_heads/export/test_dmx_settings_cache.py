@@ -0,0 +1,87 @@
+"""Tests for content-keyed DMX settings string caching."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from twinklr.core.config.fixtures.dmx import DmxMapping
+from twinklr.core.config.fixtures.instances import FixtureConfig, FixtureInstance
+from twinklr.core.curves.models import CurvePoint, PointsCurve
+from twinklr.core.sequencer.models.enum import ChannelName
+from twinklr.core.sequencer.moving_heads.channels.state import FixtureSegment
+from twinklr.core.sequencer.moving_heads.export.dmx_settings_builder import (
+    DmxSettingsBuilder,
+    DmxSettingsCache,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _fixture(fixture_id: str) -> FixtureInstance:
+    mapping = DmxMapping(pan_channel=11, tilt_channel=13, dimmer_channel=15)
+    config = FixtureConfig(fixture_id=fixture_id, dmx_mapping=mapping)
+    return FixtureInstance(fixture_id=fixture_id, config=config, xlights_model_name=fixture_id)
+
+
+def _segment(fixture_id: str, t0_ms: int, pan_points: list[tuple[float, float]]) -> FixtureSegment:
+    segment = FixtureSegment(
+        section_id="s",
+        segment_id="0",
+        step_id="step",
+        template_id="tpl",
+        fixture_id=fixture_id,
+        t0_ms=t0_ms,
+        t1_ms=t0_ms + 1000,
+    )
+    points = [CurvePoint(t=t, v=v) for t, v in pan_points]
+    segment.add_channel(ChannelName.PAN, curve=PointsCurve(points=points), value_points=points)
+    segment.add_channel(ChannelName.DIMMER, static_dmx=200)
+    return segment
+
+
+def test_identical_content_on_matching_fixtures_builds_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Same channels on fixtures with the same mapping share one settings string."""
+    cache = DmxSettingsCache()
+    first, second = _fixture("MH1"), _fixture("MH2")
+    expected = DmxSettingsBuilder(first).build_settings_string(
+        _segment(first.fixture_id, 0, [(0.0, 0.2), (1.0, 0.8)])
+    )
+    builds: list[str] = []
+    build_settings_string = DmxSettingsBuilder.build_settings_string
+
+    def counting_build(self: DmxSettingsBuilder, segment: FixtureSegment) -> str:
+        builds.append(segment.fixture_id)
+        return build_settings_string(self, segment)
+
+    monkeypatch.setattr(DmxSettingsBuilder, "build_settings_string", counting_build)
+    seg_a = _segment(first.fixture_id, 0, [(0.0, 0.2), (1.0, 0.8)])
+    seg_b = _segment(second.fixture_id, 4000, [(0.0, 0.2), (1.0, 0.8)])
+
+    key_a = cache.fingerprint(seg_a, first)
+    key_b = cache.fingerprint(seg_b, second)
+    settings_a = cache.settings_for(key_a, seg_a, first)
+    settings_b = cache.settings_for(key_b, seg_b, second)
+
+    assert key_a == key_b
+    assert settings_a == settings_b == expected
+    assert builds == ["MH1"]
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+
+def test_different_curve_points_get_different_settings() -> None:
+    """Curve content is part of the key."""
+    cache = DmxSettingsCache()
+    fixture = _fixture("MH1")
+    seg_a = _segment(fixture.fixture_id, 0, [(0.0, 0.2), (1.0, 0.8)])
+    seg_b = _segment(fixture.fixture_id, 0, [(0.0, 0.2), (1.0, 0.4)])
+
+    key_a = cache.fingerprint(seg_a, fixture)
+    key_b = cache.fingerprint(seg_b, fixture)
+
+    assert key_a != key_b
+    assert cache.settings_for(key_a, seg_a, fixture) != cache.settings_for(key_b, seg_b, fixture)
+    assert len(cache) == 2
@@ -0,0 +1,82 @@
+"""Tests for dense DMX frame rasterization of FixtureSegment IR."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from twinklr.core.curves.models import CurvePoint, PointsCurve
+from twinklr.core.sequencer.models.enum import ChannelName
+from twinklr.core.sequencer.moving_heads.channels.state import FixtureSegment
+from twinklr.core.sequencer.moving_heads.export.raster import rasterize_segments
+
+
+def _segment(fixture_id: str, t0_ms: int, t1_ms: int, **channels: int | list) -> FixtureSegment:
+    """Build a segment; ints are static DMX, lists are (t, v) curve points."""
+    segment = FixtureSegment(
+        section_id="s",
+        segment_id="0",
+        step_id="step",
+        template_id="tpl",
+        fixture_id=fixture_id,
+        t0_ms=t0_ms,
+        t1_ms=t1_ms,
+    )
+    for name, value in channels.items():
+        if isinstance(value, int):
+            segment.add_channel(ChannelName(name), static_dmx=value)
+        else:
+            points = [CurvePoint(t=t, v=v) for t, v in value]
+            segment.add_channel(
+                ChannelName(name), curve=PointsCurve(points=points), value_points=points
+            )
+    return segment
+
+
+def test_static_and_curve_channels_interpolate_per_frame() -> None:
+    segment = _segment("MH1", 0, 1000, pan=[(0.0, 0.0), (1.0, 1.0)], dimmer=255)
+
+    raster = rasterize_segments([segment], fps=10.0)
+
+    assert raster.frames.dtype == np.uint8
+    assert raster.frames.shape == (1, 3, 10)
+    pan = raster.channel("MH1", ChannelName.PAN)
+    assert pan.tolist() == [round(i / 10 * 255) for i in range(10)]
+    assert raster.channel("MH1", ChannelName.DIMMER).tolist() == [255] * 10
+    # Channels no segment carries stay 0.
+    assert raster.channel("MH1", ChannelName.TILT).tolist() == [0] * 10
+
+
+def test_first_segment_wins_and_gaps_are_zero() -> None:
+    segments = [
+        _segment("MH1", 0, 500, pan=100),
+        _segment("MH1", 250, 1000, pan=200),
+        _segment("MH2", 750, 1000, pan=50),
+    ]
+
+    raster = rasterize_segments(segments, fps=4.0, start_ms=0, end_ms=1500)
+
+    assert raster.fixture_ids == ("MH1", "MH2")
+    assert raster.channel("MH1", ChannelName.PAN).tolist() == [100, 100, 200, 200, 0, 0]
+    assert raster.channel("MH2", ChannelName.PAN).tolist() == [0, 0, 0, 50, 0, 0]
+    assert raster.active[1].tolist() == [False, False, False, True, False, False]
+
+
+def test_window_slices_frames_and_drops_inactive_fixtures() -> None:
+    segments = [_segment("MH1", 0, 1000, pan=10), _segment("MH2", 0, 250, pan=20)]
+    raster = rasterize_segments(segments, fps=8.0)
+
+    window = raster.window(500, 1000)
+
+    assert window.fixture_ids == ("MH1",)
+    assert window.start_ms == 500
+    assert window.channel("MH1", ChannelName.PAN).tolist() == [10] * 4
+
+
+def test_diff_reports_signed_changes_and_rejects_mismatched_layouts() -> None:
+    before = rasterize_segments([_segment("MH1", 0, 1000, pan=10)], fps=4.0)
+    after = rasterize_segments([_segment("MH1", 0, 1000, pan=30)], fps=4.0)
+
+    assert before.diff(after)[0, 0].tolist() == [20] * 4
+    with pytest.raises(ValueError, match="differ"):
+        before.diff(rasterize_segments([_segment("MH1", 0, 1000, pan=10)], fps=8.0))
@@ -0,0 +1,137 @@
+"""Tests for copy-on-write template snapshots in TemplateRegistry."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+import pytest
+
+from twinklr.core.sequencer.templates.shared import (
+    BaseTemplateInfo,
+    SnapshotMutationError,
+    TemplateNotFoundError,
+    TemplateRegistry,
+    freeze_model,
+    thaw_model,
+)
+
+
+class _Layer(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    params: dict[str, float] = {}
+
+
+class _Template(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    template_id: str
+    template_version: str = "1.0.0"
+    name: str
+    tags: list[str] = []
+    layers: list[_Layer] = []
+
+
+def _info(t: _Template) -> BaseTemplateInfo:
+    return BaseTemplateInfo(
+        template_id=t.template_id, version=t.template_version, name=t.name, tags=tuple(t.tags)
+    )
+
+
+@pytest.fixture
+def registry() -> TemplateRegistry[_Template, BaseTemplateInfo]:
+    reg: TemplateRegistry[_Template, BaseTemplateInfo] = TemplateRegistry(
+        info_factory=_info, name="test template"
+    )
+    reg.register(
+        lambda: _Template(
+            template_id="tpl_a",
+            name="Template A",
+            tags=["x"],
+            layers=[_Layer(name="base", params={"speed": 1.0})],
+        ),
+        aliases=["Alpha"],
+    )
+    return reg
+
+
+def test_get_returns_shared_snapshot(registry):
+    first = registry.get("tpl_a")
+    second = registry.get("alpha")
+
+    assert first is second
+    assert isinstance(first, _Template)
+
+
+def test_materializes_once(registry):
+    for _ in range(5):
+        registry.get("tpl_a")
+
+    stats = registry.stats()
+    assert stats.lookups == 5
+    assert stats.materializations == 1
+    assert stats.cached == 1
+
+
+def test_snapshot_is_deeply_frozen(registry):
+    snap = registry.get("tpl_a")
+
+    with pytest.raises(Exception):  # noqa: B017 - pydantic ValidationError
+        snap.name = "changed"
+    with pytest.raises(SnapshotMutationError):
+        snap.tags.append("y")
+    with pytest.raises(SnapshotMutationError):
+        snap.layers[0].params["speed"] = 2.0
+    with pytest.raises(Exception):  # noqa: B017
+        snap.layers[0].name = "changed"
+
+
+def test_snapshot_serializes_like_original(registry):
+    snap = registry.get("tpl_a")
+    fresh = _Template(
+        template_id="tpl_a",
+        name="Template A",
+        tags=["x"],
+        layers=[_Layer(name="base", params={"speed": 1.0})],
+    )
+
+    assert snap.model_dump() == fresh.model_dump()
+    assert snap.model_dump_json() == fresh.model_dump_json()
+    assert snap == fresh
+    assert fresh == snap
+
+
+def test_checkout_copies_on_first_write(registry):
+    handle = registry.checkout("tpl_a")
+
+    assert handle.value is registry.get("tpl_a")
+    assert not handle.is_copied
+
+    editable = handle.mutable()
+    editable.tags.append("y")
+    editable.layers[0].params["speed"] = 2.0
+    editable.name = "Renamed"
+
+    assert handle.mutable() is editable
+    assert handle.value is editable
+    assert type(editable) is _Template
+    assert registry.get("tpl_a").tags == ["x"]
+    assert registry.get("tpl_a").layers[0].params == {"speed": 1.0}
+    assert registry.stats().copies == 1
+
+
+def test_unknown_template_raises(registry):
+    with pytest.raises(TemplateNotFoundError):
+        registry.get("missing")
+    with pytest.raises(TemplateNotFoundError):
+        registry.checkout("missing")
+
+
+def test_freeze_thaw_roundtrip():
+    model = _Template(template_id="t", name="T", tags=["a"], layers=[_Layer(name="l")])
+    frozen = freeze_model(model)
+    thawed = thaw_model(frozen)
+
+    assert thawed == frozen
+    thawed.layers.append(_Layer(name="m"))
+    assert len(frozen.layers) == 1